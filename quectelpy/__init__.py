@@ -4,6 +4,8 @@ QuectelPy - Python library for controlling Quectel cellular modems.
 
 from .version import __version__
 from .modem import QuectelModem
+from .async_modem import AsyncQuectelModem
+from .core import MockTransport, ModemPool, URCDispatcher, OverflowPolicy
 
 from .types import (
     NetworkInfo,
@@ -12,6 +14,7 @@ from .types import (
     CurrentOperator,
     RegistrationStatus,
     RegistrationState,
+    NetworkStatus,
     SIMState,
     EquipmentStatus,
     MessageFormat,
@@ -23,6 +26,9 @@ from .exceptions import (
     EC25Error,
     ATTimeoutError,
     ATParseError,
+    ATCommandError,
+    CMEError,
+    CMSError,
     TransportError,
     DeviceDisconnectedError,
     ModemNotStartedError,
@@ -33,12 +39,18 @@ from .exceptions import (
 __all__ = [
     "__version__",
     "QuectelModem",
+    "AsyncQuectelModem",
+    "MockTransport",
+    "ModemPool",
+    "URCDispatcher",
+    "OverflowPolicy",
     "NetworkInfo",
     "SignalQuality",
     "ModelInfo",
     "CurrentOperator",
     "RegistrationStatus",
     "RegistrationState",
+    "NetworkStatus",
     "SIMState",
     "EquipmentStatus",
     "MessageFormat",
@@ -47,6 +59,9 @@ __all__ = [
     "EC25Error",
     "ATTimeoutError",
     "ATParseError",
+    "ATCommandError",
+    "CMEError",
+    "CMSError",
     "TransportError",
     "DeviceDisconnectedError",
     "ModemNotStartedError",
@@ -0,0 +1,244 @@
+"""
+AsyncQuectelModem class.
+
+asyncio counterpart of QuectelModem. Runs entirely on the event loop with
+no per-modem threads.
+"""
+
+import logging
+from typing import AsyncIterator, Optional, Union
+
+from .core import SerialTransport, Transport, URCCallback, URCEventCallback, URCSubscription
+from .core.async_modem import AsyncModemCore
+from .features.async_managers import AsyncDeviceManager, AsyncNetworkManager, AsyncSMSManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncQuectelModem:
+    """
+    asyncio interface for Quectel modem control.
+
+    Mirrors QuectelModem with awaitable methods:
+
+    - device: AsyncDeviceManager
+    - network: AsyncNetworkManager
+    - sms: AsyncSMSManager
+
+    Example usage:
+
+    .. code-block:: python
+
+        async with AsyncQuectelModem(port="/dev/ttyUSB2") as modem:
+            signal = await modem.network.get_signal_quality()
+            print(f"Signal: {signal.rssi_dbm} dBm")
+
+            async for urc in modem.urcs("+CMTI"):
+                print(f"New SMS: {urc}")
+    """
+
+    def __init__(
+        self,
+        port: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        baudrate: int = 115200,
+        timeout: float = 1.0,
+        log_urcs: bool = False,
+        max_urc_queue_size: int = 1000,
+        on_disconnect: Optional[callable] = None
+    ) -> None:
+        """
+        Initialize AsyncQuectelModem.
+
+        Args:
+            port: Serial port path (e.g., "/dev/ttyUSB2"). Either port or transport required.
+            transport: Custom transport instance. Must provide fileno().
+            baudrate: Serial port baud rate (default: 115200)
+            timeout: AT command timeout in seconds (default: 1.0)
+            log_urcs: Log URCs at INFO level instead of DEBUG (default: False)
+            max_urc_queue_size: Maximum URCs to queue (default: 1000)
+            on_disconnect: Optional callback function called when device disconnects.
+                          Signature: callback(exception: Exception) -> None
+
+        Raises:
+            ValueError: If neither port nor transport is provided
+            EC25Error: If serial port cannot be opened
+        """
+        if transport is None and port is None:
+            raise ValueError("Either 'port' or 'transport' must be provided")
+
+        if transport is None:
+            transport = SerialTransport(
+                port=port,
+                baudrate=baudrate,
+                timeout=timeout
+            )
+            logger.info(f"Created serial transport for {port}")
+
+        self._core = AsyncModemCore(
+            transport=transport,
+            timeout=timeout,
+            log_urcs=log_urcs,
+            max_urc_queue_size=max_urc_queue_size,
+            on_disconnect=on_disconnect
+        )
+
+        self.device = AsyncDeviceManager(self._core)
+        self.network = AsyncNetworkManager(self._core)
+        self.sms = AsyncSMSManager(self._core)
+
+        logger.info("Initialized AsyncQuectelModem")
+
+    async def start(self) -> None:
+        """Start reading from the modem on the running event loop."""
+        await self._core.start()
+        logger.info("Modem started")
+
+    async def stop(self) -> None:
+        """Stop reading from the modem."""
+        await self._core.stop()
+        logger.info("Modem stopped")
+
+    async def close(self) -> None:
+        """Stop reading and close the transport."""
+        await self._core.close()
+        logger.info("Modem closed")
+
+    def register_urc_callback(self, prefix: str, callback: URCCallback) -> URCSubscription:
+        """
+        Register a callback for unsolicited result codes.
+
+        Callbacks run on the event loop and must not block.
+
+        Args:
+            prefix: URC prefix to match (e.g., "+CMTI" for SMS notifications)
+            callback: Function to call when URC is received.
+                     Signature: callback(line: str) -> None
+
+        Returns:
+            Subscription handle. Several callbacks can share a prefix;
+            pass the handle to unregister_urc_callback() to remove one.
+        """
+        return self._core.register_urc_callback(prefix, callback)
+
+    def register_event_callback(self, prefix: str, callback: URCEventCallback) -> URCSubscription:
+        """
+        Register a callback for typed URC events.
+
+        Callbacks run on the event loop and must not block.
+
+        Args:
+            prefix: URC prefix to match (e.g., "+CMTI")
+            callback: Function to call with the event.
+                     Signature: callback(event: URCEvent) -> None
+
+        Returns:
+            Subscription handle for unregister_urc_callback()
+        """
+        return self._core.register_event_callback(prefix, callback)
+
+    def unregister_urc_callback(self, target: Union[str, URCSubscription]) -> bool:
+        """
+        Unregister URC callbacks.
+
+        Args:
+            target: Subscription handle returned by register_urc_callback(),
+                    or a URC prefix to remove all of its callbacks
+
+        Returns:
+            True if callback was removed, False if not found
+        """
+        return self._core.unregister_urc_callback(target)
+
+    def urcs(self, prefix: str = "", maxsize: int = 100) -> AsyncIterator[str]:
+        """
+        Iterate over URCs matching a prefix as they arrive.
+
+        Args:
+            prefix: URC prefix to match (empty string matches all URCs)
+            maxsize: Maximum URCs buffered before the oldest are dropped
+
+        Returns:
+            Async iterator of URC lines
+
+        Example:
+
+        .. code-block:: python
+
+            async for urc in modem.urcs("+CREG"):
+                print(f"Registration change: {urc}")
+        """
+        return self._core.urcs(prefix, maxsize=maxsize)
+
+    async def send_raw_at(
+        self,
+        cmd: str,
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[str]:
+        """
+        Send a raw AT command.
+
+        Args:
+            cmd: AT command (e.g., "AT+QGMR" or "+QGMR")
+            strip_ok: Remove "OK" from response
+            remove_cmd_prefix: Remove command prefix from first response line
+            timeout: Command timeout in seconds (uses default if None)
+
+        Returns:
+            List of response lines
+
+        Raises:
+            ATTimeoutError: If command times out
+            ATCommandError: If command returns an error result code
+        """
+        return await self._core.send_at(
+            cmd=cmd,
+            strip_ok=strip_ok,
+            remove_cmd_prefix=remove_cmd_prefix,
+            timeout=timeout
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Check if the modem is being read.
+
+        Returns:
+            True if running, False otherwise
+        """
+        return self._core.is_running()
+
+    @property
+    def is_disconnected(self) -> bool:
+        """
+        Check if the device was disconnected.
+
+        Returns:
+            True if device disconnected, False otherwise
+        """
+        return self._core.is_disconnected()
+
+    async def __aenter__(self):
+        """
+        Async context manager entry.
+
+        Automatically starts the modem if not already running.
+        """
+        if not self.is_running:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        """
+        Async context manager exit.
+
+        Automatically closes the modem connection.
+        """
+        await self.close()
+
+    def __repr__(self) -> str:
+        """String representation of modem."""
+        status = "running" if self.is_running else "stopped"
+        return f"<AsyncQuectelModem status={status}>"
@@ -3,22 +3,45 @@ Core modem infrastructure.
 
 Provides low-level building blocks for modem communication:
 - Transport: Serial communication abstraction
+- Framing: Bulk line splitting for byte streams
 - Protocol: AT command execution
 - URC: Unsolicited result code handling
+- Dispatch: URC callbacks on worker threads with bounded queues
 - ModemCore: Coordination of all core components
+- AsyncModemCore: asyncio equivalent of ModemCore (no threads)
+- ModemPool: One selector thread driving many modems
 """
 
+from .framing import LineFramer
 from .transport import Transport, SerialTransport, MockTransport
 from .protocol import ATProtocol
-from .urc import URCHandler, URCCallback
-from .modem import ModemCore
+from .urc import URCHandler, URCCallback, URCEventCallback, URCMatch, URCSubscription, URCWatch
+from .dispatch import URCDispatcher, OverflowPolicy, DispatcherStats, SubscriberStats
+from .modem import BaseModemCore, ModemCore
+from .async_modem import AsyncATProtocol, AsyncModemCore
+from .pool import ModemPool, PooledModemCore, PoolStats
 
 __all__ = [
     "Transport",
     "SerialTransport",
     "MockTransport",
+    "LineFramer",
     "ATProtocol",
     "URCHandler",
     "URCCallback",
+    "URCEventCallback",
+    "URCSubscription",
+    "URCMatch",
+    "URCWatch",
+    "URCDispatcher",
+    "OverflowPolicy",
+    "DispatcherStats",
+    "SubscriberStats",
+    "BaseModemCore",
     "ModemCore",
+    "AsyncATProtocol",
+    "AsyncModemCore",
+    "ModemPool",
+    "PooledModemCore",
+    "PoolStats",
 ]
@@ -0,0 +1,700 @@
+"""
+Asyncio modem core.
+
+Drives a transport from an asyncio event loop instead of a reader thread.
+The transport's file descriptor is registered with loop.add_reader(), so
+reading, command completion and URC delivery all happen on the loop thread.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncIterator, Optional, Union
+
+from .transport import Transport
+from .protocol import ATProtocol, CTRL_Z
+from .modem import BaseModemCore
+from ..exceptions import (
+    ATParseError,
+    ATTimeoutError,
+    DeviceDisconnectedError,
+    ModemNotStartedError,
+    error_from_result,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncATProtocol(ATProtocol):
+    """
+    AT command protocol handler for asyncio.
+
+    Shares response classification and post-processing with ATProtocol,
+    but serializes commands with an asyncio.Lock and completes them through
+    a future resolved by the event loop's reader callback.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        default_timeout: float = 1.0
+    ) -> None:
+        """
+        Initialize async AT protocol handler.
+
+        Args:
+            transport: Transport instance for communication
+            default_timeout: Default timeout for AT commands in seconds
+        """
+        super().__init__(transport, default_timeout=default_timeout)
+        self._async_lock = asyncio.Lock()
+        self._lock_owner: Optional[asyncio.Task] = None  # Task inside exclusive()
+        self._waiter: Optional[asyncio.Future] = None
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """
+        Hold the command lock across several commands.
+
+        Commands awaited by this task inside the block run back to back;
+        other tasks wait until the block ends. Nesting in the same task is
+        allowed (asyncio.Lock itself is not reentrant).
+
+        Example:
+
+        .. code-block:: python
+
+            async with protocol.exclusive():
+                await protocol.send_command("AT+CMMS=1")
+                for cmd, pdu in parts:
+                    await protocol.send_prompt_command(cmd, pdu)
+        """
+        task = asyncio.current_task()
+        if self._lock_owner is task:
+            yield
+            return
+
+        async with self._async_lock:
+            self._lock_owner = task
+            try:
+                yield
+            finally:
+                self._lock_owner = None
+
+    async def send_command(
+        self,
+        cmd: str = "AT",
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[str]:
+        """
+        Send an AT command and await the solicited response.
+
+        Args:
+            cmd: AT command to send (e.g., "AT+CSQ" or "+CSQ")
+            strip_ok: Remove "OK" from response lines
+            remove_cmd_prefix: Remove command prefix from first response line
+            timeout: Command timeout in seconds (uses default if None)
+
+        Returns:
+            List of response lines
+
+        Raises:
+            ATTimeoutError: If command times out
+            ATCommandError: If command returns an error result code
+            ATParseError: If write fails
+        """
+        async with self.exclusive():
+            cmd = self._begin_command(cmd)
+            await self._execute(cmd, timeout)
+            return self._finish_command(cmd, strip_ok, remove_cmd_prefix)
+
+    async def send_batch(
+        self,
+        cmds: list[str],
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[list[str]]:
+        """
+        Send several commands chained on one line and split the responses.
+
+        See ATProtocol.send_batch().
+
+        Args:
+            cmds: Commands to send (e.g., ["+CSQ", "+CREG?"])
+            remove_cmd_prefix: Remove the command prefix from the first line
+                               of each result
+            timeout: Timeout for the whole batch in seconds (uses default if None)
+
+        Returns:
+            One list of response lines per command, without the final OK
+
+        Raises:
+            ValueError: If cmds is empty
+            ATTimeoutError: If the batch times out
+            ATCommandError: If any command returns an error result code
+            ATParseError: If write fails
+        """
+        if not cmds:
+            raise ValueError("send_batch requires at least one command")
+
+        parts = [self._strip_at(cmd) for cmd in cmds]
+
+        async with self.exclusive():
+            line = self._begin_command("AT" + ";".join(parts))
+            await self._execute(line, timeout)
+            lines = self._finish_command(line, strip_ok=True, remove_cmd_prefix=False)
+            return self._split_batch(lines, remove_cmd_prefix)
+
+    async def send_prompt_command(
+        self,
+        cmd: str,
+        payload: bytes,
+        terminator: Optional[bytes] = CTRL_Z,
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        prompt_timeout: float = 5.0,
+        timeout: Optional[float] = None
+    ) -> list[str]:
+        """
+        Send a two-phase command: header, prompt, then payload.
+
+        See ATProtocol.send_prompt_command().
+
+        Args:
+            cmd: Command header (e.g., "AT+CMGS=23")
+            payload: Data to send after the prompt
+            terminator: Bytes written after the payload (default Ctrl+Z, None for none)
+            strip_ok: Remove "OK" from response lines
+            remove_cmd_prefix: Remove command prefix from first response line
+            prompt_timeout: Seconds to wait for the prompt
+            timeout: Seconds to wait for the final result (uses default if None)
+
+        Returns:
+            Response lines after the payload
+
+        Raises:
+            ATTimeoutError: If the prompt or the final result times out
+                (ESC is sent to cancel a pending prompt)
+            ATCommandError: If the command fails
+            ATParseError: If write fails or the command completes without a prompt
+        """
+        async with self.exclusive():
+            cmd = self._begin_command(cmd)
+            self._got_prompt = False
+            self._awaiting_prompt = True
+            try:
+                await self._execute(cmd, prompt_timeout)
+            except ATTimeoutError:
+                self._cancel_prompt(cmd)
+                raise
+            finally:
+                self._awaiting_prompt = False
+
+            if not self._got_prompt:
+                lines = self._finish_command(cmd, strip_ok, remove_cmd_prefix)
+                raise ATParseError(f"No prompt for {cmd.strip()}", command=cmd.strip(), response=lines)
+
+            self._resp_buffer = []
+            self._resp_done_event.clear()
+            data = payload + terminator if terminator else payload
+            await self._write_and_wait(data, timeout, cmd.strip())
+
+            return self._finish_command(cmd, strip_ok, remove_cmd_prefix)
+
+    async def stream_command(
+        self,
+        cmd: str,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Send an AT command and yield its response lines as they arrive.
+
+        See ATProtocol.stream_command(). The command lock is held until the
+        final result code; closing the iterator early discards the rest of
+        the response first.
+
+        Args:
+            cmd: AT command to send (e.g., 'AT+CMGL=4')
+            timeout: Maximum seconds to wait for each line (uses default if None)
+
+        Yields:
+            Response lines without echo and final result code
+
+        Raises:
+            ATTimeoutError: If no line arrives within timeout
+            ATCommandError: If the command ends with an error result code
+            ATParseError: If write fails
+        """
+        async with self.exclusive():
+            cmd = self._begin_command(cmd)
+            lines: "asyncio.Queue[Union[str, Exception]]" = asyncio.Queue()
+            timeout_val = timeout if timeout is not None else self.default_timeout
+            self._resp_stream = lines
+            try:
+                self.transport.reset_input_buffer()
+                started = time.monotonic()
+                if not self.transport.write(cmd.encode("utf-8")):
+                    raise ATParseError(f"Failed to write AT command: {cmd.strip()}")
+
+                first = True
+                while True:
+                    line = await self._next_streamed_line_async(lines, timeout_val, cmd)
+                    if first and line == self._sent_cmd:
+                        first = False
+                        continue  # Echo
+                    first = False
+                    if self.is_final_result(line):
+                        break
+                    try:
+                        yield line
+                    except GeneratorExit:
+                        while not self.is_final_result(line):
+                            line = await self._next_streamed_line_async(lines, timeout_val, cmd)
+                        raise
+            finally:
+                self._resp_stream = None
+
+            self.last_latency = time.monotonic() - started
+            if self.is_error_result(line):
+                logger.error(f"AT command {cmd.strip()} failed: {line}")
+                raise error_from_result(line, command=cmd.strip(), response=[line])
+
+    async def _next_streamed_line_async(
+        self,
+        lines: "asyncio.Queue[Union[str, Exception]]",
+        timeout: float,
+        cmd: str
+    ) -> str:
+        """
+        Await the next line of a streamed response.
+
+        Raises:
+            ATTimeoutError: If no line arrives within timeout
+        """
+        try:
+            line = await asyncio.wait_for(lines.get(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"AT command timed out: {cmd.strip()}")
+            raise ATTimeoutError(f"AT command timed out: {cmd.strip()}") from None
+        if isinstance(line, Exception):
+            raise line
+        return line
+
+    async def _execute(self, cmd: str, timeout: Optional[float]) -> None:
+        """
+        Write a prepared command and await its final result code.
+
+        Args:
+            cmd: Normalized command to write
+            timeout: Command timeout in seconds (uses default if None)
+
+        Raises:
+            ATTimeoutError: If command times out
+            ATParseError: If write fails
+        """
+        self.transport.reset_input_buffer()
+        await self._write_and_wait(cmd.encode("utf-8"), timeout, cmd.strip())
+
+    async def _write_and_wait(self, data: bytes, timeout: Optional[float], description: str) -> None:
+        """
+        Write raw bytes and await completion signalled by the reader.
+
+        Args:
+            data: Bytes to write
+            timeout: Timeout in seconds (uses default if None)
+            description: Command text for log and error messages
+
+        Raises:
+            ATTimeoutError: If no final result (or prompt) arrives in time
+            ATParseError: If write fails
+        """
+        self._waiter = asyncio.get_running_loop().create_future()
+
+        try:
+            started = time.monotonic()
+            written = self.transport.write(data)
+            if not written:
+                raise ATParseError(f"Failed to write AT command: {description}")
+
+            timeout_val = timeout if timeout is not None else self.default_timeout
+            try:
+                await asyncio.wait_for(self._waiter, timeout_val)
+            except asyncio.TimeoutError:
+                logger.error(f"AT command timed out: {description}")
+                raise ATTimeoutError(f"AT command timed out: {description}") from None
+
+            self.last_latency = time.monotonic() - started
+        finally:
+            self._waiter = None
+
+    def append_response_line(self, line: str) -> bool:
+        """
+        Append a line to the response buffer.
+
+        Resolves the pending command's future when the response completes.
+
+        Args:
+            line: Response line to append
+
+        Returns:
+            True if this completes the response (final result code received)
+        """
+        done = super().append_response_line(line)
+        if done and self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+        return done
+
+    def fail_pending(self, error: Exception) -> None:
+        """
+        Fail the in-flight command, if any.
+
+        Args:
+            error: Exception to raise in the waiting coroutine
+        """
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_exception(error)
+        if self._resp_stream is not None:
+            self._resp_stream.put_nowait(error)
+
+
+class AsyncModemCore(BaseModemCore):
+    """
+    Asyncio modem core.
+
+    Equivalent of ModemCore for asyncio applications. No threads are used:
+    the transport's descriptor is watched with loop.add_reader(), commands
+    are awaited, and URCs are delivered to callbacks on the loop or through
+    async iterators from urcs().
+
+    The transport must provide fileno() (SerialTransport does).
+
+    Example:
+
+    .. code-block:: python
+
+        core = AsyncModemCore(SerialTransport("/dev/ttyUSB2"))
+        await core.start()
+        response = await core.send_at("AT+CSQ", strip_ok=True)
+
+        async for urc in core.urcs("+CMTI"):
+            print(f"New SMS: {urc}")
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        timeout: float = 1.0,
+        log_urcs: bool = False,
+        max_urc_queue_size: int = 1000,
+        on_disconnect: Optional[callable] = None
+    ) -> None:
+        """
+        Initialize async modem core.
+
+        Args:
+            transport: Transport instance with a file descriptor
+            timeout: Default timeout for AT commands
+            log_urcs: Whether to log URCs at INFO level
+            max_urc_queue_size: Maximum URCs to queue
+            on_disconnect: Optional callback for disconnection events
+        """
+        super().__init__(
+            transport,
+            timeout=timeout,
+            log_urcs=log_urcs,
+            max_urc_queue_size=max_urc_queue_size,
+            on_disconnect=on_disconnect
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._fd: Optional[int] = None
+
+        # Queues of active urcs() iterators (fed by URC subscriptions)
+        self._urc_streams: list[asyncio.Queue] = []
+
+        # Error handling
+        self._consecutive_errors = 0
+        self._max_consecutive_errors = 5
+
+        logger.info("Initialized AsyncModemCore")
+
+    def _create_protocol(self, transport: Transport, timeout: float) -> AsyncATProtocol:
+        """Create the asyncio protocol handler."""
+        return AsyncATProtocol(transport, default_timeout=timeout)
+
+    async def start(self) -> None:
+        """
+        Start watching the transport on the running event loop.
+        """
+        if self._running:
+            logger.warning("AsyncModemCore already started")
+            return
+
+        self._disconnected = False
+        self._consecutive_errors = 0
+
+        self._loop = asyncio.get_running_loop()
+        self._fd = self.transport.fileno()
+        self._loop.add_reader(self._fd, self._on_readable)
+        self._running = True
+        logger.info("Started async modem reader")
+
+    async def stop(self) -> None:
+        """
+        Stop watching the transport.
+
+        Ends all active urcs() iterators.
+        """
+        if not self._running:
+            return
+
+        self._detach_reader()
+        self._close_streams()
+        logger.info("Stopped async modem reader")
+
+    async def close(self) -> None:
+        """
+        Close the modem connection.
+
+        Stops reading and closes the transport.
+        """
+        logger.info("Closing modem connection")
+        await self.stop()
+        self.transport.close()
+        logger.info("Modem connection closed")
+
+    def _detach_reader(self) -> None:
+        """Remove the descriptor from the event loop."""
+        if self._loop is not None and self._fd is not None:
+            self._loop.remove_reader(self._fd)
+        self._fd = None
+        self._running = False
+
+    def _on_readable(self) -> None:
+        """Event loop callback: read and route every available line."""
+        try:
+            lines = self.transport.read_lines(
+                block=False,
+                prompt=self.protocol.is_prompt_expected()
+            )
+            self._consecutive_errors = 0
+        except DeviceDisconnectedError as e:
+            logger.error("Device disconnected, stopping async reader")
+            self._detach_reader()
+            self._disconnected = True
+            self.protocol.fail_pending(e)
+            self._close_streams()
+
+            if self._on_disconnect:
+                self._on_disconnect(e)
+            return
+        except Exception as e:
+            self._consecutive_errors += 1
+            logger.error(f"Error in async reader ({self._consecutive_errors}/{self._max_consecutive_errors}): {e}")
+
+            if self._consecutive_errors >= self._max_consecutive_errors:
+                logger.error("Too many consecutive errors, stopping async reader")
+                self._detach_reader()
+                self.protocol.fail_pending(e)
+                self._close_streams()
+            return
+
+        for line in lines:
+            logger.debug(f"Reader received: {line}")
+            self._route_line(line)
+
+    @staticmethod
+    def _put_latest(queue: asyncio.Queue, item: Optional[str]) -> None:
+        """Put an item, dropping the oldest one if the queue is full."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    def _close_streams(self) -> None:
+        """Wake all urcs() iterators so they finish."""
+        for queue in self._urc_streams:
+            self._put_latest(queue, None)
+
+    async def urcs(self, prefix: str = "", maxsize: int = 100) -> AsyncIterator[str]:
+        """
+        Iterate over URCs matching a prefix as they arrive.
+
+        Iteration ends when the core stops or the device disconnects.
+        If the consumer falls behind by more than maxsize URCs, the oldest
+        unread ones are dropped.
+
+        Args:
+            prefix: URC prefix to match (empty string matches all URCs)
+            maxsize: Maximum URCs buffered for this iterator
+
+        Yields:
+            URC lines
+
+        Example:
+
+        .. code-block:: python
+
+            async for urc in core.urcs("+CMTI"):
+                storage, index = SMSParser.parse_cmti(urc)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        subscription = self.urc_handler.register_callback(
+            prefix, lambda line: self._put_latest(queue, line)
+        )
+        self._urc_streams.append(queue)
+
+        try:
+            while self._running:
+                line = await queue.get()
+                if line is None:
+                    return
+                yield line
+        finally:
+            subscription.unsubscribe()
+            self._urc_streams.remove(queue)
+
+    async def send_at(
+        self,
+        cmd: str,
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[str]:
+        """
+        Send an AT command.
+
+        Args:
+            cmd: AT command (e.g., "AT+CSQ" or "+CSQ")
+            strip_ok: Remove "OK" from response
+            remove_cmd_prefix: Remove command prefix from first line
+            timeout: Command timeout (uses default if None)
+
+        Returns:
+            List of response lines
+
+        Raises:
+            ModemNotStartedError: If start() has not been awaited
+            ATTimeoutError: If command times out
+            ATCommandError: If command returns an error result code
+        """
+        if not self._running:
+            raise ModemNotStartedError("AsyncModemCore is not started", command=cmd)
+
+        return await self.protocol.send_command(
+            cmd=cmd,
+            strip_ok=strip_ok,
+            remove_cmd_prefix=remove_cmd_prefix,
+            timeout=timeout
+        )
+
+    def stream_at(self, cmd: str, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        Send an AT command and yield response lines as they arrive.
+
+        Args:
+            cmd: AT command (e.g., 'AT+CMGL=4')
+            timeout: Maximum seconds to wait for each line (uses default if None)
+
+        Returns:
+            Async iterator over the response lines (see AsyncATProtocol.stream_command)
+
+        Raises:
+            ModemNotStartedError: If start() has not been awaited
+        """
+        if not self._running:
+            raise ModemNotStartedError("AsyncModemCore is not started", command=cmd)
+
+        return self.protocol.stream_command(cmd, timeout=timeout)
+
+    async def send_batch(
+        self,
+        cmds: list[str],
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[list[str]]:
+        """
+        Send several commands in one round trip.
+
+        See ModemCore.send_batch().
+
+        Args:
+            cmds: Commands to send (e.g., ["+CSQ", "+CREG?"])
+            remove_cmd_prefix: Remove the command prefix from each result's first line
+            timeout: Timeout for the whole batch (uses default if None)
+
+        Returns:
+            One list of response lines per command
+
+        Raises:
+            ModemNotStartedError: If start() has not been awaited
+            ATTimeoutError: If the batch times out
+            ATCommandError: If any command returns an error result code
+        """
+        if not self._running:
+            raise ModemNotStartedError("AsyncModemCore is not started", command=";".join(cmds))
+
+        return await self.protocol.send_batch(
+            cmds,
+            remove_cmd_prefix=remove_cmd_prefix,
+            timeout=timeout
+        )
+
+    def exclusive(self) -> AbstractAsyncContextManager:
+        """
+        Keep other tasks' commands out while a sequence of commands runs.
+
+        Example:
+
+        .. code-block:: python
+
+            async with modem.exclusive():
+                await modem.send_at("AT+CMMS=1")
+                await modem.send_prompt_command(cmd, pdu)
+        """
+        return self.protocol.exclusive()
+
+    async def send_prompt_command(
+        self,
+        cmd: str,
+        payload: bytes,
+        terminator: Optional[bytes] = CTRL_Z,
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        prompt_timeout: float = 5.0,
+        timeout: Optional[float] = None
+    ) -> list[str]:
+        """
+        Send a two-phase (prompt) command.
+
+        See ModemCore.send_prompt_command().
+
+        Raises:
+            ModemNotStartedError: If start() has not been awaited
+            ATTimeoutError: If the prompt or the final result times out
+                (ESC is sent to cancel a pending prompt)
+            ATCommandError: If the command fails
+        """
+        if not self._running:
+            raise ModemNotStartedError("AsyncModemCore is not started", command=cmd)
+
+        return await self.protocol.send_prompt_command(
+            cmd,
+            payload,
+            terminator=terminator,
+            strip_ok=strip_ok,
+            remove_cmd_prefix=remove_cmd_prefix,
+            prompt_timeout=prompt_timeout,
+            timeout=timeout
+        )
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        if not self._running:
+            await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        """Async context manager exit."""
+        await self.close()
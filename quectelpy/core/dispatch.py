@@ -0,0 +1,345 @@
+"""
+Off-reader-thread execution of URC callbacks.
+
+By default URC callbacks run on the thread that reads the modem, so a slow
+callback delays every line behind it, including solicited responses. A
+URCDispatcher moves callbacks onto a small pool of worker threads with one
+bounded queue per subscription.
+"""
+
+import logging
+import threading
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Deque, Optional
+
+if TYPE_CHECKING:
+    from .urc import URCSubscription
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    """What a URCDispatcher does when a subscription's queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued URC
+    BLOCK = "block"              # Make the reader wait for room
+    COALESCE = "coalesce"        # Replace a queued URC of the same type, else drop oldest
+
+
+@dataclass
+class DispatcherStats:
+    """Counters for a URCDispatcher."""
+    submitted: int = 0   # URCs handed to the dispatcher
+    delivered: int = 0   # Callback invocations completed (including failed ones)
+    dropped: int = 0     # URCs discarded because a queue was full
+    coalesced: int = 0   # Queued URCs replaced by a newer one of the same type
+    blocked: int = 0     # Times the reader waited for queue room (BLOCK)
+    depth: int = 0       # URCs currently queued across all subscriptions
+    max_depth: int = 0   # Highest depth seen
+
+
+@dataclass
+class SubscriberStats:
+    """Counters for one subscription's queue."""
+    depth: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
+class _SubscriberQueue:
+    """Pending URCs for one subscription."""
+
+    __slots__ = ("prefix", "callback", "lines", "inflight", "scheduled", "stats")
+
+    def __init__(self, prefix: str, callback) -> None:
+        self.prefix = prefix
+        self.callback = callback
+        self.lines: Deque[str] = deque()
+        self.inflight = 0  # Lines taken by a worker and not yet delivered
+        self.scheduled = False  # Queued on the ready list or held by a worker
+        self.stats = SubscriberStats()
+
+    def held(self) -> int:
+        """URCs queued or being delivered, counted against max_queue_size."""
+        return len(self.lines) + self.inflight
+
+
+class URCDispatcher:
+    """
+    Runs URC callbacks on worker threads instead of the reader.
+
+    Each subscription gets its own bounded queue, so one slow callback only
+    backs up its own URCs. Callbacks of one subscription always run in
+    order and never concurrently; different subscriptions run in parallel
+    on up to ``workers`` threads. Workers start on the first URC.
+
+    When a queue is full, ``policy`` decides what happens:
+
+    - ``DROP_OLDEST``: the oldest queued URC is discarded
+    - ``BLOCK``: the reader waits for room (at most ``block_timeout``
+      seconds, then the new URC is dropped). Solicited responses wait too.
+    - ``COALESCE``: a queued URC with the same prefix (text before ":") is
+      replaced by the new one, which suits state reports like +CREG or
+      +QIND: "csq"; otherwise the oldest is discarded
+
+    A dispatcher can be shared by several modems and is not closed with
+    them; close it (or use it as a context manager) to drain and stop the
+    workers.
+
+    Example:
+
+    .. code-block:: python
+
+        with URCDispatcher(workers=2, max_queue_size=100) as dispatcher:
+            modem = QuectelModem(port="/dev/ttyUSB2", urc_dispatcher=dispatcher)
+            modem.register_urc_callback("+CMTI", store_in_database)
+            ...
+            print(dispatcher.stats)
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        max_queue_size: int = 100,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout: Optional[float] = None
+    ) -> None:
+        """
+        Initialize URC dispatcher.
+
+        Args:
+            workers: Number of worker threads
+            max_queue_size: Maximum URCs held per subscription, queued or
+                            being delivered
+            policy: What to do when a subscription's queue is full
+            block_timeout: Longest the reader waits for room under BLOCK
+                           (None waits until room is made)
+
+        Raises:
+            ValueError: If workers or max_queue_size is less than 1
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+        # Workers take at most half a queue at a time, so a full queue
+        # still has queued URCs for DROP_OLDEST and COALESCE to discard
+        self._batch_size = max(1, max_queue_size // 2)
+
+        self._cond = threading.Condition()
+        self._queues: "weakref.WeakKeyDictionary[URCSubscription, _SubscriberQueue]" = weakref.WeakKeyDictionary()
+        self._ready: Deque[_SubscriberQueue] = deque()
+        self._threads: list[threading.Thread] = []
+        self._running = False
+        self._closed = False
+        self.stats = DispatcherStats()
+
+        logger.info(f"Initialized URC dispatcher (workers={workers}, policy={policy.value})")
+
+    def submit(self, subscription: "URCSubscription", line: str) -> None:
+        """
+        Queue a URC for one subscription's callback.
+
+        Called by URCHandler on the reader thread.
+
+        Args:
+            subscription: Subscription whose callback should receive the URC
+            line: URC line
+        """
+        with self._cond:
+            if self._closed:
+                logger.warning(f"URC dispatcher closed, dropping: {line}")
+                self.stats.dropped += 1
+                return
+            if not self._running:
+                self._start_workers()
+
+            queue = self._queues.get(subscription)
+            if queue is None:
+                queue = _SubscriberQueue(subscription.prefix, subscription.callback)
+                self._queues[subscription] = queue
+
+            self.stats.submitted += 1
+            if queue.held() >= self.max_queue_size and not self._make_room(queue, line):
+                return
+
+            queue.lines.append(line)
+            queue.stats.depth += 1
+            self.stats.depth += 1
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+
+            if not queue.scheduled:
+                queue.scheduled = True
+                self._ready.append(queue)
+                self._cond.notify()
+
+    def _make_room(self, queue: _SubscriberQueue, line: str) -> bool:
+        """
+        Apply the overflow policy to a full queue. Called with the lock held.
+
+        Returns:
+            True if the new line should be queued, False if it was dropped
+        """
+        if self.policy is OverflowPolicy.BLOCK:
+            self.stats.blocked += 1
+            has_room = self._cond.wait_for(
+                lambda: queue.held() < self.max_queue_size or self._closed,
+                timeout=self.block_timeout
+            )
+            if has_room and not self._closed:
+                return True
+            logger.warning(f"URC queue for '{queue.prefix}' still full, dropping: {line}")
+            queue.stats.dropped += 1
+            self.stats.dropped += 1
+            return False
+
+        if not queue.lines:
+            # Everything held is being delivered; only the new URC can go
+            logger.warning(f"URC queue for '{queue.prefix}' full, dropping: {line}")
+            queue.stats.dropped += 1
+            self.stats.dropped += 1
+            return False
+
+        if self.policy is OverflowPolicy.COALESCE:
+            key = line.split(":", 1)[0]
+            for i in range(len(queue.lines) - 1, -1, -1):
+                if queue.lines[i].split(":", 1)[0] == key:
+                    del queue.lines[i]
+                    queue.stats.coalesced += 1
+                    self.stats.coalesced += 1
+                    break
+            else:
+                queue.lines.popleft()
+                queue.stats.dropped += 1
+                self.stats.dropped += 1
+        else:
+            queue.lines.popleft()
+            queue.stats.dropped += 1
+            self.stats.dropped += 1
+
+        queue.stats.depth -= 1
+        self.stats.depth -= 1
+        return True
+
+    def subscriber_stats(self, subscription: "URCSubscription") -> SubscriberStats:
+        """
+        Get the counters for one subscription's queue.
+
+        Args:
+            subscription: Subscription handle
+
+        Returns:
+            Copy of the subscription's counters (all zero if it never
+            received a URC)
+        """
+        with self._cond:
+            queue = self._queues.get(subscription)
+            if queue is None:
+                return SubscriberStats()
+            return SubscriberStats(**vars(queue.stats))
+
+    def _start_workers(self) -> None:
+        """Start the worker threads. Called with the lock held."""
+        self._running = True
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker,
+                daemon=True,
+                name=f"URCDispatcher-{i}"
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.debug(f"Started {self.workers} URC dispatcher workers")
+
+    def _worker(self) -> None:
+        """Worker thread: run queued callbacks one subscription at a time."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._ready or not self._running)
+                if not self._ready:
+                    return
+
+                queue = self._ready.popleft()
+                lines = [queue.lines.popleft() for _ in range(min(len(queue.lines), self._batch_size))]
+                queue.inflight = len(lines)
+                queue.stats.depth -= len(lines)
+                self.stats.depth -= len(lines)
+
+            for line in lines:
+                try:
+                    queue.callback(line)
+                except Exception as e:
+                    logger.error(f"URC callback for '{queue.prefix}' failed: {e}", exc_info=True)
+
+            with self._cond:
+                queue.inflight = 0
+                queue.stats.delivered += len(lines)
+                self.stats.delivered += len(lines)
+                if queue.lines:
+                    self._ready.append(queue)
+                else:
+                    queue.scheduled = False
+                # Room was made: wake a reader blocked in submit() (and a worker)
+                self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued URC has been delivered.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if all queues are empty, False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._ready and not any(q.scheduled for q in self._queues.values()),
+                timeout=timeout
+            )
+
+    def close(self, timeout: float = 1.0) -> None:
+        """
+        Deliver queued URCs and stop the workers.
+
+        URCs submitted after close() are dropped.
+
+        Args:
+            timeout: Maximum seconds to wait for each worker
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._running = False
+            self._cond.notify_all()
+
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning(f"{thread.name} did not terminate in time")
+        self._threads.clear()
+        logger.info("Closed URC dispatcher")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the dispatcher."""
+        return (
+            f"<URCDispatcher workers={self.workers} policy={self.policy.value} "
+            f"depth={self.stats.depth} dropped={self.stats.dropped}>"
+        )
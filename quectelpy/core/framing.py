@@ -0,0 +1,145 @@
+"""
+Line framing for byte streams.
+
+Splits raw modem output into lines without per-byte reads.
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LineFramer:
+    """
+    Incremental line framer over a reusable byte buffer.
+
+    Raw chunks are appended with feed(). Complete lines are split out in one
+    pass (a single decode for all of them), and any partial trailing line is
+    kept in the buffer until the rest of it arrives.
+
+    Example:
+
+    .. code-block:: python
+
+        framer = LineFramer()
+        framer.feed(b"+CSQ: 24,99\\r\\nOK\\r\\n+CRE")
+        framer.lines()  # ["+CSQ: 24,99", "OK"]
+        framer.feed(b"G: 1\\r\\n")
+        framer.lines()  # ["+CREG: 1"]
+    """
+
+    def __init__(
+        self,
+        terminator: bytes = b"\r\n",
+        max_buffer_size: int = 65536
+    ) -> None:
+        """
+        Initialize line framer.
+
+        Args:
+            terminator: Line terminator
+            max_buffer_size: Maximum size of an unterminated tail before it is
+                             discarded (protects against line noise)
+        """
+        self.terminator = terminator
+        self._text_terminator = terminator.decode("ascii")
+        self._max_buffer_size = max_buffer_size
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        """
+        Append raw bytes to the buffer.
+
+        Args:
+            data: Bytes read from the transport
+        """
+        self._buffer += data
+
+        if len(self._buffer) > self._max_buffer_size and self.terminator not in self._buffer:
+            logger.warning(f"Discarding {len(self._buffer)} bytes of unterminated input")
+            self._buffer.clear()
+
+    def lines(self) -> list[str]:
+        """
+        Split out all complete lines currently buffered.
+
+        Lines are decoded as UTF-8 (invalid bytes ignored) and stripped;
+        empty lines are dropped.
+
+        Returns:
+            Complete lines in arrival order (may be empty)
+        """
+        end = self._buffer.rfind(self.terminator)
+        if end < 0:
+            return []
+        end += len(self.terminator)
+
+        with memoryview(self._buffer) as view:
+            text = str(view[:end], "utf-8", "ignore")
+        del self._buffer[:end]
+
+        return [
+            line for line in (part.strip() for part in text.split(self._text_terminator))
+            if line
+        ]
+
+    def take_until(self, terminator: bytes) -> Optional[bytes]:
+        """
+        Remove and return buffered bytes up to and including a terminator.
+
+        Args:
+            terminator: Byte sequence to search for
+
+        Returns:
+            Bytes including the terminator, or None if it is not buffered yet
+        """
+        pos = self._buffer.find(terminator)
+        if pos < 0:
+            return None
+        end = pos + len(terminator)
+        data = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return data
+
+    def take_prompt(self, prompt: bytes = b">") -> bool:
+        """
+        Consume an unterminated prompt if it is all that is buffered.
+
+        Modems send the data entry prompt as "\\r\\n> " with no trailing
+        line terminator, so lines() never returns it.
+
+        Args:
+            prompt: Prompt bytes, compared after stripping whitespace
+
+        Returns:
+            True if the prompt was buffered (and has been removed)
+        """
+        if self._buffer.strip() != prompt:
+            return False
+        self._buffer.clear()
+        return True
+
+    def take_all(self) -> bytes:
+        """
+        Remove and return everything buffered, including a partial line.
+
+        Returns:
+            Buffered bytes
+        """
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+    def pending(self) -> int:
+        """
+        Get number of buffered bytes not yet returned.
+
+        Returns:
+            Buffered byte count
+        """
+        return len(self._buffer)
+
+    def clear(self) -> None:
+        """Discard all buffered bytes."""
+        self._buffer.clear()
@@ -7,17 +7,200 @@ This is the foundation that feature managers build upon.
 import logging
 import threading
 import time
-from typing import Optional
+from contextlib import AbstractContextManager
+from typing import Generator, Iterator, Optional, Union
 
 from .transport import Transport
-from .protocol import ATProtocol
-from .urc import URCHandler, URCCallback
+from .protocol import ATProtocol, CTRL_Z
+from .urc import URCHandler, URCCallback, URCEventCallback, URCMatch, URCSubscription, URCWatch
+from .dispatch import URCDispatcher
 from ..exceptions import DeviceDisconnectedError
 
 logger = logging.getLogger(__name__)
 
 
-class ModemCore:
+class BaseModemCore:
+    """
+    State and line routing shared by all modem cores.
+
+    Owns the protocol handler and URC handler and decides where each
+    received line goes. Subclasses supply the I/O model: ModemCore uses a
+    reader thread, AsyncModemCore an asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        timeout: float = 1.0,
+        log_urcs: bool = False,
+        max_urc_queue_size: int = 1000,
+        on_disconnect: Optional[callable] = None,
+        urc_dispatcher: Optional[URCDispatcher] = None
+    ) -> None:
+        """
+        Initialize modem core.
+
+        Args:
+            transport: Transport instance for communication
+            timeout: Default timeout for AT commands
+            log_urcs: Whether to log URCs at INFO level
+            max_urc_queue_size: Maximum URCs to queue
+            on_disconnect: Optional callback for disconnection events
+            urc_dispatcher: Run URC callbacks on this dispatcher's worker
+                            threads instead of the reader
+        """
+        self.transport = transport
+        self.protocol = self._create_protocol(transport, timeout)
+        self.urc_handler = URCHandler(
+            max_queue_size=max_urc_queue_size,
+            log_urcs=log_urcs,
+            dispatcher=urc_dispatcher
+        )
+
+        self._running = False
+        self._on_disconnect = on_disconnect
+        self._disconnected = False
+
+        # Multi-line URC being assembled and lines still expected
+        self._urc_lines: list[str] = []
+        self._urc_remaining = 0
+
+    def _create_protocol(self, transport: Transport, timeout: float) -> ATProtocol:
+        """Create the protocol handler used by this core."""
+        return ATProtocol(transport, default_timeout=timeout)
+
+    def _route_line(self, line: str) -> None:
+        """
+        Route a line to either protocol or URC handler.
+
+        Continuation lines of a multi-line URC are collected before any
+        other classification.
+
+        Args:
+            line: Line to route
+        """
+        if self._urc_remaining:
+            if not (self.protocol.is_response_pending() and self.protocol.is_final_result(line)):
+                self._continue_urc(line)
+                return
+            # A command's final result: the URC lost its continuation lines
+            logger.warning(f"Incomplete multi-line URC: {self._urc_lines[0]}")
+            self._flush_urc()
+
+        # If we're waiting for a command response
+        if self.protocol.is_response_pending():
+            # Check if this is a URC or solicited response
+            if self.protocol.is_urc(line):
+                # It's a URC - send to URC handler
+                self._handle_urc(line)
+            else:
+                # It's part of the solicited response
+                self.protocol.append_response_line(line)
+        else:
+            # No pending command, everything is a URC
+            self._handle_urc(line)
+
+    def _handle_urc(self, line: str) -> None:
+        """
+        Deliver a URC line, or start assembling a multi-line URC.
+
+        Args:
+            line: URC line
+        """
+        remaining = self.urc_handler.continuation_lines(line)
+        if remaining:
+            self._urc_lines = [line]
+            self._urc_remaining = remaining
+            return
+
+        self.urc_handler.handle_urc(line)
+
+    def _continue_urc(self, line: str) -> None:
+        """Add a continuation line; deliver the URC once complete."""
+        self._urc_lines.append(line)
+        self._urc_remaining -= 1
+        if not self._urc_remaining:
+            self._flush_urc()
+
+    def _flush_urc(self) -> None:
+        """Deliver the assembled multi-line URC."""
+        lines = self._urc_lines
+        self._urc_lines = []
+        self._urc_remaining = 0
+        self.urc_handler.handle_urc("\n".join(lines))
+
+    def register_urc_callback(self, prefix: str, callback: URCCallback) -> URCSubscription:
+        """
+        Register a callback for URCs matching a prefix.
+
+        Args:
+            prefix: URC prefix to match (e.g., "+CMTI")
+            callback: Function to call when URC is received
+
+        Returns:
+            Subscription handle (other callbacks for the prefix are kept)
+
+        Example:
+
+        .. code-block:: python
+
+            sub = modem.register_urc_callback("+CMTI", lambda line: print(f"SMS: {line}"))
+        """
+        return self.urc_handler.register_callback(prefix, callback)
+
+    def register_event_callback(self, prefix: str, callback: URCEventCallback) -> URCSubscription:
+        """
+        Register a callback that receives typed URC events.
+
+        Args:
+            prefix: URC prefix to match (e.g., "+CMTI")
+            callback: Function to call with the decoded event
+
+        Returns:
+            Subscription handle
+
+        Example:
+
+        .. code-block:: python
+
+            modem.register_event_callback("+CMTI", lambda event: print(event.index))
+        """
+        return self.urc_handler.register_event_callback(prefix, callback)
+
+    def unregister_urc_callback(self, target: Union[str, URCSubscription]) -> bool:
+        """
+        Unregister URC callbacks.
+
+        Args:
+            target: Subscription handle, or a prefix to remove all its callbacks
+
+        Returns:
+            True if a callback was removed
+        """
+        return self.urc_handler.unregister_callback(target)
+
+    def is_running(self) -> bool:
+        """
+        Check if the core is reading from the transport.
+
+        Returns:
+            True if running
+        """
+        return self._running
+
+    def is_disconnected(self) -> bool:
+        """
+        Check if the device was disconnected during operation.
+
+        This typically indicates a physical disconnection or USB port issue.
+
+        Returns:
+            True if device was disconnected, False otherwise
+        """
+        return self._disconnected
+
+
+class ModemCore(BaseModemCore):
     """
     Core modem functionality.
 
@@ -36,7 +219,8 @@ class ModemCore:
         timeout: float = 1.0,
         log_urcs: bool = False,
         max_urc_queue_size: int = 1000,
-        on_disconnect: Optional[callable] = None
+        on_disconnect: Optional[callable] = None,
+        urc_dispatcher: Optional[URCDispatcher] = None
     ) -> None:
         """
         Initialize modem core.
@@ -47,24 +231,25 @@ class ModemCore:
             log_urcs: Whether to log URCs at INFO level
             max_urc_queue_size: Maximum URCs to queue
             on_disconnect: Optional callback for disconnection events
+            urc_dispatcher: Run URC callbacks on this dispatcher's worker
+                            threads instead of the reader
         """
-        self.transport = transport
-        self.protocol = ATProtocol(transport, default_timeout=timeout)
-        self.urc_handler = URCHandler(
-            max_queue_size=max_urc_queue_size,
-            log_urcs=log_urcs
+        super().__init__(
+            transport,
+            timeout=timeout,
+            log_urcs=log_urcs,
+            max_urc_queue_size=max_urc_queue_size,
+            on_disconnect=on_disconnect,
+            urc_dispatcher=urc_dispatcher
         )
 
         # Reader thread management
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._running = False
-        self._on_disconnect = on_disconnect
 
         # Error handling
         self._consecutive_errors = 0
         self._max_consecutive_errors = 5
-        self._disconnected = False
 
         logger.info("Initialized ModemCore")
 
@@ -75,6 +260,12 @@ class ModemCore:
         The reader thread continuously reads from the transport and routes
         lines to either the protocol (for solicited responses) or URC handler
         (for unsolicited result codes).
+
+        On the first start, input the transport buffered before the reader
+        ran (boot output, replies to commands sent by a previous program)
+        is discarded: a stale final result read just as the first command
+        begins would otherwise be taken as its response. Restarting after
+        stop() keeps buffered input.
         """
         if self._running:
             logger.warning("ModemCore already started")
@@ -84,6 +275,11 @@ class ModemCore:
         self._disconnected = False
         self._consecutive_errors = 0
 
+        if self._reader_thread is None:
+            # Whatever arrived before the first start is stale, not a response
+            # (before, it was read and routed as URCs)
+            self.transport.reset_input_buffer()
+
         self._stop_event.clear()
         self._reader_thread = threading.Thread(
             target=self._reader_loop,
@@ -112,6 +308,7 @@ class ModemCore:
                 logger.warning("Reader thread did not terminate in time")
 
         self._running = False
+        self.urc_handler.cancel_waiters()
         logger.info("Stopped modem reader thread")
 
     def close(self) -> None:
@@ -125,10 +322,63 @@ class ModemCore:
         self.transport.close()
         logger.info("Modem connection closed")
 
+    def exclusive(self) -> AbstractContextManager:
+        """
+        Keep other threads' commands out while a sequence of commands runs.
+
+        Example:
+
+        .. code-block:: python
+
+            with modem.exclusive():
+                modem.send_at("AT+CMMS=1")
+                modem.send_prompt_command(cmd, pdu)
+        """
+        return self.protocol.exclusive()
+
+    def wait_for_urc(self, match: URCMatch, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Block until a matching URC arrives.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Matching URC line, or None on timeout or when the core stops
+        """
+        return self.urc_handler.wait_for_urc(match, timeout)
+
+    def iter_urcs(self, match: URCMatch, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Iterate over matching URCs as they arrive.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+            timeout: Stop after this many seconds without a matching URC
+
+        Yields:
+            Matching URC lines until timeout or until the core stops
+        """
+        return self.urc_handler.iter_urcs(match, timeout)
+
+    def watch_urcs(self, match: URCMatch) -> URCWatch:
+        """
+        Start collecting matching URCs now, to wait for them later.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+
+        Returns:
+            URCWatch (use as a context manager)
+        """
+        return self.urc_handler.watch(match)
+
     def _reader_loop(self) -> None:
         """
         Continuously read lines from the modem.
 
+        Lines are read in batches via transport.read_lines().
         Classifies each line as either:
         - Solicited response (part of AT command response)
         - URC (unsolicited result code)
@@ -139,31 +389,24 @@ class ModemCore:
 
         while not self._stop_event.is_set():
             try:
-                # Read next line from transport
-                line_bytes = self.transport.read_until(b"\r\n")
+                # Read every complete line currently available
+                lines = self.transport.read_lines(prompt=self.protocol.is_prompt_expected())
 
                 # Reset error counter on successful read
                 self._consecutive_errors = 0
 
-                if not line_bytes:
-                    continue
-
-                # Decode and clean up line
-                line = line_bytes.decode("utf-8", errors="ignore").strip()
-
-                if not line:
-                    continue
+                for line in lines:
+                    logger.debug(f"Reader received: {line}")
 
-                logger.debug(f"Reader received: {line}")
-
-                # Route line based on context
-                self._route_line(line)
+                    # Route line based on context
+                    self._route_line(line)
 
             except DeviceDisconnectedError as e:
                 # Device is actually disconnected - stop the reader thread
                 logger.error("Device disconnected, stopping reader thread")
                 self._running = False
                 self._disconnected = True
+                self.urc_handler.cancel_waiters()
 
                 # Call disconnect callback if provided
                 if self._on_disconnect:
@@ -178,6 +421,7 @@ class ModemCore:
                 if self._consecutive_errors >= self._max_consecutive_errors:
                     logger.error(f"Too many consecutive errors ({self._consecutive_errors}), stopping reader thread")
                     self._running = False
+                    self.urc_handler.cancel_waiters()
                     break
 
                 # Exponential backoff: 0.1s, 0.2s, 0.4s, 0.8s, 1.6s
@@ -186,54 +430,6 @@ class ModemCore:
 
         logger.debug("Reader thread stopped")
 
-    def _route_line(self, line: str) -> None:
-        """
-        Route a line to either protocol or URC handler.
-
-        Args:
-            line: Line to route
-        """
-        # If we're waiting for a command response
-        if self.protocol.is_response_pending():
-            # Check if this is a URC or solicited response
-            if self.protocol.is_urc(line):
-                # It's a URC - send to URC handler
-                self.urc_handler.handle_urc(line)
-            else:
-                # It's part of the solicited response
-                self.protocol.append_response_line(line)
-        else:
-            # No pending command, everything is a URC
-            self.urc_handler.handle_urc(line)
-
-    def register_urc_callback(self, prefix: str, callback: URCCallback) -> None:
-        """
-        Register a callback for URCs matching a prefix.
-
-        Args:
-            prefix: URC prefix to match (e.g., "+CMTI")
-            callback: Function to call when URC is received
-
-        Example:
-
-        .. code-block:: python
-
-            modem.register_urc_callback("+CMTI", lambda line: print(f"SMS: {line}"))
-        """
-        self.urc_handler.register_callback(prefix, callback)
-
-    def unregister_urc_callback(self, prefix: str) -> bool:
-        """
-        Unregister a URC callback.
-
-        Args:
-            prefix: URC prefix to unregister
-
-        Returns:
-            True if callback was removed
-        """
-        return self.urc_handler.unregister_callback(prefix)
-
     def send_at(
         self,
         cmd: str,
@@ -257,7 +453,7 @@ class ModemCore:
 
         Raises:
             ATTimeoutError: If command times out
-            EC25Error: If command returns ERROR
+            ATCommandError: If command returns an error result code
         """
         return self.protocol.send_command(
             cmd=cmd,
@@ -266,25 +462,99 @@ class ModemCore:
             timeout=timeout
         )
 
-    def is_running(self) -> bool:
+    def stream_at(
+        self,
+        cmd: str,
+        timeout: Optional[float] = None
+    ) -> Generator[str, None, str]:
         """
-        Check if the reader thread is running.
+        Send an AT command and yield response lines as they arrive.
+
+        This is a convenience wrapper around protocol.stream_command().
+
+        Args:
+            cmd: AT command (e.g., 'AT+CMGL=4')
+            timeout: Maximum seconds to wait for each line (uses default if None)
+
+        Yields:
+            Response lines without echo and final result code
+
+        Raises:
+            ATTimeoutError: If no line arrives in time
+            ATCommandError: If command returns an error result code (after
+                            all other lines were yielded)
+        """
+        return self.protocol.stream_command(cmd, timeout=timeout)
+
+    def send_batch(
+        self,
+        cmds: list[str],
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[list[str]]:
+        """
+        Send several commands in one round trip.
+
+        This is a convenience wrapper around protocol.send_batch().
+
+        Args:
+            cmds: Commands to send (e.g., ["+CSQ", "+CREG?", "+COPS?"])
+            remove_cmd_prefix: Remove the command prefix from each result's first line
+            timeout: Timeout for the whole batch (uses default if None)
 
         Returns:
-            True if running
+            One list of response lines per command, without the final OK
+
+        Raises:
+            ATTimeoutError: If the batch times out
+            ATCommandError: If any command returns an error result code
         """
-        return self._running
+        return self.protocol.send_batch(
+            cmds,
+            remove_cmd_prefix=remove_cmd_prefix,
+            timeout=timeout
+        )
 
-    def is_disconnected(self) -> bool:
+    def send_prompt_command(
+        self,
+        cmd: str,
+        payload: bytes,
+        terminator: Optional[bytes] = CTRL_Z,
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        prompt_timeout: float = 5.0,
+        timeout: Optional[float] = None
+    ) -> list[str]:
         """
-        Check if the device was disconnected during operation.
+        Send a two-phase (prompt) command such as AT+CMGS or AT+QISEND.
 
-        This typically indicates a physical disconnection or USB port issue.
+        This is a convenience wrapper around protocol.send_prompt_command().
+
+        Args:
+            cmd: Command header (e.g., "AT+CMGS=23")
+            payload: Data to send after the "> " prompt
+            terminator: Bytes written after the payload (default Ctrl+Z, None for none)
+            strip_ok: Remove "OK" from response
+            remove_cmd_prefix: Remove command prefix from first line
+            prompt_timeout: Seconds to wait for the prompt
+            timeout: Seconds to wait for the final result (uses default if None)
 
         Returns:
-            True if device was disconnected, False otherwise
+            Response lines after the payload
+
+        Raises:
+            ATTimeoutError: If the prompt or the final result times out
+            ATCommandError: If the command fails
         """
-        return self._disconnected
+        return self.protocol.send_prompt_command(
+            cmd,
+            payload,
+            terminator=terminator,
+            strip_ok=strip_ok,
+            remove_cmd_prefix=remove_cmd_prefix,
+            prompt_timeout=prompt_timeout,
+            timeout=timeout
+        )
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,366 @@
+"""
+Single-thread multiplexer for many modems.
+
+A ModemPool watches the transports of many modems with one selector
+(epoll on Linux) instead of running a reader thread per modem.
+"""
+
+import logging
+import os
+import selectors
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .transport import Transport, SerialTransport
+from .modem import ModemCore
+from .dispatch import URCDispatcher
+from ..exceptions import DeviceDisconnectedError
+
+if TYPE_CHECKING:
+    from ..modem import QuectelModem
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStats:
+    """Counters for a ModemPool's selector thread."""
+    modems: int = 0         # Modems currently registered
+    wakeups: int = 0        # Selector wakeups (each select() return)
+    lines: int = 0          # Lines read and routed
+    cpu_time: float = 0.0   # CPU seconds used by the selector thread
+
+
+class PooledModemCore(ModemCore):
+    """
+    ModemCore driven by a ModemPool.
+
+    start() registers the transport with the pool's selector instead of
+    starting a reader thread. Commands, URC handling and feature managers
+    work exactly as with ModemCore; URC callbacks run on the pool thread.
+    """
+
+    def __init__(self, pool: "ModemPool", transport: Transport, **kwargs) -> None:
+        """
+        Initialize pooled modem core.
+
+        Args:
+            pool: Pool whose selector thread reads this modem
+            transport: Transport with a file descriptor
+            **kwargs: ModemCore options (timeout, log_urcs, ...)
+        """
+        super().__init__(transport, **kwargs)
+        self._pool = pool
+        self._fd: Optional[int] = None
+
+    def start(self) -> None:
+        """Register with the pool's selector."""
+        if self._running:
+            logger.warning("PooledModemCore already started")
+            return
+
+        self._disconnected = False
+        self._consecutive_errors = 0
+        self._pool._register(self)
+        self._running = True
+
+    def stop(self) -> None:
+        """Unregister from the pool's selector."""
+        if not self._running:
+            return
+
+        self._pool._unregister(self)
+        self._running = False
+        self.urc_handler.cancel_waiters()
+
+    def _on_readable(self) -> int:
+        """
+        Pool callback: read and route every available line.
+
+        Returns:
+            Number of lines routed
+        """
+        try:
+            lines = self.transport.read_lines(
+                block=False,
+                prompt=self.protocol.is_prompt_expected()
+            )
+            self._consecutive_errors = 0
+        except DeviceDisconnectedError as e:
+            logger.error("Device disconnected, removing modem from pool")
+            self.stop()
+            self._disconnected = True
+
+            if self._on_disconnect:
+                self._on_disconnect(e)
+            return 0
+        except Exception as e:
+            self._consecutive_errors += 1
+            logger.error(f"Error reading pooled modem ({self._consecutive_errors}/{self._max_consecutive_errors}): {e}")
+
+            if self._consecutive_errors >= self._max_consecutive_errors:
+                logger.error("Too many consecutive errors, removing modem from pool")
+                self.stop()
+            return 0
+
+        for line in lines:
+            logger.debug(f"Reader received: {line}")
+            self._route_line(line)
+
+        return len(lines)
+
+
+class ModemPool:
+    """
+    Drives many modems from one selector thread.
+
+    Every modem added to the pool is a regular QuectelModem, but instead of
+    one reader thread per modem, a single thread waits on all transports
+    with the platform's best selector (epoll on Linux) and routes each
+    modem's lines to its protocol and URC handler.
+
+    URC callbacks of all modems run on the pool thread, so they should
+    return quickly, or be moved off it with a shared URCDispatcher.
+
+    Example:
+
+    .. code-block:: python
+
+        with ModemPool() as pool:
+            modems = [pool.add(port=f"/dev/ttyUSB{i}") for i in range(2, 50, 4)]
+            for modem in modems:
+                print(modem.network.get_signal_quality())
+    """
+
+    def __init__(
+        self,
+        timeout: float = 1.0,
+        log_urcs: bool = False,
+        max_urc_queue_size: int = 1000,
+        urc_dispatcher: Optional[URCDispatcher] = None
+    ) -> None:
+        """
+        Initialize modem pool.
+
+        Args:
+            timeout: Default AT command timeout for modems in the pool
+            log_urcs: Whether to log URCs at INFO level
+            max_urc_queue_size: Maximum URCs to queue per modem
+            urc_dispatcher: Run every modem's URC callbacks on this
+                            dispatcher's workers instead of the pool thread
+        """
+        self.timeout = timeout
+        self.log_urcs = log_urcs
+        self.max_urc_queue_size = max_urc_queue_size
+        self.urc_dispatcher = urc_dispatcher
+
+        self._selector = selectors.DefaultSelector()
+        self._modems: list["QuectelModem"] = []
+
+        # Registration changes requested from other threads, applied by the
+        # selector thread after a wakeup
+        self._changed = threading.Condition()
+        self._pending: list[tuple[str, PooledModemCore]] = []
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        os.set_blocking(self._wakeup_r, False)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ, None)
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.stats = PoolStats()
+
+        logger.info(f"Initialized ModemPool ({type(self._selector).__name__})")
+
+    def add(
+        self,
+        port: Optional[str] = None,
+        transport: Optional[Transport] = None,
+        baudrate: int = 115200,
+        on_disconnect: Optional[callable] = None,
+        auto_start: bool = True
+    ) -> "QuectelModem":
+        """
+        Add a modem to the pool.
+
+        Args:
+            port: Serial port path. Either port or transport required.
+            transport: Custom transport with a file descriptor
+            baudrate: Serial port baud rate
+            on_disconnect: Optional callback for disconnection events
+            auto_start: Start reading this modem immediately (default: True)
+
+        Returns:
+            QuectelModem backed by the pool
+
+        Raises:
+            ValueError: If neither port nor transport is provided
+            EC25Error: If serial port cannot be opened
+        """
+        from ..modem import QuectelModem
+
+        if transport is None and port is None:
+            raise ValueError("Either 'port' or 'transport' must be provided")
+
+        if transport is None:
+            transport = SerialTransport(port=port, baudrate=baudrate, timeout=self.timeout)
+
+        core = PooledModemCore(
+            self,
+            transport,
+            timeout=self.timeout,
+            log_urcs=self.log_urcs,
+            max_urc_queue_size=self.max_urc_queue_size,
+            on_disconnect=on_disconnect,
+            urc_dispatcher=self.urc_dispatcher
+        )
+        modem = QuectelModem(core=core)
+        self._modems.append(modem)
+
+        if auto_start:
+            self.start()
+            modem.start()
+
+        return modem
+
+    @property
+    def modems(self) -> list["QuectelModem"]:
+        """Modems added to the pool."""
+        return list(self._modems)
+
+    def start(self) -> None:
+        """Start the selector thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name="ModemPoolThread"
+        )
+        self._thread.start()
+        logger.info("Started modem pool thread")
+
+    def stop(self) -> None:
+        """Stop the selector thread. Modems stay registered."""
+        if self._thread is None:
+            return
+
+        self._stop_event.set()
+        self._wake()
+        self._thread.join(timeout=1.0)
+        if self._thread.is_alive():
+            logger.warning("Modem pool thread did not terminate in time")
+        self._thread = None
+        self._apply_pending()
+        logger.info("Stopped modem pool thread")
+
+    def close(self) -> None:
+        """Close every modem in the pool and stop the selector thread."""
+        for modem in self._modems:
+            modem.close()
+        self._modems.clear()
+        self.stop()
+        self._selector.close()
+        os.close(self._wakeup_r)
+        os.close(self._wakeup_w)
+        logger.info("Closed modem pool")
+
+    def _register(self, core: PooledModemCore) -> None:
+        """Add a core's descriptor to the selector."""
+        self._change("register", core)
+
+    def _unregister(self, core: PooledModemCore) -> None:
+        """Remove a core's descriptor from the selector."""
+        self._change("unregister", core)
+
+    def _change(self, op: str, core: PooledModemCore) -> None:
+        """
+        Apply a registration change.
+
+        The selector is only modified by the pool thread while it runs, so
+        other threads queue the change, wake the selector and wait until it
+        has been applied (the descriptor may be closed right afterwards).
+        """
+        if self._thread is None or threading.current_thread() is self._thread:
+            self._apply(op, core)
+            return
+
+        request = (op, core)
+        with self._changed:
+            self._pending.append(request)
+            self._wake()
+            applied = self._changed.wait_for(lambda: request not in self._pending, timeout=1.0)
+
+        if not applied:
+            logger.warning(f"Modem pool thread did not apply {op} in time")
+
+    def _apply_pending(self) -> None:
+        """Apply queued registration changes and notify waiters."""
+        with self._changed:
+            for op, core in self._pending:
+                self._apply(op, core)
+            self._pending.clear()
+            self._changed.notify_all()
+
+    def _apply(self, op: str, core: PooledModemCore) -> None:
+        """Register or unregister a core's descriptor."""
+        try:
+            if op == "register":
+                core._fd = core.transport.fileno()
+                self._selector.register(core._fd, selectors.EVENT_READ, core)
+                self.stats.modems += 1
+            elif core._fd is not None:
+                self._selector.unregister(core._fd)
+                core._fd = None
+                self.stats.modems -= 1
+        except (KeyError, ValueError, OSError) as e:
+            logger.warning(f"Pool {op} failed: {e}")
+
+    def _wake(self) -> None:
+        """Interrupt a blocking select()."""
+        try:
+            os.write(self._wakeup_w, b"\0")
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        """Selector thread: wait on all transports and dispatch reads."""
+        logger.debug("Modem pool thread started")
+        cpu_start = time.thread_time()
+        self._apply_pending()
+
+        while not self._stop_event.is_set():
+            events = self._selector.select()
+            self.stats.wakeups += 1
+
+            for key, _ in events:
+                core = key.data
+                if core is None:
+                    try:
+                        os.read(self._wakeup_r, 4096)
+                    except BlockingIOError:
+                        pass
+                    self._apply_pending()
+                    continue
+
+                self.stats.lines += core._on_readable()
+
+            self.stats.cpu_time = time.thread_time() - cpu_start
+
+        logger.debug("Modem pool thread stopped")
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the pool."""
+        return f"<ModemPool modems={self.stats.modems}>"
@@ -5,15 +5,31 @@ Manages AT command execution, response parsing, and URC detection.
 """
 
 import logging
+import queue
 import threading
 import time
-from typing import Optional
+from contextlib import contextmanager
+from typing import Generator, Iterator, Optional
 
 from .transport import Transport
-from ..exceptions import ATTimeoutError, ATParseError, EC25Error
+from ..exceptions import ATTimeoutError, ATParseError, EC25Error, error_from_result
 
 logger = logging.getLogger(__name__)
 
+# Final result codes that end a command (3GPP TS 27.007 / V.250)
+FINAL_SUCCESS = frozenset({"OK", "CONNECT", "SEND OK"})
+FINAL_FAILURE = frozenset({"ERROR", "NO CARRIER", "BUSY", "NO ANSWER", "NO DIALTONE", "SEND FAIL"})
+FINAL_ERROR_PREFIXES = ("+CME ERROR:", "+CMS ERROR:")
+
+# Data entry prompt ("> " for AT+CMGS/AT+QISEND, reported as a ">" line)
+PROMPT = ">"
+
+# Ctrl+Z: ends prompt data entry
+CTRL_Z = b"\x1a"
+
+# Escape: cancels prompt data entry without sending
+ESC = b"\x1b"
+
 
 class ATProtocol:
     """
@@ -38,21 +54,53 @@ class ATProtocol:
         self.transport = transport
         self.default_timeout = default_timeout
 
-        # Thread safety for AT commands
-        self._at_lock = threading.Lock()
+        # Thread safety for AT commands (reentrant so exclusive() can
+        # hold it across several commands)
+        self._at_lock = threading.RLock()
 
         # Response handling
         self._resp_buffer: list[str] = []
         self._resp_done_event = threading.Event()
 
+        # Streamed commands: set while lines go to a consumer instead of the buffer
+        self._resp_stream: "Optional[queue.SimpleQueue[str]]" = None
+
+        # Two-phase (prompt) commands: set while waiting for "> "/CONNECT
+        self._awaiting_prompt = False
+        self._got_prompt = False
+
         # Command tracking for URC detection and echo stripping
         self._full_cmd: Optional[str] = None
         self._norm_prefix: Optional[str] = None
         self._resp_prefix: Optional[str] = None
+        self._resp_prefixes: tuple[str, ...] = ()  # One per command in a chained line
         self._sent_cmd: Optional[str] = None  # Track exact command sent for echo detection
 
+        # Round-trip time of the last completed command (write -> final result)
+        self.last_latency: Optional[float] = None
+
         logger.info("Initialized AT protocol handler")
 
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """
+        Hold the command lock across several commands.
+
+        Commands sent by this thread inside the block run back to back;
+        other threads wait until the block ends.
+
+        Example:
+
+        .. code-block:: python
+
+            with protocol.exclusive():
+                protocol.send_command("AT+CMMS=1")
+                for cmd, pdu in parts:
+                    protocol.send_prompt_command(cmd, pdu)
+        """
+        with self._at_lock:
+            yield
+
     def send_command(
         self,
         cmd: str = "AT",
@@ -76,63 +124,362 @@ class ATProtocol:
 
         Raises:
             ATTimeoutError: If command times out
-            EC25Error: If command returns ERROR
+            ATCommandError: If command returns an error result code
+            ATParseError: If write fails
+        """
+        with self._at_lock:
+            cmd = self._begin_command(cmd)
+            self._execute(cmd, timeout)
+            return self._finish_command(cmd, strip_ok, remove_cmd_prefix)
+
+    def stream_command(
+        self,
+        cmd: str,
+        timeout: Optional[float] = None
+    ) -> Generator[str, None, str]:
+        """
+        Send an AT command and yield its response lines as they arrive.
+
+        For commands with long responses (AT+CMGL on a full store, AT+QFLST)
+        the caller can process each line while the rest is still arriving,
+        and no line is kept after it was yielded.
+
+        The command is sent and the command lock taken when iteration
+        starts; the lock is held until the final result code. Leaving the
+        loop early discards the remaining lines up to the final result code
+        before other commands can run.
+
+        Args:
+            cmd: AT command to send (e.g., 'AT+CMGL=4')
+            timeout: Maximum seconds to wait for each line (uses default if None)
+
+        Yields:
+            Response lines without echo and final result code
+
+        Returns:
+            The final result code (e.g., "OK"), as the generator's return value
+
+        Raises:
+            ATTimeoutError: If no line arrives within timeout
+            ATCommandError: If the command ends with an error result code
+                            (raised after all other lines were yielded)
             ATParseError: If write fails
+
+        Example:
+
+        .. code-block:: python
+
+            for line in protocol.stream_command('AT+CMGL=4', timeout=10.0):
+                print(line)
         """
         with self._at_lock:
-            # Clear previous response
+            cmd = self._begin_command(cmd)
+            lines: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+            timeout_val = timeout if timeout is not None else self.default_timeout
+            self._resp_stream = lines
+            try:
+                self.transport.reset_input_buffer()
+                started = time.monotonic()
+                if not self.transport.write(cmd.encode("utf-8")):
+                    raise ATParseError(f"Failed to write AT command: {cmd.strip()}")
+
+                first = True
+                while True:
+                    line = self._next_streamed_line(lines, timeout_val, cmd)
+                    if first and line == self._sent_cmd:
+                        first = False
+                        continue  # Echo
+                    first = False
+                    if self.is_final_result(line):
+                        break
+                    try:
+                        yield line
+                    except GeneratorExit:
+                        # Abandoned early: let the rest pass before releasing the lock
+                        while not self.is_final_result(line):
+                            line = self._next_streamed_line(lines, timeout_val, cmd)
+                        raise
+            finally:
+                self._resp_stream = None
+
+            self.last_latency = time.monotonic() - started
+            logger.debug(f"Streamed response ended with {line} ({self.last_latency * 1000:.2f} ms)")
+            if self.is_error_result(line):
+                logger.error(f"AT command {cmd.strip()} failed: {line}")
+                raise error_from_result(line, command=cmd.strip(), response=[line])
+            return line
+
+    def _next_streamed_line(self, lines: "queue.SimpleQueue[str]", timeout: float, cmd: str) -> str:
+        """
+        Take the next line of a streamed response.
+
+        Raises:
+            ATTimeoutError: If no line arrives within timeout
+        """
+        try:
+            return lines.get(timeout=timeout)
+        except queue.Empty:
+            logger.error(f"AT command timed out: {cmd.strip()}")
+            raise ATTimeoutError(f"AT command timed out: {cmd.strip()}") from None
+
+    def send_batch(
+        self,
+        cmds: list[str],
+        remove_cmd_prefix: bool = False,
+        timeout: Optional[float] = None
+    ) -> list[list[str]]:
+        """
+        Send several commands chained on one line and split the responses.
+
+        The commands are joined with ";" (e.g. "AT+CSQ;+CREG?;+COPS?") so
+        the modem answers all of them in a single round trip with one final
+        OK. Each response line is assigned to the command whose response
+        prefix it carries; lines without a known prefix belong to the most
+        recent command that answered.
+
+        Commands whose response has no prefix (e.g. AT+CGSN) should come
+        first. Repeating a command in one batch puts all of its lines on
+        the first occurrence.
+
+        Args:
+            cmds: Commands to send (e.g., ["+CSQ", "+CREG?"]; "AT" optional)
+            remove_cmd_prefix: Remove the command prefix from the first line
+                               of each result
+            timeout: Timeout for the whole batch in seconds (uses default if None)
+
+        Returns:
+            One list of response lines per command, without the final OK
+
+        Raises:
+            ValueError: If cmds is empty
+            ATTimeoutError: If the batch times out
+            ATCommandError: If any command returns an error result code (later commands are not run)
+            ATParseError: If write fails
+
+        Example:
+
+        .. code-block:: python
+
+            csq, creg = protocol.send_batch(["+CSQ", "+CREG?"], remove_cmd_prefix=True)
+            # csq == ["24,99"], creg == ["0,1"]
+        """
+        if not cmds:
+            raise ValueError("send_batch requires at least one command")
+
+        parts = [self._strip_at(cmd) for cmd in cmds]
+
+        with self._at_lock:
+            line = self._begin_command("AT" + ";".join(parts))
+            self._execute(line, timeout)
+            lines = self._finish_command(line, strip_ok=True, remove_cmd_prefix=False)
+            return self._split_batch(lines, remove_cmd_prefix)
+
+    def send_prompt_command(
+        self,
+        cmd: str,
+        payload: bytes,
+        terminator: Optional[bytes] = CTRL_Z,
+        strip_ok: bool = False,
+        remove_cmd_prefix: bool = False,
+        prompt_timeout: float = 5.0,
+        timeout: Optional[float] = None
+    ) -> list[str]:
+        """
+        Send a two-phase command: header, prompt, then payload.
+
+        Writes the command line, waits for the "> " prompt (or CONNECT)
+        through the reader thread, writes the payload followed by the
+        terminator, and waits for the final result. The command lock is
+        held throughout, so no other command can interleave.
+
+        Used for AT+CMGS (SMS), AT+QISEND (sockets) and AT+QFUPL (files;
+        pass terminator=None since the length is given in the header).
+
+        Args:
+            cmd: Command header (e.g., "AT+CMGS=23")
+            payload: Data to send after the prompt
+            terminator: Bytes written after the payload (default Ctrl+Z, None for none)
+            strip_ok: Remove "OK" from response lines
+            remove_cmd_prefix: Remove command prefix from first response line
+            prompt_timeout: Seconds to wait for the prompt
+            timeout: Seconds to wait for the final result after the payload
+                     (uses default if None)
+
+        Returns:
+            Response lines after the payload
+
+        Raises:
+            ATTimeoutError: If the prompt or the final result times out
+                (ESC is sent to cancel a pending prompt)
+            ATCommandError: If the command fails before or after the prompt
+            ATParseError: If write fails or the command completes without a prompt
+
+        Example:
+
+        .. code-block:: python
+
+            response = protocol.send_prompt_command("AT+CMGS=18", pdu.encode(), timeout=30.0)
+            # ["+CMGS: 42", "OK"]
+        """
+        with self._at_lock:
+            cmd = self._begin_command(cmd)
+            self._got_prompt = False
+            self._awaiting_prompt = True
+            try:
+                self._execute(cmd, prompt_timeout)
+            except ATTimeoutError:
+                self._cancel_prompt(cmd)
+                raise
+            finally:
+                self._awaiting_prompt = False
+
+            if not self._got_prompt:
+                # Failed before the prompt (e.g. +CMS ERROR) or no prompt at all
+                lines = self._finish_command(cmd, strip_ok, remove_cmd_prefix)
+                raise ATParseError(f"No prompt for {cmd.strip()}", command=cmd.strip(), response=lines)
+
+            logger.debug(f"Prompt received, sending {len(payload)} byte payload")
             self._resp_buffer = []
             self._resp_done_event.clear()
+            data = payload + terminator if terminator else payload
+            self._write_and_wait(data, timeout, cmd.strip())
 
-            # Normalize command
-            cmd = self._normalize_command(cmd)
+            return self._finish_command(cmd, strip_ok, remove_cmd_prefix)
 
-            # Precompute prefixes for smart URC detection
-            self._precompute_prefixes(cmd)
+    def _execute(self, cmd: str, timeout: Optional[float]) -> None:
+        """
+        Write a prepared command and wait for its final result code.
 
-            # Store sent command for echo detection
-            self._sent_cmd = cmd.strip()
+        Must be called with the command lock held, after _begin_command().
 
-            logger.debug(f"Sending AT command: {cmd.strip()}")
+        Args:
+            cmd: Normalized command to write
+            timeout: Command timeout in seconds (uses default if None)
 
-            # Clear input buffer and send command
-            self.transport.reset_input_buffer()
-            written = self.transport.write(cmd.encode("utf-8"))
-            if not written:
-                raise ATParseError(f"Failed to write AT command: {cmd}")
+        Raises:
+            ATTimeoutError: If command times out
+            ATParseError: If write fails
+        """
+        # Clear input buffer and send command
+        self.transport.reset_input_buffer()
+        self._write_and_wait(cmd.encode("utf-8"), timeout, cmd.strip())
 
-            # Wait for response
-            timeout_val = timeout if timeout is not None else self.default_timeout
-            end_time = time.monotonic() + timeout_val
+    def _write_and_wait(self, data: bytes, timeout: Optional[float], description: str) -> None:
+        """
+        Write raw bytes and wait until the reader signals completion.
+
+        Args:
+            data: Bytes to write
+            timeout: Timeout in seconds (uses default if None)
+            description: Command text for log and error messages
+
+        Raises:
+            ATTimeoutError: If no final result (or prompt) arrives in time
+            ATParseError: If write fails
+        """
+        started = time.monotonic()
+        written = self.transport.write(data)
+        if not written:
+            raise ATParseError(f"Failed to write AT command: {description}")
+
+        # Block until the reader thread signals the final result code
+        timeout_val = timeout if timeout is not None else self.default_timeout
+        if not self._resp_done_event.wait(timeout_val):
+            logger.error(f"AT command timed out: {description}")
+            raise ATTimeoutError(f"AT command timed out: {description}")
+
+        self.last_latency = time.monotonic() - started
+
+    def _cancel_prompt(self, cmd: str) -> None:
+        """
+        Send ESC after a prompt timeout so the modem leaves data entry.
+
+        A late "> " would otherwise swallow the next command as payload.
+        Write errors are logged, not raised: the timeout is the error the
+        caller needs to see.
+
+        Args:
+            cmd: Command that timed out, for the log message
+        """
+        logger.warning(f"Prompt timed out, cancelling {cmd.strip()}")
+        try:
+            self.transport.write(ESC)
+        except EC25Error as e:
+            logger.error(f"Failed to cancel prompt for {cmd.strip()}: {e}")
+
+    def _begin_command(self, cmd: str) -> str:
+        """
+        Reset response state and prepare a command for sending.
+
+        Must be called with the command lock held.
+
+        Args:
+            cmd: AT command as given by the caller
+
+        Returns:
+            Normalized command ready to write
+        """
+        # Clear previous response
+        self._resp_buffer = []
+        self._resp_done_event.clear()
+
+        # Normalize command
+        cmd = self._normalize_command(cmd)
+
+        # Precompute prefixes for smart URC detection
+        self._precompute_prefixes(cmd)
+
+        # Store sent command for echo detection
+        self._sent_cmd = cmd.strip()
+
+        logger.debug(f"Sending AT command: {cmd.strip()}")
+        return cmd
+
+    def _finish_command(
+        self,
+        cmd: str,
+        strip_ok: bool,
+        remove_cmd_prefix: bool
+    ) -> list[str]:
+        """
+        Post-process a completed response.
+
+        Args:
+            cmd: Normalized command that was sent
+            strip_ok: Remove "OK" from response lines
+            remove_cmd_prefix: Remove command prefix from first response line
 
-            while not self._resp_done_event.is_set():
-                if time.monotonic() > end_time:
-                    logger.error(f"AT command timed out: {cmd.strip()}")
-                    raise ATTimeoutError(f"AT command timed out: {cmd.strip()}")
-                time.sleep(0.01)
+        Returns:
+            List of response lines
 
-            # Retrieve response
-            lines = list(self._resp_buffer)
+        Raises:
+            ATCommandError: If command ended with an error result code
+        """
+        # Retrieve response
+        lines = list(self._resp_buffer)
 
-            # Strip echo if present (detection-based, not state-based)
-            if lines and self._sent_cmd and lines[0] == self._sent_cmd:
-                logger.debug(f"Stripping echo line: {lines[0]}")
-                lines = lines[1:]
+        # Strip echo if present (detection-based, not state-based)
+        if lines and self._sent_cmd and lines[0] == self._sent_cmd:
+            logger.debug(f"Stripping echo line: {lines[0]}")
+            lines = lines[1:]
 
+        if self.last_latency is not None:
+            logger.debug(f"Received response: {lines} ({self.last_latency * 1000:.2f} ms)")
+        else:
             logger.debug(f"Received response: {lines}")
 
-            # Process response
-            if lines and lines[-1] == "OK":
-                if strip_ok:
-                    lines = lines[:-1]
-            elif lines and lines[-1] == "ERROR":
-                logger.error(f"AT command returned ERROR: {cmd.strip()}")
-                raise EC25Error(f"AT command {cmd.strip()} returned ERROR")
+        # Process response
+        if lines and lines[-1] == "OK":
+            if strip_ok:
+                lines = lines[:-1]
+        elif lines and self.is_error_result(lines[-1]):
+            logger.error(f"AT command {cmd.strip()} failed: {lines[-1]}")
+            raise error_from_result(lines[-1], command=cmd.strip(), response=lines)
 
-            if remove_cmd_prefix and lines:
-                lines[0] = self._remove_cmd_response(lines[0])
+        if remove_cmd_prefix and lines:
+            lines[0] = self._remove_cmd_response(lines[0])
 
-            return lines
+        return lines
 
     def _normalize_command(self, cmd: str) -> str:
         """
@@ -150,33 +497,67 @@ class ATProtocol:
 
         return cmd
 
+    @staticmethod
+    def _strip_at(cmd: str) -> str:
+        """Remove the "AT" prefix and line terminators from a command."""
+        cmd = cmd.strip()
+        if cmd.upper().startswith("AT"):
+            cmd = cmd[2:]
+        return cmd
+
     def _precompute_prefixes(self, cmd: str) -> None:
         """
         Precompute command prefixes for efficient response parsing.
 
+        Chained commands ("AT+CSQ;+CREG?") get one response prefix each.
+
         Args:
             cmd: Normalized AT command (e.g., "AT+CREG?\r\n")
         """
-        raw = cmd.strip()
+        # Store full command without AT (e.g., "+CREG?")
+        raw = self._strip_at(cmd)
+        self._full_cmd = raw
 
-        # Remove AT prefix
-        if raw.upper().startswith("AT"):
-            raw = raw[2:]
+        # Normalized prefixes (e.g., "+CREG") and response prefixes ("+CREG:")
+        norm_prefixes = [part.replace("?", "").split("=")[0] for part in raw.split(";")]
+        self._resp_prefixes = tuple(prefix + ":" for prefix in norm_prefixes)
 
-        # Remove line terminators
-        raw = raw.replace("\r", "").replace("\n", "")
+        self._norm_prefix = norm_prefixes[0]
+        self._resp_prefix = self._resp_prefixes[0]
 
-        # Store full command (e.g., "+CREG?")
-        self._full_cmd = raw
+        logger.debug(f"Command prefixes - full: {self._full_cmd}, "
+                    f"norm: {self._norm_prefix}, resp: {self._resp_prefixes}")
 
-        # Extract normalized prefix (e.g., "+CREG")
-        self._norm_prefix = raw.replace("?", "").split("=")[0]
+    def _split_batch(self, lines: list[str], remove_cmd_prefix: bool) -> list[list[str]]:
+        """
+        Split a chained command's response into per-command results.
 
-        # Build response prefix (e.g., "+CREG:")
-        self._resp_prefix = self._norm_prefix + ":"
+        Args:
+            lines: Response lines without echo and final OK
+            remove_cmd_prefix: Remove each command's prefix from its first line
 
-        logger.debug(f"Command prefixes - full: {self._full_cmd}, "
-                    f"norm: {self._norm_prefix}, resp: {self._resp_prefix}")
+        Returns:
+            One list of lines per chained command
+        """
+        prefixes = self._resp_prefixes
+        results: list[list[str]] = [[] for _ in prefixes]
+        current = 0
+
+        for line in lines:
+            if line.startswith(prefixes):
+                # Earliest command at or after the current one with this prefix
+                for i in range(current, len(prefixes)):
+                    if line.startswith(prefixes[i]):
+                        current = i
+                        break
+            results[current].append(line)
+
+        if remove_cmd_prefix:
+            for prefix, result in zip(prefixes, results):
+                if result and result[0].startswith(prefix):
+                    result[0] = result[0][len(prefix):].strip()
+
+        return results
 
     def _remove_cmd_response(self, response: str) -> str:
         """
@@ -210,10 +591,15 @@ class ATProtocol:
         if not line.startswith("+"):
             return False
 
+        if not self._resp_done_event.is_set():
+            # Error result codes end the pending command
+            if line.startswith(FINAL_ERROR_PREFIXES):
+                return False
+
         # If we're waiting for a response and have a prefix
-        if not self._resp_done_event.is_set() and self._norm_prefix:
-            # It's a solicited response if it matches our command prefix
-            return not line.startswith(self._norm_prefix + ":")
+        if not self._resp_done_event.is_set() and self._resp_prefixes:
+            # It's a solicited response if it matches a sent command's prefix
+            return not line.startswith(self._resp_prefixes)
 
         # Otherwise, it's a URC
         return True
@@ -226,17 +612,60 @@ class ATProtocol:
             line: Response line to append
 
         Returns:
-            True if this completes the response (OK/ERROR received)
+            True if this completes the response (final result code received)
         """
-        self._resp_buffer.append(line)
+        if self._awaiting_prompt and (line == PROMPT or line.startswith("CONNECT")):
+            self._got_prompt = True
+            self._resp_done_event.set()
+            return True
+
+        if self._resp_stream is not None:
+            self._resp_stream.put_nowait(line)
+        else:
+            self._resp_buffer.append(line)
 
         # Check for completion
-        if line == "OK" or line == "ERROR":
+        if self.is_final_result(line):
             self._resp_done_event.set()
             return True
 
         return False
 
+    @staticmethod
+    def is_final_result(line: str) -> bool:
+        """
+        Check if a line is a final result code.
+
+        Recognizes OK, CONNECT, SEND OK, ERROR, NO CARRIER, BUSY,
+        NO ANSWER, NO DIALTONE, SEND FAIL, +CME ERROR: <err> and
+        +CMS ERROR: <err>.
+
+        Args:
+            line: Response line
+
+        Returns:
+            True if the line ends a command
+        """
+        return (
+            line in FINAL_SUCCESS
+            or line.startswith("CONNECT ")
+            or ATProtocol.is_error_result(line)
+        )
+
+    @staticmethod
+    def is_error_result(line: str) -> bool:
+        """
+        Check if a line is a failing final result code.
+
+        Args:
+            line: Response line
+
+        Returns:
+            True for ERROR, NO CARRIER, BUSY, NO ANSWER, NO DIALTONE,
+            SEND FAIL, +CME ERROR and +CMS ERROR
+        """
+        return line in FINAL_FAILURE or line.startswith(FINAL_ERROR_PREFIXES)
+
     def is_response_pending(self) -> bool:
         """
         Check if we're currently waiting for a command response.
@@ -246,6 +675,18 @@ class ATProtocol:
         """
         return not self._resp_done_event.is_set()
 
+    def is_prompt_expected(self) -> bool:
+        """
+        Check if a two-phase command is waiting for its prompt.
+
+        The reader passes this to Transport.read_lines() so an unterminated
+        "> " is reported as a line.
+
+        Returns:
+            True while waiting for "> " or CONNECT
+        """
+        return self._awaiting_prompt
+
     def get_current_prefix(self) -> Optional[str]:
         """
         Get the current command's normalized prefix.
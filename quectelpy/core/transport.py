@@ -6,11 +6,13 @@ Provides abstractions for serial communication with dependency injection support
 
 import logging
 import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 import serial
 from serial import SerialException
 
+from .framing import LineFramer
 from ..exceptions import EC25Error, DeviceDisconnectedError
 
 logger = logging.getLogger(__name__)
@@ -52,6 +54,33 @@ class Transport(ABC):
         """
         pass
 
+    def read_lines(self, block: bool = True, prompt: bool = False) -> list[str]:
+        """
+        Read the next batch of complete lines.
+
+        The default implementation reads a single line with read_until(),
+        so a data entry prompt is only seen if the transport terminates it
+        like a line. Transports that can read in bulk override this to
+        return every line that is already available.
+
+        Args:
+            block: Wait up to the read timeout for data. If False, only
+                   return what can be read without waiting.
+            prompt: A "> " prompt is expected; report an unterminated
+                    prompt as a ">" line
+
+        Returns:
+            Decoded, stripped, non-empty lines (empty list on timeout)
+
+        Raises:
+            EC25Error: If read fails
+        """
+        data = self.read_until(b"\r\n", timeout=None if block else 0)
+        if not data:
+            return []
+        line = data.decode("utf-8", errors="ignore").strip()
+        return [line] if line else []
+
     @abstractmethod
     def reset_input_buffer(self) -> None:
         """Clear the input buffer."""
@@ -62,6 +91,18 @@ class Transport(ABC):
         """Check if transport is open."""
         pass
 
+    def fileno(self) -> int:
+        """
+        Get the OS file descriptor for event-loop integration.
+
+        Returns:
+            File descriptor that becomes readable when data arrives
+
+        Raises:
+            NotImplementedError: If the transport is not backed by a descriptor
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no file descriptor")
+
     @abstractmethod
     def close(self) -> None:
         """Close the transport."""
@@ -92,6 +133,9 @@ class SerialTransport(Transport):
         self.baudrate = baudrate
         self.timeout = timeout
 
+        # Bytes read from the port but not yet returned as lines
+        self._framer = LineFramer()
+
         try:
             self._serial = serial.Serial(
                 port=port,
@@ -113,50 +157,126 @@ class SerialTransport(Transport):
             logger.error(f"Serial write failed: {e}")
             raise EC25Error(f"Serial write failed: {e}") from e
 
-    def read_until(self, terminator: bytes = b"\r\n", timeout: Optional[float] = None) -> bytes:
-        """Read from serial port until terminator."""
-        try:
-            # Temporarily change timeout if specified
-            original_timeout = None
-            if timeout is not None:
-                original_timeout = self._serial.timeout
-                self._serial.timeout = timeout
+    def _read_chunk(self, timeout: Optional[float] = None) -> bytes:
+        """
+        Read whatever the port has buffered in as few syscalls as possible.
 
-            data = self._serial.read_until(terminator)
+        Blocks for up to the timeout for the first byte, then drains
+        everything else that is already waiting.
+        """
+        original_timeout = None
+        if timeout is not None:
+            original_timeout = self._serial.timeout
+            self._serial.timeout = timeout
 
-            # Restore original timeout
+        try:
+            waiting = self._serial.in_waiting
+            data = self._serial.read(waiting or 1)
+
+            if data and not waiting:
+                waiting = self._serial.in_waiting
+                if waiting:
+                    data += self._serial.read(waiting)
+        finally:
             if original_timeout is not None:
                 self._serial.timeout = original_timeout
 
-            if data:
-                logger.debug(f"Read {len(data)} bytes: {data}")
+        if data:
+            logger.debug(f"Read {len(data)} bytes: {data}")
 
-            return data
-        except SerialException as e:
-            error_str = str(e).lower()
-
-            # Detect device disconnection
-            if any(phrase in error_str for phrase in [
-                "device disconnected",
-                "device reports readiness to read but returned no data",
-                "no such device",
-                "device not configured",
-                "input/output error"
-            ]):
-                logger.error(f"Device disconnected: {e}")
-                raise DeviceDisconnectedError(
-                    f"Serial device disconnected: {e}",
-                    response=[str(e)]
-                ) from e
-
-            # Other serial errors
-            logger.error(f"Serial read failed: {e}")
-            raise EC25Error(f"Serial read failed: {e}") from e
+        return data
+
+    def _raise_read_error(self, e: Exception) -> None:
+        """Translate a pyserial read failure into a QuectelPy exception."""
+        error_str = str(e).lower()
+
+        # Detect device disconnection
+        if any(phrase in error_str for phrase in [
+            "device disconnected",
+            "device reports readiness to read but returned no data",
+            "no such device",
+            "device not configured",
+            "input/output error"
+        ]):
+            logger.error(f"Device disconnected: {e}")
+            raise DeviceDisconnectedError(
+                f"Serial device disconnected: {e}",
+                response=[str(e)]
+            ) from e
+
+        # Other serial errors
+        logger.error(f"Serial read failed: {e}")
+        raise EC25Error(f"Serial read failed: {e}") from e
+
+    def read_until(self, terminator: bytes = b"\r\n", timeout: Optional[float] = None) -> bytes:
+        """
+        Read from serial port until terminator.
+
+        Serves data already held by the line framer first. Like pyserial,
+        returns whatever was received if the timeout expires first.
+        """
+        try:
+            data = self._framer.take_until(terminator)
+            if data is not None:
+                return data
+
+            timeout_val = timeout if timeout is not None else self.timeout
+            deadline = time.monotonic() + timeout_val
+
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return self._framer.take_all()
+
+                chunk = self._read_chunk(timeout=remaining)
+                if chunk:
+                    self._framer.feed(chunk)
+                    data = self._framer.take_until(terminator)
+                    if data is not None:
+                        return data
+        except (SerialException, OSError) as e:
+            self._raise_read_error(e)
+
+    def read_lines(self, block: bool = True, prompt: bool = False) -> list[str]:
+        """
+        Read all complete lines available from the serial port.
+
+        Reads in bulk (everything in the driver buffer per syscall) and
+        splits lines with a LineFramer, keeping any partial tail for the
+        next call. With prompt=True, a buffered "> " tail (which has no
+        line terminator) is returned as a ">" line after any complete
+        lines (with echo on, "AT+CMGS=n\r\r\n> " arrives in one read).
+        """
+        try:
+            lines = self._framer.lines()
+            if prompt and self._framer.take_prompt():
+                lines.append(">")
+            if lines:
+                return lines
+
+            if block:
+                chunk = self._read_chunk()
+            elif self._serial.in_waiting:
+                chunk = self._serial.read(self._serial.in_waiting)
+            else:
+                # Zero-timeout read: returns empty, or raises if the device went away
+                chunk = self._read_chunk(timeout=0)
+            if not chunk:
+                return []
+
+            self._framer.feed(chunk)
+            lines = self._framer.lines()
+            if prompt and self._framer.take_prompt():
+                lines.append(">")
+            return lines
+        except (SerialException, OSError) as e:
+            self._raise_read_error(e)
 
     def reset_input_buffer(self) -> None:
         """Clear the serial input buffer."""
         try:
             self._serial.reset_input_buffer()
+            self._framer.clear()
             logger.debug("Reset input buffer")
         except SerialException as e:
             logger.error(f"Failed to reset input buffer: {e}")
@@ -166,6 +286,10 @@ class SerialTransport(Transport):
         """Check if serial port is open."""
         return self._serial and self._serial.is_open
 
+    def fileno(self) -> int:
+        """Get the serial port file descriptor."""
+        return self._serial.fileno()
+
     def close(self) -> None:
         """Close the serial port."""
         if self._serial and self._serial.is_open:
@@ -177,30 +301,62 @@ class MockTransport(Transport):
     """
     Mock transport for testing.
 
-    Simulates modem responses without requiring hardware.
+    Simulates modem responses without requiring hardware. Like a modem, a
+    queued response is sent when the next command is written, one response
+    per write. A response nobody writes a command for shows up on its own
+    after read_timeout (an unsolicited line). Responses queued before the
+    transport is first read or reset are already waiting in the input
+    buffer, as stale bytes are when a port is opened; reset_input_buffer()
+    (called by ModemCore.start()) discards them.
+
+    Behaviour change: responses used to be returned by read_until as soon
+    as they were queued, whether or not a command had been written, and
+    responses queued before ModemCore.start() were read as URCs. Tests
+    that queue a response and read it back without writing a command now
+    get it only after read_timeout.
     """
 
-    def __init__(self) -> None:
-        """Initialize mock transport."""
+    def __init__(self, read_timeout: float = 0.05) -> None:
+        """
+        Initialize mock transport.
+
+        Args:
+            read_timeout: How long read_until blocks waiting for input
+                before returning empty (mirrors a serial read timeout), and
+                how long a response waits for its command before it is
+                sent unsolicited
+        """
         self._open = True
         self._input_buffer: list[bytes] = []
-        self._response_queue: list[list[str]] = []
+        self._response_queue: list[tuple[float, list[str]]] = []  # (queued at, lines)
+        self._started = False  # First read or reset done; responses now wait for writes
+        self.written: list[bytes] = []  # Everything written, for assertions
         self._lock = threading.Lock()
+        self._data_ready = threading.Condition(self._lock)
+        self.read_timeout = read_timeout
         logger.info("Initialized MockTransport")
 
     def add_response(self, lines: list[str]) -> None:
         """
-        Queue a response to be returned by read_until.
+        Queue a response to be sent when the next command is written.
 
         Args:
             lines: List of response lines (e.g., ["+CSQ: 24,99", "OK"])
         """
         with self._lock:
-            self._response_queue.append(lines)
+            if self._started:
+                self._response_queue.append((time.monotonic(), list(lines)))
+            else:
+                self._input_buffer.extend(self._encode(lines))
             logger.debug(f"Added mock response: {lines}")
 
+    @staticmethod
+    def _encode(lines: list[str]) -> list[bytes]:
+        """Lines as they arrive from the modem, terminator included."""
+        return [(line + "\r\n").encode("utf-8") for line in lines]
+
     def write(self, data: bytes) -> int:
-        """Simulate writing data."""
+        """Simulate writing data; sends the next queued response."""
         if not self._open:
             raise DeviceDisconnectedError(
                 "MockTransport is closed (simulating device disconnection)",
@@ -208,13 +364,19 @@ class MockTransport(Transport):
             )
 
         logger.debug(f"Mock write: {data}")
+        with self._lock:
+            self.written.append(bytes(data))
+            if self._response_queue:
+                self._input_buffer.extend(self._encode(self._response_queue.pop(0)[1]))
+            self._data_ready.notify_all()
         return len(data)
 
     def read_until(self, terminator: bytes = b"\r\n", timeout: Optional[float] = None) -> bytes:
         """
         Simulate reading from modem.
 
-        Returns queued responses one line at a time.
+        Returns received lines one at a time, blocking for up to the read
+        timeout when nothing has arrived.
         """
         if not self._open:
             raise DeviceDisconnectedError(
@@ -223,31 +385,30 @@ class MockTransport(Transport):
             )
 
         with self._lock:
-            # Check if we have buffered input
-            if self._input_buffer:
-                return self._input_buffer.pop(0)
+            self._started = True
+            # Block like a serial port would instead of spinning
+            if not self._input_buffer:
+                self._data_ready.wait(timeout if timeout is not None else self.read_timeout)
+
+            # A response left waiting for its command arrives unsolicited
+            if not self._input_buffer and self._response_queue:
+                queued_at, lines = self._response_queue[0]
+                if time.monotonic() - queued_at >= self.read_timeout:
+                    self._response_queue.pop(0)
+                    self._input_buffer.extend(self._encode(lines))
 
-            # Get next response from queue
-            if self._response_queue:
-                current_response = self._response_queue[0]
-                if current_response:
-                    line = current_response.pop(0)
-
-                    # Remove empty response from queue
-                    if not current_response:
-                        self._response_queue.pop(0)
-
-                    # Add terminator and return
-                    result = (line + "\r\n").encode("utf-8")
-                    logger.debug(f"Mock read: {result}")
-                    return result
+            if self._input_buffer:
+                result = self._input_buffer.pop(0)
+                logger.debug(f"Mock read: {result}")
+                return result
 
         # No data available
         return b""
 
     def reset_input_buffer(self) -> None:
-        """Clear mock input buffer."""
+        """Clear mock input buffer (queued responses still wait for their command)."""
         with self._lock:
+            self._started = True
             self._input_buffer.clear()
             logger.debug("Reset mock input buffer")
 
@@ -257,11 +418,14 @@ class MockTransport(Transport):
 
     def close(self) -> None:
         """Close mock transport."""
-        self._open = False
+        with self._lock:
+            self._open = False
+            self._data_ready.notify_all()
         logger.info("Closed MockTransport")
 
     def clear_responses(self) -> None:
-        """Clear all queued responses (useful for testing)."""
+        """Clear all queued and unread responses (useful for testing)."""
         with self._lock:
             self._response_queue.clear()
+            self._input_buffer.clear()
             logger.debug("Cleared mock response queue")
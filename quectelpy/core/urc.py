@@ -4,16 +4,157 @@ Unsolicited Result Code (URC) handler.
 Manages URC queuing, callbacks, and dispatching in a thread-safe manner.
 """
 
+import itertools
 import logging
 import threading
 from collections import deque
-from typing import Callable, Dict, Deque, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Deque, Iterator, Optional, Union
+
+from ..parsers.urc import URCDecoderRegistry, URCEvent, default_registry
+
+if TYPE_CHECKING:
+    from .dispatch import URCDispatcher
 
 logger = logging.getLogger(__name__)
 
 # Type alias for URC callbacks
 URCCallback = Callable[[str], None]
 
+# Type alias for typed URC callbacks
+URCEventCallback = Callable[[URCEvent], None]
+
+# What a waiter matches: a prefix, several prefixes, or a predicate on the line
+URCMatch = Union[str, tuple[str, ...], Callable[[str], bool]]
+
+# Number of lines following the header line of a multi-line URC: a count,
+# or a function of the header line for URCs whose shape depends on the mode
+URCContinuation = Union[int, Callable[[str], int]]
+
+
+def _cds_continuation(line: str) -> int:
+    """+CDS: <length> (PDU mode) is followed by the PDU; text mode is one line."""
+    return 0 if "," in line else 1
+
+
+# Multi-line URCs known to the library, by URC name
+MULTILINE_URCS: Dict[str, URCContinuation] = {
+    "+CMT": 1,      # SMS delivered to the TE: header, then PDU or text
+    "+CBM": 1,      # Cell broadcast: header, then PDU or text
+    "+CDS": _cds_continuation,  # Status report
+}
+
+
+class URCSubscription:
+    """
+    Handle for one registered URC callback.
+
+    Returned by URCHandler.register_callback(). Several subscriptions may
+    share a prefix; each one is removed independently.
+
+    Attributes:
+        prefix: URC prefix the callback is registered for
+        callback: Registered callback
+    """
+
+    __slots__ = ("id", "prefix", "callback", "_handler", "__weakref__")
+
+    def __init__(self, sub_id: int, prefix: str, callback: URCCallback, handler: "URCHandler") -> None:
+        self.id = sub_id
+        self.prefix = prefix
+        self.callback = callback
+        self._handler = handler
+
+    def unsubscribe(self) -> bool:
+        """
+        Remove this subscription.
+
+        Returns:
+            True if it was removed, False if it was already gone
+        """
+        return self._handler.unregister_callback(self)
+
+    def __repr__(self) -> str:
+        """String representation of the subscription."""
+        return f"<URCSubscription id={self.id} prefix={self.prefix!r}>"
+
+
+class URCWatch:
+    """
+    Collects matching URCs from the moment it is created.
+
+    Created by URCHandler.watch(). Create the watch before sending the
+    command that triggers a URC, so a URC arriving before wait() is called
+    is not missed. Waiting blocks on a condition variable that the reader
+    signals only when a matching URC arrives, so it costs no CPU.
+
+    Example:
+
+    .. code-block:: python
+
+        with modem.watch_urcs('+QIOPEN:') as watch:
+            modem.send_at('AT+QIOPEN=1,0,"TCP","example.com",80')
+            line = watch.wait(timeout=30.0)
+    """
+
+    def __init__(self, handler: "URCHandler", match: URCMatch, max_lines: int) -> None:
+        self._handler = handler
+        self._match = match if callable(match) else (lambda line, prefix=match: line.startswith(prefix))
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+        self._cond = threading.Condition(handler._lock)
+        self._closed = False
+
+    def _offer(self, line: str) -> None:
+        """Keep the line if it matches. Called with the handler lock held."""
+        try:
+            matched = self._match(line)
+        except Exception as e:
+            logger.error(f"URC wait predicate failed: {e}", exc_info=True)
+            return
+        if matched:
+            self._lines.append(line)
+            self._cond.notify()
+
+    def _cancel(self) -> None:
+        """Wake the waiter for good. Called with the handler lock held."""
+        self._closed = True
+        self._cond.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Return the next matching URC, waiting for one if needed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            URC line, or None on timeout or once the watch is closed
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._lines or self._closed, timeout=timeout)
+            if self._lines:
+                return self._lines.popleft()
+            return None
+
+    def close(self) -> None:
+        """Stop collecting URCs and wake any waiter."""
+        self._handler._remove_watch(self)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield matching URCs until the watch is closed."""
+        while True:
+            line = self.wait()
+            if line is None:
+                return
+            yield line
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.close()
+
 
 class URCHandler:
     """
@@ -21,15 +162,21 @@ class URCHandler:
 
     Features:
     - Bounded queue to prevent memory issues
-    - Callback registration system
+    - Callback registration system with any number of subscribers per prefix
+    - Prefix-indexed dispatch (cost independent of the number of subscriptions)
     - Thread-safe operations
     - Error handling for misbehaving callbacks
+    - Optional off-thread callback execution via a URCDispatcher
+    - Blocking waits for specific URCs (no polling)
+    - Specs for multi-line URCs, assembled by the modem core
     """
 
     def __init__(
         self,
         max_queue_size: int = 1000,
-        log_urcs: bool = False
+        log_urcs: bool = False,
+        dispatcher: Optional["URCDispatcher"] = None,
+        decoders: Optional[URCDecoderRegistry] = None
     ) -> None:
         """
         Initialize URC handler.
@@ -37,64 +184,206 @@ class URCHandler:
         Args:
             max_queue_size: Maximum number of URCs to queue (prevents memory leak)
             log_urcs: Whether to log URCs at INFO level
+            dispatcher: Run callbacks on this dispatcher's workers instead of
+                        the calling (reader) thread
+            decoders: Decoder registry for event callbacks (default: the
+                      library's built-in decoders)
         """
         self.log_urcs = log_urcs
+        self.dispatcher = dispatcher
+        self.decoders = decoders if decoders is not None else default_registry
+
+        # Last decoded event, shared by all event callbacks for that line.
+        # Dispatcher workers decode concurrently, so it has its own lock.
+        self._last_event: Optional[URCEvent] = None
+        self._decode_lock = threading.Lock()
         self._max_queue_size = max_queue_size
 
         # Bounded queue for URC storage
         self._urc_queue: Deque[str] = deque(maxlen=max_queue_size)
 
-        # Callback registry: prefix -> callback function
-        self._callbacks: Dict[str, URCCallback] = {}
+        # Callback registry: prefix -> subscriptions in registration order
+        self._callbacks: Dict[str, list[URCSubscription]] = {}
+        self._ids = itertools.count(1)
+
+        # Dispatch index, rebuilt on (un)registration and swapped in as one
+        # tuple so dispatch can read it without the lock:
+        # (distinct prefix lengths ascending, prefix -> subscriptions)
+        self._index: tuple[tuple[int, ...], Dict[str, tuple[URCSubscription, ...]]] = ((), {})
 
         # Thread safety
         self._lock = threading.Lock()
 
+        # Active waiters, offered every URC under the lock
+        self._watches: list[URCWatch] = []
+
+        # URC name -> continuation lines after the header
+        self._multiline: Dict[str, URCContinuation] = dict(MULTILINE_URCS)
+
         logger.info(f"Initialized URC handler (max_queue_size={max_queue_size})")
 
-    def register_callback(self, prefix: str, callback: URCCallback) -> None:
+    def register_callback(self, prefix: str, callback: URCCallback) -> URCSubscription:
         """
         Register a callback for URCs matching a prefix.
 
+        A prefix can have any number of callbacks; they run in registration
+        order. An empty prefix matches every URC.
+
         Args:
             prefix: URC prefix to match (e.g., "+CMTI" for SMS notifications)
             callback: Function to call when URC is received.
                      Signature: callback(line: str) -> None
 
+        Returns:
+            Subscription handle for unregistering this callback alone
+
         Example:
 
         .. code-block:: python
 
-            handler.register_callback("+CMTI", lambda line: print(f"New SMS: {line}"))
+            sub = handler.register_callback("+CMTI", lambda line: print(f"New SMS: {line}"))
+            handler.register_callback("+CMTI", metrics.count_sms)
+            sub.unsubscribe()
         """
         with self._lock:
-            self._callbacks[prefix] = callback
+            subscription = URCSubscription(next(self._ids), prefix, callback, self)
+            self._callbacks.setdefault(prefix, []).append(subscription)
+            self._rebuild_index()
             logger.info(f"Registered URC callback for prefix: {prefix}")
+            return subscription
+
+    def register_event_callback(self, prefix: str, callback: URCEventCallback) -> URCSubscription:
+        """
+        Register a callback that receives typed URC events.
+
+        The line is wrapped in the event class from the decoder registry
+        (URCEvent for unknown URCs). Fields are parsed when the callback
+        first reads them, and every event callback for the same line
+        shares one event.
+
+        Args:
+            prefix: URC prefix to match (e.g., "+CMTI")
+            callback: Function to call with the event.
+                     Signature: callback(event: URCEvent) -> None
+
+        Returns:
+            Subscription handle, removed like any other callback
+
+        Example:
+
+        .. code-block:: python
+
+            handler.register_event_callback("+CMTI", lambda event: print(event.index))
+        """
+        def deliver(line: str) -> None:
+            callback(self.decode(line))
+
+        return self.register_callback(prefix, deliver)
 
-    def unregister_callback(self, prefix: str) -> bool:
+    def decode(self, line: str) -> URCEvent:
         """
-        Unregister a URC callback.
+        Decode a URC line into its event, reusing the last event for the same line.
+
+        Thread-safe: dispatcher workers may decode for different
+        subscriptions at the same time.
+
+        Args:
+            line: URC line
+
+        Returns:
+            Typed event with lazily parsed fields
+        """
+        with self._decode_lock:
+            event = self._last_event
+            if event is None or event.line is not line:
+                event = self.decoders.decode(line)
+                self._last_event = event
+        return event
+
+    def unregister_callback(self, target: Union[str, URCSubscription]) -> bool:
+        """
+        Unregister URC callbacks.
 
         Args:
-            prefix: URC prefix to unregister
+            target: A subscription handle to remove just that callback, or a
+                    prefix to remove every callback registered for it
 
         Returns:
-            True if callback was removed, False if not found
+            True if any callback was removed, False if not found
         """
         with self._lock:
-            if prefix in self._callbacks:
-                del self._callbacks[prefix]
-                logger.info(f"Unregistered URC callback for prefix: {prefix}")
-                return True
-            return False
+            if isinstance(target, URCSubscription):
+                subscriptions = self._callbacks.get(target.prefix, [])
+                if target not in subscriptions:
+                    return False
+                subscriptions.remove(target)
+                if not subscriptions:
+                    del self._callbacks[target.prefix]
+                prefix = target.prefix
+            else:
+                if target not in self._callbacks:
+                    return False
+                del self._callbacks[target]
+                prefix = target
+
+            self._rebuild_index()
+            logger.info(f"Unregistered URC callback for prefix: {prefix}")
+            return True
 
     def clear_callbacks(self) -> None:
         """Clear all registered callbacks."""
         with self._lock:
-            count = len(self._callbacks)
+            count = sum(len(subs) for subs in self._callbacks.values())
             self._callbacks.clear()
+            self._rebuild_index()
             logger.info(f"Cleared {count} URC callbacks")
 
+    def _rebuild_index(self) -> None:
+        """Rebuild the dispatch index. Must be called with the lock held."""
+        index = {prefix: tuple(subs) for prefix, subs in self._callbacks.items()}
+        lengths = tuple(sorted({len(prefix) for prefix in index}))
+        self._index = (lengths, index)
+
+    def register_multiline_urc(self, name: str, continuation: URCContinuation) -> None:
+        """
+        Declare how many lines follow the header line of a URC.
+
+        The modem core collects that many lines after the header and
+        delivers them as one URC, lines joined by "\\n", so they never
+        end up in a command's response.
+
+        Args:
+            name: URC name, e.g. "+CMT"
+            continuation: Line count, or a function taking the header line
+                          and returning the count (0 for a single line)
+
+        Example:
+
+        .. code-block:: python
+
+            # "+QLINES: 3" followed by three lines
+            handler.register_multiline_urc("+QLINES", lambda line: int(line.split(":")[1]))
+        """
+        with self._lock:
+            self._multiline = {**self._multiline, name: continuation}
+
+    def continuation_lines(self, line: str) -> int:
+        """
+        Get the number of lines that follow a URC header line.
+
+        Args:
+            line: First line of a URC
+
+        Returns:
+            Number of continuation lines (0 for single-line URCs)
+        """
+        continuation = self._multiline.get(line.partition(":")[0])
+        if continuation is None:
+            return 0
+        if callable(continuation):
+            return continuation(line)
+        return continuation
+
     def handle_urc(self, line: str) -> None:
         """
         Process a URC line.
@@ -102,16 +391,18 @@ class URCHandler:
         Adds to queue and dispatches to matching callbacks.
 
         Args:
-            line: URC line to handle
+            line: URC line to handle (lines of a multi-line URC joined by "\\n")
         """
         if self.log_urcs:
             logger.info(f"URC received: {line}")
         else:
             logger.debug(f"URC received: {line}")
 
-        # Add to queue (automatically drops oldest if full)
+        # Add to queue (automatically drops oldest if full) and wake waiters
         with self._lock:
             self._urc_queue.append(line)
+            for watch in self._watches:
+                watch._offer(line)
 
         # Dispatch to callbacks
         self._dispatch_callbacks(line)
@@ -120,23 +411,33 @@ class URCHandler:
         """
         Dispatch URC to matching callbacks.
 
+        Looks up line[:n] for each distinct registered prefix length n,
+        so the cost depends on how many prefix lengths exist, not on how
+        many callbacks are registered. With a dispatcher, callbacks are
+        queued for its workers instead of being called here.
+
         Args:
             line: URC line to dispatch
         """
-        # Get callbacks (outside lock to prevent deadlock if callback is slow)
-        with self._lock:
-            callbacks_to_call = [
-                (prefix, cb) for prefix, cb in self._callbacks.items()
-                if line.startswith(prefix)
-            ]
-
-        # Call callbacks outside lock
-        for prefix, callback in callbacks_to_call:
-            try:
-                callback(line)
-                logger.debug(f"URC callback for '{prefix}' executed successfully")
-            except Exception as e:
-                logger.error(f"URC callback for '{prefix}' failed: {e}", exc_info=True)
+        # Immutable snapshot: callbacks run without the lock held
+        lengths, index = self._index
+        dispatcher = self.dispatcher
+
+        for length in lengths:
+            if length > len(line):
+                break
+            subscriptions = index.get(line[:length])
+            if not subscriptions:
+                continue
+
+            for subscription in subscriptions:
+                if dispatcher is not None:
+                    dispatcher.submit(subscription, line)
+                    continue
+                try:
+                    subscription.callback(line)
+                except Exception as e:
+                    logger.error(f"URC callback for '{subscription.prefix}' failed: {e}", exc_info=True)
 
     def get_urc_queue(self) -> list[str]:
         """
@@ -183,12 +484,95 @@ class URCHandler:
         with self._lock:
             return len(self._urc_queue)
 
-    def get_callbacks(self) -> Dict[str, URCCallback]:
+    def watch(self, match: URCMatch, max_lines: Optional[int] = None) -> URCWatch:
+        """
+        Start collecting URCs that match.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the
+                   line (runs on the reader thread; keep it fast)
+            max_lines: Maximum unread URCs kept (default: max_queue_size)
+
+        Returns:
+            Watch to wait on; close it when done
+        """
+        watch = URCWatch(self, match, max_lines or self._max_queue_size)
+        with self._lock:
+            self._watches.append(watch)
+        return watch
+
+    def _remove_watch(self, watch: URCWatch) -> None:
+        """Remove a watch and wake its waiter."""
+        with self._lock:
+            if watch in self._watches:
+                self._watches.remove(watch)
+            watch._cancel()
+
+    def wait_for_urc(self, match: URCMatch, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the next URC that matches.
+
+        Only URCs arriving after the call are considered; to avoid missing
+        a URC triggered by a command, create a watch() before sending it.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Matching URC line, or None on timeout
+
+        Example:
+
+        .. code-block:: python
+
+            line = handler.wait_for_urc('+QIURC: "recv"', timeout=10.0)
+        """
+        with self.watch(match, max_lines=1) as watch:
+            return watch.wait(timeout)
+
+    def iter_urcs(self, match: URCMatch, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Iterate over matching URCs as they arrive.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+            timeout: Stop after this many seconds without a matching URC
+                     (None waits indefinitely)
+
+        Yields:
+            Matching URC lines
+
+        Example:
+
+        .. code-block:: python
+
+            for line in handler.iter_urcs(("+CREG", "+CGREG"), timeout=60.0):
+                print(line)
+        """
+        with self.watch(match) as watch:
+            while True:
+                line = watch.wait(timeout)
+                if line is None:
+                    return
+                yield line
+
+    def cancel_waiters(self) -> None:
+        """Wake every waiter and end every iterator (e.g. when the reader stops)."""
+        with self._lock:
+            watches, self._watches = self._watches, []
+            for watch in watches:
+                watch._cancel()
+
+    def get_callbacks(self) -> Dict[str, list[URCCallback]]:
         """
         Get registered callbacks (for debugging).
 
         Returns:
-            Dictionary mapping prefixes to callbacks
+            Dictionary mapping prefixes to their callbacks in registration order
         """
         with self._lock:
-            return dict(self._callbacks)
+            return {
+                prefix: [sub.callback for sub in subs]
+                for prefix, subs in self._callbacks.items()
+            }
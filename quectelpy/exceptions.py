@@ -134,3 +134,310 @@ class SMSError(EC25Error):
     """
     pass
 
+
+
+# Final result codes (3GPP TS 27.007 / 27.005, Quectel extensions)
+
+#: +CME ERROR codes: 3GPP TS 27.007 section 9.2 and Quectel TCP/IP errors
+CME_ERROR_CODES: dict[int, str] = {
+    0: "Phone failure",
+    1: "No connection to phone",
+    2: "Phone-adaptor link reserved",
+    3: "Operation not allowed",
+    4: "Operation not supported",
+    5: "PH-SIM PIN required",
+    6: "PH-FSIM PIN required",
+    7: "PH-FSIM PUK required",
+    10: "SIM not inserted",
+    11: "SIM PIN required",
+    12: "SIM PUK required",
+    13: "SIM failure",
+    14: "SIM busy",
+    15: "SIM wrong",
+    16: "Incorrect password",
+    17: "SIM PIN2 required",
+    18: "SIM PUK2 required",
+    20: "Memory full",
+    21: "Invalid index",
+    22: "Not found",
+    23: "Memory failure",
+    24: "Text string too long",
+    25: "Invalid characters in text string",
+    26: "Dial string too long",
+    27: "Invalid characters in dial string",
+    30: "No network service",
+    31: "Network timeout",
+    32: "Network not allowed - emergency calls only",
+    40: "Network personalization PIN required",
+    41: "Network personalization PUK required",
+    42: "Network subset personalization PIN required",
+    43: "Network subset personalization PUK required",
+    44: "Service provider personalization PIN required",
+    45: "Service provider personalization PUK required",
+    46: "Corporate personalization PIN required",
+    47: "Corporate personalization PUK required",
+    100: "Unknown",
+    103: "Illegal MS",
+    106: "Illegal ME",
+    107: "GPRS services not allowed",
+    111: "PLMN not allowed",
+    112: "Location area not allowed",
+    113: "Roaming not allowed in this location area",
+    132: "Service option not supported",
+    133: "Requested service option not subscribed",
+    134: "Service option temporarily out of order",
+    148: "Unspecified GPRS error",
+    149: "PDP authentication failure",
+    150: "Invalid mobile class",
+    550: "Unknown error",
+    551: "Operation blocked",
+    552: "Invalid parameters",
+    553: "Memory not enough",
+    554: "Create socket failed",
+    555: "Operation not supported",
+    556: "Socket bind failed",
+    557: "Socket listen failed",
+    558: "Socket write failed",
+    559: "Socket read failed",
+    560: "Socket accept failed",
+    561: "Open PDP context failed",
+    562: "Close PDP context failed",
+    563: "Socket identity has been used",
+    564: "DNS busy",
+    565: "DNS parse failed",
+    566: "Socket connect failed",
+    567: "Socket has been closed",
+    568: "Operation busy",
+    569: "Operation timeout",
+    570: "PDP context broken down",
+    571: "Cancel send",
+    572: "Operation not allowed",
+    573: "APN not configured",
+    574: "Port busy",
+}
+
+#: +CMS ERROR codes: RP causes (3GPP TS 24.011), TP-FCS values
+#: (3GPP TS 23.040) and ME/TA errors (3GPP TS 27.005 section 3.2.5)
+CMS_ERROR_CODES: dict[int, str] = {
+    1: "Unassigned (unallocated) number",
+    8: "Operator determined barring",
+    10: "Call barred",
+    21: "Short message transfer rejected",
+    27: "Destination out of service",
+    28: "Unidentified subscriber",
+    29: "Facility rejected",
+    30: "Unknown subscriber",
+    38: "Network out of order",
+    41: "Temporary failure",
+    42: "Congestion",
+    47: "Resources unavailable, unspecified",
+    50: "Requested facility not subscribed",
+    69: "Requested facility not implemented",
+    81: "Invalid short message transfer reference value",
+    95: "Invalid message, unspecified",
+    96: "Invalid mandatory information",
+    97: "Message type non-existent or not implemented",
+    98: "Message not compatible with short message protocol state",
+    99: "Information element non-existent or not implemented",
+    111: "Protocol error, unspecified",
+    127: "Interworking, unspecified",
+    128: "Telematic interworking not supported",
+    129: "Short message Type 0 not supported",
+    130: "Cannot replace short message",
+    143: "Unspecified TP-PID error",
+    144: "Data coding scheme (alphabet) not supported",
+    145: "Message class not supported",
+    159: "Unspecified TP-DCS error",
+    160: "Command cannot be actioned",
+    161: "Command unsupported",
+    175: "Unspecified TP-Command error",
+    176: "TPDU not supported",
+    192: "SC busy",
+    193: "No SC subscription",
+    194: "SC system failure",
+    195: "Invalid SME address",
+    196: "Destination SME barred",
+    197: "SM rejected - duplicate SM",
+    198: "TP-VPF not supported",
+    199: "TP-VP not supported",
+    208: "(U)SIM SMS storage full",
+    209: "No SMS storage capability in (U)SIM",
+    210: "Error in MS",
+    211: "Memory capacity exceeded",
+    212: "(U)SIM Application Toolkit busy",
+    213: "(U)SIM data download error",
+    255: "Unspecified error cause",
+    300: "ME failure",
+    301: "SMS service of ME reserved",
+    302: "Operation not allowed",
+    303: "Operation not supported",
+    304: "Invalid PDU mode parameter",
+    305: "Invalid text mode parameter",
+    310: "(U)SIM not inserted",
+    311: "(U)SIM PIN required",
+    312: "PH-(U)SIM PIN required",
+    313: "(U)SIM failure",
+    314: "(U)SIM busy",
+    315: "(U)SIM wrong",
+    316: "(U)SIM PUK required",
+    317: "(U)SIM PIN2 required",
+    318: "(U)SIM PUK2 required",
+    320: "Memory failure",
+    321: "Invalid memory index",
+    322: "Memory full",
+    330: "SMSC address unknown",
+    331: "No network service",
+    332: "Network timeout",
+    340: "No +CNMA acknowledgement expected",
+    500: "Unknown error",
+}
+
+
+class ATCommandError(EC25Error):
+    """
+    Raised when a command ends with a final result code other than OK.
+
+    Covers ERROR, NO CARRIER, BUSY, NO ANSWER, NO DIALTONE and SEND FAIL;
+    +CME ERROR and +CMS ERROR raise the CMEError and CMSError subclasses.
+
+    Attributes:
+        result: Final result code line (e.g., "NO CARRIER")
+    """
+
+    def __init__(
+        self,
+        message: str,
+        command: Optional[str] = None,
+        response: Optional[list[str]] = None,
+        result: Optional[str] = None
+    ) -> None:
+        """
+        Initialize exception with the final result code.
+
+        Args:
+            message: Error description
+            command: AT command that failed
+            response: Modem response
+            result: Final result code line
+        """
+        super().__init__(message, command=command, response=response)
+        self.result = result
+
+
+class CMEError(ATCommandError):
+    """
+    Raised on +CME ERROR (mobile equipment error, 3GPP TS 27.007).
+
+    Attributes:
+        code: Numeric error code (None if the modem reported text only)
+        description: Error text from CME_ERROR_CODES or the modem
+    """
+
+    def __init__(
+        self,
+        code: Optional[int],
+        description: str,
+        command: Optional[str] = None,
+        response: Optional[list[str]] = None,
+        result: Optional[str] = None
+    ) -> None:
+        """
+        Initialize CME error.
+
+        Args:
+            code: Numeric error code, if known
+            description: Error text
+            command: AT command that failed
+            response: Modem response
+            result: Final result code line
+        """
+        label = f"+CME ERROR {code}" if code is not None else "+CME ERROR"
+        super().__init__(f"{label}: {description}", command=command, response=response, result=result)
+        self.code = code
+        self.description = description
+
+
+class CMSError(ATCommandError, SMSError):
+    """
+    Raised on +CMS ERROR (message service failure, 3GPP TS 27.005).
+
+    Also an SMSError, so existing SMS error handling catches it.
+
+    Attributes:
+        code: Numeric error code (None if the modem reported text only)
+        description: Error text from CMS_ERROR_CODES or the modem
+    """
+
+    def __init__(
+        self,
+        code: Optional[int],
+        description: str,
+        command: Optional[str] = None,
+        response: Optional[list[str]] = None,
+        result: Optional[str] = None
+    ) -> None:
+        """
+        Initialize CMS error.
+
+        Args:
+            code: Numeric error code, if known
+            description: Error text
+            command: AT command that failed
+            response: Modem response
+            result: Final result code line
+        """
+        label = f"+CMS ERROR {code}" if code is not None else "+CMS ERROR"
+        super().__init__(f"{label}: {description}", command=command, response=response, result=result)
+        self.code = code
+        self.description = description
+
+
+def error_from_result(
+    result: str,
+    command: Optional[str] = None,
+    response: Optional[list[str]] = None
+) -> ATCommandError:
+    """
+    Build the exception for a failing final result code.
+
+    Handles numeric (AT+CMEE=1) and verbose (AT+CMEE=2) error reports.
+
+    Args:
+        result: Final result code line (e.g., "+CME ERROR: 10")
+        command: AT command that failed
+        response: Modem response
+
+    Returns:
+        CMEError, CMSError or ATCommandError
+
+    Example:
+
+    .. code-block:: python
+
+        error = error_from_result("+CMS ERROR: 330")
+        # CMSError: +CMS ERROR 330: SMSC address unknown
+    """
+    for prefix, cls, table in (
+        ("+CME ERROR:", CMEError, CME_ERROR_CODES),
+        ("+CMS ERROR:", CMSError, CMS_ERROR_CODES),
+    ):
+        if result.startswith(prefix):
+            detail = result[len(prefix):].strip()
+            if detail.isdigit():
+                code = int(detail)
+                description = table.get(code, "Unknown error code")
+            else:
+                # Verbose mode: look the text up to recover the number
+                code = next(
+                    (num for num, text in table.items() if text.lower() == detail.lower()),
+                    None
+                )
+                description = detail
+            return cls(code, description, command=command, response=response, result=result)
+
+    return ATCommandError(
+        f"AT command returned {result}",
+        command=command,
+        response=response,
+        result=result
+    )
@@ -5,14 +5,31 @@ Provides high-level managers for different modem capabilities:
 - DeviceManager: Device info, IMEI, firmware, SIM
 - NetworkManager: Registration, signal, operators, GPRS
 - SMSManager: SMS messaging (planned)
+- Async*Manager: Awaitable versions for AsyncQuectelModem
 """
 
 from .device_info import DeviceManager
 from .network import NetworkManager
 from .sms import SMSManager
+from .sms_delivery import DirectDelivery, DeliveryStats
+from .sms_reports import DeliveryTracker, TrackerStats
+from .inbox import InboxMirror, MirrorStats
+from .outbox import SMSOutbox, OutboxStats
+from .async_managers import AsyncDeviceManager, AsyncNetworkManager, AsyncSMSManager
 
 __all__ = [
     "DeviceManager",
     "NetworkManager",
     "SMSManager",
+    "DirectDelivery",
+    "DeliveryStats",
+    "DeliveryTracker",
+    "TrackerStats",
+    "InboxMirror",
+    "MirrorStats",
+    "SMSOutbox",
+    "OutboxStats",
+    "AsyncDeviceManager",
+    "AsyncNetworkManager",
+    "AsyncSMSManager",
 ]
@@ -0,0 +1,630 @@
+"""
+Asyncio feature managers.
+
+Awaitable counterparts of DeviceManager, NetworkManager and SMSManager for
+use with AsyncModemCore. They reuse the synchronous managers' parsers and
+response handling; only the command round trips are awaited.
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterable, Optional, Union
+
+from ..types import (
+    ModelInfo,
+    SIMState,
+    EquipmentStatus,
+    NetworkInfo,
+    SignalQuality,
+    CurrentOperator,
+    RegistrationStatus,
+    NetworkStatus,
+    MessageFormat,
+    SMSMessage,
+    SMSStatus,
+    SMSStorage,
+)
+from ..exceptions import ATCommandError, ATParseError, EC25Error, NetworkError, SMSError
+from ..parsers.concat import StreamReassembler, reassemble as reassemble_parts
+from .device_info import DeviceManager
+from .network import NetworkManager
+from .sms import SMSManager
+
+if TYPE_CHECKING:
+    from ..core.async_modem import AsyncModemCore
+
+logger = logging.getLogger(__name__)
+
+
+class _AsyncOnly:
+    """
+    Mixin that keeps a sync manager's blocking methods out of the async API.
+
+    Every public method the async subclass inherits from its sync base
+    without overriding it is replaced by one that raises, so a sync method
+    added later cannot hand out unawaited coroutines or block the loop.
+    List it first in the bases: ``class AsyncFoo(_AsyncOnly, Foo)``.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in dir(cls):
+            if name.startswith("_") or name in cls.__dict__:
+                continue
+            attr = inspect.getattr_static(cls, name)
+            if inspect.isfunction(attr) and not inspect.iscoroutinefunction(attr):
+                setattr(cls, name, _sync_only(cls.__name__, attr))
+
+
+def _sync_only(owner: str, method):
+    """Stand-in for a sync method that has no async counterpart."""
+    @functools.wraps(method)
+    def unavailable(self, *args, **kwargs):
+        raise NotImplementedError(
+            f"{owner}.{method.__name__}() is not available in the async API; "
+            f"use it through the synchronous QuectelModem"
+        )
+    return unavailable
+
+
+class AsyncDeviceManager(_AsyncOnly, DeviceManager):
+    """
+    Awaitable device information and status queries.
+
+    See DeviceManager for details on each method.
+    """
+
+    def __init__(self, modem_core: "AsyncModemCore") -> None:
+        """
+        Initialize async device manager.
+
+        Args:
+            modem_core: AsyncModemCore instance for AT command execution
+        """
+        super().__init__(modem_core)
+
+    async def get_model_info(self) -> ModelInfo:
+        """Get modem model information (ATI)."""
+        logger.info("Getting model info")
+        response = await self.modem.send_at("ATI", strip_ok=True)
+        return self._model_parser.parse(response)
+
+    async def get_imei(self) -> str:
+        """Get device IMEI (AT+GSN)."""
+        logger.info("Getting IMEI")
+        response = await self.modem.send_at("AT+GSN", strip_ok=True, remove_cmd_prefix=True)
+        return self._simple_parser.parse(response)
+
+    async def get_firmware_version(self) -> str:
+        """Get device firmware version (AT+QGMR)."""
+        logger.info("Getting firmware version")
+        response = await self.modem.send_at("AT+QGMR", strip_ok=True)
+        return self._simple_parser.parse(response)
+
+    async def get_sim_state(self) -> SIMState:
+        """
+        Get SIM card state (AT+CPIN?).
+
+        Raises:
+            SIMError: If SIM is not ready (PIN required, PUK required, etc.)
+        """
+        logger.info("Getting SIM state")
+        response = await self.modem.send_at("AT+CPIN?", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_sim_state(response)
+
+    async def get_equipment_status(self) -> EquipmentStatus:
+        """Get mobile equipment activity status (AT+CPAS)."""
+        logger.info("Getting equipment status")
+        response = await self.modem.send_at("AT+CPAS", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_equipment_status(response)
+
+    async def change_imei(self, new_imei: str) -> str:
+        """
+        Change device IMEI.
+
+        **WARNING**: Changing IMEI may be illegal in your jurisdiction.
+        See DeviceManager.change_imei().
+        """
+        logger.warning(f"Attempting to change IMEI to {new_imei}")
+
+        current_imei = await self.get_imei()
+        if new_imei == current_imei:
+            logger.info("IMEI already matches, skipping change")
+            return new_imei
+
+        cmd = f'AT+EGMR=1,7,"{new_imei}"'
+        await self.modem.send_at(cmd)
+
+        updated_imei = await self.get_imei()
+        if updated_imei != new_imei:
+            raise ATParseError(
+                f"IMEI change failed. Expected {new_imei}, got {updated_imei}",
+                command=cmd
+            )
+
+        logger.info(f"IMEI changed successfully: {current_imei} -> {updated_imei}")
+        return updated_imei
+
+    async def set_echo_mode(self, enabled: bool) -> None:
+        """Set AT command echo mode (ATE1/ATE0)."""
+        cmd = "ATE1" if enabled else "ATE0"
+        logger.info(f"Setting echo mode: {'ON' if enabled else 'OFF'} via {cmd}")
+        await self.modem.send_at(cmd)
+
+
+class AsyncNetworkManager(_AsyncOnly, NetworkManager):
+    """
+    Awaitable network registration, signal and operator queries.
+
+    See NetworkManager for details on each method.
+    """
+
+    def __init__(self, modem_core: "AsyncModemCore") -> None:
+        """
+        Initialize async network manager.
+
+        Args:
+            modem_core: AsyncModemCore instance for AT command execution
+        """
+        super().__init__(modem_core)
+
+    async def get_signal_quality(self) -> SignalQuality:
+        """Get signal quality (AT+CSQ)."""
+        logger.info("Getting signal quality")
+        response = await self.modem.send_at("AT+CSQ", strip_ok=True, remove_cmd_prefix=True)
+        return self._signal_parser.parse(response)
+
+    async def get_network_info(self) -> NetworkInfo:
+        """Get current network information (AT+QNWINFO)."""
+        logger.info("Getting network info")
+        response = await self.modem.send_at("AT+QNWINFO", strip_ok=True, remove_cmd_prefix=True)
+        return self._network_info_parser.parse(response)
+
+    async def get_current_operator(self) -> Optional[CurrentOperator]:
+        """Get current network operator (AT+COPS?), or None if not registered."""
+        logger.info("Getting current operator")
+        response = await self.modem.send_at("AT+COPS?", strip_ok=True, remove_cmd_prefix=True)
+        return self._operator_parser.parse(response)
+
+    async def get_registration_status(self) -> RegistrationStatus:
+        """Get network registration status (AT+CREG?)."""
+        logger.info("Getting registration status")
+        response = await self.modem.send_at("AT+CREG?", strip_ok=True, remove_cmd_prefix=True)
+        return self._reg_status_parser.parse(response)
+
+    async def get_status_snapshot(self) -> NetworkStatus:
+        """Get signal, registration, operator and serving cell in one round trip."""
+        logger.info("Getting network status snapshot")
+        responses = await self.modem.send_batch(self._STATUS_COMMANDS, remove_cmd_prefix=True)
+        return self._parse_status_snapshot(responses)
+
+    async def get_gprs_registration_status(self) -> RegistrationStatus:
+        """Get GPRS network registration status (AT+CGREG?)."""
+        logger.info("Getting GPRS registration status")
+        response = await self.modem.send_at("AT+CGREG?", strip_ok=True, remove_cmd_prefix=True)
+        return self._reg_status_parser.parse(response)
+
+    async def get_gprs_attachment_status(self) -> bool:
+        """Get GPRS attachment status (AT+CGATT?)."""
+        logger.info("Getting GPRS attachment status")
+        response = await self.modem.send_at("AT+CGATT?", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_gprs_attachment(response)
+
+    async def attach_gprs(self) -> None:
+        """
+        Attach to GPRS service.
+
+        Raises:
+            NetworkError: If attachment fails
+        """
+        logger.info("Attaching to GPRS service")
+        if await self.get_gprs_attachment_status():
+            logger.info("Already attached to GPRS")
+            return
+
+        try:
+            await self.modem.send_at("AT+CGATT=1")
+        except Exception as e:
+            raise NetworkError(
+                "Failed to attach to GPRS service",
+                command="AT+CGATT=1"
+            ) from e
+
+    async def detach_gprs(self) -> None:
+        """
+        Detach from GPRS service.
+
+        Raises:
+            NetworkError: If detachment fails
+        """
+        logger.info("Detaching from GPRS service")
+        if not await self.get_gprs_attachment_status():
+            logger.info("Already detached from GPRS")
+            return
+
+        try:
+            await self.modem.send_at("AT+CGATT=0")
+        except Exception as e:
+            raise NetworkError(
+                "Failed to detach from GPRS service",
+                command="AT+CGATT=0"
+            ) from e
+
+    async def wait_for_registration(self, timeout: float = 30.0, check_interval: float = 2.0) -> bool:
+        """
+        Wait for network registration without blocking the event loop.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+            check_interval: Time between checks in seconds
+
+        Returns:
+            True if registered, False if timeout
+        """
+        logger.info(f"Waiting for network registration (timeout={timeout}s)")
+        start_time = time.monotonic()
+
+        while time.monotonic() - start_time < timeout:
+            try:
+                reg_status = await self.get_registration_status()
+                if reg_status.is_registered:
+                    logger.info(f"Registered to network: {reg_status.state}")
+                    return True
+            except Exception as e:
+                logger.warning(f"Error checking registration: {e}")
+
+            await asyncio.sleep(check_interval)
+
+        logger.warning("Network registration timeout")
+        return False
+
+
+class AsyncSMSManager(_AsyncOnly, SMSManager):
+    """
+    Awaitable SMS storage, reading and listing.
+
+    See SMSManager for details on each method. The thread-driven features
+    (start_direct_delivery, track_deliveries, inbox, outbox) are only
+    available through the synchronous QuectelModem.
+    """
+
+    def __init__(self, modem_core: "AsyncModemCore") -> None:
+        """
+        Initialize async SMS manager.
+
+        Args:
+            modem_core: AsyncModemCore instance for AT command execution
+        """
+        super().__init__(modem_core)
+
+    async def get_message_format(self, use_cache: bool = True) -> MessageFormat:
+        """Get current SMS message format mode (AT+CMGF?)."""
+        if use_cache and self._cached_format is not None:
+            return self._cached_format
+
+        logger.info("Getting message format")
+        response = await self.modem.send_at("AT+CMGF?", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_message_format(response)
+
+    async def get_sms_service(self) -> int:
+        """Get the selected SMS message service (AT+CSMS?)."""
+        response = await self.modem.send_at("AT+CSMS?", strip_ok=True, remove_cmd_prefix=True)
+        try:
+            return int(response[0].split(",")[0])
+        except (ValueError, IndexError) as e:
+            raise ATParseError(
+                "Failed to parse SMS service",
+                command="AT+CSMS?",
+                response=response
+            ) from e
+
+    async def set_message_format(self, mode: MessageFormat) -> None:
+        """Set SMS message format mode (AT+CMGF=<mode>)."""
+        current_mode = await self.get_message_format()
+        if current_mode == mode:
+            logger.debug("Message format already set to desired mode")
+            return
+
+        await self.modem.send_at(f"AT+CMGF={mode.value}")
+        self._cached_format = mode
+        logger.info(f"Message format changed: {current_mode} -> {mode}")
+
+    async def send_sms(
+        self,
+        number: str,
+        message: str,
+        encoding: str = "auto",
+        request_status: bool = False,
+        keep_link: bool = True,
+        ref16: bool = False,
+        languages: Iterable[int] = ()
+    ) -> Union[int, list[int]]:
+        """
+        Send an SMS message using PDU mode (AT+CMGS).
+
+        Long messages are sent as concatenated parts (see SMSManager.send_sms).
+
+        Raises:
+            SMSError: If sending fails
+        """
+        logger.info(f"Sending SMS to {number}")
+        await self.set_message_format(MessageFormat.PDU_MODE)
+
+        parts = self._build_cmgs_parts(
+            number, message, encoding, request_status, self._next_concat_ref(ref16), ref16, languages
+        )
+
+        if len(parts) == 1:
+            refs = await self._submit_async(*parts[0])
+        else:
+            # Parts go out back to back; no other task's command can slip in between
+            async with self.modem.exclusive():
+                if keep_link:
+                    try:
+                        await self.modem.send_at("AT+CMMS=1")
+                    except EC25Error as e:
+                        logger.warning(f"AT+CMMS=1 failed, sending parts without it: {e}")
+                refs = [
+                    await self._submit_async(cmd, pdu, part=(i, len(parts)))
+                    for i, (cmd, pdu) in enumerate(parts, start=1)
+                ]
+
+        if request_status:
+            self._track(refs, number)
+        return refs
+
+    async def _submit_async(self, cmd: str, pdu: str, part: Optional[tuple[int, int]] = None) -> int:
+        """Send one AT+CMGS and return its message reference."""
+        label = f" part {part[0]}/{part[1]}" if part else ""
+        try:
+            response = await self.modem.send_prompt_command(
+                cmd, pdu.encode("ascii"), timeout=self.SEND_TIMEOUT
+            )
+        except SMSError:
+            raise
+        except Exception as e:
+            raise SMSError(f"SMS{label} send failed: {e}", command=cmd) from e
+
+        return self._parse_cmgs_response(response, cmd)
+
+    async def read_sms(self, index: int) -> SMSMessage:
+        """
+        Read SMS message by index (AT+CMGR).
+
+        Raises:
+            SMSError: If reading fails or message doesn't exist
+        """
+        logger.info(f"Reading SMS at index {index}")
+        cmd = f"AT+CMGR={index}"
+        response = await self.modem.send_at(cmd, strip_ok=True)
+
+        if not response:
+            raise SMSError(f"No message at index {index}", command=cmd, response=response)
+
+        try:
+            mode = await self.get_message_format()
+            return self._parse_cmgr(response, index, mode)
+        except ValueError as e:
+            raise SMSError(f"Failed to parse SMS: {e}", command=cmd, response=[]) from e
+
+    async def read_many(self, indices: Iterable[int], reassemble: bool = True) -> list[SMSMessage]:
+        """Read several messages with one AT+CMGL or chained AT+CMGR (see SMSManager.read_many)."""
+        wanted = sorted(set(indices))
+        if not wanted:
+            return []
+
+        mode = await self.get_message_format()
+        if len(wanted) > 1 and len(wanted) * 2 >= (await self.get_storage_info())[0].used:
+            selected = set(wanted)
+            messages = [m async for m in self.iter_messages(SMSStatus.ALL, reassemble=False) if m.index in selected]
+            messages.sort(key=lambda m: m.index)
+        else:
+            messages = []
+            for start in range(0, len(wanted), self.BATCH_SIZE):
+                messages.extend(await self._read_chained_async(wanted[start:start + self.BATCH_SIZE], mode))
+
+        return reassemble_parts(messages) if reassemble else messages
+
+    async def _read_chained_async(self, indices: list[int], mode: MessageFormat) -> list[SMSMessage]:
+        """Read messages with one chained AT+CMGR, or one by one if that fails."""
+        try:
+            lines = (await self.modem.send_batch([f"+CMGR={index}" for index in indices]))[0]
+            responses = self._split_cmgr(lines)
+        except ATCommandError as e:
+            logger.debug(f"Chained AT+CMGR failed, reading one by one: {e}")
+            responses = []
+
+        if len(responses) == len(indices):
+            try:
+                return [self._parse_cmgr(r, index, mode) for r, index in zip(responses, indices)]
+            except ValueError as e:
+                raise SMSError(f"Failed to parse SMS: {e}", command="AT+CMGR") from e
+
+        messages = []
+        for index in indices:
+            try:
+                messages.append(await self.read_sms(index))
+            except (SMSError, ATCommandError) as e:
+                if isinstance(e.__cause__, ValueError):
+                    raise
+                logger.debug(f"Skipping message {index}: {e}")
+        return messages
+
+    async def drain(
+        self,
+        status: SMSStatus = SMSStatus.ALL,
+        reassemble: bool = True,
+        keep_incomplete: bool = True
+    ) -> list[SMSMessage]:
+        """Read and delete messages in two round trips (see SMSManager.drain)."""
+        mode = await self.get_message_format()
+        listing = self.modem.stream_at(self._cmgl_command(status, mode), timeout=5.0)
+        headers: list[str] = []
+        messages = [
+            m async for m in self._parse_listing_async(self._tally_headers_async(listing, headers), mode, reassemble)
+        ]
+        consumed, cmd = self._drain_plan(status, messages, keep_incomplete, len(headers))
+
+        if cmd is not None:
+            try:
+                await self.modem.send_at(cmd)
+            except Exception as e:
+                raise SMSError(f"Failed to delete drained messages: {e}", command=cmd) from e
+        else:
+            await self.delete_many(self._message_indices(consumed))
+
+        return consumed
+
+    async def list_messages(
+        self,
+        status: SMSStatus = SMSStatus.ALL,
+        reassemble: bool = True
+    ) -> list[SMSMessage]:
+        """List SMS messages by status (AT+CMGL), joining long messages."""
+        logger.info(f"Listing messages with status: {status.value}")
+        mode = await self.get_message_format()
+        cmd = self._cmgl_command(status, mode)
+        response = await self.modem.send_at(cmd, strip_ok=True)
+
+        if not response or (len(response) == 1 and not response[0]):
+            return []
+
+        try:
+            return self._parse_cmgl(response, mode, reassemble)
+        except ValueError as e:
+            raise SMSError(f"Failed to parse message list: {e}", command=cmd, response=[]) from e
+
+    async def iter_messages(
+        self,
+        status: SMSStatus = SMSStatus.ALL,
+        reassemble: bool = True,
+        timeout: float = 5.0
+    ) -> AsyncIterator[SMSMessage]:
+        """Yield SMS messages while the AT+CMGL listing is still arriving."""
+        mode = await self.get_message_format()
+        cmd = self._cmgl_command(status, mode)
+
+        logger.info(f"Streaming messages with status: {status.value}")
+        async for message in self._parse_listing_async(self.modem.stream_at(cmd, timeout=timeout), mode, reassemble):
+            yield message
+
+    @staticmethod
+    async def _tally_headers_async(lines: AsyncIterator[str], headers: list[str]) -> AsyncIterator[str]:
+        """Pass listing lines through, collecting the +CMGL: headers."""
+        async for line in lines:
+            if line.startswith("+CMGL:"):
+                headers.append(line)
+            yield line
+
+    async def _parse_listing_async(
+        self,
+        lines: AsyncIterator[str],
+        mode: MessageFormat,
+        reassemble: bool
+    ) -> AsyncIterator[SMSMessage]:
+        """Parse streamed AT+CMGL lines in the given format mode."""
+        parse = (
+            self._sms_parser.iter_cmgl_text if mode == MessageFormat.TEXT_MODE
+            else self._sms_parser.iter_cmgl_pdu
+        )
+        joiner = StreamReassembler() if reassemble else None
+
+        # A message's lines are complete when the next header (or the end) arrives
+        pending: list[str] = []
+        async for line in lines:
+            if line.startswith("+CMGL:") and pending:
+                messages = parse(pending)
+                for message in joiner.feed(messages) if joiner else messages:
+                    yield message
+                pending = []
+            pending.append(line)
+
+        messages = parse(pending)
+        for message in joiner.feed(messages) if joiner else messages:
+            yield message
+        if joiner is not None:
+            for message in joiner.finish():
+                yield message
+
+    async def delete_message(self, index: int) -> None:
+        """
+        Delete SMS message by index (AT+CMGD).
+
+        Raises:
+            SMSError: If deletion fails
+        """
+        cmd = f"AT+CMGD={index}"
+        try:
+            await self.modem.send_at(cmd)
+        except Exception as e:
+            raise SMSError(f"Failed to delete message {index}: {e}", command=cmd) from e
+
+    async def delete_many(self, indices: Iterable[int]) -> None:
+        """
+        Delete several messages with chained AT+CMGD commands.
+
+        Raises:
+            SMSError: If deletion fails
+        """
+        indices = list(indices)
+        for start in range(0, len(indices), self.BATCH_SIZE):
+            cmds = [f"+CMGD={index}" for index in indices[start:start + self.BATCH_SIZE]]
+            try:
+                await self.modem.send_batch(cmds)
+            except Exception as e:
+                raise SMSError(f"Failed to delete messages: {e}", command="AT" + ";".join(cmds)) from e
+
+    async def delete_all_messages(self, status: Optional[SMSStatus] = None) -> None:
+        """
+        Delete all messages, optionally filtered by status.
+
+        Raises:
+            SMSError: If deletion fails
+        """
+        cmd = self._delete_all_command(status)
+        try:
+            await self.modem.send_at(cmd)
+        except Exception as e:
+            raise SMSError(f"Failed to delete messages: {e}", command=cmd) from e
+
+    async def get_storage_info(self) -> tuple[SMSStorage, SMSStorage, SMSStorage]:
+        """Get SMS storage information (AT+CPMS?)."""
+        response = await self.modem.send_at("AT+CPMS?", strip_ok=True)
+        try:
+            return self._sms_parser.parse_cpms(response)
+        except ValueError as e:
+            raise SMSError(
+                f"Failed to parse storage info: {e}",
+                command="AT+CPMS?",
+                response=[]
+            ) from e
+
+    async def set_preferred_storage(
+        self,
+        mem1: str = "ME",
+        mem2: str = "ME",
+        mem3: str = "ME"
+    ) -> None:
+        """
+        Set preferred message storage (AT+CPMS=).
+
+        Raises:
+            SMSError: If the storage cannot be set
+        """
+        cmd = f'AT+CPMS="{mem1}","{mem2}","{mem3}"'
+        try:
+            await self.modem.send_at(cmd)
+        except Exception as e:
+            raise SMSError(f"Failed to set storage: {e}", command=cmd) from e
+
+    async def get_storage_locations(self) -> list[str]:
+        """Get list of available storage locations (AT+CPMS=?)."""
+        try:
+            response = await self.modem.send_at("AT+CPMS=?", strip_ok=True)
+            return self._parse_storage_locations(response)
+        except Exception as e:
+            logger.warning(f"Failed to get storage locations: {e}")
+            return ["ME", "SM", "MT"]
@@ -123,6 +123,10 @@ class DeviceManager:
         """
         logger.info("Getting SIM state")
         response = self.modem.send_at("AT+CPIN?", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_sim_state(response)
+
+    def _parse_sim_state(self, response: list[str]) -> SIMState:
+        """Parse an AT+CPIN? response, raising SIMError unless READY."""
         state_str = self._simple_parser.parse(response)
 
         try:
@@ -161,7 +165,10 @@ class DeviceManager:
         """
         logger.info("Getting equipment status")
         response = self.modem.send_at("AT+CPAS", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_equipment_status(response)
 
+    def _parse_equipment_status(self, response: list[str]) -> EquipmentStatus:
+        """Parse an AT+CPAS response."""
         try:
             status_code = self._int_parser.parse(response)
             status = EquipmentStatus(status_code)
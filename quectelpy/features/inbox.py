@@ -0,0 +1,241 @@
+"""
+Local mirror of the modem's SMS store.
+
+Listing the store with AT+CMGL transfers and decodes every message each
+time. InboxMirror reads each message once, keeps it in memory keyed by
+(storage, index), and answers queries without any serial traffic. New
+messages announced by +CMTI are read one by one; an AT+CPMS? used count
+check detects changes made behind the mirror's back and triggers a full
+resync.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Set, Tuple
+
+from ..types import SMSMessage, SMSStatus
+from ..parsers.sms import SMSParser
+from ..parsers.concat import reassemble as reassemble_parts
+from ..exceptions import EC25Error, SMSError
+
+if TYPE_CHECKING:
+    from .sms import SMSManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MirrorStats:
+    """Counters for an InboxMirror."""
+    syncs: int = 0          # sync() calls
+    full_syncs: int = 0     # Full AT+CMGL resyncs
+    incremental: int = 0    # Messages read individually after +CMTI
+    notifications: int = 0  # +CMTI URCs received
+
+
+class InboxMirror:
+    """
+    In-memory mirror of the messages in the modem's read storage.
+
+    The mirror subscribes to +CMTI; notifications are only recorded on the
+    reader thread and applied by the next sync(), which
+
+    1. reads each announced message with AT+CMGR,
+    2. compares the AT+CPMS? used count (and storage) with the mirror, and
+    3. relists the store with AT+CMGL if they disagree.
+
+    A sync with nothing new costs one AT+CPMS? round trip. Queries
+    (messages(), get(), len()) never touch the modem.
+
+    Note that the modem marks messages as read when they are listed or
+    read; the mirror keeps the status reported at that time.
+
+    Example:
+
+    .. code-block:: python
+
+        with modem.sms.inbox() as inbox:
+            inbox.sync()
+            while True:
+                modem.wait_for_urc("+CMTI", timeout=60.0)
+                inbox.sync()
+                for message in inbox.messages(SMSStatus.REC_UNREAD):
+                    ...
+    """
+
+    def __init__(self, sms: "SMSManager") -> None:
+        """
+        Initialize inbox mirror.
+
+        Args:
+            sms: SMSManager used to read the store
+        """
+        self.sms = sms
+        self.storage: Optional[str] = None
+        self.stats = MirrorStats()
+
+        self._lock = threading.Lock()
+        self._messages: Dict[Tuple[str, int], SMSMessage] = {}
+        self._announced: Set[Tuple[str, int]] = set()
+        self._subscription = None
+
+    def start(self) -> None:
+        """Subscribe to +CMTI notifications."""
+        if self._subscription is None:
+            self._subscription = self.sms.modem.register_urc_callback("+CMTI:", self._on_cmti)
+
+    def stop(self) -> None:
+        """Unsubscribe from +CMTI. The mirrored messages are kept."""
+        if self._subscription is not None:
+            self._subscription.unsubscribe()
+            self._subscription = None
+
+    @property
+    def pending(self) -> int:
+        """Number of announced messages not yet read."""
+        return len(self._announced)
+
+    def _on_cmti(self, urc: str) -> None:
+        """Record a new message announcement (reader thread, no AT commands)."""
+        try:
+            storage, index = SMSParser.parse_cmti(urc)
+        except ValueError as e:
+            logger.warning(f"Ignoring malformed +CMTI: {e}")
+            return
+        with self._lock:
+            self._announced.add((storage, index))
+            self.stats.notifications += 1
+
+    def sync(self, full: bool = False) -> int:
+        """
+        Bring the mirror up to date with the modem.
+
+        Args:
+            full: Relist the whole store even if the used count matches
+
+        Returns:
+            Number of messages added to the mirror
+
+        Raises:
+            SMSError: If the store cannot be read
+        """
+        self.stats.syncs += 1
+        with self._lock:
+            announced, self._announced = self._announced, set()
+
+        before = len(self._messages)
+        read_storage = self.sms.get_storage_info()[0]
+
+        if read_storage.storage_type != self.storage:
+            if self.storage is not None:
+                logger.info(f"Read storage changed: {self.storage} -> {read_storage.storage_type}")
+            self.storage = read_storage.storage_type
+            full = True
+
+        if not full:
+            for storage, index in sorted(announced):
+                if storage != self.storage:
+                    logger.debug(f"Ignoring +CMTI for {storage}: mirroring {self.storage}")
+                    continue
+                if (storage, index) not in self._messages:
+                    self._read_one(index)
+            full = read_storage.used != len(self._messages)
+            if full:
+                logger.info(
+                    f"Inbox mirror out of sync ({len(self._messages)} mirrored, "
+                    f"{read_storage.used} stored), relisting"
+                )
+
+        if full:
+            self._relist()
+
+        return max(0, len(self._messages) - before)
+
+    def _read_one(self, index: int) -> None:
+        """Read and mirror a single message."""
+        try:
+            message = self.sms.read_sms(index)
+        except (EC25Error, SMSError) as e:
+            logger.warning(f"Failed to read announced message {index}: {e}")
+            return
+        message.storage = self.storage
+        with self._lock:
+            self._messages[(self.storage, index)] = message
+        self.stats.incremental += 1
+
+    def _relist(self) -> None:
+        """Replace the mirror with a full listing of the store."""
+        messages = {}
+        for message in self.sms.iter_messages(SMSStatus.ALL, reassemble=False):
+            message.storage = self.storage
+            messages[(self.storage, message.index)] = message
+        with self._lock:
+            self._messages = messages
+        self.stats.full_syncs += 1
+        logger.info(f"Mirrored {len(messages)} message(s) from {self.storage}")
+
+    def delete(self, index: int) -> None:
+        """
+        Delete a message on the modem and from the mirror.
+
+        Args:
+            index: Storage index
+
+        Raises:
+            SMSError: If deletion fails
+        """
+        self.sms.delete_message(index)
+        with self._lock:
+            self._messages.pop((self.storage, index), None)
+
+    def messages(
+        self,
+        status: Optional[SMSStatus] = None,
+        reassemble: bool = True
+    ) -> list[SMSMessage]:
+        """
+        Get mirrored messages. No AT commands are sent.
+
+        Args:
+            status: Only messages with this status (None or ALL for all)
+            reassemble: Join the parts of long messages
+
+        Returns:
+            Messages in storage index order
+        """
+        with self._lock:
+            messages = [self._messages[key] for key in sorted(self._messages)]
+        if status is not None and status != SMSStatus.ALL:
+            messages = [m for m in messages if m.status == status.value]
+        return reassemble_parts(messages) if reassemble else messages
+
+    def get(self, index: int) -> Optional[SMSMessage]:
+        """
+        Get one mirrored message by storage index. No AT commands are sent.
+
+        Returns:
+            SMSMessage, or None if not mirrored
+        """
+        return self._messages.get((self.storage, index))
+
+    def __len__(self) -> int:
+        """Number of mirrored messages (parts of long messages count singly)."""
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[SMSMessage]:
+        """Iterate over mirrored messages with long messages joined."""
+        return iter(self.messages())
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.stop()
+
+    def __repr__(self) -> str:
+        """String representation of the mirror."""
+        return f"<InboxMirror storage={self.storage} messages={len(self._messages)} pending={self.pending}>"
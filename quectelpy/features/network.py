@@ -11,7 +11,8 @@ from ..types import (
     NetworkInfo,
     SignalQuality,
     CurrentOperator,
-    RegistrationStatus
+    RegistrationStatus,
+    NetworkStatus
 )
 from ..parsers.network import (
     NetworkInfoParser,
@@ -171,6 +172,43 @@ class NetworkManager:
         logger.debug(f"GPRS registration status: {gprs_status}")
         return gprs_status
 
+    # Commands chained by get_status_snapshot(), in order
+    _STATUS_COMMANDS = ["+CSQ", "+CREG?", "+CGREG?", "+COPS?", "+QNWINFO"]
+
+    def get_status_snapshot(self) -> NetworkStatus:
+        """
+        Get signal, registration, operator and serving cell in one round trip.
+
+        Chains AT+CSQ, AT+CREG?, AT+CGREG?, AT+COPS? and AT+QNWINFO on a
+        single command line instead of sending five commands.
+
+        Returns:
+            NetworkStatus snapshot
+
+        Example:
+
+        .. code-block:: python
+
+            status = modem.network.get_status_snapshot()
+            print(f"{status.signal.rssi_dbm} dBm, registered={status.registration.is_registered}")
+        """
+        logger.info("Getting network status snapshot")
+        responses = self.modem.send_batch(self._STATUS_COMMANDS, remove_cmd_prefix=True)
+        return self._parse_status_snapshot(responses)
+
+    def _parse_status_snapshot(self, responses: list[list[str]]) -> NetworkStatus:
+        """Parse the per-command responses of get_status_snapshot()."""
+        csq, creg, cgreg, cops, qnwinfo = responses
+        status = NetworkStatus(
+            signal=self._signal_parser.parse(csq),
+            registration=self._reg_status_parser.parse(creg),
+            gprs_registration=self._reg_status_parser.parse(cgreg),
+            operator=self._operator_parser.parse(cops),
+            network_info=self._network_info_parser.parse(qnwinfo)
+        )
+        logger.debug(f"Network status: {status}")
+        return status
+
     def get_gprs_attachment_status(self) -> bool:
         """
         Get GPRS attachment status.
@@ -189,7 +227,10 @@ class NetworkManager:
         """
         logger.info("Getting GPRS attachment status")
         response = self.modem.send_at("AT+CGATT?", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_gprs_attachment(response)
 
+    def _parse_gprs_attachment(self, response: list[str]) -> bool:
+        """Parse an AT+CGATT? response."""
         try:
             status = self._int_parser.parse(response)
         except ATParseError as e:
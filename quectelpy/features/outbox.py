@@ -0,0 +1,551 @@
+"""
+Persistent, rate-limited SMS outbox.
+
+send_sms() submits one message and raises on failure. SMSOutbox instead
+stores messages in sqlite and sends them from a worker thread at a
+configured rate, so a burst of thousands of messages neither blocks the
+caller nor is lost when the process stops. Failed sends are retried with a
+backoff chosen from the +CMS ERROR code; results can be looked up by outbox
+ID or by the +CMGS message reference.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Tuple, Union
+
+from ..types import OutboxEntry, OutboxState
+from ..exceptions import CMSError, EC25Error, SMSError
+
+if TYPE_CHECKING:
+    from .sms import SMSManager
+
+logger = logging.getLogger(__name__)
+
+# Called with the entry of each message that was sent or failed for good
+OutboxCallback = Callable[[OutboxEntry], None]
+
+# +CMS ERROR codes worth retrying, with the initial backoff in seconds.
+# Any other code (unassigned number, barring, invalid PDU, ...) fails the
+# message at once.
+RETRY_BACKOFF: dict[int, float] = {
+    38: 30.0,   # Network out of order
+    41: 10.0,   # Temporary failure
+    42: 60.0,   # Congestion
+    47: 30.0,   # Resources unavailable
+    192: 60.0,  # SC busy
+    194: 60.0,  # SC system failure
+    212: 5.0,   # (U)SIM Application Toolkit busy
+    300: 10.0,  # ME failure
+    314: 5.0,   # (U)SIM busy
+    331: 30.0,  # No network service
+    332: 10.0,  # Network timeout
+    500: 10.0,  # Unknown error
+}
+
+# Initial backoff for failures without a CMS code (timeouts, lost link, ERROR)
+DEFAULT_BACKOFF = 10.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    number TEXT NOT NULL,
+    text TEXT NOT NULL,
+    encoding TEXT NOT NULL,
+    request_status INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    created REAL NOT NULL,
+    sent_at REAL,
+    refs TEXT,
+    error TEXT,
+    error_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS outbox_state ON outbox (state, id);
+CREATE TABLE IF NOT EXISTS outbox_refs (
+    reference INTEGER NOT NULL,
+    message_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_refs_reference ON outbox_refs (reference);
+"""
+
+_COLUMNS = "id, number, text, state, attempts, refs, error, error_code, created, sent_at"
+
+
+def retry_backoff(error: Exception) -> Optional[float]:
+    """
+    Initial retry backoff for a send error.
+
+    Args:
+        error: Exception raised by send_sms()
+
+    Returns:
+        Seconds to wait before the first retry, or None if the error is
+        permanent (unknown number, barred, message cannot be encoded, ...)
+
+    Example:
+
+    .. code-block:: python
+
+        retry_backoff(CMSError(42, "Congestion"))  # 60.0
+        retry_backoff(CMSError(1, "Unassigned (unallocated) number"))  # None
+    """
+    error = _send_cause(error)
+    if isinstance(error, CMSError):
+        if error.code is None:
+            return DEFAULT_BACKOFF
+        return RETRY_BACKOFF.get(error.code)
+    if isinstance(error, EC25Error) and not isinstance(error, SMSError):
+        return DEFAULT_BACKOFF
+    return None
+
+
+def _send_cause(error: Exception) -> Exception:
+    """Unwrap the SMSError that send_sms() raises around command failures."""
+    while (
+        isinstance(error, SMSError)
+        and not isinstance(error, CMSError)
+        and error.__cause__ is not None
+    ):
+        error = error.__cause__
+    return error
+
+
+@dataclass
+class OutboxStats:
+    """Counters and timings for an SMSOutbox."""
+    sent: int = 0              # Messages accepted by the network
+    parts: int = 0             # SMS submitted (each part of a long message counts)
+    failed: int = 0            # Messages failed for good
+    retries: int = 0           # Failed attempts scheduled for retry
+    send_time: float = 0.0     # Seconds spent submitting sent messages
+    max_send_time: float = 0.0
+    latency: float = 0.0       # Seconds from enqueue to sent, summed
+    max_latency: float = 0.0
+    elapsed: float = 0.0       # Seconds from start() to the last send
+
+    @property
+    def throughput(self) -> float:
+        """SMS (parts) submitted per second since start()."""
+        return self.parts / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def avg_send_time(self) -> float:
+        """Average seconds to submit one message."""
+        return self.send_time / self.sent if self.sent else 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """Average seconds from enqueue to sent."""
+        return self.latency / self.sent if self.sent else 0.0
+
+
+class SMSOutbox:
+    """
+    Durable SMS queue drained by a worker thread.
+
+    Messages are stored in a sqlite database (``":memory:"`` for a
+    non-persistent queue) and sent oldest first. ``rate`` limits the SMS
+    submitted per second, counting every part of a long message. A failed
+    send is retried after ``RETRY_BACKOFF[code]`` seconds (doubling per
+    attempt, capped at ``max_backoff``) if its +CMS ERROR code is transient,
+    and fails for good otherwise or after ``max_attempts`` attempts.
+
+    Messages that were being sent when the process stopped are queued
+    again on the next start, so a message can occasionally be sent twice.
+    A long message is retried as a whole.
+
+    Use one outbox, and one database file, per modem.
+
+    Example:
+
+    .. code-block:: python
+
+        with modem.sms.outbox("outbox.db", rate=0.5) as outbox:
+            ids = outbox.enqueue_many((number, "Maintenance at 22:00") for number in numbers)
+            outbox.join()
+            print(outbox.stats.throughput, outbox.stats.avg_latency)
+            print(outbox.by_reference(42))
+    """
+
+    def __init__(
+        self,
+        sms: "SMSManager",
+        path: str = ":memory:",
+        rate: Optional[float] = None,
+        max_attempts: int = 5,
+        max_backoff: float = 600.0,
+        on_result: Optional[OutboxCallback] = None
+    ) -> None:
+        """
+        Initialize outbox.
+
+        Args:
+            sms: SMSManager used to send
+            path: sqlite database file
+            rate: Maximum SMS per second (None = as fast as the modem accepts)
+            max_attempts: Attempts before a message fails for good
+            max_backoff: Upper limit for the retry backoff in seconds
+            on_result: Called on the worker thread with the entry of each
+                       message that was sent or failed for good
+
+        Raises:
+            ValueError: If rate is not positive or max_attempts is less than 1
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.sms = sms
+        self.path = path
+        self.rate = rate
+        self.max_attempts = max_attempts
+        self.max_backoff = max_backoff
+        self.on_result = on_result
+        self.stats = OutboxStats()
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._next_send = 0.0
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            recovered = self._db.execute(
+                "UPDATE outbox SET state = ? WHERE state = ?",
+                (OutboxState.QUEUED.value, OutboxState.SENDING.value)
+            ).rowcount
+        if recovered:
+            logger.warning(f"Requeued {recovered} message(s) interrupted while sending")
+
+    @property
+    def active(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._worker is not None
+
+    @property
+    def pending(self) -> int:
+        """Number of messages queued or being sent."""
+        with self._lock:
+            return self._pending()
+
+    def _pending(self) -> int:
+        """Count unfinished messages. Called with the lock held."""
+        return self._db.execute(
+            "SELECT COUNT(*) FROM outbox WHERE state IN (?, ?)",
+            (OutboxState.QUEUED.value, OutboxState.SENDING.value)
+        ).fetchone()[0]
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self.active:
+            return
+
+        self._stopping.clear()
+        self._started = time.monotonic()
+        self._worker = threading.Thread(target=self._run, daemon=True, name="SMSOutboxThread")
+        self._worker.start()
+        logger.info(f"Started SMS outbox ({self.pending} pending, rate={self.rate})")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker thread after the message being sent, if any.
+
+        Queued messages stay in the database and are sent after the next
+        start().
+
+        Args:
+            timeout: Seconds to wait for the worker
+        """
+        if not self.active:
+            return
+
+        self._stopping.set()
+        self._wake.set()
+        self._worker.join(timeout=timeout)
+        if self._worker.is_alive():
+            logger.warning("SMS outbox thread did not terminate in time")
+        self._worker = None
+        logger.info("Stopped SMS outbox")
+
+    def close(self) -> None:
+        """Stop the worker and close the database."""
+        self.stop()
+        self._db.close()
+
+    def enqueue(
+        self,
+        number: str,
+        text: str,
+        encoding: str = "auto",
+        request_status: bool = False
+    ) -> int:
+        """
+        Queue one message.
+
+        Args:
+            number: Recipient phone number
+            text: Message text
+            encoding: "gsm7", "ucs2", or "auto"
+            request_status: Request a delivery status report
+
+        Returns:
+            Outbox ID of the message
+        """
+        return self.enqueue_many([(number, text)], encoding, request_status)[0]
+
+    def enqueue_many(
+        self,
+        messages: Iterable[Tuple[str, str]],
+        encoding: str = "auto",
+        request_status: bool = False
+    ) -> list[int]:
+        """
+        Queue many messages in one transaction.
+
+        Args:
+            messages: (number, text) pairs
+            encoding: "gsm7", "ucs2", or "auto"
+            request_status: Request delivery status reports
+
+        Returns:
+            Outbox IDs in input order
+        """
+        now = time.time()
+        with self._changed:
+            with self._db:
+                ids = [
+                    self._db.execute(
+                        "INSERT INTO outbox (number, text, encoding, request_status, state, "
+                        "next_attempt, created) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (number, text, encoding, int(request_status), OutboxState.QUEUED.value, now, now)
+                    ).lastrowid
+                    for number, text in messages
+                ]
+            self._changed.notify_all()
+        self._wake.set()
+        logger.debug(f"Queued {len(ids)} message(s)")
+        return ids
+
+    def get(self, message_id: int) -> Optional[OutboxEntry]:
+        """
+        Get a message and its result by outbox ID.
+
+        Returns:
+            OutboxEntry, or None if the ID is unknown
+        """
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE id = ?", (message_id,)
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def by_reference(self, reference: int) -> Optional[OutboxEntry]:
+        """
+        Get the message most recently sent with a +CMGS reference.
+
+        References wrap around at 255, so older messages may share one.
+
+        Args:
+            reference: Message reference of the message or one of its parts
+
+        Returns:
+            OutboxEntry, or None if no message was sent with the reference
+        """
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_COLUMNS} FROM outbox WHERE id = ("
+                "SELECT message_id FROM outbox_refs WHERE reference = ? "
+                "ORDER BY rowid DESC LIMIT 1)",
+                (reference,)
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued message was sent or failed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the outbox is empty, False on timeout
+        """
+        with self._changed:
+            return self._changed.wait_for(lambda: self._pending() == 0, timeout)
+
+    def _run(self) -> None:
+        """Worker thread: send due messages at the configured rate."""
+        while not self._stopping.is_set():
+            delay = self._next_send - time.monotonic()
+            if delay > 0 and self._stopping.wait(delay):
+                return
+
+            self._wake.clear()
+            claimed = self._claim()
+            if isinstance(claimed, tuple):
+                self._send(*claimed)
+            else:
+                # Nothing due: sleep until the next retry or a new message
+                self._wake.wait(claimed)
+
+    def _claim(self) -> Union[tuple, Optional[float]]:
+        """
+        Mark the oldest due message as sending.
+
+        Returns:
+            (id, number, text, encoding, request_status, attempts, created),
+            or the seconds until the next retry is due (None if none is queued)
+        """
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT id, number, text, encoding, request_status, attempts, created "
+                "FROM outbox WHERE state = ? AND next_attempt <= ? ORDER BY id LIMIT 1",
+                (OutboxState.QUEUED.value, now)
+            ).fetchone()
+            if row is None:
+                next_attempt = self._db.execute(
+                    "SELECT MIN(next_attempt) FROM outbox WHERE state = ?",
+                    (OutboxState.QUEUED.value,)
+                ).fetchone()[0]
+                return None if next_attempt is None else max(0.0, next_attempt - now)
+
+            self._db.execute(
+                "UPDATE outbox SET state = ?, attempts = attempts + 1 WHERE id = ?",
+                (OutboxState.SENDING.value, row[0])
+            )
+            return row
+
+    def _send(
+        self,
+        message_id: int,
+        number: str,
+        text: str,
+        encoding: str,
+        request_status: int,
+        attempts: int,
+        created: float
+    ) -> None:
+        """Submit one message and record the result."""
+        started = time.monotonic()
+        try:
+            result = self.sms.send_sms(number, text, encoding=encoding, request_status=bool(request_status))
+        except Exception as e:
+            if not isinstance(e, EC25Error):
+                logger.error(f"Unexpected error sending outbox message {message_id}: {e}", exc_info=True)
+            self._throttle(started, 1)
+            self._failed(message_id, attempts + 1, e)
+            return
+
+        finished = time.monotonic()
+        refs = result if isinstance(result, list) else [result]
+        self._throttle(started, len(refs))
+
+        now = time.time()
+        with self._changed:
+            with self._db:
+                self._db.execute(
+                    "UPDATE outbox SET state = ?, sent_at = ?, refs = ?, error = NULL, "
+                    "error_code = NULL WHERE id = ?",
+                    (OutboxState.SENT.value, now, ",".join(map(str, refs)), message_id)
+                )
+                self._db.executemany(
+                    "INSERT INTO outbox_refs (reference, message_id) VALUES (?, ?)",
+                    [(ref, message_id) for ref in refs if ref >= 0]
+                )
+            self._changed.notify_all()
+
+        stats = self.stats
+        stats.sent += 1
+        stats.parts += len(refs)
+        stats.send_time += finished - started
+        stats.max_send_time = max(stats.max_send_time, finished - started)
+        stats.latency += now - created
+        stats.max_latency = max(stats.max_latency, now - created)
+        stats.elapsed = finished - self._started
+
+        logger.debug(f"Sent outbox message {message_id} (refs {refs})")
+        self._report(message_id)
+
+    def _throttle(self, started: float, parts: int) -> None:
+        """Delay the next send so that at most ``rate`` SMS go out per second."""
+        if self.rate is not None:
+            self._next_send = started + parts / self.rate
+
+    def _failed(self, message_id: int, attempts: int, error: Exception) -> None:
+        """Schedule a retry or fail the message for good."""
+        backoff = retry_backoff(error)
+        cause = _send_cause(error)
+        code = cause.code if isinstance(cause, CMSError) else None
+        final = backoff is None or attempts >= self.max_attempts
+
+        if final:
+            state, next_attempt = OutboxState.FAILED, 0.0
+            logger.warning(f"Outbox message {message_id} failed after {attempts} attempt(s): {error}")
+        else:
+            backoff = min(backoff * 2 ** (attempts - 1), self.max_backoff)
+            state, next_attempt = OutboxState.QUEUED, time.time() + backoff
+            logger.info(f"Outbox message {message_id} failed ({error}), retrying in {backoff:.0f}s")
+
+        with self._changed:
+            with self._db:
+                self._db.execute(
+                    "UPDATE outbox SET state = ?, next_attempt = ?, error = ?, error_code = ? WHERE id = ?",
+                    (state.value, next_attempt, str(error), code, message_id)
+                )
+            self._changed.notify_all()
+
+        if final:
+            self.stats.failed += 1
+            self._report(message_id)
+        else:
+            self.stats.retries += 1
+
+    def _report(self, message_id: int) -> None:
+        """Pass a finished message to on_result."""
+        if self.on_result is None:
+            return
+        try:
+            self.on_result(self.get(message_id))
+        except Exception as e:
+            logger.error(f"Outbox result callback failed: {e}", exc_info=True)
+
+    @staticmethod
+    def _entry(row: tuple) -> OutboxEntry:
+        """Build an OutboxEntry from a row of _COLUMNS."""
+        message_id, number, text, state, attempts, refs, error, error_code, created, sent_at = row
+        return OutboxEntry(
+            id=message_id,
+            number=number,
+            text=text,
+            state=OutboxState(state),
+            attempts=attempts,
+            references=[int(ref) for ref in refs.split(",")] if refs else None,
+            error=error,
+            error_code=error_code,
+            created=created,
+            sent_at=sent_at
+        )
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the outbox."""
+        return f"<SMSOutbox path={self.path} active={self.active} sent={self.stats.sent}>"
@@ -6,20 +6,42 @@ Supports both text mode and PDU mode for maximum compatibility.
 """
 
 import logging
-from typing import TYPE_CHECKING, Optional
-import time
+import random
+import re
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union
 
 from ..types import MessageFormat, SMSMessage, SMSStatus, SMSStorage
 from ..parsers.base import IntValueParser
 from ..parsers.sms import SMSParser
-from ..parsers.pdu import encode_sms_submit, calculate_sms_parts, PDUError
-from ..exceptions import ATParseError, SMSError
+from ..parsers.concat import SMSReassembler, iter_reassembled, reassemble as reassemble_parts
+from ..parsers.pdu import encode_sms_submit_parts, PDUError
+from ..exceptions import ATCommandError, ATParseError, EC25Error, SMSError
+from .sms_delivery import DirectDelivery, SMSMessageCallback
+from .sms_reports import DeliveryCallback, DeliveryTracker
+from .inbox import InboxMirror
+from .outbox import OutboxCallback, SMSOutbox
 
 if TYPE_CHECKING:
     from ..core import ModemCore
 
 logger = logging.getLogger(__name__)
 
+# AT+CMGL <stat> values in PDU mode
+PDU_LIST_STAT = {
+    SMSStatus.REC_UNREAD: 0,
+    SMSStatus.REC_READ: 1,
+    SMSStatus.STO_UNSENT: 2,
+    SMSStatus.STO_SENT: 3,
+    SMSStatus.ALL: 4,
+}
+
+# AT+CMGD=1,<flag> deleting exactly what drain() listed for a status: listing
+# marks received messages as read, and messages arriving meanwhile stay unread
+DRAIN_DELETE_FLAG = {
+    SMSStatus.REC_READ: 1,
+    SMSStatus.ALL: 3,
+}
+
 
 class SMSManager:
     """
@@ -33,8 +55,16 @@ class SMSManager:
     - SMS storage management
     - Automatic encoding detection
     - Support for long messages (concatenated SMS)
+    - Direct-to-TE delivery of incoming messages (+CMT)
+    - Delivery tracking from status reports (+CDS)
     """
 
+    # Network submission of an SMS can take several seconds
+    SEND_TIMEOUT = 30.0
+
+    # Commands chained per line by read_many() and delete_many()
+    BATCH_SIZE = 10
+
     def __init__(self, modem_core: "ModemCore") -> None:
         """
         Initialize SMS manager.
@@ -46,6 +76,11 @@ class SMSManager:
         self._int_parser = IntValueParser()
         self._sms_parser = SMSParser()
         self._cached_format: Optional[MessageFormat] = None
+        self._delivery: Optional[DirectDelivery] = None
+        self._tracker: Optional[DeliveryTracker] = None
+
+        # Concatenation reference, incremented per multi-part message
+        self._concat_ref = random.randrange(0x10000)
 
         logger.debug("Initialized SMSManager")
 
@@ -74,7 +109,10 @@ class SMSManager:
 
         logger.info("Getting message format")
         response = self.modem.send_at("AT+CMGF?", strip_ok=True, remove_cmd_prefix=True)
+        return self._parse_message_format(response)
 
+    def _parse_message_format(self, response: list[str]) -> MessageFormat:
+        """Parse an AT+CMGF? response and update the format cache."""
         try:
             mode = self._int_parser.parse(response)
             message_format = MessageFormat(mode)
@@ -128,8 +166,11 @@ class SMSManager:
         number: str,
         message: str,
         encoding: str = "auto",
-        request_status: bool = False
-    ) -> int:
+        request_status: bool = False,
+        keep_link: bool = True,
+        ref16: bool = False,
+        languages: Iterable[int] = ()
+    ) -> Union[int, list[int]]:
         """
         Send an SMS message using PDU mode.
 
@@ -138,14 +179,27 @@ class SMSManager:
         - Long messages (automatic concatenation)
         - Delivery reports
 
+        A message longer than one SMS is split into parts with a
+        concatenation header. All parts are submitted back to back under one
+        command lock hold, after AT+CMMS=1 so the network keeps the relay
+        link open between parts.
+
         Args:
             number: Recipient phone number (with or without +)
             message: Message text
-            encoding: "gsm7", "ucs2", or "auto" (default)
+            encoding: "gsm7", "ucs2", or "auto" (default). The encoding
+                      with the fewest parts is used (see plan_sms())
             request_status: Request delivery status report
+            keep_link: Send AT+CMMS=1 before a multi-part message
+            ref16: Use a 16-bit concatenation reference (one character
+                   less per part, fewer reference collisions)
+            languages: National languages whose shift tables may be used
+                       (NATIONAL_LANGUAGES values), e.g.
+                       ``[NATIONAL_LANGUAGES["turkish"]]``; none by default
 
         Returns:
-            Message reference number
+            Message reference number, or a list with one reference per part
+            for a multi-part message
 
         Raises:
             SMSError: If sending fails
@@ -162,111 +216,324 @@ class SMSManager:
 
             # Request delivery report
             ref = modem.sms.send_sms("+1234567890", "Important", request_status=True)
-        """
-        logger.info(f"Sending SMS to {number}")
 
-        # Calculate SMS parts
-        parts = calculate_sms_parts(message, encoding)
-        logger.debug(f"Message will be sent as {parts} part(s)")
+            # Long message: one reference per part
+            refs = modem.sms.send_sms("+1234567890", "x" * 400)
 
-        if parts > 1:
-            logger.warning("Concatenated SMS (multi-part) not fully implemented")
-            logger.warning("Only first 160 chars (GSM7) or 70 chars (UCS2) will be sent")
+            # Turkish text in GSM 7-bit with the national shift tables
+            ref = modem.sms.send_sms(
+                "+905551234567", "Görüşürüz!", languages=[NATIONAL_LANGUAGES["turkish"]]
+            )
+        """
+        logger.info(f"Sending SMS to {number}")
 
         # Ensure we're in PDU mode
         self.set_message_format(MessageFormat.PDU_MODE)
 
+        parts = self._build_cmgs_parts(
+            number, message, encoding, request_status, self._next_concat_ref(ref16), ref16, languages
+        )
+        logger.debug(f"Message will be sent as {len(parts)} part(s)")
+
+        if len(parts) == 1:
+            refs = self._submit(*parts[0])
+        else:
+            # Parts go out back to back; no other command can slip in between
+            with self.modem.exclusive():
+                if keep_link:
+                    self._keep_link_open()
+                refs = [
+                    self._submit(cmd, pdu, part=(i, len(parts)))
+                    for i, (cmd, pdu) in enumerate(parts, start=1)
+                ]
+
+        if request_status:
+            self._track(refs, number)
+        return refs
+
+    def _track(self, refs: Union[int, list[int]], number: str) -> None:
+        """Register sent references with the active delivery tracker."""
+        if self._tracker is None or not self._tracker.active:
+            return
+        refs = refs if isinstance(refs, list) else [refs]
+        self._tracker.track([ref for ref in refs if ref >= 0], number)
+
+    def _submit(self, cmd: str, pdu: str, part: Optional[tuple[int, int]] = None) -> int:
+        """Send one AT+CMGS and return its message reference."""
+        label = f" part {part[0]}/{part[1]}" if part else ""
         try:
-            # Encode message to PDU
-            pdu = encode_sms_submit(
-                number=number,
-                text=message,
-                encoding=encoding,
-                request_status=request_status
-            )
+            # Header, "> " prompt, PDU + Ctrl+Z, final result: one lock hold
+            response = self.modem.send_prompt_command(cmd, pdu.encode("ascii"), timeout=self.SEND_TIMEOUT)
+        except SMSError:
+            raise
+        except Exception as e:
+            raise SMSError(f"SMS{label} send failed: {e}", command=cmd) from e
 
-            # Calculate PDU length (excluding SMSC)
-            # First byte is SMSC length (00 = use default)
-            pdu_length = (len(pdu) // 2) - 1
+        return self._parse_cmgs_response(response, cmd)
 
-            # Send AT+CMGS command
-            cmd = f"AT+CMGS={pdu_length}"
-            logger.debug(f"Sending: {cmd}")
+    def _keep_link_open(self) -> None:
+        """Ask the network to keep the relay link open (AT+CMMS=1)."""
+        try:
+            self.modem.send_at("AT+CMMS=1")
+        except EC25Error as e:
+            logger.warning(f"AT+CMMS=1 failed, sending parts without it: {e}")
 
-            # Write command and wait for prompt
-            self.modem.transport.write((cmd + "\r\n").encode())
-            time.sleep(0.1)
+    def _next_concat_ref(self, ref16: bool) -> int:
+        """Next concatenation reference (8 or 16 bit)."""
+        self._concat_ref = (self._concat_ref + 1) & 0xFFFF
+        return self._concat_ref if ref16 else self._concat_ref & 0xFF
 
-            # Wait for "> " prompt
-            prompt = self.modem.transport.read_until(b"> ", timeout=5.0)
-            if b">" not in prompt:
-                raise SMSError(
-                    "Did not receive SMS prompt",
-                    command=cmd,
-                    response=[prompt.decode('utf-8', errors='ignore')]
-                )
+    @staticmethod
+    def _build_cmgs_parts(
+        number: str,
+        message: str,
+        encoding: str,
+        request_status: bool,
+        reference: int = 0,
+        ref16: bool = False,
+        languages: Iterable[int] = ()
+    ) -> list[tuple[str, str]]:
+        """
+        Encode every part of a message with its AT+CMGS header.
 
-            # Send PDU followed by Ctrl+Z
-            pdu_with_terminator = pdu + "\x1A"
-            self.modem.transport.write(pdu_with_terminator.encode())
-
-            # Wait for response (can take several seconds)
-            # Read lines until we get a final response
-            response_lines = []
-            start_time = time.time()
-            timeout = 30.0  # SMS can take a while
-
-            while time.time() - start_time < timeout:
-                try:
-                    line_bytes = self.modem.transport.read_until(b"\r\n", timeout=1.0)
-                    if not line_bytes:
-                        continue
-
-                    line = line_bytes.decode("utf-8", errors="ignore").strip()
-                    if not line:
-                        continue
-
-                    response_lines.append(line)
-                    logger.debug(f"SMS response: {line}")
-
-                    # Check for final response
-                    if line == "OK":
-                        break
-                    elif "ERROR" in line or "+CMS ERROR" in line:
-                        raise SMSError(
-                            f"SMS send failed: {line}",
-                            command=cmd,
-                            response=response_lines
-                        )
-
-                except Exception as e:
-                    if isinstance(e, SMSError):
-                        raise
-                    # Continue waiting
-                    continue
-
-            # Parse message reference from response
-            try:
-                ref = self._sms_parser.parse_cmgs(response_lines)
-                logger.info(f"SMS sent successfully, reference: {ref}")
-                return ref
-            except ValueError as e:
-                # Even if we can't parse reference, if we got OK, it was sent
-                if "OK" in response_lines:
-                    logger.warning(f"SMS sent but could not parse reference: {e}")
-                    return -1
-                raise SMSError(
-                    f"Failed to parse SMS response: {e}",
-                    command=cmd,
-                    response=response_lines
-                ) from e
+        Returns:
+            List of (AT+CMGS command, PDU hex string), one per part
 
+        Raises:
+            SMSError: If PDU encoding fails
+        """
+        try:
+            pdus = encode_sms_submit_parts(
+                number,
+                message,
+                encoding=encoding,
+                reference=reference,
+                ref16=ref16,
+                request_status=request_status,
+                languages=languages
+            )
         except PDUError as e:
             raise SMSError(f"PDU encoding failed: {e}") from e
+
+        return [(SMSManager._cmgs_command(pdu), pdu) for pdu in pdus]
+
+    @staticmethod
+    def _cmgs_command(pdu: str) -> str:
+        """AT+CMGS header for a PDU that starts with the 00 (default) SMSC."""
+        # PDU length excludes the SMSC part (first byte 00 = use default SMSC)
+        return f"AT+CMGS={(len(pdu) // 2) - 1}"
+
+    def _parse_cmgs_response(self, response: list[str], cmd: str) -> int:
+        """Parse the message reference from an AT+CMGS response."""
+        try:
+            ref = self._sms_parser.parse_cmgs(response)
+            logger.info(f"SMS sent successfully, reference: {ref}")
+            return ref
+        except ValueError as e:
+            # Even if we can't parse reference, if we got OK, it was sent
+            if "OK" in response:
+                logger.warning(f"SMS sent but could not parse reference: {e}")
+                return -1
+            raise SMSError(
+                f"Failed to parse SMS response: {e}",
+                command=cmd,
+                response=response
+            ) from e
+
+    def get_sms_service(self) -> int:
+        """
+        Get the selected SMS message service (AT+CSMS?).
+
+        Returns:
+            0 (phase 2, no acknowledgement) or 1 (phase 2+, incoming
+            messages routed to the TE must be acknowledged with AT+CNMA)
+        """
+        response = self.modem.send_at("AT+CSMS?", strip_ok=True, remove_cmd_prefix=True)
+        try:
+            return int(response[0].split(",")[0])
+        except (ValueError, IndexError) as e:
+            raise ATParseError(
+                "Failed to parse SMS service",
+                command="AT+CSMS?",
+                response=response
+            ) from e
+
+    def start_direct_delivery(
+        self,
+        on_message: Optional[SMSMessageCallback] = None,
+        phase2plus: Optional[bool] = None,
+        max_queue_size: int = 1000,
+        reassemble: bool = True
+    ) -> DirectDelivery:
+        """
+        Receive incoming SMS directly as +CMT URCs instead of via storage.
+
+        Switches to PDU mode and sets AT+CNMI <mt>=2 (other routing
+        settings, such as status reports from track_deliveries(), are kept),
+        so the modem sends each new message to the host instead of storing
+        it and sending +CMTI. Messages are decoded on a worker thread; there are no
+        AT+CMGR/AT+CMGD round trips per message. Under phase 2+ SMS service
+        each message is acknowledged with AT+CNMA after it was delivered.
+
+        Args:
+            on_message: Called with each SMSMessage on the worker thread
+                        (default: queue messages, read with get() or by
+                        iterating over the returned DirectDelivery)
+            phase2plus: Select phase 2+ (True, AT+CSMS=1) or phase 2
+                        (False, AT+CSMS=0) service; None keeps the current one
+            max_queue_size: Maximum undelivered messages queued
+            reassemble: Deliver long messages once all parts arrived
+                        instead of part by part
+
+        Returns:
+            Running DirectDelivery; call stop() to restore the previous routing
+
+        Raises:
+            SMSError: If direct delivery is already active or cannot be enabled
+
+        Example:
+
+        .. code-block:: python
+
+            with modem.sms.start_direct_delivery(phase2plus=True) as delivery:
+                for message in delivery:
+                    print(f"{message.sender}: {message.content}")
+        """
+        if self._delivery is not None and self._delivery.active:
+            raise SMSError("Direct delivery already active")
+
+        try:
+            self.set_message_format(MessageFormat.PDU_MODE)
+
+            if phase2plus is None:
+                acknowledge = self.get_sms_service() == 1
+            else:
+                self.modem.send_at(f"AT+CSMS={int(phase2plus)}")
+                acknowledge = phase2plus
+
+            delivery = DirectDelivery(
+                self.modem,
+                acknowledge=acknowledge,
+                on_message=on_message,
+                max_queue_size=max_queue_size,
+                reassembler=SMSReassembler() if reassemble else None
+            )
+            delivery.start()
+        except SMSError:
+            raise
         except Exception as e:
-            if isinstance(e, SMSError):
-                raise
-            raise SMSError(f"SMS send failed: {e}") from e
+            raise SMSError(f"Failed to enable direct delivery: {e}") from e
+
+        self._delivery = delivery
+        return delivery
+
+    def track_deliveries(
+        self,
+        on_update: Optional[DeliveryCallback] = None,
+        stored: bool = False,
+        ttl: float = 48 * 3600.0
+    ) -> DeliveryTracker:
+        """
+        Track the delivery of sent messages from their status reports.
+
+        Switches to PDU mode and routes status reports to the host (+CDS,
+        AT+CNMI <ds>=1) or, with ``stored``, to storage with a +CDSI
+        notification (<ds>=2). From then on every message sent with
+        request_status=True is tracked by its message reference; reports
+        are matched as they arrive, without polling the store.
+
+        Args:
+            on_update: Called with each TrackedDelivery whose state changes
+            stored: Store reports and read them on +CDSI instead of +CDS
+            ttl: Seconds each message is tracked after sending
+
+        Returns:
+            Running DeliveryTracker; call stop() to turn routing off
+
+        Raises:
+            SMSError: If tracking is already active or cannot be enabled
+
+        Example:
+
+        .. code-block:: python
+
+            tracker = modem.sms.track_deliveries()
+            ref = modem.sms.send_sms("+1234567890", "Hello!", request_status=True)
+            ...
+            if tracker.get(ref).state == DeliveryState.DELIVERED:
+                print(f"Delivered in {tracker.get(ref).latency:.1f}s")
+        """
+        if self._tracker is not None and self._tracker.active:
+            raise SMSError("Delivery tracking already active")
+
+        try:
+            self.set_message_format(MessageFormat.PDU_MODE)
+            tracker = DeliveryTracker(
+                self.modem,
+                acknowledge=self.get_sms_service() == 1,
+                stored=stored,
+                ttl=ttl,
+                on_update=on_update
+            )
+            tracker.start()
+        except Exception as e:
+            raise SMSError(f"Failed to enable delivery tracking: {e}") from e
+
+        self._tracker = tracker
+        return tracker
+
+    def inbox(self) -> InboxMirror:
+        """
+        Create a local mirror of the read storage, subscribed to +CMTI.
+
+        Queries against the mirror send no AT commands; call sync() on it
+        to apply new messages (see InboxMirror).
+
+        Returns:
+            Started InboxMirror; call sync() to fill it
+
+        Example:
+
+        .. code-block:: python
+
+            with modem.sms.inbox() as inbox:
+                inbox.sync()
+                unread = inbox.messages(SMSStatus.REC_UNREAD)
+        """
+        mirror = InboxMirror(self)
+        mirror.start()
+        return mirror
+
+    def outbox(
+        self,
+        path: str = ":memory:",
+        rate: Optional[float] = None,
+        max_attempts: int = 5,
+        on_result: Optional[OutboxCallback] = None
+    ) -> SMSOutbox:
+        """
+        Open a persistent outbox that sends queued messages in the background.
+
+        Args:
+            path: sqlite database file (":memory:" for a non-persistent queue)
+            rate: Maximum SMS per second (None = as fast as the modem accepts)
+            max_attempts: Attempts before a message fails for good
+            on_result: Called with each sent or failed OutboxEntry
+
+        Returns:
+            Started SMSOutbox; close it to stop sending
+
+        Example:
+
+        .. code-block:: python
+
+            with modem.sms.outbox("outbox.db", rate=0.5) as outbox:
+                outbox.enqueue("+1234567890", "Hello!")
+                outbox.join()
+        """
+        outbox = SMSOutbox(self, path, rate=rate, max_attempts=max_attempts, on_result=on_result)
+        outbox.start()
+        return outbox
 
     def read_sms(self, index: int) -> SMSMessage:
         """
@@ -307,12 +574,7 @@ class SMSManager:
 
             # Parse based on current format
             mode = self.get_message_format()
-
-            if mode == MessageFormat.TEXT_MODE:
-                message = self._sms_parser.parse_cmgr_text(response)
-                message.index = index
-            else:
-                message = self._sms_parser.parse_cmgr_pdu(response, index)
+            message = self._parse_cmgr(response, index, mode)
 
             logger.info(f"Read SMS from {message.sender}")
             return message
@@ -324,14 +586,206 @@ class SMSManager:
                 response=[]
             ) from e
 
-    def list_messages(self, status: SMSStatus = SMSStatus.ALL) -> list[SMSMessage]:
+    def read_many(self, indices: Iterable[int], reassemble: bool = True) -> list[SMSMessage]:
+        """
+        Read several messages with as few round trips as possible.
+
+        If the requested messages make up at least half of the store, they
+        are taken from a single AT+CMGL listing. Otherwise AT+CMGR commands
+        are chained, BATCH_SIZE per line; a chain that hits an empty index
+        is read again one message at a time.
+
+        A listing marks every received message in the store as read, not
+        only the requested ones.
+
+        Args:
+            indices: Storage indices (empty indices are skipped)
+            reassemble: Join long messages whose parts are all requested
+
+        Returns:
+            Messages in index order
+
+        Raises:
+            SMSError: If a message cannot be parsed
+
+        Example:
+
+        .. code-block:: python
+
+            for message in modem.sms.read_many([3, 4, 7]):
+                print(f"{message.index}: {message.content}")
+        """
+        wanted = sorted(set(indices))
+        if not wanted:
+            return []
+
+        mode = self.get_message_format()
+        if len(wanted) > 1 and len(wanted) * 2 >= self.get_storage_info()[0].used:
+            selected = set(wanted)
+            messages = [m for m in self.iter_messages(SMSStatus.ALL, reassemble=False) if m.index in selected]
+            messages.sort(key=lambda m: m.index)
+        else:
+            messages = []
+            for start in range(0, len(wanted), self.BATCH_SIZE):
+                messages.extend(self._read_chained(wanted[start:start + self.BATCH_SIZE], mode))
+
+        logger.info(f"Read {len(messages)} of {len(wanted)} requested message(s)")
+        return reassemble_parts(messages) if reassemble else messages
+
+    def _read_chained(self, indices: list[int], mode: MessageFormat) -> list[SMSMessage]:
+        """Read messages with one chained AT+CMGR, or one by one if that fails."""
+        try:
+            lines = self.modem.send_batch([f"+CMGR={index}" for index in indices])[0]
+            responses = self._split_cmgr(lines)
+        except ATCommandError as e:
+            logger.debug(f"Chained AT+CMGR failed, reading one by one: {e}")
+            responses = []
+
+        if len(responses) != len(indices):
+            return [m for m in map(self._read_if_present, indices) if m is not None]
+
+        try:
+            return [self._parse_cmgr(r, index, mode) for r, index in zip(responses, indices)]
+        except ValueError as e:
+            raise SMSError(f"Failed to parse SMS: {e}", command="AT+CMGR") from e
+
+    def _read_if_present(self, index: int) -> Optional[SMSMessage]:
+        """Read one message, returning None for an empty index."""
+        try:
+            return self.read_sms(index)
+        except (SMSError, ATCommandError) as e:
+            if isinstance(e.__cause__, ValueError):
+                raise
+            logger.debug(f"Skipping message {index}: {e}")
+            return None
+
+    @staticmethod
+    def _split_cmgr(lines: list[str]) -> list[list[str]]:
+        """Split the lines of chained AT+CMGR commands into one response per message."""
+        responses: list[list[str]] = []
+        for line in lines:
+            if line.startswith("+CMGR:"):
+                responses.append([line])
+            elif responses:
+                responses[-1].append(line)
+        return responses
+
+    def drain(
+        self,
+        status: SMSStatus = SMSStatus.ALL,
+        reassemble: bool = True,
+        keep_incomplete: bool = True
+    ) -> list[SMSMessage]:
+        """
+        Read and delete messages in two round trips.
+
+        Lists the messages with one AT+CMGL, then deletes them with one
+        AT+CMGD=1,<flag> if a flag matches exactly what was listed (ALL and
+        REC_READ), or with chained AT+CMGD=<index> commands otherwise.
+        Messages arriving in between are not deleted, nor are listed
+        entries that cannot be decoded (e.g. stored SMS-SUBMITs in PDU mode).
+
+        Messages are deleted before they are returned: persist them before
+        the next drain() if losing them on a crash matters.
+
+        Args:
+            status: Messages to drain (default: ALL)
+            reassemble: Join the parts of long messages
+            keep_incomplete: Leave parts of incomplete long messages in
+                             storage, so a later drain() can join them
+
+        Returns:
+            Drained messages in listing order
+
+        Raises:
+            SMSError: If listing or deleting fails
+
+        Example:
+
+        .. code-block:: python
+
+            while True:
+                modem.wait_for_urc("+CMTI", timeout=60.0)
+                for message in modem.sms.drain():
+                    ingest(message)
+        """
+        mode = self.get_message_format()
+        listing = self.modem.stream_at(self._cmgl_command(status, mode), timeout=5.0)
+        headers: list[str] = []
+        messages = list(self._parse_listing(self._tally_headers(listing, headers), mode, reassemble))
+        consumed, cmd = self._drain_plan(status, messages, keep_incomplete, len(headers))
+
+        if cmd is not None:
+            try:
+                self.modem.send_at(cmd)
+            except Exception as e:
+                raise SMSError(f"Failed to delete drained messages: {e}", command=cmd) from e
+        else:
+            self.delete_many(self._message_indices(consumed))
+
+        logger.info(f"Drained {len(consumed)} message(s)")
+        return consumed
+
+    @staticmethod
+    def _drain_plan(
+        status: SMSStatus,
+        messages: list[SMSMessage],
+        keep_incomplete: bool,
+        listed: int
+    ) -> tuple[list[SMSMessage], Optional[str]]:
+        """
+        Pick the messages drain() consumes and how to delete them.
+
+        The bulk delete flag is only used when the consumed messages cover
+        every listed entry: entries the parser skipped (stored SUBMITs,
+        status reports, undecodable PDUs) would otherwise be deleted unseen.
+
+        Args:
+            status: Status the messages were listed with
+            messages: Messages parsed from the listing
+            keep_incomplete: Leave parts of incomplete long messages stored
+            listed: Number of +CMGL entries in the listing
+
+        Returns:
+            Tuple of (messages to return and delete, bulk AT+CMGD command
+            or None to delete them by index)
+        """
+        consumed = [m for m in messages if not (keep_incomplete and m.concat is not None)]
+        flag = DRAIN_DELETE_FLAG.get(status)
+        parts = sum(len(m.indices or [m.index]) for m in consumed)
+        if consumed and flag is not None and parts == listed:
+            return consumed, f"AT+CMGD=1,{flag}"
+        return consumed, None
+
+    @staticmethod
+    def _tally_headers(lines: Iterable[str], headers: list[str]) -> Iterator[str]:
+        """Pass listing lines through, collecting the +CMGL: headers."""
+        for line in lines:
+            if line.startswith("+CMGL:"):
+                headers.append(line)
+            yield line
+
+    @staticmethod
+    def _message_indices(messages: list[SMSMessage]) -> list[int]:
+        """Storage indices of messages, including every part of joined ones."""
+        return [index for m in messages for index in (m.indices or [m.index])]
+
+    def list_messages(
+        self,
+        status: SMSStatus = SMSStatus.ALL,
+        reassemble: bool = True
+    ) -> list[SMSMessage]:
         """
         List SMS messages by status.
 
-        Uses current message format mode (PDU or text).
+        Uses current message format mode (PDU or text). In PDU mode the
+        parts of long messages are joined; a joined message has the index
+        of its first part and all part indices in ``indices``.
 
         Args:
             status: Message status filter (default: ALL)
+            reassemble: Join the parts of long messages (parts whose
+                        siblings are missing are returned unjoined)
 
         Returns:
             List of SMSMessage objects
@@ -350,22 +804,18 @@ class SMSManager:
         """
         logger.info(f"Listing messages with status: {status.value}")
 
+        # The status is a quoted name in text mode and a number in PDU mode
+        mode = self.get_message_format()
+        cmd = self._cmgl_command(status, mode)
+
         try:
-            # Build command
-            cmd = f'AT+CMGL="{status.value}"'
             response = self.modem.send_at(cmd, strip_ok=True)
 
             if not response or (len(response) == 1 and not response[0]):
                 logger.info("No messages found")
                 return []
 
-            # Parse based on current format
-            mode = self.get_message_format()
-
-            if mode == MessageFormat.TEXT_MODE:
-                messages = self._sms_parser.parse_cmgl_text(response)
-            else:
-                messages = self._sms_parser.parse_cmgl_pdu(response)
+            messages = self._parse_cmgl(response, mode, reassemble)
 
             logger.info(f"Found {len(messages)} message(s)")
             return messages
@@ -377,6 +827,92 @@ class SMSManager:
                 response=[]
             ) from e
 
+    def iter_messages(
+        self,
+        status: SMSStatus = SMSStatus.ALL,
+        reassemble: bool = True,
+        timeout: float = 5.0
+    ) -> Iterator[SMSMessage]:
+        """
+        Yield SMS messages by status while the listing is still arriving.
+
+        Like list_messages(), but each message is decoded and yielded as
+        soon as its lines are read, so the first message is available
+        early and a full store is never held in memory at once. Long
+        messages are yielded when their last part has been read; parts
+        whose siblings are missing come at the end.
+
+        The command lock is held until the listing ends: send other
+        commands (e.g. delete_message()) after the loop, or break out of
+        it first.
+
+        Args:
+            status: Message status filter (default: ALL)
+            reassemble: Join the parts of long messages (PDU mode)
+            timeout: Maximum seconds to wait for each line of the listing
+
+        Yields:
+            SMSMessage objects in listing order
+
+        Raises:
+            ATCommandError: If AT+CMGL fails (raised after the messages
+                            listed before the error)
+            ATTimeoutError: If the listing stalls for longer than timeout
+
+        Example:
+
+        .. code-block:: python
+
+            for message in modem.sms.iter_messages(SMSStatus.REC_UNREAD):
+                store(message)
+        """
+        mode = self.get_message_format()
+        cmd = self._cmgl_command(status, mode)
+
+        logger.info(f"Streaming messages with status: {status.value}")
+        yield from self._parse_listing(self.modem.stream_at(cmd, timeout=timeout), mode, reassemble)
+
+    def _parse_listing(
+        self,
+        lines: Iterable[str],
+        mode: MessageFormat,
+        reassemble: bool
+    ) -> Iterator[SMSMessage]:
+        """Parse streamed AT+CMGL lines in the given format mode."""
+        if mode == MessageFormat.TEXT_MODE:
+            yield from self._sms_parser.iter_cmgl_text(lines)
+        elif reassemble:
+            yield from iter_reassembled(self._sms_parser.iter_cmgl_pdu(lines))
+        else:
+            yield from self._sms_parser.iter_cmgl_pdu(lines)
+
+    @staticmethod
+    def _cmgl_command(status: SMSStatus, mode: MessageFormat) -> str:
+        """Build AT+CMGL for a status: quoted name in text mode, number in PDU mode."""
+        if mode == MessageFormat.TEXT_MODE:
+            return f'AT+CMGL="{status.value}"'
+        return f"AT+CMGL={PDU_LIST_STAT[status]}"
+
+    def _parse_cmgr(self, response: list[str], index: int, mode: MessageFormat) -> SMSMessage:
+        """Parse an AT+CMGR response in the given format mode."""
+        if mode == MessageFormat.TEXT_MODE:
+            message = self._sms_parser.parse_cmgr_text(response)
+            message.index = index
+            return message
+        return self._sms_parser.parse_cmgr_pdu(response, index)
+
+    def _parse_cmgl(
+        self,
+        response: list[str],
+        mode: MessageFormat,
+        reassemble: bool = True
+    ) -> list[SMSMessage]:
+        """Parse an AT+CMGL response in the given format mode."""
+        if mode == MessageFormat.TEXT_MODE:
+            return self._sms_parser.parse_cmgl_text(response)
+        messages = self._sms_parser.parse_cmgl_pdu(response)
+        return reassemble_parts(messages) if reassemble else messages
+
     def delete_message(self, index: int) -> None:
         """
         Delete SMS message by index.
@@ -406,6 +942,31 @@ class SMSManager:
                 command=cmd
             ) from e
 
+    def delete_many(self, indices: Iterable[int]) -> None:
+        """
+        Delete several messages, BATCH_SIZE chained AT+CMGD commands per line.
+
+        Args:
+            indices: Storage indices to delete
+
+        Raises:
+            SMSError: If deletion fails
+
+        Example:
+
+        .. code-block:: python
+
+            modem.sms.delete_many(message.indices)
+        """
+        indices = list(indices)
+        for start in range(0, len(indices), self.BATCH_SIZE):
+            cmds = [f"+CMGD={index}" for index in indices[start:start + self.BATCH_SIZE]]
+            try:
+                self.modem.send_batch(cmds)
+            except Exception as e:
+                raise SMSError(f"Failed to delete messages: {e}", command="AT" + ";".join(cmds)) from e
+        logger.info(f"Deleted {len(indices)} message(s)")
+
     def delete_all_messages(self, status: Optional[SMSStatus] = None) -> None:
         """
         Delete all messages, optionally filtered by status.
@@ -426,6 +987,21 @@ class SMSManager:
             # Delete ALL messages (use with caution!)
             modem.sms.delete_all_messages()
         """
+        cmd = self._delete_all_command(status)
+
+        try:
+            self.modem.send_at(cmd)
+            logger.info("Messages deleted successfully")
+
+        except Exception as e:
+            raise SMSError(
+                f"Failed to delete messages: {e}",
+                command=cmd
+            ) from e
+
+    @staticmethod
+    def _delete_all_command(status: Optional[SMSStatus]) -> str:
+        """Build the AT+CMGD command for delete_all_messages()."""
         if status:
             logger.info(f"Deleting all messages with status: {status.value}")
             # Delete by status - use flag 1,2,3,4
@@ -436,21 +1012,11 @@ class SMSManager:
                 SMSStatus.STO_UNSENT: 4,
             }
             flag = status_map.get(status, 1)
-            cmd = f"AT+CMGD=1,{flag}"
-        else:
-            logger.warning("Deleting ALL messages")
-            # Delete all messages - use flag 4
-            cmd = "AT+CMGD=1,4"
-
-        try:
-            self.modem.send_at(cmd)
-            logger.info("Messages deleted successfully")
+            return f"AT+CMGD=1,{flag}"
 
-        except Exception as e:
-            raise SMSError(
-                f"Failed to delete messages: {e}",
-                command=cmd
-            ) from e
+        logger.warning("Deleting ALL messages")
+        # Delete all messages - use flag 4
+        return "AT+CMGD=1,4"
 
     def get_storage_info(self) -> tuple[SMSStorage, SMSStorage, SMSStorage]:
         """
@@ -544,21 +1110,7 @@ class SMSManager:
             # AT+CPMS=? returns supported storage types
             response = self.modem.send_at("AT+CPMS=?", strip_ok=True)
 
-            # Parse response: +CPMS: ("ME","SM","MT"),("ME","SM","MT"),("ME","SM","MT")
-            if not response:
-                return []
-
-            line = response[0]
-            # Extract first set of storage types
-            import re
-            match = re.search(r'\(([^)]+)\)', line)
-            if not match:
-                return []
-
-            # Parse storage types
-            types_str = match.group(1)
-            storage_types = [s.strip('"') for s in types_str.split(',')]
-
+            storage_types = self._parse_storage_locations(response)
             logger.info(f"Available storage locations: {storage_types}")
             return storage_types
 
@@ -566,3 +1118,19 @@ class SMSManager:
             logger.warning(f"Failed to get storage locations: {e}")
             # Return common defaults
             return ["ME", "SM", "MT"]
+
+    @staticmethod
+    def _parse_storage_locations(response: list[str]) -> list[str]:
+        """Parse an AT+CPMS=? response into the mem1 storage types."""
+        # Parse response: +CPMS: ("ME","SM","MT"),("ME","SM","MT"),("ME","SM","MT")
+        if not response:
+            return []
+
+        # Extract first set of storage types
+        match = re.search(r'\(([^)]+)\)', response[0])
+        if not match:
+            return []
+
+        # Parse storage types
+        types_str = match.group(1)
+        return [s.strip('"') for s in types_str.split(',')]
@@ -0,0 +1,352 @@
+"""
+Direct-to-TE SMS delivery.
+
+With AT+CNMI <mt>=2 the modem routes each incoming SMS to the host as a
++CMT URC instead of storing it, so receiving a message needs no AT+CMGR or
+AT+CMGD round trips and no flash writes.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+from ..types import SMSMessage
+from ..parsers.sms import SMSParser
+from ..parsers.concat import SMSReassembler
+from ..exceptions import EC25Error
+
+if TYPE_CHECKING:
+    from ..core import ModemCore
+
+logger = logging.getLogger(__name__)
+
+# Callback receiving each delivered message
+SMSMessageCallback = Callable[[SMSMessage], None]
+
+# AT+CNMI fields: <mode>,<mt>,<bm>,<ds>,<bfr>
+CNMI_MT = 1
+CNMI_DS = 3
+
+
+def set_cnmi_field(modem_core: "ModemCore", field: int, value: int) -> str:
+    """
+    Set one AT+CNMI field, keeping the others as the modem reports them.
+
+    Direct delivery (<mt>) and delivery tracking (<ds>) each change only
+    their own field, so either can be started or stopped independently.
+
+    Args:
+        modem_core: ModemCore instance for AT commands
+        field: Index of the field (CNMI_MT or CNMI_DS)
+        value: New value of the field
+
+    Returns:
+        The field's previous value
+
+    Raises:
+        EC25Error: If the settings cannot be read or written
+    """
+    response = modem_core.send_at("AT+CNMI?", strip_ok=True, remove_cmd_prefix=True)
+    values = response[0].split(",") if response and response[0] else []
+    values = [v.strip() for v in values] + ["0"] * (5 - len(values))
+    previous = values[field]
+    values[field] = str(value)
+    # <mode> 0 buffers indications in the modem; URCs need 1 or 2
+    if values[0] == "0":
+        values[0] = "2"
+    modem_core.send_at(f"AT+CNMI={','.join(values[:5])}")
+    return previous
+
+
+@dataclass
+class DeliveryStats:
+    """Counters for a DirectDelivery pipeline."""
+    received: int = 0       # +CMT URCs received
+    delivered: int = 0      # Messages handed to the callback or queue
+    acknowledged: int = 0   # AT+CNMA sent successfully
+    rejected: int = 0       # AT+CNMA=2 sent for messages not delivered
+    dropped: int = 0        # Messages not delivered (queue full)
+    parts: int = 0          # Parts of long messages held for reassembly
+    errors: int = 0         # Undecodable messages and failed acknowledgements
+
+
+class DirectDelivery:
+    """
+    Receives SMS routed straight to the host as +CMT URCs.
+
+    Created by SMSManager.start_direct_delivery(). The reader thread only
+    queues the raw URC; a worker thread decodes it, hands the SMSMessage to
+    ``on_message`` (or the queue read by get()) and, if the modem uses
+    phase 2+ SMS service (AT+CSMS=1), acknowledges it with AT+CNMA.
+
+    With acknowledgement, a message that cannot be queued (or whose
+    callback raises) is rejected with AT+CNMA=2, so the network delivers it
+    again later. It is never left unacknowledged: the modem would then
+    turn +CMT routing off and later messages would be stored instead.
+
+    With a ``reassembler``, parts of long messages are held (and
+    acknowledged) until the last part arrives, then delivered as one
+    message. Parts of a message that never completes are delivered
+    individually when the reassembler evicts them.
+
+    Example:
+
+    .. code-block:: python
+
+        delivery = modem.sms.start_direct_delivery()
+        for message in delivery:
+            print(f"{message.sender}: {message.content}")
+    """
+
+    # Seconds between reassembly age checks while no message arrives
+    EVICT_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        modem_core: "ModemCore",
+        acknowledge: bool,
+        on_message: Optional[SMSMessageCallback] = None,
+        max_queue_size: int = 1000,
+        reassembler: Optional[SMSReassembler] = None
+    ) -> None:
+        """
+        Initialize direct delivery.
+
+        Args:
+            modem_core: ModemCore instance for URCs and AT+CNMA
+            acknowledge: Acknowledge each message with AT+CNMA
+            on_message: Called with each message on the worker thread
+                        (default: queue messages for get())
+            max_queue_size: Maximum undelivered messages queued for get()
+            reassembler: Joins the parts of long messages (None delivers
+                         each part as it arrives); if it has no on_evict
+                         callback, evicted parts are delivered as fragments
+        """
+        self.modem = modem_core
+        self.acknowledge = acknowledge
+        self.on_message = on_message
+        self.reassembler = reassembler
+        self.stats = DeliveryStats()
+
+        if reassembler is not None and reassembler.on_evict is None:
+            reassembler.on_evict = self._deliver_parts
+
+        self._messages: "queue.Queue[Optional[SMSMessage]]" = queue.Queue(maxsize=max_queue_size)
+        self._urcs: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._subscription = None
+        self._worker: Optional[threading.Thread] = None
+        self._saved_mt: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether messages are being received."""
+        return self._worker is not None
+
+    def start(self) -> None:
+        """
+        Subscribe to +CMT, start the worker and route messages to it.
+
+        Only AT+CNMI <mt> is changed (to 2); the previous value is restored
+        by stop().
+
+        Raises:
+            EC25Error: If message routing cannot be enabled
+        """
+        if self.active:
+            return
+
+        # Subscribe before routing changes so no +CMT is missed
+        self._subscription = self.modem.register_urc_callback("+CMT:", self._urcs.put)
+        self._worker = threading.Thread(
+            target=self._run,
+            daemon=True,
+            name="SMSDeliveryThread"
+        )
+        self._worker.start()
+
+        try:
+            self._saved_mt = set_cnmi_field(self.modem, CNMI_MT, 2)
+        except Exception:
+            self.stop(restore_routing=False)
+            raise
+        logger.info(f"Started direct SMS delivery (acknowledge={self.acknowledge})")
+
+    def stop(self, restore_routing: bool = True) -> None:
+        """
+        Stop receiving messages.
+
+        Messages already received are still delivered and acknowledged.
+        Parts of incomplete long messages are delivered as fragments.
+        Iterators over the delivery end once the queue is drained.
+
+        Args:
+            restore_routing: Restore the AT+CNMI <mt> value replaced by
+                             start() (typically 1: store new messages and
+                             report them with +CMTI)
+        """
+        if not self.active:
+            return
+
+        if restore_routing and self._saved_mt is not None:
+            try:
+                set_cnmi_field(self.modem, CNMI_MT, int(self._saved_mt))
+            except (EC25Error, ValueError) as e:
+                logger.warning(f"Failed to restore SMS routing: {e}")
+
+        self._subscription.unsubscribe()
+        self._urcs.put(None)
+        self._worker.join(timeout=5.0)
+        if self._worker.is_alive():
+            logger.warning("SMS delivery thread did not terminate in time")
+        self._worker = None
+
+        # Parts were acknowledged when stored: hand them on rather than lose them
+        if self.reassembler is not None:
+            self._deliver_parts(self.reassembler.flush())
+
+        try:
+            self._messages.put_nowait(None)
+        except queue.Full:
+            pass
+        logger.info("Stopped direct SMS delivery")
+
+    def get(self, timeout: Optional[float] = None) -> Optional[SMSMessage]:
+        """
+        Get the next delivered message.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            SMSMessage, or None on timeout or after stop()
+        """
+        try:
+            message = self._messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+        if message is None:
+            # Leave the end marker for other consumers
+            self._messages.put(None)
+        return message
+
+    def __iter__(self) -> Iterator[SMSMessage]:
+        """Yield messages until stop() is called."""
+        while True:
+            message = self.get()
+            if message is None:
+                return
+            yield message
+
+    def _run(self) -> None:
+        """Worker thread: decode, deliver and acknowledge each +CMT."""
+        while True:
+            try:
+                urc = self._urcs.get(timeout=self.EVICT_INTERVAL if self.reassembler else None)
+            except queue.Empty:
+                # Parts stopped arriving: give up on expired messages
+                self.reassembler.evict()
+                continue
+            if urc is None:
+                return
+
+            self.stats.received += 1
+            delivered = self._deliver(urc)
+
+            if not self.acknowledge:
+                continue
+            if delivered:
+                self._acknowledge()
+            else:
+                # Rejected rather than left unacknowledged, so routing stays on
+                self._reject()
+
+    def _deliver(self, urc: str) -> bool:
+        """
+        Decode a +CMT URC and hand the message on.
+
+        Returns:
+            True if the message was delivered or cannot ever be (bad PDU),
+            False if it should be retried by the network
+        """
+        try:
+            message = SMSParser.parse_cmt(urc)
+        except ValueError as e:
+            logger.error(f"Failed to decode delivered SMS: {e}")
+            self.stats.errors += 1
+            return True
+
+        if message.concat is not None and self.reassembler is not None:
+            complete = self.reassembler.add(message)
+            if complete is None:
+                # Held in memory until the other parts arrive
+                self.stats.parts += 1
+                return True
+            message = complete
+
+        return self._hand_on(message)
+
+    def _deliver_parts(self, parts: list[SMSMessage]) -> None:
+        """Deliver the parts of an evicted long message one by one."""
+        for part in parts:
+            self._hand_on(part)
+
+    def _hand_on(self, message: SMSMessage) -> bool:
+        """
+        Pass a message to the callback or queue.
+
+        Returns:
+            True if delivered, False if it was dropped
+        """
+        if self.on_message is not None:
+            try:
+                self.on_message(message)
+            except Exception as e:
+                logger.error(f"SMS delivery callback failed: {e}", exc_info=True)
+                self.stats.errors += 1
+                return False
+        else:
+            try:
+                self._messages.put_nowait(message)
+            except queue.Full:
+                logger.warning(f"SMS delivery queue full, dropping message from {message.sender}")
+                self.stats.dropped += 1
+                return False
+
+        self.stats.delivered += 1
+        return True
+
+    def _acknowledge(self) -> None:
+        """Acknowledge the last +CMT with AT+CNMA."""
+        try:
+            self.modem.send_at("AT+CNMA")
+            self.stats.acknowledged += 1
+        except EC25Error as e:
+            logger.warning(f"Failed to acknowledge SMS: {e}")
+            self.stats.errors += 1
+
+    def _reject(self) -> None:
+        """Reject the last +CMT with AT+CNMA=2 so the network retries it."""
+        try:
+            self.modem.send_at("AT+CNMA=2")
+            self.stats.rejected += 1
+        except EC25Error as e:
+            logger.warning(f"Failed to reject SMS: {e}")
+            self.stats.errors += 1
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.stop()
+
+    def __repr__(self) -> str:
+        """String representation of the delivery pipeline."""
+        return (
+            f"<DirectDelivery active={self.active} acknowledge={self.acknowledge} "
+            f"received={self.stats.received}>"
+        )
@@ -0,0 +1,365 @@
+"""
+SMS delivery tracking from status reports.
+
+A message sent with request_status=True makes the service centre send a
+status report once it was delivered (or given up on). DeliveryTracker
+receives the reports as +CDS URCs (or +CDSI notifications of stored
+reports), matches them to the references returned by send_sms() and keeps
+the delivery state of every tracked message, without polling the modem.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Iterable, Optional, Union
+
+from ..types import DeliveryState, StatusReport, TrackedDelivery
+from ..parsers.sms import SMSParser
+from ..parsers.urc import URCEvent
+from ..exceptions import EC25Error
+from .sms_delivery import CNMI_DS, set_cnmi_field
+
+if TYPE_CHECKING:
+    from ..core import ModemCore
+
+logger = logging.getLogger(__name__)
+
+# Called with a tracked message whenever its state changes
+DeliveryCallback = Callable[[TrackedDelivery], None]
+
+
+@dataclass
+class TrackerStats:
+    """Counters and timings for a DeliveryTracker."""
+    tracked: int = 0         # Messages registered with track()
+    reports: int = 0         # Status reports received
+    delivered: int = 0       # Messages reported delivered
+    failed: int = 0          # Messages reported failed
+    expired: int = 0         # Messages forgotten without a final report
+    unmatched: int = 0       # Reports for unknown references
+    errors: int = 0          # Undecodable reports and failed AT commands
+    latency: float = 0.0     # Seconds from sending to delivery, summed
+    max_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        """Average seconds from sending to the delivery report."""
+        return self.latency / self.delivered if self.delivered else 0.0
+
+
+class DeliveryTracker:
+    """
+    Matches SMS status reports to sent messages.
+
+    Created by SMSManager.track_deliveries(), after which every message
+    sent with request_status=True is tracked automatically; track() adds
+    others. Messages are indexed by message reference, so matching a
+    report is a dictionary lookup. A reference reused by a later message
+    replaces the earlier entry.
+
+    With ``stored=False`` the modem routes reports to the host as +CDS
+    (AT+CNMI <ds>=1), acknowledged with AT+CNMA under phase 2+ service.
+    With ``stored=True`` it stores them and sends +CDSI (<ds>=2); each
+    announced report is read with AT+CMGR and deleted.
+
+    Entries are kept for ``ttl`` seconds after sending; a message still
+    pending then is marked EXPIRED. As in DirectDelivery, URCs are only
+    queued on the reader thread and handled on a worker thread.
+
+    Example:
+
+    .. code-block:: python
+
+        tracker = modem.sms.track_deliveries(on_update=print)
+        ref = modem.sms.send_sms("+1234567890", "Hello!", request_status=True)
+        ...
+        print(tracker.get(ref).state, tracker.stats.avg_latency)
+    """
+
+    # Seconds between TTL checks while no report arrives
+    EVICT_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        modem_core: "ModemCore",
+        acknowledge: bool,
+        stored: bool = False,
+        ttl: float = 48 * 3600.0,
+        on_update: Optional[DeliveryCallback] = None,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Initialize delivery tracker.
+
+        Args:
+            modem_core: ModemCore instance for URCs and AT commands
+            acknowledge: Acknowledge each +CDS with AT+CNMA
+            stored: Have reports stored and announced with +CDSI instead of
+                    routed to the host as +CDS
+            ttl: Seconds a message is tracked after sending
+            on_update: Called on the worker thread when a message's state
+                       changes (delivered, failed, expired)
+            clock: Time source in epoch seconds (for tests)
+
+        Raises:
+            ValueError: If ttl is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.modem = modem_core
+        self.acknowledge = acknowledge
+        self.stored = stored
+        self.ttl = ttl
+        self.on_update = on_update
+        self.stats = TrackerStats()
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[int, TrackedDelivery]" = OrderedDict()
+        self._urcs: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._subscriptions = []
+        self._worker: Optional[threading.Thread] = None
+        self._saved_ds: Optional[str] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether reports are being received."""
+        return self._worker is not None
+
+    @property
+    def pending(self) -> int:
+        """Number of tracked messages without a final report."""
+        with self._lock:
+            return sum(1 for e in self._entries.values() if e.state == DeliveryState.PENDING)
+
+    def start(self) -> None:
+        """
+        Subscribe to +CDS/+CDSI, start the worker and route reports to it.
+
+        Raises:
+            EC25Error: If report routing cannot be enabled
+        """
+        if self.active:
+            return
+
+        self._subscriptions = [
+            self.modem.register_urc_callback(prefix, self._urcs.put)
+            for prefix in ("+CDS:", "+CDSI:")
+        ]
+        self._worker = threading.Thread(target=self._run, daemon=True, name="SMSReportThread")
+        self._worker.start()
+
+        try:
+            self._saved_ds = set_cnmi_field(self.modem, CNMI_DS, 2 if self.stored else 1)
+        except Exception:
+            self.stop(restore_routing=False)
+            raise
+        logger.info(f"Tracking SMS deliveries (stored={self.stored}, acknowledge={self.acknowledge})")
+
+    def stop(self, restore_routing: bool = True) -> None:
+        """
+        Stop receiving reports. Tracked messages can still be queried.
+
+        Args:
+            restore_routing: Restore the AT+CNMI <ds> value replaced by
+                             start() (typically 0: no status reports)
+        """
+        if not self.active:
+            return
+
+        if restore_routing and self._saved_ds is not None:
+            try:
+                set_cnmi_field(self.modem, CNMI_DS, int(self._saved_ds))
+            except (EC25Error, ValueError) as e:
+                logger.warning(f"Failed to restore status report routing: {e}")
+
+        for subscription in self._subscriptions:
+            subscription.unsubscribe()
+        self._subscriptions = []
+        self._urcs.put(None)
+        self._worker.join(timeout=5.0)
+        if self._worker.is_alive():
+            logger.warning("SMS report thread did not terminate in time")
+        self._worker = None
+        logger.info("Stopped SMS delivery tracking")
+
+    def track(self, references: Union[int, Iterable[int]], recipient: str = "") -> None:
+        """
+        Track sent messages.
+
+        Args:
+            references: Reference, or list of part references, from send_sms()
+            recipient: Recipient phone number
+        """
+        if isinstance(references, int):
+            references = [references]
+
+        now = self._clock()
+        replaced = []
+        with self._lock:
+            expired = self._evict_expired(now)
+            for reference in references:
+                old = self._entries.pop(reference, None)
+                if old is not None and old.state == DeliveryState.PENDING:
+                    old.state = DeliveryState.EXPIRED
+                    replaced.append(old)
+                self._entries[reference] = TrackedDelivery(reference, recipient, now)
+                self.stats.tracked += 1
+            self.stats.expired += len(replaced)
+
+        for entry in expired + replaced:
+            self._notify(entry)
+
+    def get(self, reference: int) -> Optional[TrackedDelivery]:
+        """
+        Get the tracked message with a reference.
+
+        Returns:
+            TrackedDelivery, or None if the reference is not tracked
+        """
+        return self._entries.get(reference)
+
+    def evict(self) -> list[TrackedDelivery]:
+        """
+        Forget messages tracked for longer than ttl.
+
+        Returns:
+            Messages that were still pending (now EXPIRED)
+        """
+        with self._lock:
+            expired = self._evict_expired(self._clock())
+        for entry in expired:
+            self._notify(entry)
+        return expired
+
+    def _evict_expired(self, now: float) -> list[TrackedDelivery]:
+        """Remove entries older than ttl. Called with the lock held."""
+        expired = []
+        # Entries are in tracking order, so stop at the first young one
+        while self._entries:
+            reference, entry = next(iter(self._entries.items()))
+            if now - entry.sent_at < self.ttl:
+                break
+            del self._entries[reference]
+            if entry.state == DeliveryState.PENDING:
+                entry.state = DeliveryState.EXPIRED
+                expired.append(entry)
+        self.stats.expired += len(expired)
+        return expired
+
+    def apply(self, report: StatusReport) -> Optional[TrackedDelivery]:
+        """
+        Match a status report to its tracked message and update its state.
+
+        Called by the worker for every report; also usable for reports
+        obtained elsewhere.
+
+        Args:
+            report: Decoded status report
+
+        Returns:
+            The updated TrackedDelivery, or None if the reference is not tracked
+        """
+        now = self._clock()
+        with self._lock:
+            self.stats.reports += 1
+            entry = self._entries.get(report.reference)
+            if entry is None:
+                self.stats.unmatched += 1
+                logger.debug(f"Status report for untracked reference {report.reference}")
+                return None
+
+            previous = entry.state
+            entry.status = report.status
+            entry.updated_at = now
+            if previous == DeliveryState.PENDING:
+                entry.state = report.state
+
+            changed = entry.state != previous
+            if changed and entry.state == DeliveryState.DELIVERED:
+                latency = now - entry.sent_at
+                self.stats.delivered += 1
+                self.stats.latency += latency
+                self.stats.max_latency = max(self.stats.max_latency, latency)
+            elif changed and entry.state == DeliveryState.FAILED:
+                self.stats.failed += 1
+
+        logger.info(f"SMS {report.reference} to {entry.recipient}: {entry.state.value} (status {report.status:#04x})")
+        if changed:
+            self._notify(entry)
+        return entry
+
+    def _run(self) -> None:
+        """Worker thread: decode reports, match them and acknowledge."""
+        while True:
+            try:
+                urc = self._urcs.get(timeout=self.EVICT_INTERVAL)
+            except queue.Empty:
+                self.evict()
+                continue
+            if urc is None:
+                return
+
+            if urc.startswith("+CDSI:"):
+                self._read_stored(urc)
+                continue
+
+            try:
+                self.apply(SMSParser.parse_cds(urc))
+            except ValueError as e:
+                logger.error(f"Failed to decode status report: {e}")
+                self.stats.errors += 1
+
+            # Undecodable reports are acknowledged too: the network would resend them unchanged
+            if self.acknowledge:
+                self._acknowledge()
+
+    def _read_stored(self, urc: str) -> None:
+        """Read, apply and delete a report announced by +CDSI."""
+        try:
+            # +CDSI: "SR",<index>
+            index = int(URCEvent(urc).fields[1])
+            response = self.modem.send_at(f"AT+CMGR={index}", strip_ok=True)
+            if len(response) < 2:
+                raise ValueError(f"No status report at index {index}")
+            self.apply(SMSParser.parse_status_report_pdu(response[1]))
+            self.modem.send_at(f"AT+CMGD={index}")
+        except (ValueError, IndexError, EC25Error) as e:
+            logger.error(f"Failed to read stored status report ({urc}): {e}")
+            self.stats.errors += 1
+
+    def _acknowledge(self) -> None:
+        """Acknowledge the last +CDS with AT+CNMA."""
+        try:
+            self.modem.send_at("AT+CNMA")
+        except EC25Error as e:
+            logger.warning(f"Failed to acknowledge status report: {e}")
+            self.stats.errors += 1
+
+    def _notify(self, entry: TrackedDelivery) -> None:
+        """Pass a state change to on_update."""
+        if self.on_update is None:
+            return
+        try:
+            self.on_update(entry)
+        except Exception as e:
+            logger.error(f"Delivery callback failed: {e}", exc_info=True)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *exc):
+        """Context manager exit."""
+        self.stop()
+
+    def __repr__(self) -> str:
+        """String representation of the tracker."""
+        return (
+            f"<DeliveryTracker active={self.active} tracked={len(self._entries)} "
+            f"delivered={self.stats.delivered} failed={self.stats.failed}>"
+        )
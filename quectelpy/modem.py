@@ -5,9 +5,19 @@ User-facing API that coordinates all feature managers.
 """
 
 import logging
-from typing import Optional
-
-from .core import ModemCore, SerialTransport, Transport, URCCallback
+from typing import Iterator, Optional, Union
+
+from .core import (
+    ModemCore,
+    SerialTransport,
+    Transport,
+    URCCallback,
+    URCDispatcher,
+    URCEventCallback,
+    URCMatch,
+    URCSubscription,
+    URCWatch,
+)
 from .features import DeviceManager, NetworkManager, SMSManager
 
 logger = logging.getLogger(__name__)
@@ -60,7 +70,9 @@ class QuectelModem:
         log_urcs: bool = False,
         max_urc_queue_size: int = 1000,
         auto_start: bool = False,
-        on_disconnect: Optional[callable] = None
+        on_disconnect: Optional[callable] = None,
+        urc_dispatcher: Optional[URCDispatcher] = None,
+        core: Optional[ModemCore] = None
     ) -> None:
         """
         Initialize QuectelModem.
@@ -75,9 +87,13 @@ class QuectelModem:
             auto_start: Automatically start reader thread (default: False)
             on_disconnect: Optional callback function called when device disconnects.
                           Signature: callback(exception: Exception) -> None
+            urc_dispatcher: Run URC callbacks on this dispatcher's worker threads
+                            instead of the reader thread (default: None)
+            core: Prebuilt modem core (e.g. from ModemPool.add()). When given,
+                  all transport and core options are ignored.
 
         Raises:
-            ValueError: If neither port nor transport is provided
+            ValueError: If neither port, transport nor core is provided
             EC25Error: If serial port cannot be opened
 
         Example:
@@ -106,24 +122,28 @@ class QuectelModem:
             from quectelpy.core import MockTransport
             modem = QuectelModem(transport=MockTransport())
         """
-        if transport is None and port is None:
-            raise ValueError("Either 'port' or 'transport' must be provided")
-
-        if transport is None:
-            transport = SerialTransport(
-                port=port,
-                baudrate=baudrate,
-                timeout=timeout
+        if core is None:
+            if transport is None and port is None:
+                raise ValueError("Either 'port' or 'transport' must be provided")
+
+            if transport is None:
+                transport = SerialTransport(
+                    port=port,
+                    baudrate=baudrate,
+                    timeout=timeout
+                )
+                logger.info(f"Created serial transport for {port}")
+
+            core = ModemCore(
+                transport=transport,
+                timeout=timeout,
+                log_urcs=log_urcs,
+                max_urc_queue_size=max_urc_queue_size,
+                on_disconnect=on_disconnect,
+                urc_dispatcher=urc_dispatcher
             )
-            logger.info(f"Created serial transport for {port}")
-
-        self._core = ModemCore(
-            transport=transport,
-            timeout=timeout,
-            log_urcs=log_urcs,
-            max_urc_queue_size=max_urc_queue_size,
-            on_disconnect=on_disconnect
-        )
+
+        self._core = core
 
         self.device = DeviceManager(self._core)
         self.network = NetworkManager(self._core)
@@ -180,7 +200,7 @@ class QuectelModem:
         self._core.close()
         logger.info("Modem closed")
 
-    def register_urc_callback(self, prefix: str, callback: URCCallback) -> None:
+    def register_urc_callback(self, prefix: str, callback: URCCallback) -> URCSubscription:
         """
         Register a callback for unsolicited result codes.
 
@@ -189,6 +209,10 @@ class QuectelModem:
             callback: Function to call when URC is received.
                      Signature: callback(line: str) -> None
 
+        Returns:
+            Subscription handle. Several callbacks can share a prefix;
+            pass the handle to unregister_urc_callback() to remove one.
+
         Example:
 
         .. code-block:: python
@@ -204,14 +228,46 @@ class QuectelModem:
                 lambda line: print(f"Registration change: {line}")
             )
         """
-        self._core.register_urc_callback(prefix, callback)
+        return self._core.register_urc_callback(prefix, callback)
 
-    def unregister_urc_callback(self, prefix: str) -> bool:
+    def register_event_callback(self, prefix: str, callback: URCEventCallback) -> URCSubscription:
         """
-        Unregister a URC callback.
+        Register a callback for typed URC events.
+
+        Known URCs arrive as NewMessageEvent, RegistrationEvent,
+        SignalIndEvent, IndicationEvent or SocketEvent; others as URCEvent.
+        Fields are parsed only when the callback reads them.
 
         Args:
-            prefix: URC prefix to unregister
+            prefix: URC prefix to match (e.g., "+CMTI")
+            callback: Function to call with the event.
+                     Signature: callback(event: URCEvent) -> None
+
+        Returns:
+            Subscription handle for unregister_urc_callback()
+
+        Example:
+
+        .. code-block:: python
+
+            def on_sms(event: NewMessageEvent):
+                message = modem.sms.read_sms(event.index)
+
+            modem.register_event_callback("+CMTI", on_sms)
+            modem.register_event_callback(
+                "+CREG",
+                lambda event: print(f"Registered: {event.is_registered}")
+            )
+        """
+        return self._core.register_event_callback(prefix, callback)
+
+    def unregister_urc_callback(self, target: Union[str, URCSubscription]) -> bool:
+        """
+        Unregister URC callbacks.
+
+        Args:
+            target: Subscription handle returned by register_urc_callback(),
+                    or a URC prefix to remove all of its callbacks
 
         Returns:
             True if callback was removed, False if not found
@@ -220,9 +276,79 @@ class QuectelModem:
 
         .. code-block:: python
 
-            modem.unregister_urc_callback("+CMTI")
+            sub = modem.register_urc_callback("+CMTI", on_sms)
+            modem.unregister_urc_callback(sub)       # just this callback
+            modem.unregister_urc_callback("+CMTI")   # every +CMTI callback
+        """
+        return self._core.unregister_urc_callback(target)
+
+    def wait_for_urc(self, match: URCMatch, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Block until a matching URC arrives.
+
+        The calling thread sleeps on a condition variable that is signalled
+        only when a matching URC is received, so waiting costs no CPU.
+        URCs received before the call are not considered; use watch_urcs()
+        when the URC is triggered by a command you are about to send.
+
+        Args:
+            match: URC prefix (e.g. "+CMTI"), tuple of prefixes, or a
+                   predicate taking the line
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Matching URC line, or None on timeout or when the modem stops
+
+        Example:
+
+        .. code-block:: python
+
+            line = modem.wait_for_urc("+CMTI", timeout=60.0)
+            if line:
+                storage, index = SMSParser.parse_cmti(line)
+        """
+        return self._core.wait_for_urc(match, timeout)
+
+    def iter_urcs(self, match: URCMatch, timeout: Optional[float] = None) -> Iterator[str]:
+        """
+        Iterate over matching URCs as they arrive.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+            timeout: Stop after this many seconds without a matching URC
+                     (None waits indefinitely)
+
+        Yields:
+            Matching URC lines until timeout or until the modem stops
+
+        Example:
+
+        .. code-block:: python
+
+            for line in modem.iter_urcs(("+CREG", "+CGREG")):
+                print(f"Registration change: {line}")
+        """
+        return self._core.iter_urcs(match, timeout)
+
+    def watch_urcs(self, match: URCMatch) -> URCWatch:
+        """
+        Start collecting matching URCs now, to wait for them later.
+
+        Args:
+            match: URC prefix, tuple of prefixes, or predicate taking the line
+
+        Returns:
+            URCWatch whose wait() returns the collected URCs in order
+
+        Example:
+
+        .. code-block:: python
+
+            with modem.watch_urcs("+QIOPEN:") as watch:
+                modem.send_raw_at('AT+QIOPEN=1,0,"TCP","example.com",80')
+                result = watch.wait(timeout=30.0)
         """
-        return self._core.unregister_urc_callback(prefix)
+        return self._core.watch_urcs(match)
 
     def send_raw_at(
         self,
@@ -247,7 +373,7 @@ class QuectelModem:
 
         Raises:
             ATTimeoutError: If command times out
-            EC25Error: If command returns ERROR
+            ATCommandError: If command returns an error result code
 
         Example:
 
@@ -1,7 +1,8 @@
 """
 Response parsers for AT command responses.
 
-Provides type-safe parsing of modem responses into structured data.
+Provides type-safe parsing of modem responses into structured data, and
+typed events for unsolicited result codes.
 """
 
 from .base import ResponseParser, SimpleValueParser, IntValueParser, CommaSeparatedParser
@@ -12,6 +13,23 @@ from .network import (
     CurrentOperatorParser,
     RegistrationStatusParser
 )
+from .urc import (
+    URCEvent,
+    NewMessageEvent,
+    RegistrationEvent,
+    IndicationEvent,
+    SignalIndEvent,
+    SocketEvent,
+    SMSDeliverEvent,
+    StatusReportEvent,
+    CellBroadcastEvent,
+    URCDecoder,
+    URCDecoderRegistry,
+    default_registry,
+    decode_urc,
+    split_urc_fields,
+)
+from .concat import SMSReassembler, ReassemblyStats, StreamReassembler, reassemble, iter_reassembled
 
 __all__ = [
     "ResponseParser",
@@ -23,4 +41,23 @@ __all__ = [
     "NetworkInfoParser",
     "CurrentOperatorParser",
     "RegistrationStatusParser",
+    "URCEvent",
+    "NewMessageEvent",
+    "RegistrationEvent",
+    "IndicationEvent",
+    "SignalIndEvent",
+    "SocketEvent",
+    "SMSDeliverEvent",
+    "StatusReportEvent",
+    "CellBroadcastEvent",
+    "URCDecoder",
+    "URCDecoderRegistry",
+    "default_registry",
+    "decode_urc",
+    "split_urc_fields",
+    "SMSReassembler",
+    "ReassemblyStats",
+    "StreamReassembler",
+    "reassemble",
+    "iter_reassembled",
 ]
@@ -0,0 +1,404 @@
+"""
+Reassembly of concatenated (long) SMS.
+
+A long message arrives as several SMS, each carrying a concatenation
+element in its User Data Header. SMSReassembler collects the parts of each
+message and returns the joined SMSMessage once every part is present.
+Incomplete sets are evicted after an age limit or when the stored text
+exceeds a memory cap, so lost parts cannot grow memory without bound.
+"""
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from ..types import ConcatInfo, SMSMessage
+
+logger = logging.getLogger(__name__)
+
+# Called with the parts of an incomplete message when it is evicted
+EvictionCallback = Callable[[list[SMSMessage]], None]
+
+# Approximate bookkeeping cost of one stored part besides its text
+_PART_OVERHEAD = 64
+
+
+@dataclass
+class ReassemblyStats:
+    """Counters for an SMSReassembler."""
+    parts: int = 0           # Parts added
+    completed: int = 0       # Messages joined from all their parts
+    duplicates: int = 0      # Parts received again (replaced the stored copy)
+    evicted_age: int = 0     # Incomplete messages evicted for age
+    evicted_memory: int = 0  # Incomplete messages evicted for the memory cap
+    pending: int = 0         # Incomplete messages held
+    pending_bytes: int = 0   # Approximate memory held by pending parts
+
+
+# (sender, reference, total)
+_Key = Tuple[str, int, int]
+
+
+class _PartSet:
+    """Parts received so far for one long message."""
+
+    __slots__ = ("first", "created", "texts", "indices", "size")
+
+    def __init__(self, first: SMSMessage, created: float) -> None:
+        # Metadata (status, timestamp, ...) comes from the first part stored;
+        # its text and PDU are dropped to keep the set small
+        self.first = replace(first, content="", pdu=None)
+        self.created = created
+        self.texts: Dict[int, str] = {}
+        self.indices: Dict[int, int] = {}
+        self.size = _PART_OVERHEAD
+
+    def fragments(self) -> list[SMSMessage]:
+        """Rebuild the stored parts as individual messages."""
+        concat = self.first.concat
+        return [
+            replace(
+                self.first,
+                index=self.indices[seq],
+                content=self.texts[seq],
+                concat=ConcatInfo(concat.reference, concat.total, seq)
+            )
+            for seq in sorted(self.texts)
+        ]
+
+
+class SMSReassembler:
+    """
+    Joins the parts of concatenated SMS.
+
+    Parts are keyed by (sender, reference, total) and only their text and
+    storage index are kept. add() returns the complete message when its
+    last part arrives: content is the joined text, index the index of
+    part 1, indices the storage indices of all parts (for deletion) and
+    concat None.
+
+    Incomplete messages are evicted oldest first when they are older than
+    ``max_age`` seconds (checked on every add() and by evict()) or when the
+    parts held exceed ``max_bytes``. Evicted parts are passed to
+    ``on_evict`` so the caller can still deliver them as fragments.
+
+    Thread-safe; one reassembler can be fed from a URC worker thread while
+    another thread calls evict().
+
+    Example:
+
+    .. code-block:: python
+
+        reassembler = SMSReassembler(max_age=600.0)
+        for message in messages:
+            if message.concat is None:
+                handle(message)
+            elif (complete := reassembler.add(message)) is not None:
+                handle(complete)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024,
+        max_age: Optional[float] = 3600.0,
+        on_evict: Optional[EvictionCallback] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize reassembler.
+
+        Args:
+            max_bytes: Approximate memory cap for parts of incomplete messages
+            max_age: Seconds an incomplete message is kept (None = no limit)
+            on_evict: Called with the parts of each evicted message
+            clock: Time source in seconds (for tests)
+
+        Raises:
+            ValueError: If max_bytes is less than 1 or max_age is not positive
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.on_evict = on_evict
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._sets: "OrderedDict[_Key, _PartSet]" = OrderedDict()
+        self.stats = ReassemblyStats()
+
+    @property
+    def pending(self) -> int:
+        """Number of incomplete messages held."""
+        return len(self._sets)
+
+    def add(self, message: SMSMessage) -> Optional[SMSMessage]:
+        """
+        Add one part of a long message.
+
+        Args:
+            message: Message with concat set (messages without it are
+                     returned unchanged)
+
+        Returns:
+            The joined message if this was the last missing part, else None
+        """
+        concat = message.concat
+        if concat is None:
+            return message
+
+        evicted = []
+        with self._lock:
+            now = self._clock()
+            evicted.extend(self._evict_expired(now))
+
+            key = (message.sender, concat.reference, concat.total)
+            parts = self._sets.get(key)
+            if parts is None:
+                parts = self._sets[key] = _PartSet(message, now)
+                self.stats.pending_bytes += parts.size
+
+            self.stats.parts += 1
+            if concat.sequence in parts.texts:
+                self.stats.duplicates += 1
+                self._resize(parts, -sys.getsizeof(parts.texts[concat.sequence]))
+            parts.texts[concat.sequence] = message.content
+            parts.indices[concat.sequence] = message.index
+            self._resize(parts, sys.getsizeof(message.content))
+
+            complete = None
+            if len(parts.texts) == concat.total:
+                del self._sets[key]
+                self.stats.pending_bytes -= parts.size
+                self.stats.completed += 1
+                complete = self._join(parts)
+            else:
+                evicted.extend(self._evict_oversize(keep=key))
+
+            self.stats.pending = len(self._sets)
+
+        self._report(evicted)
+        return complete
+
+    def evict(self) -> list[SMSMessage]:
+        """
+        Evict incomplete messages older than max_age.
+
+        Call periodically when parts may stop arriving, since add() only
+        checks ages when a part comes in.
+
+        Returns:
+            Parts of the evicted messages (also passed to on_evict)
+        """
+        with self._lock:
+            evicted = self._evict_expired(self._clock())
+            self.stats.pending = len(self._sets)
+
+        self._report(evicted)
+        return [part for parts in evicted for part in parts]
+
+    def flush(self) -> list[SMSMessage]:
+        """
+        Remove every incomplete message without calling on_evict.
+
+        Returns:
+            Parts of all incomplete messages, oldest message first
+        """
+        with self._lock:
+            sets = list(self._sets.values())
+            self._sets.clear()
+            self.stats.pending = 0
+            self.stats.pending_bytes = 0
+        return [part for parts in sets for part in parts.fragments()]
+
+    def _resize(self, parts: _PartSet, delta: int) -> None:
+        """Account for a change in a set's size. Called with the lock held."""
+        parts.size += delta
+        self.stats.pending_bytes += delta
+
+    def _evict_expired(self, now: float) -> list[list[SMSMessage]]:
+        """Remove sets older than max_age. Called with the lock held."""
+        evicted = []
+        if self.max_age is None:
+            return evicted
+        # Sets are in creation order, so stop at the first young one
+        while self._sets:
+            key, parts = next(iter(self._sets.items()))
+            if now - parts.created < self.max_age:
+                break
+            logger.warning(
+                f"Evicting incomplete SMS from {key[0]} (ref {key[1]}): "
+                f"{len(parts.texts)}/{key[2]} parts after {now - parts.created:.0f}s"
+            )
+            evicted.append(self._remove(key))
+            self.stats.evicted_age += 1
+        return evicted
+
+    def _evict_oversize(self, keep: _Key) -> list[list[SMSMessage]]:
+        """Remove the oldest sets while over max_bytes. Called with the lock held."""
+        evicted = []
+        while self.stats.pending_bytes > self.max_bytes:
+            key = next((k for k in self._sets if k != keep), None)
+            if key is None:
+                break
+            logger.warning(
+                f"Evicting incomplete SMS from {key[0]} (ref {key[1]}): "
+                f"reassembly memory cap of {self.max_bytes} bytes reached"
+            )
+            evicted.append(self._remove(key))
+            self.stats.evicted_memory += 1
+        return evicted
+
+    def _remove(self, key: _Key) -> list[SMSMessage]:
+        """Drop a set and return its parts. Called with the lock held."""
+        parts = self._sets.pop(key)
+        self.stats.pending_bytes -= parts.size
+        return parts.fragments()
+
+    @staticmethod
+    def _join(parts: _PartSet) -> SMSMessage:
+        """Build the complete message from all parts."""
+        order = sorted(parts.texts)
+        return replace(
+            parts.first,
+            index=parts.indices[order[0]],
+            content="".join(parts.texts[seq] for seq in order),
+            concat=None,
+            indices=[parts.indices[seq] for seq in order]
+        )
+
+    def _report(self, evicted: list[list[SMSMessage]]) -> None:
+        """Pass evicted parts to on_evict, outside the lock."""
+        if self.on_evict is None:
+            return
+        for parts in evicted:
+            try:
+                self.on_evict(parts)
+            except Exception as e:
+                logger.error(f"SMS eviction callback failed: {e}", exc_info=True)
+
+    def __repr__(self) -> str:
+        """String representation of the reassembler."""
+        return (
+            f"<SMSReassembler pending={self.stats.pending} "
+            f"bytes={self.stats.pending_bytes}/{self.max_bytes}>"
+        )
+
+
+def reassemble(messages: Iterable[SMSMessage]) -> list[SMSMessage]:
+    """
+    Join the parts of long messages in a list, e.g. from AT+CMGL.
+
+    Complete messages take the place of their first part; parts of
+    incomplete messages are returned unchanged, after the other messages.
+
+    Args:
+        messages: Messages in any order
+
+    Returns:
+        Messages with every complete long message joined
+
+    Example:
+
+    .. code-block:: python
+
+        messages = reassemble(modem.sms.list_messages(reassemble=False))
+    """
+    reassembler = SMSReassembler(max_bytes=sys.maxsize, max_age=None)
+    # Reserve the slot of each message's first part so output keeps list order
+    result: list[Optional[SMSMessage]] = []
+    slots: Dict[_Key, int] = {}
+
+    for message in messages:
+        concat = message.concat
+        if concat is None:
+            result.append(message)
+            continue
+
+        key = (message.sender, concat.reference, concat.total)
+        if key not in slots:
+            slots[key] = len(result)
+            result.append(None)
+
+        complete = reassembler.add(message)
+        if complete is not None:
+            result[slots.pop(key)] = complete
+
+    return [message for message in result if message is not None] + reassembler.flush()
+
+
+class StreamReassembler:
+    """
+    Joins the parts of long messages in one finite stream, fed in batches.
+
+    For a listing read line by line (sync or async): feed() each batch of
+    parsed messages as it arrives, then finish() once the stream ends.
+    Nothing is evicted, since the stream is finite.
+
+    Example:
+
+    .. code-block:: python
+
+        joiner = StreamReassembler()
+        async for batch in batches:
+            for message in joiner.feed(batch):
+                ...
+        leftovers = joiner.finish()
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty stream reassembler."""
+        self._reassembler = SMSReassembler(max_bytes=sys.maxsize, max_age=None)
+
+    def feed(self, messages: Iterable[SMSMessage]) -> Iterator[SMSMessage]:
+        """
+        Add messages, yielding those that are complete.
+
+        Messages without concatenation information are yielded
+        immediately, long messages as soon as their last part arrives.
+
+        Args:
+            messages: Next messages of the stream
+
+        Yields:
+            Complete messages
+        """
+        for message in messages:
+            complete = self._reassembler.add(message)
+            if complete is not None:
+                yield complete
+
+    def finish(self) -> list[SMSMessage]:
+        """
+        End the stream.
+
+        Returns:
+            Parts of messages that never completed, unjoined
+        """
+        return self._reassembler.flush()
+
+
+def iter_reassembled(messages: Iterable[SMSMessage]) -> Iterator[SMSMessage]:
+    """
+    Join the parts of long messages in a stream of messages.
+
+    Messages without concatenation information are yielded immediately,
+    long messages as soon as their last part arrives, and parts of
+    incomplete messages once the input is exhausted.
+
+    Args:
+        messages: Messages, e.g. from SMSParser.iter_cmgl_pdu()
+
+    Yields:
+        Messages with every complete long message joined
+    """
+    joiner = StreamReassembler()
+    yield from joiner.feed(messages)
+    yield from joiner.finish()
@@ -5,15 +5,25 @@ Implements GSM 03.40 specification for SMS PDU format.
 Supports:
 - 7-bit GSM alphabet (160 chars)
 - UCS2 Unicode (70 chars)
+- National language shift tables (Turkish, Spanish, Portuguese), chosen to
+  minimise the number of parts
 - Concatenated SMS (long messages)
 - Flash SMS
 - Validity period
 - Status reports
+- Full TPDU decoding (SMSC, header elements, 8-bit data, alphanumeric senders)
+- Bulk decoding of PDU archives, optionally across processes
 """
 
+import codecs
 import re
-from typing import Optional, Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple, Union
 
 
 # GSM 7-bit default alphabet
@@ -39,6 +49,70 @@ GSM7_EXTENDED = {
 # Reverse mapping for decoding
 GSM7_EXTENDED_REV = {v: k for k, v in GSM7_EXTENDED.items()}
 
+# Character -> septet bytes (escape included for extended characters), as a
+# charmap so encoding is one pass in C
+_GSM7_ENCODE_MAP = {ord(char): value for value, char in enumerate(GSM7_BASIC)}
+_GSM7_ENCODE_MAP.update({ord(char): bytes([0x1B, value]) for char, value in GSM7_EXTENDED.items()})
+
+# Septet -> character; octets above 0x7F never occur in unpacked septets
+_GSM7_DECODE_TABLE = GSM7_BASIC + "?" * 128
+
+# Character decoded after an escape -> extended character
+_GSM7_ESCAPED = {GSM7_BASIC[value]: char for char, value in GSM7_EXTENDED.items()}
+_GSM7_ESCAPE_RE = re.compile("\x1b(.)?", re.DOTALL)
+
+# National language identifiers (3GPP TS 23.038 section 6.2.1.2.4)
+NATIONAL_LANGUAGES = {
+    "turkish": 1,
+    "spanish": 2,
+    "portuguese": 3,
+}
+
+# National locking shift tables (UDH IEI 0x25): replace the default
+# alphabet for the whole part (3GPP TS 23.038 annex A.3). Spanish has none.
+_LOCKING_SHIFT_TABLES = {
+    0: GSM7_BASIC,
+    1: (  # Turkish
+        "@£$¥€éùıòÇ\nĞğ\rÅåΔ_ΦΓΛΩΠΨΣΘΞ\x1bŞşßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+        "İABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§çabcdefghijklmnopqrstuvwxyzäöñüà"
+    ),
+    3: (  # Portuguese
+        "@£$¥êéúíóç\nÔô\rÁáΔ_ªÇÀ∞^\\€Ó|\x1bÂâÊÉ !\"#º%&'()*+,-./0123456789:;<=>?"
+        "ÍABCDEFGHIJKLMNOPQRSTUVWXYZÃÕÚÜ§~abcdefghijklmnopqrstuvwxyzãõ`üà"
+    ),
+}
+
+# National single shift tables (UDH IEI 0x24): characters reached with the
+# escape, replacing GSM7_EXTENDED (3GPP TS 23.038 annex A.2)
+_SINGLE_SHIFT_TABLES = {
+    0: GSM7_EXTENDED,
+    1: {**GSM7_EXTENDED, "Ğ": 0x47, "İ": 0x49, "Ş": 0x53, "ç": 0x63, "ğ": 0x67, "ı": 0x69, "ş": 0x73},
+    2: {
+        **GSM7_EXTENDED, "ç": 0x09, "Á": 0x41, "Í": 0x49, "Ó": 0x4F, "Ú": 0x55,
+        "á": 0x61, "í": 0x69, "ó": 0x6F, "ú": 0x75,
+    },
+    3: {
+        **GSM7_EXTENDED, "ê": 0x05, "ç": 0x09, "Ô": 0x0B, "ô": 0x0C, "Á": 0x0E, "á": 0x0F,
+        "Φ": 0x12, "Γ": 0x13, "Ω": 0x15, "Π": 0x16, "Ψ": 0x17, "Σ": 0x18, "Θ": 0x19,
+        "Ê": 0x1F, "À": 0x41, "Í": 0x49, "Ó": 0x4F, "Ú": 0x55, "Ã": 0x5B, "Õ": 0x5C,
+        "Â": 0x61, "í": 0x69, "ó": 0x6F, "ú": 0x75, "ã": 0x7B, "õ": 0x7C, "â": 0x7F,
+    },
+}
+
+# UDH information element identifiers of the shift tables
+IEI_SINGLE_SHIFT = 0x24
+IEI_LOCKING_SHIFT = 0x25
+
+# Semi-octet (BCD) address digits; 0xF is filler (3GPP TS 23.040 section 9.1.2.3)
+_BCD_NIBBLES = "0123456789*#abc"
+_BCD_DIGITS = tuple(
+    _BCD_NIBBLES[octet & 0x0F:(octet & 0x0F) + 1] + _BCD_NIBBLES[octet >> 4:(octet >> 4) + 1]
+    for octet in range(256)
+)
+
+# Semi-octet -> two-digit value (digits swapped), for timestamps
+_SEMI_OCTETS = tuple((octet & 0x0F) * 10 + (octet >> 4) for octet in range(256))
+
 
 class PDUError(Exception):
     """PDU encoding/decoding error."""
@@ -58,20 +132,73 @@ def encode_gsm7(text: str) -> bytes:
     Raises:
         PDUError: If text contains unsupported characters
     """
-    septets = []
+    # Pack 7-bit septets into 8-bit octets
+    return _pack_septets(_text_to_septets(text))
 
-    for char in text:
-        if char in GSM7_BASIC:
-            septets.append(GSM7_BASIC.index(char))
-        elif char in GSM7_EXTENDED:
-            # Extended character needs escape
-            septets.append(0x1B)
-            septets.append(GSM7_EXTENDED[char])
-        else:
-            raise PDUError(f"Character '{char}' not in GSM 7-bit alphabet")
 
-    # Pack 7-bit septets into 8-bit octets
-    return _pack_septets(septets)
+def gsm7_septets(text: str) -> Optional[bytes]:
+    """
+    Map text to GSM 7-bit septets in a single pass.
+
+    Tells in one step whether the text is representable, how many septets
+    it needs (len of the result) and what they are.
+
+    Args:
+        text: Text to encode
+
+    Returns:
+        One byte per septet (extended characters take two), or None if the
+        text contains a character outside the GSM 7-bit alphabet
+    """
+    try:
+        return codecs.charmap_encode(text, "strict", _GSM7_ENCODE_MAP)[0]
+    except UnicodeEncodeError:
+        return None
+
+
+def _text_to_septets(text: str, locking: int = 0, single: int = 0) -> bytes:
+    """
+    Map text to GSM 7-bit septet values (extended characters take two).
+
+    Args:
+        text: Text to encode
+        locking: National locking shift table (0 = default alphabet)
+        single: National single shift table (0 = default extension table)
+
+    Raises:
+        PDUError: If text contains unsupported characters
+    """
+    try:
+        return codecs.charmap_encode(text, "strict", _gsm7_encode_map(locking, single))[0]
+    except UnicodeEncodeError as e:
+        raise PDUError(f"Character '{text[e.start]}' not in GSM 7-bit alphabet") from None
+
+
+def _national_septets(text: str, locking: int, single: int) -> Optional[bytes]:
+    """Septets of text with national shift tables, or None if it does not fit them."""
+    try:
+        return codecs.charmap_encode(text, "strict", _gsm7_encode_map(locking, single))[0]
+    except UnicodeEncodeError:
+        return None
+
+
+@lru_cache(maxsize=16)
+def _gsm7_encode_map(locking: int, single: int) -> dict:
+    """Encoding charmap for a pair of national shift tables (0, 0 = default)."""
+    if not (locking or single):
+        return _GSM7_ENCODE_MAP
+    charmap = {ord(char): bytes([0x1B, value]) for char, value in _SINGLE_SHIFT_TABLES[single].items()}
+    # A character in the locking table takes one septet, not an escape
+    charmap.update({ord(char): value for value, char in enumerate(_LOCKING_SHIFT_TABLES[locking])})
+    return charmap
+
+
+@lru_cache(maxsize=16)
+def _gsm7_decode_tables(locking: int, single: int) -> Tuple[str, dict]:
+    """Decoding table and escaped-character map for a pair of shift tables."""
+    table = _LOCKING_SHIFT_TABLES[locking]
+    escaped = {table[value]: char for char, value in _SINGLE_SHIFT_TABLES[single].items()}
+    return table + "?" * 128, escaped
 
 
 def decode_gsm7(data: bytes, length: int) -> str:
@@ -85,81 +212,97 @@ def decode_gsm7(data: bytes, length: int) -> str:
     Returns:
         Decoded text
     """
-    septets = _unpack_septets(data, length)
-
-    text = []
-    i = 0
-    while i < len(septets):
-        if septets[i] == 0x1B:
-            # Extended character escape
-            if i + 1 < len(septets):
-                i += 1
-                if septets[i] in GSM7_EXTENDED_REV:
-                    text.append(GSM7_EXTENDED_REV[septets[i]])
-                else:
-                    text.append("?")  # Unknown extended char
-            i += 1
-        else:
-            if septets[i] < len(GSM7_BASIC):
-                text.append(GSM7_BASIC[septets[i]])
-            else:
-                text.append("?")  # Unknown char
-            i += 1
+    return _septets_to_text(_unpack_septet_bytes(data, length))
 
-    return "".join(text)
 
+def _septets_to_text(septets: bytes, locking: int = 0, single: int = 0) -> str:
+    """Map GSM 7-bit septet values to text, with optional national shift tables."""
+    if locking or single:
+        table, escaped = _gsm7_decode_tables(locking, single)
+    else:
+        table, escaped = _GSM7_DECODE_TABLE, _GSM7_ESCAPED
+    text = codecs.charmap_decode(bytes(septets), "strict", table)[0]
+    if "\x1b" not in text:
+        return text
+    # Escape + next character -> extended character ("?" if unknown); a
+    # trailing escape is dropped
+    return _GSM7_ESCAPE_RE.sub(
+        lambda m: escaped.get(m.group(1), "?") if m.group(1) is not None else "",
+        text
+    )
+
+
+@lru_cache(maxsize=8)
+def _septet_masks(octets: int) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Masks for moving septets between 8-bit and packed 7-bit lanes.
 
-def _pack_septets(septets: list[int]) -> bytes:
-    """Pack 7-bit septets into 8-bit octets."""
-    if not septets:
-        return b''
+    For lanes of 16, 32 and 64 bits, whose halves hold 7, 14 and 28 used
+    bits, returns (gap, low half mask, high half mask) covering ``octets``
+    octets; gap is how far the high half moves to close up with the low.
+    """
+    masks = []
+    for width, used in ((16, 7), (32, 14), (64, 28)):
+        lanes = octets * 8 // width
+        low = int.from_bytes(((1 << used) - 1).to_bytes(width // 8, "little") * lanes, "little")
+        masks.append((width // 2 - used, low, low << (width // 2)))
+    return tuple(masks)
 
-    octets = []
-    bits = 0  # Accumulated bits
-    bits_count = 0  # Number of bits accumulated
 
-    for septet in septets:
-        # Add septet to accumulator
-        bits |= (septet << bits_count)
-        bits_count += 7
+def _pack_septets(septets: Union[bytes, list[int]], fill_bits: int = 0) -> bytes:
+    """
+    Pack 7-bit septets into 8-bit octets.
 
-        # Extract complete octets
-        while bits_count >= 8:
-            octets.append(bits & 0xFF)
-            bits >>= 8
-            bits_count -= 8
+    The septets are loaded into one integer (8 bits each) and squeezed
+    with whole-integer mask-and-shift steps: 8 septets per 64-bit lane
+    become 56 bits, then the unused top octet of each lane is removed.
 
-    # Add remaining bits if any
-    if bits_count > 0:
-        octets.append(bits & 0xFF)
+    Args:
+        septets: Septet values
+        fill_bits: Zero bits before the first septet, to align it to a
+                   septet boundary after a User Data Header
+    """
+    count = len(septets)
+    if not count:
+        return b''
 
-    return bytes(octets)
+    padded = -(-count // 8) * 8
+    value = int.from_bytes(bytes(septets), "little")
+    for gap, low, high in _septet_masks(padded):
+        # Close the gap between the two halves of every lane
+        value = (value & low) | ((value & high) >> gap)
+
+    lanes = bytearray(value.to_bytes(padded, "little"))
+    del lanes[7::8]
+    value = int.from_bytes(lanes, "little") << fill_bits
+    return value.to_bytes((count * 7 + fill_bits + 7) // 8, "little")
 
 
 def _unpack_septets(octets: bytes, length: int) -> list[int]:
     """Unpack 8-bit octets into 7-bit septets."""
-    if not octets or length == 0:
-        return []
+    return list(_unpack_septet_bytes(octets, length))
+
 
-    septets = []
-    bits = 0  # Accumulated bits
-    bits_count = 0  # Number of bits accumulated
+def _unpack_septet_bytes(octets: bytes, length: int) -> bytes:
+    """Unpack 8-bit octets into 7-bit septets, one byte per septet."""
+    if not octets or length <= 0:
+        return b''
 
-    for octet in octets:
-        # Add octet to accumulator
-        bits |= (octet << bits_count)
-        bits_count += 8
+    # Septets that the octets actually hold
+    length = min(length, len(octets) * 8 // 7)
+    padded = -(-length // 8) * 8
 
-        # Extract complete septets
-        while bits_count >= 7 and len(septets) < length:
-            septets.append(bits & 0x7F)
-            bits >>= 7
-            bits_count -= 7
+    # Spread every 7 octets over a 64-bit lane, then widen the halves
+    lanes = bytearray(padded)
+    data = bytes(octets[:padded // 8 * 7]).ljust(padded // 8 * 7, b"\x00")
+    for i in range(7):
+        lanes[i::8] = data[i::7]
 
-        if len(septets) >= length:
-            break
+    value = int.from_bytes(lanes, "little")
+    for gap, low, high in reversed(_septet_masks(padded)):
+        value = (value & low) | ((value << gap) & high)
 
-    return septets[:length]
+    return value.to_bytes(padded, "little")[:length]
 
 
 def encode_ucs2(text: str) -> bytes:
@@ -226,27 +369,22 @@ def decode_phone_number(data: bytes, length: int, type_of_addr: int) -> str:
     """
     Decode phone number from PDU format.
 
+    Alphanumeric addresses (type of number 101, e.g. sender IDs like
+    "BANK") are decoded as GSM 7-bit text; semi-octet numbers may contain
+    the digits *, #, a, b and c.
+
     Args:
         data: Encoded phone number
-        length: Number of digits
+        length: Number of digits (useful semi-octets)
         type_of_addr: Type-of-address byte
 
     Returns:
         Decoded phone number
     """
-    digits = []
-
-    for octet in data:
-        # Extract swapped nibbles
-        low = octet & 0x0F
-        high = (octet >> 4) & 0x0F
-
-        if low != 0xF:
-            digits.append(str(low))
-        if high != 0xF:
-            digits.append(str(high))
+    if (type_of_addr & 0x70) == 0x50:  # Alphanumeric
+        return decode_gsm7(data, length * 4 // 7)
 
-    number = "".join(digits[:length])
+    number = "".join([_BCD_DIGITS[octet] for octet in data])[:length]
 
     # Add + for international numbers
     if (type_of_addr & 0x70) == 0x10:  # International
@@ -308,38 +446,287 @@ def decode_timestamp(data: bytes) -> str:
     if len(data) < 7:
         raise PDUError(f"Invalid timestamp length: {len(data)}")
 
-    def decode_semi_octet(octet: int) -> int:
-        """Decode semi-octet (swapped digits)."""
-        low = (octet >> 4) & 0x0F
-        high = octet & 0x0F
-        return high * 10 + low
-
-    year = decode_semi_octet(data[0])
-    month = decode_semi_octet(data[1])
-    day = decode_semi_octet(data[2])
-    hour = decode_semi_octet(data[3])
-    minute = decode_semi_octet(data[4])
-    second = decode_semi_octet(data[5])
+    year, month, day, hour, minute, second = [_SEMI_OCTETS[octet] for octet in data[:6]]
 
     # Timezone (in quarters of an hour, with sign bit)
     tz_octet = data[6]
     tz_sign = "-" if (tz_octet & 0x08) else "+"
-    tz_value = decode_semi_octet(tz_octet & 0xF7)  # Clear sign bit
+    tz_value = _SEMI_OCTETS[tz_octet & 0xF7]  # Clear sign bit
 
     return f"{year:02d}/{month:02d}/{day:02d},{hour:02d}:{minute:02d}:{second:02d}{tz_sign}{tz_value:02d}"
 
 
+class _Alphabet(NamedTuple):
+    """A candidate encoding of one message."""
+    encoding: str             # "gsm7" or "ucs2"
+    septets: Optional[bytes]  # GSM 7-bit septets, None for UCS2
+    locking: int = 0          # National locking shift table
+    single: int = 0           # National single shift table
+
+
+@dataclass(frozen=True)
+class EncodingPlan:
+    """Encoding chosen for a message by plan_sms()."""
+    encoding: str              # "gsm7" or "ucs2"
+    segments: Tuple[str, ...]  # Text of each part
+    locking_shift: int = 0     # National locking shift table (0 = default alphabet)
+    single_shift: int = 0      # National single shift table (0 = default extension table)
+
+    @property
+    def parts(self) -> int:
+        """Number of SMS parts."""
+        return len(self.segments)
+
+    @property
+    def header(self) -> bytes:
+        """Shift table information elements every part carries (no length octet)."""
+        return _shift_elements(self.locking_shift, self.single_shift)
+
+
+def _shift_elements(locking: int, single: int) -> bytes:
+    """UDH information elements selecting national shift tables."""
+    elements = b""
+    if locking:
+        elements += bytes([IEI_LOCKING_SHIFT, 0x01, locking])
+    if single:
+        elements += bytes([IEI_SINGLE_SHIFT, 0x01, single])
+    return elements
+
+
+@lru_cache(maxsize=8)
+def _shift_pairs(languages: Tuple[int, ...]) -> Tuple[Tuple[int, int], ...]:
+    """
+    (locking, single) table pairs to try, cheapest header first: single
+    shift only, locking shift only, then both.
+    """
+    for language in languages:
+        if language not in _SINGLE_SHIFT_TABLES or not language:
+            raise PDUError(f"Unsupported national language: {language}")
+    lockable = [language for language in languages if language in _LOCKING_SHIFT_TABLES]
+    return tuple(
+        [(0, language) for language in languages]
+        + [(language, 0) for language in lockable]
+        + [(language, language) for language in lockable]
+    )
+
+
+def _alphabets(text: str, encoding: str, languages: Iterable[int]) -> Iterator[_Alphabet]:
+    """
+    Candidate encodings of text, in order of preference, computed lazily.
+
+    The default GSM alphabet comes first, then UCS2 (understood by every
+    phone), then the national shift tables.
+
+    Raises:
+        PDUError: If the encoding is unsupported or text does not fit it
+    """
+    pairs = _shift_pairs(tuple(languages))
+
+    if encoding == "ucs2":
+        yield _Alphabet("ucs2", None)
+        return
+    if encoding not in ("auto", "gsm7"):
+        raise PDUError(f"Unsupported encoding: {encoding}")
+
+    septets = gsm7_septets(text)
+    if septets is not None:
+        yield _Alphabet("gsm7", septets)
+        if len(septets) == len(text):
+            return  # One septet per character: no other encoding is shorter
+    if encoding == "auto":
+        yield _Alphabet("ucs2", None)
+
+    found = septets is not None or encoding == "auto"
+    for locking, single in pairs:
+        septets = _national_septets(text, locking, single)
+        if septets is not None:
+            found = True
+            yield _Alphabet("gsm7", septets, locking, single)
+
+    if not found:
+        _text_to_septets(text)  # Raises PDUError naming the character
+
+
+def _segments(alphabet: _Alphabet, text: str, ref16: bool) -> list[str]:
+    """Split text into parts for one candidate encoding."""
+    if alphabet.encoding == "ucs2":
+        return _split_ucs2(text, ref16)
+
+    # Every part carries the shift elements (and the UDH length octet)
+    shift = len(_shift_elements(alphabet.locking, alphabet.single))
+    header = 1 + shift if shift else 0
+    septets = alphabet.septets
+    if len(septets) <= (140 - header) * 8 // 7:
+        return [text]
+    per_part = (140 - 1 - (6 if ref16 else 5) - shift) * 8 // 7
+    return _split_septets(septets, per_part, alphabet.locking, alphabet.single)
+
+
+def _choose(
+    text: str,
+    encoding: str,
+    ref16: bool,
+    languages: Iterable[int]
+) -> Tuple[_Alphabet, list[str]]:
+    """The candidate encoding with the fewest parts, and its segments."""
+    best = None
+    for alphabet in _alphabets(text, encoding, languages):
+        segments = _segments(alphabet, text, ref16)
+        if best is None or len(segments) < len(best[1]):
+            best = (alphabet, segments)
+            if len(segments) == 1:
+                break  # Nothing later can do better
+    return best
+
+
+def plan_sms(
+    text: str,
+    encoding: str = "auto",
+    ref16: bool = False,
+    languages: Iterable[int] = ()
+) -> EncodingPlan:
+    """
+    Choose the encoding that sends text in the fewest parts.
+
+    Besides the default GSM alphabet and UCS2, GSM 7-bit text may use the
+    national single and locking shift tables of 3GPP TS 23.038 (Turkish,
+    Spanish, Portuguese) of the languages passed in ``languages``,
+    announced in the User Data Header. A Turkish message that needs UCS2
+    otherwise then fits 149-155 characters per part instead of 67-70. The
+    tables are opt-in: a recipient's phone may not support them, so only
+    enable the languages its users read. When encodings tie, the default
+    alphabet is preferred, then UCS2, then the smallest header.
+
+    Args:
+        text: Message text
+        encoding: "gsm7" (default alphabet or shift tables), "ucs2", or
+                  "auto" (any)
+        ref16: Size parts for a 16-bit concatenation reference
+        languages: National languages whose shift tables may be used
+                   (NATIONAL_LANGUAGES values); none by default
+
+    Returns:
+        EncodingPlan
+
+    Raises:
+        PDUError: If the encoding or a language is unsupported, or text
+                  does not fit the encoding
+
+    Example:
+
+    .. code-block:: python
+
+        plan = plan_sms(
+            "Yarın saat 10'da görüşürüz, lütfen geç kalmayın.",
+            languages=[NATIONAL_LANGUAGES["turkish"]]
+        )
+        print(plan.encoding, plan.locking_shift, plan.single_shift, plan.parts)
+    """
+    alphabet, segments = _choose(text, encoding, ref16, languages)
+    return EncodingPlan(alphabet.encoding, tuple(segments), alphabet.locking, alphabet.single)
+
+
+def concat_udh(reference: int, total: int, sequence: int, ref16: bool = False) -> bytes:
+    """
+    Build a User Data Header for one part of a concatenated SMS.
+
+    Args:
+        reference: Concatenation reference shared by all parts
+        total: Number of parts
+        sequence: This part's number (1-based)
+        ref16: Use a 16-bit reference (IEI 0x08) instead of 8-bit (IEI 0x00)
+
+    Returns:
+        UDH including its length octet (6 or 7 octets)
+    """
+    if ref16:
+        return bytes([0x06, 0x08, 0x04, (reference >> 8) & 0xFF, reference & 0xFF, total, sequence])
+    return bytes([0x05, 0x00, 0x03, reference & 0xFF, total, sequence])
+
+
+def split_sms_text(
+    text: str,
+    encoding: str = "auto",
+    ref16: bool = False,
+    languages: Iterable[int] = ()
+) -> Tuple[str, list[str]]:
+    """
+    Split text into the segments of a (possibly concatenated) SMS.
+
+    Text that fits one SMS (160 septets or 70 UCS2 units) is one segment.
+    Otherwise each part holds what is left after the concatenation header:
+    153 septets or 67 UCS2 units (152/66 with a 16-bit reference). Escape
+    sequences and surrogate pairs are never split across parts.
+
+    National shift tables are only used for the languages passed in
+    ``languages``; plan_sms() reports which tables the segments need.
+
+    Args:
+        text: Message text
+        encoding: "gsm7", "ucs2", or "auto"
+        ref16: Size parts for a 16-bit concatenation reference
+        languages: National languages to consider (see plan_sms())
+
+    Returns:
+        Tuple of (resolved encoding, segments)
+
+    Raises:
+        PDUError: If the encoding is unsupported or text does not fit it
+    """
+    alphabet, segments = _choose(text, encoding, ref16, languages)
+    return alphabet.encoding, segments
+
+
+def _split_ucs2(text: str, ref16: bool) -> list[str]:
+    """Split text into UCS2 segments, keeping surrogate pairs whole."""
+    single, per_part = 70, 66 if ref16 else 67
+    if len(encode_ucs2(text)) // 2 <= single:
+        return [text]
+
+    segments = []
+    start = 0
+    used = 0
+    for i, char in enumerate(text):
+        size = 2 if ord(char) > 0xFFFF else 1
+        if used + size > per_part:
+            segments.append(text[start:i])
+            start, used = i, 0
+        used += size
+    segments.append(text[start:])
+
+    return segments
+
+
+def _split_septets(septets: bytes, per_part: int, locking: int = 0, single: int = 0) -> list[str]:
+    """Split GSM 7-bit septets into text segments, keeping escapes whole."""
+    segments = []
+    start = 0
+    while start < len(septets):
+        end = min(start + per_part, len(septets))
+        if end < len(septets) and septets[end - 1] == 0x1B:
+            end -= 1  # Escape would be separated from its character
+        segments.append(_septets_to_text(septets[start:end], locking, single))
+        start = end
+    return segments
+
+
 def encode_sms_submit(
     number: str,
     text: str,
     encoding: str = "auto",
     validity_period: Optional[int] = None,
     flash: bool = False,
-    request_status: bool = False
+    request_status: bool = False,
+    udh: bytes = b"",
+    languages: Iterable[int] = ()
 ) -> str:
     """
     Encode SMS-SUBMIT PDU.
 
+    With "auto" (or "gsm7") encoding, text outside the default GSM
+    alphabet may be sent with the shift tables of ``languages``; see
+    plan_sms().
+
     Args:
         number: Destination phone number
         text: Message text
@@ -347,14 +734,58 @@ def encode_sms_submit(
         validity_period: Validity period in minutes (None = max)
         flash: Flash SMS (class 0)
         request_status: Request status report
+        udh: User Data Header including its length octet (e.g. from
+             concat_udh()); sets TP-UDHI
+        languages: National languages to consider (see plan_sms())
 
     Returns:
         Hex-encoded PDU string
+
+    Raises:
+        PDUError: If text does not fit the encoding or one SMS (140 octets
+                  of user data)
+    """
+    alphabet = _choose(text, encoding, False, languages)[0]
+    return _encode_submit(number, text, alphabet, validity_period, flash, request_status, udh)
+
+
+def _encode_submit(
+    number: str,
+    text: str,
+    alphabet: _Alphabet,
+    validity_period: Optional[int],
+    flash: bool,
+    request_status: bool,
+    udh: bytes
+) -> str:
     """
-    pdu = []
+    Encode SMS-SUBMIT PDU with a chosen encoding.
 
-    # SMSC length (let modem use default)
-    pdu.append(0x00)
+    The PDU is written into one bytearray sized up front and hex-encoded
+    in a single call.
+    """
+    # Shift table elements join the caller's header
+    shift = _shift_elements(alphabet.locking, alphabet.single)
+    if shift:
+        udh = bytes([len(udh[1:]) + len(shift)]) + udh[1:] + shift
+
+    # User data after the header, and its Data Coding Scheme
+    if alphabet.encoding == "gsm7":
+        septets = alphabet.septets
+        dcs = 0x00  # 7-bit default alphabet
+        # The first septet starts on a septet boundary after the header
+        header_septets = (len(udh) * 8 + 6) // 7
+        payload = _pack_septets(septets, fill_bits=header_septets * 7 - len(udh) * 8)
+        user_data_length = header_septets + len(septets)  # Septets for GSM7
+    else:
+        dcs = 0x08  # UCS2
+        payload = encode_ucs2(text)
+        user_data_length = len(udh) + len(payload)  # Octets for UCS2
+    if flash:
+        dcs |= 0x10  # Class 0 (flash)
+
+    if len(udh) + len(payload) > 140:
+        raise PDUError(f"User data too long for one SMS: {len(udh) + len(payload)} octets (max 140)")
 
     # PDU type (SMS-SUBMIT)
     pdu_type = 0x01  # SMS-SUBMIT
@@ -362,192 +793,610 @@ def encode_sms_submit(
         pdu_type |= 0x10  # Validity Period Format: relative
     if request_status:
         pdu_type |= 0x20  # Status Report Request
-    pdu.append(pdu_type)
+    if udh:
+        pdu_type |= 0x40  # User Data Header Indicator
+
+    address = _address_field(number)
+    idx = 3 + len(address)
+    header = idx + 3 + (validity_period is not None)
+
+    # SMSC length 00 (modem default), PDU type, Message Reference 00 (modem assigns)
+    pdu = bytearray(header + len(udh) + len(payload))
+    pdu[1] = pdu_type
+    pdu[3:idx] = address
+
+    # Protocol Identifier 00 (normal SMS), Data Coding Scheme
+    pdu[idx + 1] = dcs
+    idx += 2
+
+    if validity_period is not None:
+        pdu[idx] = _relative_validity(validity_period)
+        idx += 1
+
+    pdu[idx] = user_data_length
+    pdu[header:header + len(udh)] = udh
+    pdu[header + len(udh):] = payload
+
+    return pdu.hex().upper()
 
-    # Message Reference (let modem assign)
-    pdu.append(0x00)
 
-    # Destination address
+@lru_cache(maxsize=256)
+def _address_field(number: str) -> bytes:
+    """
+    Destination address field: digit count, type-of-address, digits.
+
+    Cached, so messages to a repeat recipient skip the semi-octet encoding.
+    """
     phone_data, phone_type = encode_phone_number(number)
-    pdu.append(len(number.lstrip("+")))  # Number of digits
-    pdu.append(phone_type)
-    pdu.extend(phone_data)
+    digits = len(phone_data) * 2
+    if phone_data and phone_data[-1] >> 4 == 0xF:
+        digits -= 1  # Odd number of digits, padded with F
+    return bytes([digits, phone_type]) + phone_data
+
+
+def _relative_validity(minutes: int) -> int:
+    """Relative TP-VP octet for a validity period in minutes."""
+    if minutes <= 720:  # 12 hours
+        vp = (minutes // 5) - 1
+    elif minutes <= 1440:  # 24 hours
+        vp = ((minutes - 720) // 30) + 143
+    elif minutes <= 43200:  # 30 days
+        vp = (minutes // 1440) + 166
+    else:  # > 30 days
+        vp = (minutes // 10080) + 192
+    return max(0, min(255, vp))
+
+
+def encode_sms_submit_parts(
+    number: str,
+    text: str,
+    encoding: str = "auto",
+    reference: int = 0,
+    ref16: bool = False,
+    validity_period: Optional[int] = None,
+    flash: bool = False,
+    request_status: bool = False,
+    languages: Iterable[int] = ()
+) -> list[str]:
+    """
+    Encode a message as one SMS-SUBMIT PDU per part.
 
-    # Protocol Identifier (normal SMS)
-    pdu.append(0x00)
+    The encoding is chosen by plan_sms(). A message that fits one SMS
+    gives a single PDU without a concatenation header; longer messages are
+    split and every part gets a concatenation header with the same
+    reference. Parts using national shift tables all carry them.
 
-    # Auto-detect encoding if needed
-    if encoding == "auto":
-        try:
-            encode_gsm7(text)
-            encoding = "gsm7"
-        except PDUError:
-            encoding = "ucs2"
+    Args:
+        number: Destination phone number
+        text: Message text
+        encoding: "gsm7", "ucs2", or "auto"
+        reference: Concatenation reference (0-255, or 0-65535 with ref16)
+        ref16: Use a 16-bit concatenation reference
+        validity_period: Validity period in minutes (None = max)
+        flash: Flash SMS (class 0)
+        request_status: Request status report for every part
+        languages: National languages to consider (see plan_sms())
 
-    # Data Coding Scheme
-    if encoding == "gsm7":
-        dcs = 0x00  # 7-bit default alphabet
-        if flash:
-            dcs |= 0x10  # Class 0 (flash)
-        user_data = encode_gsm7(text)
-        user_data_length = len(text)  # Septets for GSM7
-    elif encoding == "ucs2":
-        dcs = 0x08  # UCS2
-        if flash:
-            dcs |= 0x10  # Class 0 (flash)
-        user_data = encode_ucs2(text)
-        user_data_length = len(user_data)  # Octets for UCS2
-    else:
-        raise PDUError(f"Unsupported encoding: {encoding}")
+    Returns:
+        Hex-encoded PDU strings in part order
 
-    pdu.append(dcs)
+    Raises:
+        PDUError: If encoding fails or the message needs more than 255 parts
+    """
+    alphabet, segments = _choose(text, encoding, ref16, languages)
+    total = len(segments)
+    if total > 255:
+        raise PDUError(f"Message too long: {total} parts (max 255)")
+
+    if total == 1:
+        return [_encode_submit(number, text, alphabet, validity_period, flash, request_status, b"")]
+
+    pdus = []
+    for sequence, segment in enumerate(segments, start=1):
+        if alphabet.encoding == "gsm7":
+            part = alphabet._replace(septets=_text_to_septets(segment, alphabet.locking, alphabet.single))
+        else:
+            part = alphabet
+        pdus.append(_encode_submit(
+            number, segment, part, validity_period, flash, request_status,
+            concat_udh(reference, total, sequence, ref16)
+        ))
+    return pdus
 
-    # Validity Period (if specified)
-    if validity_period is not None:
-        # Convert minutes to TP-VP format
-        if validity_period <= 720:  # 12 hours
-            vp = (validity_period // 5) - 1
-        elif validity_period <= 1440:  # 24 hours
-            vp = ((validity_period - 720) // 30) + 143
-        elif validity_period <= 43200:  # 30 days
-            vp = (validity_period // 1440) + 166
-        else:  # > 30 days
-            vp = (validity_period // 10080) + 192
-        pdu.append(max(0, min(255, vp)))
 
-    # User Data Length
-    pdu.append(user_data_length)
+# TP-MTI -> TPDU type, for PDUs received from the modem (3GPP TS 23.040 section 9.2.3.1)
+_TPDU_TYPES = ("deliver", "submit", "status-report")
 
-    # User Data
-    pdu.extend(user_data)
+# TP-VPF -> length of TP-VP in octets (none, enhanced, relative, absolute)
+_VALIDITY_LENGTHS = (0, 7, 1, 7)
 
-    # Convert to hex string
-    return "".join(f"{b:02X}" for b in pdu)
+# DCS character set bits (general data coding); "11" is reserved and read as 7-bit
+_DCS_ALPHABETS = ("gsm7", "8bit", "ucs2", "gsm7")
 
 
-def decode_sms_deliver(pdu_hex: str) -> dict:
+@dataclass(frozen=True, slots=True)
+class InformationElement:
+    """One information element of a User Data Header."""
+    iei: int     # Information element identifier (0x00 concatenation, 0x05 ports, ...)
+    data: bytes  # Element data, without identifier and length
+
+
+@dataclass(frozen=True, slots=True)
+class DataCoding:
+    """Decoded Data Coding Scheme (3GPP TS 23.038 section 4)."""
+    dcs: int                      # Raw TP-DCS octet
+    alphabet: str                 # "gsm7", "8bit" or "ucs2"
+    message_class: Optional[int]  # 0 (flash), 1 (ME), 2 (SIM), 3 (TE), or None
+    compressed: bool = False      # Compressed user data (not decoded)
+
+
+@lru_cache(maxsize=256)
+def data_coding(dcs: int) -> DataCoding:
     """
-    Decode SMS-DELIVER PDU.
+    Decode a Data Coding Scheme octet.
 
     Args:
-        pdu_hex: Hex-encoded PDU string
+        dcs: TP-DCS octet
 
     Returns:
-        Dictionary with decoded fields:
-        - sender: Phone number
-        - timestamp: Timestamp string
-        - text: Message text
-        - encoding: "gsm7" or "ucs2"
+        DataCoding (cached, one instance per value)
     """
-    # Convert hex string to bytes
-    pdu = bytes.fromhex(pdu_hex)
+    if dcs < 0x80:
+        # General data coding; 0x40-0x7F are marked for automatic deletion
+        message_class = dcs & 0x03 if dcs & 0x10 else None
+        return DataCoding(dcs, _DCS_ALPHABETS[(dcs >> 2) & 0x03], message_class, bool(dcs & 0x20))
+    if dcs >= 0xF0:
+        # Data coding/message class
+        return DataCoding(dcs, "8bit" if dcs & 0x04 else "gsm7", dcs & 0x03)
+    if dcs >= 0xE0:
+        # Message waiting indication, UCS2 text
+        return DataCoding(dcs, "ucs2", None)
+    # Message waiting indication with 7-bit text (0xC0-0xDF), reserved groups
+    return DataCoding(dcs, "gsm7", None)
+
+
+@dataclass(frozen=True, slots=True)
+class TPDU:
+    """
+    Decoded SMS TPDU: SMS-DELIVER, SMS-SUBMIT or SMS-STATUS-REPORT.
 
-    idx = 0
+    Fields a type does not carry are left at their defaults.
+    """
+    type: str                            # "deliver", "submit" or "status-report"
+    first_octet: int                     # Raw first octet (MTI, UDHI, SRI/SRR, VPF, ...)
+    address: str                         # Sender, destination or recipient
+    address_type: int                    # Type-of-address octet
+    smsc: Optional[str] = None           # Service centre, None if absent or not given
+    reference: Optional[int] = None      # TP-MR (SUBMIT and STATUS-REPORT)
+    pid: int = 0                         # TP-PID
+    coding: DataCoding = DataCoding(0, "gsm7", None)
+    timestamp: Optional[str] = None      # TP-SCTS
+    discharge_time: Optional[str] = None  # TP-DT (STATUS-REPORT)
+    status: Optional[int] = None         # TP-ST (STATUS-REPORT)
+    validity: Optional[bytes] = None     # Raw TP-VP (SUBMIT)
+    elements: Tuple[InformationElement, ...] = ()
+    text: Optional[str] = None           # Text, None for 8-bit or compressed data
+    data: bytes = b""                    # User data after the header
+
+    @property
+    def concat(self) -> Optional[Tuple[int, int, int]]:
+        """(reference, total, sequence) if this is a part of a long message."""
+        return _concat_element(self.elements)
+
+    @property
+    def ports(self) -> Optional[Tuple[int, int]]:
+        """(destination, originator) application ports, if addressed to a port."""
+        for element in self.elements:
+            data = element.data
+            if element.iei == 0x05 and len(data) == 4:
+                return (data[0] << 8) | data[1], (data[2] << 8) | data[3]
+            if element.iei == 0x04 and len(data) == 2:
+                return data[0], data[1]
+        return None
+
+    def element(self, iei: int) -> Optional[InformationElement]:
+        """First header element with identifier ``iei``, or None."""
+        for element in self.elements:
+            if element.iei == iei:
+                return element
+        return None
+
+
+def decode_tpdu(pdu: Union[str, bytes], smsc: bool = True) -> TPDU:
+    """
+    Decode an SMS-DELIVER, SMS-SUBMIT or SMS-STATUS-REPORT PDU.
 
-    # SMSC length
-    smsc_len = pdu[idx]
-    idx += 1 + smsc_len
+    The PDU is walked once over a memoryview; only the fields of the result
+    are copied out. Any malformed input raises PDUError.
 
-    # PDU type
-    pdu_type = pdu[idx]
-    idx += 1
+    Args:
+        pdu: Hex-encoded PDU string or raw bytes
+        smsc: The PDU starts with the SMSC address (as in +CMGR, +CMGL, +CMT)
 
-    if (pdu_type & 0x03) != 0x00:
-        raise PDUError(f"Not an SMS-DELIVER PDU: {pdu_type:02X}")
+    Returns:
+        TPDU
 
-    # Sender address
-    sender_len = pdu[idx]
-    idx += 1
-    sender_type = pdu[idx]
-    idx += 1
+    Raises:
+        PDUError: If the PDU is truncated, malformed or of another type
 
-    # Number of octets for sender (round up)
-    sender_octets = (sender_len + 1) // 2
-    sender_data = pdu[idx:idx + sender_octets]
-    idx += sender_octets
+    Example:
 
-    sender = decode_phone_number(sender_data, sender_len, sender_type)
+    .. code-block:: python
 
-    # Protocol Identifier
-    pid = pdu[idx]
+        tpdu = decode_tpdu(pdu_hex)
+        if tpdu.ports == (2948, 9200):
+            handle_wap_push(tpdu.data)
+        else:
+            print(tpdu.address, tpdu.text)
+    """
+    try:
+        raw = bytes.fromhex(pdu) if isinstance(pdu, str) else pdu
+        return _decode_tpdu(memoryview(raw), smsc)
+    except IndexError:
+        raise PDUError(f"Truncated PDU ({len(raw)} octets)") from None
+    except ValueError as e:
+        # Bad hex, invalid UCS2
+        raise PDUError(f"Malformed PDU: {e}") from None
+
+
+def _decode_tpdu(view: memoryview, smsc: bool) -> TPDU:
+    """Decode a TPDU; truncation surfaces as IndexError."""
+    idx = 0
+    smsc_number = None
+    if smsc:
+        smsc_len = view[0]
+        if smsc_len:
+            # SMSC length counts octets, type-of-address included
+            smsc_number = decode_phone_number(view[2:1 + smsc_len], 2 * (smsc_len - 1), view[1])
+        idx = 1 + smsc_len
+
+    first = view[idx]
+    mti = first & 0x03
     idx += 1
+    if mti == 0x03:
+        raise PDUError(f"Unsupported TPDU type: {first:02X}")
+
+    reference = None
+    if mti != 0x00:
+        reference = view[idx]
+        idx += 1
+
+    # Address: length in useful semi-octets, then type-of-address
+    address_len, address_type = view[idx], view[idx + 1]
+    end = idx + 2 + (address_len + 1) // 2
+    if end > len(view):
+        raise PDUError("Truncated address")
+    address = decode_phone_number(view[idx + 2:end], address_len, address_type)
+    idx = end
+
+    fields = {}
+    if mti == 0x02:
+        # SMS-STATUS-REPORT: the PID, DCS and user data are optional
+        if idx + 15 > len(view):
+            raise PDUError("Truncated SMS-STATUS-REPORT")
+        fields["timestamp"] = decode_timestamp(view[idx:idx + 7])
+        fields["discharge_time"] = decode_timestamp(view[idx + 7:idx + 14])
+        fields["status"] = view[idx + 14]
+        idx += 15
+
+        pid, dcs, has_user_data = 0, 0, False
+        if idx < len(view):
+            indicator = view[idx]
+            idx += 1
+            extension = indicator
+            while extension & 0x80 and idx < len(view):
+                extension = view[idx]
+                idx += 1
+            if indicator & 0x01:
+                pid = view[idx]
+                idx += 1
+            if indicator & 0x02:
+                dcs = view[idx]
+                idx += 1
+            has_user_data = bool(indicator & 0x04)
+    else:
+        pid, dcs = view[idx], view[idx + 1]
+        idx += 2
+        if mti == 0x00:
+            fields["timestamp"] = decode_timestamp(view[idx:idx + 7])
+            idx += 7
+        else:
+            vp_len = _VALIDITY_LENGTHS[(first >> 3) & 0x03]
+            if vp_len:
+                fields["validity"] = bytes(view[idx:idx + vp_len])
+                idx += vp_len
+        has_user_data = True
+
+    coding = data_coding(dcs)
+    if has_user_data:
+        udl = view[idx]
+        _decode_user_data(view[idx + 1:], udl, bool(first & 0x40), coding, fields)
+
+    return TPDU(
+        type=_TPDU_TYPES[mti],
+        first_octet=first,
+        address=address,
+        address_type=address_type,
+        smsc=smsc_number,
+        reference=reference,
+        pid=pid,
+        coding=coding,
+        **fields
+    )
+
+
+def _decode_user_data(ud: memoryview, udl: int, udhi: bool, coding: DataCoding, fields: dict) -> None:
+    """Decode TP-UD into header elements, text and data."""
+    header_len = 0
+    if udhi and len(ud):
+        header_len = ud[0] + 1
+        if header_len > len(ud):
+            raise PDUError("User Data Header longer than user data")
+        fields["elements"] = _header_elements(ud[1:header_len])
+
+    if coding.alphabet == "gsm7" and not coding.compressed:
+        # UDL counts septets, header included; the text starts at the first
+        # septet boundary after the header
+        header_septets = (header_len * 8 + 6) // 7
+        locking, single = _shift_tables(fields.get("elements", ()))
+        fields["text"] = _septets_to_text(_unpack_septet_bytes(ud, udl)[header_septets:], locking, single)
+        fields["data"] = bytes(ud[header_len:(udl * 7 + 7) // 8])
+        return
+
+    # UDL counts octets, header included
+    payload = ud[header_len:udl]
+    fields["data"] = bytes(payload)
+    if coding.alphabet == "ucs2" and not coding.compressed:
+        fields["text"] = str(payload, "utf-16-be")
+
+
+def _shift_tables(elements: Tuple[InformationElement, ...]) -> Tuple[int, int]:
+    """National (locking, single) shift tables announced in a header; unknown ones are ignored."""
+    locking = single = 0
+    for element in elements:
+        if element.iei == IEI_LOCKING_SHIFT and len(element.data) == 1 and element.data[0] in _LOCKING_SHIFT_TABLES:
+            locking = element.data[0]
+        elif element.iei == IEI_SINGLE_SHIFT and len(element.data) == 1 and element.data[0] in _SINGLE_SHIFT_TABLES:
+            single = element.data[0]
+    return locking, single
+
+
+def _header_elements(header: memoryview) -> Tuple[InformationElement, ...]:
+    """Split a User Data Header (without its length octet) into elements."""
+    elements = []
+    idx = 0
+    while idx + 1 < len(header):
+        iei, length = header[idx], header[idx + 1]
+        start, idx = idx + 2, idx + 2 + length
+        if idx > len(header):
+            break  # Truncated element
+        elements.append(InformationElement(iei, bytes(header[start:idx])))
+    return tuple(elements)
+
+
+def _concat_element(elements: Iterable[InformationElement]) -> Optional[Tuple[int, int, int]]:
+    """Find the first valid 8-bit (IEI 0x00) or 16-bit (IEI 0x08) concatenation element."""
+    for element in elements:
+        data = element.data
+        if element.iei == 0x00 and len(data) == 3:
+            reference, total, sequence = data
+        elif element.iei == 0x08 and len(data) == 4:
+            reference, total, sequence = (data[0] << 8) | data[1], data[2], data[3]
+        else:
+            continue
 
-    # Data Coding Scheme
-    dcs = pdu[idx]
-    idx += 1
+        if 0 < sequence <= total:
+            return reference, total, sequence
 
-    # Timestamp
-    timestamp_data = pdu[idx:idx + 7]
-    idx += 7
-    timestamp = decode_timestamp(timestamp_data)
+    return None
 
-    # User Data Length
-    udl = pdu[idx]
-    idx += 1
 
-    # User Data
-    user_data = pdu[idx:]
+def decode_sms_deliver(pdu_hex: str) -> dict:
+    """
+    Decode SMS-DELIVER PDU.
 
-    # Decode based on DCS
-    if (dcs & 0x0C) == 0x08:
-        # UCS2
-        text = decode_ucs2(user_data[:udl])
-        encoding = "ucs2"
-    else:
-        # GSM 7-bit (default)
-        text = decode_gsm7(user_data, udl)
-        encoding = "gsm7"
+    Args:
+        pdu_hex: Hex-encoded PDU string
+
+    Returns:
+        Dictionary with decoded fields:
+        - sender: Phone number or alphanumeric sender ID
+        - timestamp: Timestamp string
+        - text: Message text (8-bit data as Latin-1)
+        - encoding: "gsm7", "8bit" or "ucs2"
+        - concat: (reference, total, sequence) for long message parts, or None
+
+    Raises:
+        PDUError: If the PDU is not a valid SMS-DELIVER
+    """
+    tpdu = decode_tpdu(pdu_hex)
+    if tpdu.type != "deliver":
+        raise PDUError(f"Not an SMS-DELIVER PDU: {tpdu.first_octet:02X}")
+
+    return {
+        "sender": tpdu.address,
+        "timestamp": tpdu.timestamp,
+        "text": tpdu.text if tpdu.text is not None else tpdu.data.decode("latin-1"),
+        "encoding": tpdu.coding.alphabet,
+        "concat": tpdu.concat,
+    }
+
+
+def decode_status_report(pdu_hex: str) -> dict:
+    """
+    Decode SMS-STATUS-REPORT PDU (+CDS, or a report read with AT+CMGR).
+
+    Args:
+        pdu_hex: Hex-encoded PDU string, starting with the SMSC address
+
+    Returns:
+        Dictionary with decoded fields:
+        - reference: Message reference (TP-MR) of the submitted message
+        - recipient: Recipient phone number
+        - timestamp: Service centre timestamp of the submitted message
+        - discharge_time: Time of delivery, or of the last delivery attempt
+        - status: Status code (TP-ST, 3GPP TS 23.040 section 9.2.3.15)
+
+    Raises:
+        PDUError: If the PDU is not a complete SMS-STATUS-REPORT
+    """
+    tpdu = decode_tpdu(pdu_hex)
+    if tpdu.type != "status-report":
+        raise PDUError(f"Not an SMS-STATUS-REPORT PDU: {tpdu.first_octet:02X}")
 
     return {
-        "sender": sender,
-        "timestamp": timestamp,
-        "text": text,
-        "encoding": encoding,
+        "reference": tpdu.reference,
+        "recipient": tpdu.address,
+        "timestamp": tpdu.timestamp,
+        "discharge_time": tpdu.discharge_time,
+        "status": tpdu.status,
     }
 
 
-def calculate_sms_parts(text: str, encoding: str = "auto") -> int:
+def parse_concat_udh(udh: bytes) -> Optional[Tuple[int, int, int]]:
+    """
+    Find the concatenation element in a User Data Header.
+
+    Args:
+        udh: UDH including its length octet
+
+    Returns:
+        Tuple of (reference, total, sequence), or None if the header has no
+        valid 8-bit (IEI 0x00) or 16-bit (IEI 0x08) concatenation element
+    """
+    if not udh:
+        return None
+    return _concat_element(_header_elements(memoryview(udh)[1:udh[0] + 1]))
+
+
+def calculate_sms_parts(
+    text: str,
+    encoding: str = "auto",
+    languages: Iterable[int] = ()
+) -> int:
     """
     Calculate number of SMS parts needed for text.
 
+    Counts parts as sent by send_sms() with the same ``languages``;
+    plan_sms() returns the full plan (encoding, tables, segments).
+
     Args:
         text: Message text
         encoding: "gsm7", "ucs2", or "auto"
+        languages: National languages to consider (see plan_sms())
 
     Returns:
         Number of SMS parts required
     """
-    # Auto-detect encoding
-    if encoding == "auto":
+    return plan_sms(text, encoding, languages=languages).parts
+
+
+@dataclass
+class DecodeResult:
+    """Outcome of decoding one PDU with decode_many()."""
+    index: int                     # Position of the PDU in the input
+    pdu: str                       # Hex PDU as given
+    fields: Optional[dict] = None  # decode_sms_deliver() result, None on error
+    error: Optional[str] = None    # Error description, None on success
+
+    @property
+    def ok(self) -> bool:
+        """Whether the PDU was decoded."""
+        return self.error is None
+
+
+def _decode_chunk(start: int, pdus: list[str]) -> list[DecodeResult]:
+    """Decode a chunk of PDUs; runs in worker processes, so module level."""
+    results = []
+    for offset, pdu in enumerate(pdus):
         try:
-            encode_gsm7(text)
-            encoding = "gsm7"
-        except PDUError:
-            encoding = "ucs2"
-
-    if encoding == "gsm7":
-        # Count septets (extended chars count as 2)
-        septets = 0
-        for char in text:
-            if char in GSM7_EXTENDED:
-                septets += 2
-            else:
-                septets += 1
+            results.append(DecodeResult(start + offset, pdu, fields=decode_sms_deliver(pdu)))
+        except Exception as e:
+            results.append(DecodeResult(start + offset, pdu, error=f"{type(e).__name__}: {e}"))
+    return results
+
+
+def _chunks(pdus: Iterable[str], chunk_size: int) -> Iterator[Tuple[int, list[str]]]:
+    """Yield (start index, chunk) pairs without reading ahead of the consumer."""
+    iterator = iter(pdus)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def decode_many(
+    pdus: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    ordered: bool = True
+) -> Iterator[DecodeResult]:
+    """
+    Decode many SMS-DELIVER PDUs, e.g. SMSMessage.pdu values from an archive.
 
-        # Single SMS: 160 chars, Concatenated: 153 chars per part
-        if septets <= 160:
-            return 1
-        else:
-            return (septets + 152) // 153
-
-    elif encoding == "ucs2":
-        # UCS2 uses 2 bytes per character
-        # Single SMS: 70 chars, Concatenated: 67 chars per part
-        length = len(text)
-        if length <= 70:
-            return 1
-        else:
-            return (length + 66) // 67
+    The input is read lazily in chunks, so it can be a generator over a
+    file or database cursor of any size. With ``workers``, chunks are
+    decoded in a process pool; at most two chunks per worker are in flight,
+    which bounds memory regardless of the input size.
 
-    else:
-        raise PDUError(f"Unsupported encoding: {encoding}")
+    A PDU that fails to decode yields a result with ``error`` set; the rest
+    of the batch is still decoded.
+
+    Args:
+        pdus: Hex PDU strings
+        workers: Worker processes (None or 1 decodes in this process)
+        chunk_size: PDUs per chunk handed to a worker
+        ordered: Yield results in input order; False yields each chunk as
+                 soon as it is done (use DecodeResult.index to match up)
+
+    Yields:
+        DecodeResult per PDU
+
+    Raises:
+        ValueError: If workers or chunk_size is less than 1
+
+    Example:
+
+    .. code-block:: python
+
+        rows = (line.strip() for line in open("pdus.txt"))
+        for result in decode_many(rows, workers=8):
+            if result.ok:
+                print(result.fields["sender"], result.fields["text"])
+            else:
+                print(f"row {result.index}: {result.error}")
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be at least 1")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    chunks = _chunks(pdus, chunk_size)
+
+    if workers is None or workers == 1:
+        for start, chunk in chunks:
+            yield from _decode_chunk(start, chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: "deque[Future]" = deque()
+        for start, chunk in chunks:
+            pending.append(pool.submit(_decode_chunk, start, chunk))
+            if len(pending) >= workers * 2:
+                yield from _next_done(pending, ordered)
+
+        while pending:
+            yield from _next_done(pending, ordered)
+
+
+def _next_done(pending: "deque[Future]", ordered: bool) -> list[DecodeResult]:
+    """Wait for the next chunk (oldest, or first finished) and take it off pending."""
+    if ordered:
+        return pending.popleft().result()
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    future = done.pop()
+    pending.remove(future)
+    return future.result()
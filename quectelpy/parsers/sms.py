@@ -6,11 +6,31 @@ Parses responses from SMS-related AT commands like:
 - AT+CMGR (Read message)
 - AT+CPMS (Preferred message storage)
 - +CMTI URC (New message indication)
+- +CMT URC (Message delivered to the TE)
+- +CDS URC and stored status reports (SMS-STATUS-REPORT)
 """
 
 import re
-from ..types import SMSMessage, SMSStorage
-from .pdu import decode_sms_deliver
+from typing import Iterable, Iterator, Optional
+
+from ..types import ConcatInfo, SMSMessage, SMSStorage, StatusReport
+from .pdu import decode_sms_deliver, decode_status_report
+from .urc import SMSDeliverEvent, StatusReportEvent
+
+
+# PDU mode <stat> values
+_PDU_STATUS = {
+    0: "REC UNREAD",
+    1: "REC READ",
+    2: "STO UNSENT",
+    3: "STO SENT"
+}
+
+
+def _concat_info(decoded: dict) -> Optional[ConcatInfo]:
+    """Build the ConcatInfo of a decoded PDU, if it is part of a long message."""
+    concat = decoded.get("concat")
+    return ConcatInfo(*concat) if concat else None
 
 
 class SMSParser:
@@ -133,7 +153,8 @@ class SMSParser:
             content=decoded["text"],
             encoding=decoded["encoding"],
             storage=None,
-            pdu=pdu
+            pdu=pdu,
+            concat=_concat_info(decoded)
         )
 
     @staticmethod
@@ -153,57 +174,58 @@ class SMSParser:
         Returns:
             List of SMSMessage objects
         """
-        messages = []
-        i = 0
+        return list(SMSParser.iter_cmgl_text(response))
 
-        while i < len(response):
-            line = response[i]
+    @staticmethod
+    def iter_cmgl_text(lines: Iterable[str]) -> Iterator[SMSMessage]:
+        """
+        Parse AT+CMGL text mode lines incrementally.
 
-            # Check if this is a message header
-            if line.startswith("+CMGL:"):
-                # Parse header
-                # +CMGL: <index>,"status","sender","alpha","timestamp" OR
-                # +CMGL: <index>,"status","sender",,"timestamp" (empty alpha)
-                match = re.match(
-                    r'\+CMGL:\s*(\d+),"([^"]+)","([^"]+)",(?:"[^"]*",|,)"([^"]+)"',
-                    line
-                )
-
-                if not match:
-                    i += 1
-                    continue
-
-                index = int(match.group(1))
-                status = match.group(2)
-                sender = match.group(3)
-                timestamp = match.group(4)
-
-                # Content is on next line(s) until next header or end
-                i += 1
-                content_lines = []
-
-                while i < len(response):
-                    if response[i].startswith("+CMGL:"):
-                        break
-                    content_lines.append(response[i])
-                    i += 1
-
-                content = "\n".join(content_lines).strip()
-
-                messages.append(SMSMessage(
-                    index=index,
-                    status=status,
-                    sender=sender,
-                    timestamp=timestamp,
-                    content=content,
-                    encoding="text",
-                    storage=None,
-                    pdu=None
-                ))
-            else:
-                i += 1
-
-        return messages
+        A message is yielded as soon as the next header (or the end of the
+        lines) shows its content is complete.
+
+        Args:
+            lines: Response lines, e.g. from ModemCore.stream_at()
+
+        Yields:
+            SMSMessage objects in listing order
+        """
+        header = None
+        content_lines: list[str] = []
+
+        for line in lines:
+            if not line.startswith("+CMGL:"):
+                if header is not None:
+                    content_lines.append(line)
+                continue
+
+            if header is not None:
+                yield SMSParser._cmgl_text_message(header, content_lines)
+
+            # +CMGL: <index>,"status","sender","alpha","timestamp" OR
+            # +CMGL: <index>,"status","sender",,"timestamp" (empty alpha)
+            header = re.match(
+                r'\+CMGL:\s*(\d+),"([^"]+)","([^"]+)",(?:"[^"]*",|,)"([^"]+)"',
+                line
+            )
+            content_lines = []
+
+        if header is not None:
+            yield SMSParser._cmgl_text_message(header, content_lines)
+
+    @staticmethod
+    def _cmgl_text_message(header: re.Match, content_lines: list[str]) -> SMSMessage:
+        """Build a message from a parsed text mode +CMGL header and its content."""
+        return SMSMessage(
+            index=int(header.group(1)),
+            status=header.group(2),
+            sender=header.group(3),
+            timestamp=header.group(4),
+            content="\n".join(content_lines).strip(),
+            encoding="text",
+            storage=None,
+            pdu=None
+        )
 
     @staticmethod
     def parse_cmgl_pdu(response: list[str]) -> list[SMSMessage]:
@@ -222,65 +244,55 @@ class SMSParser:
         Returns:
             List of SMSMessage objects
         """
-        messages = []
-        i = 0
+        return list(SMSParser.iter_cmgl_pdu(response))
+
+    @staticmethod
+    def iter_cmgl_pdu(lines: Iterable[str]) -> Iterator[SMSMessage]:
+        """
+        Parse AT+CMGL PDU mode lines incrementally.
 
-        while i < len(response):
-            line = response[i]
+        Each message is decoded as soon as its PDU line arrives. Malformed
+        PDUs are skipped.
 
-            # Check if this is a message header
+        Args:
+            lines: Response lines, e.g. from ModemCore.stream_at()
+
+        Yields:
+            SMSMessage objects in listing order
+        """
+        header = None
+
+        for line in lines:
             if line.startswith("+CMGL:"):
-                # Parse header
-                # +CMGL: <index>,<stat>,,<length>
-                match = re.match(r'\+CMGL:\s*(\d+),(\d+),,(\d+)', line)
-
-                if not match:
-                    i += 1
-                    continue
-
-                index = int(match.group(1))
-                stat = int(match.group(2))
-                length = int(match.group(3))
-
-                # PDU data is on next line
-                i += 1
-                if i >= len(response):
-                    break
-
-                pdu = response[i].strip()
-
-                # Decode PDU
-                try:
-                    decoded = decode_sms_deliver(pdu)
-
-                    # Map status code to text
-                    status_map = {
-                        0: "REC UNREAD",
-                        1: "REC READ",
-                        2: "STO UNSENT",
-                        3: "STO SENT"
-                    }
-                    status = status_map.get(stat, f"UNKNOWN ({stat})")
-
-                    messages.append(SMSMessage(
-                        index=index,
-                        status=status,
-                        sender=decoded["sender"],
-                        timestamp=decoded["timestamp"],
-                        content=decoded["text"],
-                        encoding=decoded["encoding"],
-                        storage=None,
-                        pdu=pdu
-                    ))
-                except Exception:
-                    # Skip malformed PDU
-                    pass
-
-                i += 1
-            else:
-                i += 1
-
-        return messages
+                # +CMGL: <index>,<stat>,,<length>; PDU data is on next line
+                header = re.match(r'\+CMGL:\s*(\d+),(\d+),,(\d+)', line)
+                continue
+            if header is None:
+                continue
+
+            index = int(header.group(1))
+            stat = int(header.group(2))
+            header = None
+            pdu = line.strip()
+
+            # Decode PDU
+            try:
+                decoded = decode_sms_deliver(pdu)
+            except Exception:
+                # Skip malformed PDU
+                continue
+
+            yield SMSMessage(
+                index=index,
+                status=_PDU_STATUS.get(stat, f"UNKNOWN ({stat})"),
+                sender=decoded["sender"],
+                timestamp=decoded["timestamp"],
+                content=decoded["text"],
+                encoding=decoded["encoding"],
+                storage=None,
+                pdu=pdu,
+                concat=_concat_info(decoded)
+            )
 
     @staticmethod
     def parse_cpms(response: list[str]) -> tuple[SMSStorage, SMSStorage, SMSStorage]:
@@ -369,6 +381,124 @@ class SMSParser:
 
         return storage, index
 
+    @staticmethod
+    def parse_cmt(urc: str) -> SMSMessage:
+        """
+        Parse +CMT URC (message routed directly to the TE).
+
+        Expected formats (header and body joined by "\\n"):
+            +CMT: ,24\\n0791447758100650040B91...           (PDU mode)
+            +CMT: "+1234567890",,"23/01/15,10:30:45+00"\\nHello  (text mode)
+
+        The message is not stored on the modem, so index is -1.
+
+        Args:
+            urc: Assembled two-line URC
+
+        Returns:
+            SMSMessage object
+
+        Raises:
+            ValueError: If URC format is invalid
+        """
+        if not urc.startswith("+CMT:"):
+            raise ValueError(f"Not a +CMT URC: {urc}")
+
+        event = SMSDeliverEvent(urc)
+        if not event.body:
+            raise ValueError(f"+CMT URC without message line: {urc}")
+
+        if not event.is_pdu:
+            fields = event.fields
+            if len(fields) < 3:
+                raise ValueError(f"Could not parse +CMT header: {event.header}")
+            return SMSMessage(
+                index=-1,
+                status="REC UNREAD",
+                sender=fields[0],
+                timestamp=fields[2],
+                content=event.text,
+                encoding=None,
+                storage=None,
+                pdu=None
+            )
+
+        try:
+            decoded = decode_sms_deliver(event.pdu)
+        except Exception as e:
+            raise ValueError(f"Failed to decode PDU: {e}") from e
+
+        return SMSMessage(
+            index=-1,
+            status="REC UNREAD",
+            sender=decoded["sender"],
+            timestamp=decoded["timestamp"],
+            content=decoded["text"],
+            encoding=decoded["encoding"],
+            storage=None,
+            pdu=event.pdu,
+            concat=_concat_info(decoded)
+        )
+
+    @staticmethod
+    def parse_cds(urc: str) -> StatusReport:
+        """
+        Parse +CDS URC (status report routed directly to the TE).
+
+        Expected formats:
+            +CDS: 26\n0006D60B911326880736F4...                       (PDU mode)
+            +CDS: 6,214,"+31628870634",145,"23/01/15,10:30:45+00","23/01/15,10:30:50+00",0
+                                                                    (text mode)
+
+        Args:
+            urc: Assembled URC
+
+        Returns:
+            StatusReport object
+
+        Raises:
+            ValueError: If URC format is invalid
+        """
+        if not urc.startswith("+CDS:"):
+            raise ValueError(f"Not a +CDS URC: {urc}")
+
+        event = StatusReportEvent(urc)
+        if event.is_pdu:
+            if not event.pdu:
+                raise ValueError(f"+CDS URC without PDU line: {urc}")
+            return SMSParser.parse_status_report_pdu(event.pdu)
+
+        # <fo>,<mr>,[<ra>],[<tora>],<scts>,<dt>,<st>
+        fields = event.fields
+        if len(fields) < 7:
+            raise ValueError(f"Could not parse +CDS: {urc}")
+        return StatusReport(
+            reference=int(fields[1]),
+            recipient=fields[2],
+            timestamp=fields[4],
+            discharge_time=fields[5],
+            status=int(fields[6])
+        )
+
+    @staticmethod
+    def parse_status_report_pdu(pdu: str) -> StatusReport:
+        """
+        Decode an SMS-STATUS-REPORT PDU.
+
+        Args:
+            pdu: Hex PDU including the SMSC address
+
+        Returns:
+            StatusReport object
+
+        Raises:
+            ValueError: If the PDU cannot be decoded
+        """
+        try:
+            return StatusReport(**decode_status_report(pdu))
+        except Exception as e:
+            raise ValueError(f"Failed to decode status report PDU: {e}") from e
+
     @staticmethod
     def parse_cmgs(response: list[str]) -> int:
         """
@@ -0,0 +1,386 @@
+"""
+Typed URC events and the decoder registry that produces them.
+
+Decoding a URC only picks the event class; fields are parsed the first
+time they are read and cached on the event, so URCs nobody inspects cost
+no parsing at all.
+"""
+
+import csv
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Dict, Optional
+
+from ..types import RegistrationState
+
+
+def split_urc_fields(payload: str) -> list[str]:
+    """
+    Split a URC payload into comma-separated fields.
+
+    Quotes are removed and commas inside quotes are kept.
+
+    Args:
+        payload: Text after the "+XXX:" prefix
+
+    Returns:
+        List of fields (empty for an empty payload)
+    """
+    payload = payload.strip()
+    if not payload:
+        return []
+    if '"' not in payload:
+        return [field.strip() for field in payload.split(",")]
+    return [field.strip() for field in next(csv.reader([payload], skipinitialspace=True))]
+
+
+@dataclass
+class URCEvent:
+    """
+    Unsolicited result code with lazily parsed fields.
+
+    Used as is for URCs without a registered decoder; subclasses add typed
+    fields for the URCs they understand.
+
+    Attributes:
+        line: Raw URC (lines of a multi-line URC joined by "\\n")
+    """
+    line: str
+
+    @cached_property
+    def header(self) -> str:
+        """First line of the URC."""
+        return self.line.partition("\n")[0]
+
+    @cached_property
+    def body(self) -> list[str]:
+        """Continuation lines of a multi-line URC (empty for single-line URCs)."""
+        return self.line.split("\n")[1:]
+
+    @cached_property
+    def name(self) -> str:
+        """URC name, e.g. "+CMTI"."""
+        return self.header.partition(":")[0].strip()
+
+    @cached_property
+    def fields(self) -> list[str]:
+        """Comma-separated header fields with quotes removed."""
+        return split_urc_fields(self.header.partition(":")[2])
+
+
+@dataclass
+class NewMessageEvent(URCEvent):
+    """
+    New SMS stored on the modem (+CMTI: "SM",3).
+
+    Attributes:
+        storage: Message storage ("SM", "ME", ...)
+        index: Storage index; read it with modem.sms.read_sms(index)
+    """
+
+    @cached_property
+    def storage(self) -> str:
+        return self.fields[0]
+
+    @cached_property
+    def index(self) -> int:
+        return int(self.fields[1])
+
+
+@dataclass
+class RegistrationEvent(URCEvent):
+    """
+    Registration change (+CREG, +CGREG or +CEREG: <stat>[,<lac>,<ci>[,<act>]]).
+
+    Attributes:
+        stat: Registration status (see RegistrationState)
+        lac: Location/tracking area code (hex string, if reported)
+        ci: Cell ID (hex string, if reported)
+        act: Access technology (if reported)
+    """
+
+    @cached_property
+    def stat(self) -> int:
+        return int(self.fields[0])
+
+    @cached_property
+    def lac(self) -> Optional[str]:
+        return self.fields[1] if len(self.fields) > 1 else None
+
+    @cached_property
+    def ci(self) -> Optional[str]:
+        return self.fields[2] if len(self.fields) > 2 else None
+
+    @cached_property
+    def act(self) -> Optional[int]:
+        return int(self.fields[3]) if len(self.fields) > 3 else None
+
+    @property
+    def state(self) -> RegistrationState:
+        """Registration status as an enum."""
+        return RegistrationState(self.stat)
+
+    @property
+    def is_registered(self) -> bool:
+        """Check if registered to network (home or roaming)."""
+        return self.stat in (
+            RegistrationState.REGISTERED_HOME,
+            RegistrationState.REGISTERED_ROAMING
+        )
+
+
+@dataclass
+class IndicationEvent(URCEvent):
+    """
+    Quectel indication (+QIND: "<kind>",...).
+
+    Attributes:
+        kind: Indication type, e.g. "csq", "FOTA", "SMS DONE"
+        values: Remaining fields
+    """
+
+    @cached_property
+    def kind(self) -> str:
+        return self.fields[0]
+
+    @cached_property
+    def values(self) -> list[str]:
+        return self.fields[1:]
+
+
+@dataclass
+class SignalIndEvent(IndicationEvent):
+    """
+    Signal quality report (+QIND: "csq",<rssi>,<ber>), enabled with
+    AT+QINDCFG="csq",1.
+
+    Attributes:
+        rssi: Signal strength (0-31, 99=unknown)
+        ber: Bit error rate (0-7, 99=unknown)
+    """
+
+    @cached_property
+    def rssi(self) -> int:
+        return int(self.fields[1])
+
+    @cached_property
+    def ber(self) -> int:
+        return int(self.fields[2])
+
+
+@dataclass
+class SocketEvent(URCEvent):
+    """
+    TCP/IP socket notification (+QIURC: "<kind>",...).
+
+    Attributes:
+        kind: "recv", "closed", "incoming", "incoming full" or "pdpdeact"
+        connect_id: Socket the event is about (None for "pdpdeact")
+        context_id: PDP context for "pdpdeact", else None
+        length: Bytes received, for "recv" in direct push mode (else None)
+    """
+
+    @cached_property
+    def kind(self) -> str:
+        return self.fields[0]
+
+    @cached_property
+    def connect_id(self) -> Optional[int]:
+        if self.kind in ("pdpdeact", "incoming full") or len(self.fields) < 2:
+            return None
+        return int(self.fields[1])
+
+    @cached_property
+    def context_id(self) -> Optional[int]:
+        return int(self.fields[1]) if self.kind == "pdpdeact" else None
+
+    @cached_property
+    def length(self) -> Optional[int]:
+        if self.kind == "recv" and len(self.fields) > 2:
+            return int(self.fields[2])
+        return None
+
+
+@dataclass
+class _MessageURCEvent(URCEvent):
+    """Two-line message URC: header, then a PDU (PDU mode) or text (text mode)."""
+
+    @cached_property
+    def is_pdu(self) -> bool:
+        """True if the header is the PDU mode form ending in <length>."""
+        return bool(self.fields) and self.fields[-1].isdigit() and len(self.fields) <= 2
+
+    @cached_property
+    def length(self) -> Optional[int]:
+        return int(self.fields[-1]) if self.is_pdu else None
+
+    @cached_property
+    def pdu(self) -> Optional[str]:
+        return self.body[0] if self.is_pdu and self.body else None
+
+    @cached_property
+    def text(self) -> Optional[str]:
+        return "\n".join(self.body) if not self.is_pdu else None
+
+
+@dataclass
+class SMSDeliverEvent(_MessageURCEvent):
+    """
+    SMS routed directly to the TE (+CMT, with AT+CNMI=2,2).
+
+    PDU mode: +CMT: [<alpha>],<length> followed by the SMS-DELIVER PDU.
+    Text mode: +CMT: <oa>,[<alpha>],<scts>[,...] followed by the text.
+
+    Attributes:
+        is_pdu: Whether the message is in PDU form
+        length: TPDU length in octets (PDU mode)
+        pdu: Hex PDU including the SMSC address (PDU mode)
+        text: Message text (text mode)
+    """
+
+
+@dataclass
+class StatusReportEvent(_MessageURCEvent):
+    """
+    SMS status report routed to the TE (+CDS).
+
+    PDU mode: +CDS: <length> followed by the SMS-STATUS-REPORT PDU.
+    Text mode: a single line of fields (see fields).
+
+    Attributes:
+        is_pdu: Whether the report is in PDU form
+        length: TPDU length in octets (PDU mode)
+        pdu: Hex PDU (PDU mode)
+    """
+
+    @cached_property
+    def is_pdu(self) -> bool:
+        return len(self.fields) == 1 and self.fields[0].isdigit()
+
+
+@dataclass
+class CellBroadcastEvent(_MessageURCEvent):
+    """
+    Cell broadcast message (+CBM).
+
+    Attributes:
+        is_pdu: Whether the message is in PDU form
+        length: PDU length in octets (PDU mode)
+        pdu: Hex CBS PDU (PDU mode)
+        text: Message text (text mode)
+    """
+
+    @cached_property
+    def is_pdu(self) -> bool:
+        return len(self.fields) == 1 and self.fields[0].isdigit()
+
+
+# Decoders take the raw line and return an event without parsing fields
+URCDecoder = Callable[[str], URCEvent]
+
+
+def _decode_qind(line: str) -> IndicationEvent:
+    """Pick the +QIND event class from the indication type."""
+    if '"csq"' in line[:14]:
+        return SignalIndEvent(line)
+    return IndicationEvent(line)
+
+
+class URCDecoderRegistry:
+    """
+    Maps URC names to decoders.
+
+    decode() looks the name up and returns the decoder's event, or a plain
+    URCEvent for URCs without a decoder. Applications can add decoders for
+    URCs the library does not know.
+
+    Example:
+
+    .. code-block:: python
+
+        @dataclass
+        class RingEvent(URCEvent):
+            @cached_property
+            def number(self) -> str:
+                return self.fields[0]
+
+        registry.register("+CLIP", RingEvent)
+    """
+
+    def __init__(self, decoders: Optional[Dict[str, URCDecoder]] = None) -> None:
+        """
+        Initialize decoder registry.
+
+        Args:
+            decoders: Initial URC name -> decoder mapping
+        """
+        self._decoders: Dict[str, URCDecoder] = dict(decoders or {})
+
+    def register(self, name: str, decoder: URCDecoder) -> None:
+        """
+        Register (or replace) the decoder for a URC name.
+
+        Args:
+            name: URC name including "+", e.g. "+CMTI"
+            decoder: Event class or function taking the raw line
+        """
+        self._decoders[name] = decoder
+
+    def unregister(self, name: str) -> bool:
+        """
+        Remove the decoder for a URC name.
+
+        Returns:
+            True if removed, False if none was registered
+        """
+        return self._decoders.pop(name, None) is not None
+
+    def decode(self, line: str) -> URCEvent:
+        """
+        Wrap a URC line in its event type. Fields are parsed on first access.
+
+        Args:
+            line: Raw URC line
+
+        Returns:
+            Event for the line
+        """
+        decoder = self._decoders.get(line.partition(":")[0])
+        if decoder is None:
+            return URCEvent(line)
+        return decoder(line)
+
+    def copy(self) -> "URCDecoderRegistry":
+        """Return an independent copy of this registry."""
+        return URCDecoderRegistry(self._decoders)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._decoders
+
+
+# Registry used by default for typed URC callbacks
+default_registry = URCDecoderRegistry({
+    "+CMTI": NewMessageEvent,
+    "+CREG": RegistrationEvent,
+    "+CGREG": RegistrationEvent,
+    "+CEREG": RegistrationEvent,
+    "+QIND": _decode_qind,
+    "+QIURC": SocketEvent,
+    "+CMT": SMSDeliverEvent,
+    "+CDS": StatusReportEvent,
+    "+CBM": CellBroadcastEvent,
+})
+
+
+def decode_urc(line: str) -> URCEvent:
+    """
+    Decode a URC line with the default registry.
+
+    Example:
+
+    .. code-block:: python
+
+        event = decode_urc('+CMTI: "SM",3')
+        print(event.storage, event.index)  # SM 3
+    """
+    return default_registry.decode(line)
@@ -149,6 +149,25 @@ class RegistrationStatus:
         return RegistrationState(self.stat)
 
 
+@dataclass
+class NetworkStatus:
+    """
+    Network status snapshot from one chained query.
+
+    Attributes:
+        signal: Signal quality (AT+CSQ)
+        registration: Network registration (AT+CREG?)
+        gprs_registration: GPRS registration (AT+CGREG?)
+        operator: Current operator (AT+COPS?), None if not registered
+        network_info: Serving network information (AT+QNWINFO)
+    """
+    signal: SignalQuality
+    registration: RegistrationStatus
+    gprs_registration: RegistrationStatus
+    operator: Optional[CurrentOperator]
+    network_info: NetworkInfo
+
+
 @dataclass
 class PDPContext:
     """PDP context configuration."""
@@ -177,6 +196,14 @@ class SMSEncoding(Enum):
     AUTO = "auto"       # Auto-detect best encoding
 
 
+@dataclass(frozen=True)
+class ConcatInfo:
+    """Concatenation element of one part of a long SMS (UDH IEI 0x00/0x08)."""
+    reference: int  # Message reference shared by all parts
+    total: int      # Number of parts
+    sequence: int   # This part's number (1-based)
+
+
 @dataclass
 class SMSMessage:
     """
@@ -192,6 +219,8 @@ class SMSMessage:
     encoding: Optional[str] = None  # Encoding used (gsm7, ucs2, etc.)
     storage: Optional[str] = None   # Storage location (ME, SM, etc.)
     pdu: Optional[str] = None       # Raw PDU data (if available)
+    concat: Optional[ConcatInfo] = None   # Set on one part of a long message
+    indices: Optional[list[int]] = None   # Storage indices of all parts (reassembled messages)
 
 
 @dataclass
@@ -202,3 +231,75 @@ class SMSStorage:
     total: int                      # Total storage capacity
 
 
+class OutboxState(Enum):
+    """State of a message in an SMSOutbox."""
+    QUEUED = "queued"      # Waiting to be sent (or to be retried)
+    SENDING = "sending"    # Handed to the modem
+    SENT = "sent"          # Accepted by the network (+CMGS)
+    FAILED = "failed"      # Permanent error or attempts exhausted
+
+
+@dataclass
+class OutboxEntry:
+    """Message queued in an SMSOutbox and the result of sending it."""
+    id: int                                 # Outbox row ID
+    number: str                             # Recipient
+    text: str                               # Message text
+    state: OutboxState                      # Current state
+    attempts: int = 0                       # Send attempts so far
+    references: Optional[list[int]] = None  # +CMGS reference of each part (once sent)
+    error: Optional[str] = None             # Last error
+    error_code: Optional[int] = None        # +CMS ERROR code of the last error
+    created: float = 0.0                    # Enqueue time (epoch seconds)
+    sent_at: Optional[float] = None         # Send time (epoch seconds)
+
+
+class DeliveryState(Enum):
+    """Delivery state of a sent SMS, from its status reports."""
+    PENDING = "pending"      # No final status report yet
+    DELIVERED = "delivered"  # Received by the recipient
+    FAILED = "failed"        # The service centre gave up
+    EXPIRED = "expired"      # No final report before the tracker forgot it
+
+
+@dataclass
+class StatusReport:
+    """
+    SMS status report (SMS-STATUS-REPORT, +CDS).
+
+    status is TP-ST (3GPP TS 23.040 section 9.2.3.15): 0x00-0x1F the
+    message was delivered, 0x20-0x3F the service centre is still trying,
+    anything higher it gave up.
+    """
+    reference: int          # Message reference returned by send_sms()
+    recipient: str          # Recipient phone number
+    timestamp: str          # Service centre timestamp of the sent message
+    discharge_time: str     # Time of delivery or of the last attempt
+    status: int             # TP-ST status code
+
+    @property
+    def state(self) -> DeliveryState:
+        """Delivery state this report stands for."""
+        if self.status < 0x20:
+            return DeliveryState.DELIVERED
+        if self.status < 0x40:
+            return DeliveryState.PENDING
+        return DeliveryState.FAILED
+
+
+@dataclass
+class TrackedDelivery:
+    """Sent SMS awaiting, or matched with, its status report."""
+    reference: int                          # Message reference from +CMGS
+    recipient: str                          # Recipient phone number
+    sent_at: float                          # Tracking start (epoch seconds)
+    state: DeliveryState = DeliveryState.PENDING
+    status: Optional[int] = None            # TP-ST of the latest report
+    updated_at: Optional[float] = None      # Time of the latest report
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Seconds from sending to the final report (None while pending)."""
+        if self.state in (DeliveryState.DELIVERED, DeliveryState.FAILED) and self.updated_at is not None:
+            return self.updated_at - self.sent_at
+        return None
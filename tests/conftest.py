@@ -4,11 +4,17 @@ Pytest configuration and fixtures.
 Provides shared test fixtures for QuectelPy tests.
 """
 
+import os
+import re
+import select
+import threading
+
 import pytest
 import logging
 
 from quectelpy.core import MockTransport, ModemCore
 from quectelpy import QuectelModem
+from quectelpy.parsers.pdu import encode_sms_submit_parts
 
 
 # Enable logging for tests
@@ -18,6 +24,80 @@ logging.basicConfig(
 )
 
 
+class PtyModem:
+    """
+    Scripted modem on a pseudo-terminal.
+
+    For code that needs a real file descriptor (asyncio, selectors). A
+    background thread answers each command line written to the pty from
+    a table of canned responses; unknown commands get ERROR.
+
+    Data ended with Ctrl+Z (prompt commands) is looked up as "<data>^Z".
+    A response given as bytes is written as-is (e.g. b"\r\n> ").
+    """
+
+    def __init__(self, responses: dict[str, list[str]] | None = None):
+        self.master, self.slave = os.openpty()
+        self.port = os.ttyname(self.slave)
+        self.responses = dict(responses or {})
+        self.received: list[str] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        buffer = b""
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self.master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                buffer += os.read(self.master, 4096)
+            except OSError:
+                return
+            while True:
+                match = re.search(b"[\r\x1a]", buffer)
+                if not match:
+                    break
+                raw, buffer = buffer[:match.start()], buffer[match.end():]
+                cmd = raw.decode(errors="ignore").strip()
+                if match.group() == b"\x1a":
+                    cmd += "^Z"
+                if not cmd:
+                    continue
+                self.received.append(cmd)
+                response = self.responses.get(cmd, ["ERROR"])
+                if isinstance(response, bytes):
+                    os.write(self.master, response)
+                else:
+                    self.send_lines(response)
+
+    def send_lines(self, lines: list[str]):
+        """Write lines to the host as the modem would."""
+        os.write(self.master, ("\r\n" + "\r\n".join(lines) + "\r\n").encode())
+
+    def close(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        os.close(self.master)
+        os.close(self.slave)
+
+
+@pytest.fixture
+def pty_modem():
+    """
+    Create a PtyModem with no canned responses.
+
+    Example:
+        def test_something(pty_modem):
+            pty_modem.responses["AT+CSQ"] = ["+CSQ: 24,99", "OK"]
+            transport = SerialTransport(pty_modem.port)
+    """
+    fake = PtyModem()
+    yield fake
+    fake.close()
+
+
 @pytest.fixture
 def mock_transport():
     """
@@ -67,6 +147,35 @@ def modem(mock_transport):
     modem_instance.close()
 
 
+@pytest.fixture
+def deliver_pdus():
+    """
+    Build the SMS-DELIVER PDUs a phone would receive for a message.
+
+    Returns a function (sender, text, **kwargs) -> list of hex PDUs, one per
+    part, that reuses encode_sms_submit_parts (kwargs are passed on) and
+    rewrites each SMS-SUBMIT into an SMS-DELIVER.
+
+    Example:
+        def test_long_sms(deliver_pdus):
+            part1, part2 = deliver_pdus("+1234567890", "Hello" * 40)
+    """
+    def build(sender, text, **kwargs):
+        pdus = []
+        for submit_hex in encode_sms_submit_parts(sender, text, **kwargs):
+            submit = bytes.fromhex(submit_hex)
+            address_end = 5 + (submit[3] + 1) // 2
+            first_octet = 0x04 | (submit[1] & 0x40)  # SMS-DELIVER, keep UDHI
+            scts = bytes.fromhex("32105101035400")
+            deliver = (
+                bytes([0x00, first_octet]) + submit[3:address_end + 2] + scts + submit[address_end + 2:]
+            )
+            pdus.append(deliver.hex().upper())
+        return pdus
+
+    return build
+
+
 @pytest.fixture
 def mock_model_info_response():
     """Mock response for ATI command."""
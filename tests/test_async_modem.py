@@ -0,0 +1,266 @@
+"""
+Tests for the asyncio modem API.
+"""
+
+import asyncio
+
+import pytest
+from quectelpy import AsyncQuectelModem
+from quectelpy.core import SerialTransport
+from quectelpy.features import AsyncSMSManager
+from quectelpy.exceptions import EC25Error, ModemNotStartedError, SIMError
+from quectelpy.types import MessageFormat, SMSStatus
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    return asyncio.run(asyncio.wait_for(coro, timeout=5.0))
+
+
+def test_send_raw_at(pty_modem):
+    """Test awaiting a raw AT command."""
+    pty_modem.responses["AT+CSQ"] = ["+CSQ: 24,99", "OK"]
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return await modem.send_raw_at("AT+CSQ", strip_ok=True)
+
+    assert run(main()) == ["+CSQ: 24,99"]
+
+
+def test_async_managers(pty_modem):
+    """Test awaitable device, network and SMS managers."""
+    pty_modem.responses.update({
+        "AT+GSN": ["861536030196001", "OK"],
+        "AT+CPIN?": ["+CPIN: SIM PIN", "OK"],
+        "AT+CREG?": ['+CREG: 2,1,"1A2B","00012345",7', "OK"],
+        "AT+CMGF?": ["+CMGF: 1", "OK"],
+        'AT+CMGL="ALL"': [
+            '+CMGL: 1,"REC READ","+1234567890",,"23/01/15,10:30:45+00"',
+            "Message 1",
+            "OK",
+        ],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            imei = await modem.device.get_imei()
+            with pytest.raises(SIMError):
+                await modem.device.get_sim_state()
+            reg = await modem.network.get_registration_status()
+            fmt = await modem.sms.get_message_format()
+            messages = await modem.sms.list_messages(SMSStatus.ALL)
+            return imei, reg, fmt, messages
+
+    imei, reg, fmt, messages = run(main())
+
+    assert imei == "861536030196001"
+    assert reg.is_registered is True
+    assert fmt == MessageFormat.TEXT_MODE
+    assert messages[0].content == "Message 1"
+
+
+def test_error_response_raises(pty_modem):
+    """Test that ERROR raises without waiting for the timeout."""
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            with pytest.raises(EC25Error):
+                await modem.send_raw_at("AT+UNKNOWN", timeout=2.0)
+
+    run(main())
+
+
+def test_urc_async_iterator(pty_modem):
+    """Test iterating over URCs matching a prefix."""
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            received = []
+
+            async def consume():
+                async for urc in modem.urcs("+CMTI"):
+                    received.append(urc)
+                    if len(received) == 2:
+                        return
+
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            pty_modem.send_lines(['+CMTI: "ME",1', '+CREG: 1', '+CMTI: "ME",2'])
+            await task
+            return received
+
+    assert run(main()) == ['+CMTI: "ME",1', '+CMTI: "ME",2']
+
+
+def test_send_before_start_raises(pty_modem):
+    """Test that commands require start()."""
+    async def main():
+        modem = AsyncQuectelModem(transport=SerialTransport(pty_modem.port))
+        with pytest.raises(ModemNotStartedError):
+            await modem.send_raw_at("AT")
+        await modem.close()
+
+    run(main())
+
+
+def test_sync_only_features_raise(pty_modem):
+    """Test thread-driven SMS features are not leaked into the async API."""
+    pty_modem.responses["AT+CSMS?"] = ["+CSMS: 1,1,1,1", "OK"]
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            for method in ("start_direct_delivery", "track_deliveries", "inbox", "outbox"):
+                with pytest.raises(NotImplementedError, match=method):
+                    getattr(modem.sms, method)()
+            return await modem.sms.get_sms_service()
+
+    assert run(main()) == 1
+
+
+def test_send_sms(pty_modem):
+    """Test awaiting an SMS submission through the prompt command."""
+    cmd, pdu = AsyncSMSManager._build_cmgs_parts("+1234567890", "Hello", "auto", False)[0]
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 0", "OK"],
+        cmd: b"\r\n> ",
+        pdu + "^Z": ["+CMGS: 7", "OK"],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return await modem.sms.send_sms("+1234567890", "Hello")
+
+    assert run(main()) == 7
+
+
+def test_send_sms_echo_on(pty_modem):
+    """Test a prompt read in the same chunk as the command echo."""
+    cmd, pdu = AsyncSMSManager._build_cmgs_parts("+1234567890", "Hello", "auto", False)[0]
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 0", "OK"],
+        cmd: f"{cmd}\r\r\n> ".encode(),
+        pdu + "^Z": ["+CMGS: 8", "OK"],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return await modem.sms.send_sms("+1234567890", "Hello")
+
+    assert run(main()) == 8
+
+
+def test_send_long_sms_exclusive(pty_modem):
+    """Test other tasks' commands wait until every part is sent."""
+    parts = AsyncSMSManager._build_cmgs_parts("+1234567890", "x" * 200, "auto", True, reference=1)
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 0", "OK"],
+        "AT+CMMS=1": ["OK"],
+        "AT+CSQ": ["+CSQ: 24,99", "OK"],
+    })
+    for ref, (cmd, pdu) in enumerate(parts, start=10):
+        pty_modem.responses[cmd] = b"\r\n> "
+        pty_modem.responses[pdu + "^Z"] = [f"+CMGS: {ref}", "OK"]
+    tracked = []
+
+    class Tracker:
+        active = True
+
+        def track(self, refs, number):
+            tracked.append((refs, number))
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            await modem.sms.set_message_format(MessageFormat.PDU_MODE)
+            modem.sms._concat_ref = 0
+            modem.sms._tracker = Tracker()
+            send = asyncio.create_task(
+                modem.sms.send_sms("+1234567890", "x" * 200, request_status=True)
+            )
+            await asyncio.sleep(0)
+            await modem.send_raw_at("AT+CSQ")
+            return await send
+
+    assert run(main()) == [10, 11]
+    assert pty_modem.received[-1] == "AT+CSQ"
+    assert tracked == [([10, 11], "+1234567890")]
+
+
+def test_iter_messages(pty_modem):
+    """Test async streamed listing of text mode messages."""
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 1", "OK"],
+        'AT+CMGL="REC UNREAD"': [
+            '+CMGL: 1,"REC UNREAD","+1234567890",,"23/01/15,10:30:45+00"',
+            "Message 1",
+            '+CMGL: 4,"REC UNREAD","+0987654321",,"23/01/15,11:45:30+00"',
+            "Message 2",
+            "OK",
+        ],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return [m async for m in modem.sms.iter_messages(SMSStatus.REC_UNREAD)]
+
+    messages = run(main())
+
+    assert [(m.index, m.content) for m in messages] == [(1, "Message 1"), (4, "Message 2")]
+
+
+def test_list_messages_pdu_mode_status(pty_modem):
+    """Test async PDU mode listing uses the status number."""
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 0", "OK"],
+        "AT+CMGL=4": ["OK"],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return await modem.sms.list_messages()
+
+    assert run(main()) == []
+    assert pty_modem.received == ["AT+CMGF?", "AT+CMGL=4"]
+
+
+def test_drain(pty_modem):
+    """Test async drain lists once and deletes in bulk."""
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 1", "OK"],
+        'AT+CMGL="ALL"': [
+            '+CMGL: 2,"REC UNREAD","+1234567890",,"23/01/15,10:30:45+00"',
+            "Message 1",
+            "OK",
+        ],
+        "AT+CMGD=1,3": ["OK"],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return await modem.sms.drain()
+
+    messages = run(main())
+
+    assert [m.index for m in messages] == [2]
+    assert pty_modem.received[-1] == "AT+CMGD=1,3"
+
+
+def test_drain_keeps_unparsed_entries(pty_modem):
+    """Test async drain deletes by index when a listed entry was not returned."""
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 1", "OK"],
+        'AT+CMGL="ALL"': [
+            '+CMGL: 2,"REC UNREAD","+1234567890",,"23/01/15,10:30:45+00"',
+            "Message 1",
+            "+CMGL: 3,garbled",
+            "OK",
+        ],
+        "AT+CMGD=2": ["OK"],
+    })
+
+    async def main():
+        async with AsyncQuectelModem(transport=SerialTransport(pty_modem.port)) as modem:
+            return await modem.sms.drain()
+
+    messages = run(main())
+
+    assert [m.index for m in messages] == [2]
+    assert pty_modem.received[-1] == "AT+CMGD=2"
@@ -0,0 +1,436 @@
+"""
+Performance benchmarks.
+
+These run as part of the normal test suite against MockTransport, print
+their measurements, and assert only loose upper bounds so they stay stable
+on slow CI machines. Run with ``pytest -s tests/test_benchmarks.py`` to see
+the numbers.
+"""
+
+import os
+import statistics
+import threading
+import time
+
+from quectelpy.core import MockTransport, ModemCore, ModemPool, SerialTransport, URCHandler
+from quectelpy.parsers.pdu import (
+    GSM7_BASIC,
+    GSM7_EXTENDED,
+    PDUError,
+    calculate_sms_parts,
+    concat_udh,
+    decode_gsm7,
+    decode_sms_deliver,
+    decode_tpdu,
+    encode_gsm7,
+    encode_phone_number,
+    encode_sms_submit,
+    gsm7_septets,
+    parse_concat_udh,
+)
+
+
+class LoopbackTransport(MockTransport):
+    """MockTransport that answers every write with a canned response."""
+
+    def __init__(self, response: list[str]) -> None:
+        super().__init__()
+        self._canned = response
+
+    def write(self, data: bytes) -> int:
+        self.add_response(list(self._canned))
+        return super().write(data)
+
+
+class TestCommandLatency:
+    """Round-trip latency of short AT queries."""
+
+    def test_send_at_latency(self):
+        """Measure per-command latency for AT+CSQ against MockTransport."""
+        transport = LoopbackTransport(["+CSQ: 24,99", "OK"])
+        core = ModemCore(transport=transport)
+        core.start()
+
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(500):
+            core.send_at("AT+CSQ", strip_ok=True)
+            latencies.append(core.protocol.last_latency)
+        elapsed = time.perf_counter() - start
+
+        core.close()
+
+        mean_ms = statistics.mean(latencies) * 1000
+        p99_ms = sorted(latencies)[int(len(latencies) * 0.99)] * 1000
+        print(f"\nsend_at: {len(latencies)} cmds in {elapsed:.3f}s, "
+              f"mean {mean_ms:.3f} ms, p99 {p99_ms:.3f} ms")
+
+        # Sleep polling added up to 10 ms per command; an event wait does not
+        assert mean_ms < 5.0
+
+
+class TestLineFraming:
+    """Bulk line framing versus per-line pyserial reads."""
+
+    @staticmethod
+    def _cmgl_dump(count: int) -> bytes:
+        pdu = "0791447758100650040B911234567890F0000023011510304580" + "C8329BFD06" * 14
+        lines = []
+        for i in range(count):
+            lines.append(f"+CMGL: {i},1,,{len(pdu) // 2 - 8}")
+            lines.append(pdu)
+        lines.append("OK")
+        return ("\r\n" + "\r\n".join(lines) + "\r\n").encode()
+
+    def _time_reads(self, read_all) -> float:
+        master, slave = os.openpty()
+        try:
+            transport = SerialTransport(os.ttyname(slave), timeout=0.5)
+            dump = self._cmgl_dump(255)
+            writer = threading.Thread(target=os.write, args=(master, dump))
+
+            start = time.perf_counter()
+            writer.start()
+            count = read_all(transport)
+            elapsed = time.perf_counter() - start
+
+            writer.join()
+            transport.close()
+        finally:
+            os.close(master)
+            os.close(slave)
+
+        assert count == 511
+        return elapsed
+
+    def test_cmgl_dump_framing(self):
+        """Measure reading a 255-message AT+CMGL dump line by line vs in bulk."""
+        def per_line(transport):
+            count = 0
+            while True:
+                line = transport._serial.read_until(b"\r\n").strip()
+                if line:
+                    count += 1
+                if line == b"OK":
+                    return count
+
+        def bulk(transport):
+            count = 0
+            while True:
+                lines = transport.read_lines()
+                count += len(lines)
+                if lines and lines[-1] == "OK":
+                    return count
+
+        per_line_s = self._time_reads(per_line)
+        bulk_s = self._time_reads(bulk)
+        print(f"\nCMGL dump: read_until {per_line_s * 1000:.1f} ms, "
+              f"read_lines {bulk_s * 1000:.1f} ms")
+
+        assert bulk_s < per_line_s
+
+
+class TestModemPool:
+    """CPU time and wakeups of one selector thread driving N modems."""
+
+    def _run_pool(self, count: int, urcs_per_modem: int) -> tuple:
+        ptys = [os.openpty() for _ in range(count)]
+        received = threading.Semaphore(0)
+        threads_before = threading.active_count()
+
+        try:
+            pool = ModemPool()
+            for _, slave in ptys:
+                modem = pool.add(transport=SerialTransport(os.ttyname(slave)))
+                modem.register_urc_callback("+CSQN", lambda line: received.release())
+            threads = threading.active_count() - threads_before
+
+            # Idle: a selector does not poll, so nothing should wake it
+            idle_wakeups = pool.stats.wakeups
+            time.sleep(0.2)
+            idle_wakeups = pool.stats.wakeups - idle_wakeups
+
+            burst = ("\r\n+CSQN: 24,99\r\n" * urcs_per_modem).encode()
+            start = time.perf_counter()
+            for master, _ in ptys:
+                os.write(master, burst)
+            for _ in range(count * urcs_per_modem):
+                assert received.acquire(timeout=5.0)
+            elapsed = time.perf_counter() - start
+
+            stats = pool.stats
+            pool.close()
+        finally:
+            for master, slave in ptys:
+                os.close(master)
+                os.close(slave)
+
+        return threads, idle_wakeups, stats, elapsed
+
+    def test_pool_scaling(self):
+        """Measure pool thread CPU and wakeups for 1, 8 and 32 modems."""
+        urcs_per_modem = 50
+        print()
+        for count in (1, 8, 32):
+            threads, idle_wakeups, stats, elapsed = self._run_pool(count, urcs_per_modem)
+            print(f"pool N={count:2d}: threads {threads}, idle wakeups {idle_wakeups}, "
+                  f"wakeups {stats.wakeups}, lines {stats.lines}, "
+                  f"cpu {stats.cpu_time * 1000:.1f} ms "
+                  f"({stats.cpu_time / stats.lines * 1e6:.1f} us/line), "
+                  f"wall {elapsed * 1000:.1f} ms")
+
+            assert threads == 1
+            assert idle_wakeups == 0
+            assert stats.lines == count * urcs_per_modem
+            # Bursts are read in bulk: never more than one wakeup per line
+            assert stats.wakeups <= stats.lines + count + 2
+
+
+class TestURCDispatch:
+    """Prefix-indexed URC dispatch versus a linear startswith scan."""
+
+    def test_dispatch_100_subscriptions(self):
+        """Dispatch 10k URCs against 100 subscriptions."""
+        handler = URCHandler()
+        hits = [0]
+
+        def on_urc(line):
+            hits[0] += 1
+
+        prefixes = [f"+Q{i:03d}" for i in range(100)]
+        for prefix in prefixes:
+            handler.register_callback(prefix, on_urc)
+
+        lines = [f"{prefixes[i % 100]}: {i},1" for i in range(10_000)]
+
+        # Reference: the previous dispatch (scan every callback per URC)
+        callbacks = {prefix: on_urc for prefix in prefixes}
+        start = time.perf_counter()
+        for line in lines:
+            for prefix, cb in [(p, c) for p, c in callbacks.items() if line.startswith(p)]:
+                cb(line)
+        linear_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for line in lines:
+            handler._dispatch_callbacks(line)
+        indexed_s = time.perf_counter() - start
+
+        print(f"\nURC dispatch, 10k URCs x 100 subs: linear {linear_s * 1000:.1f} ms, "
+              f"indexed {indexed_s * 1000:.1f} ms ({linear_s / indexed_s:.0f}x)")
+
+        assert hits[0] == 20_000
+        # 10k URCs/s must leave the reader thread mostly idle
+        assert indexed_s < 0.25
+        assert indexed_s < linear_s
+
+
+class TestGSM7Codec:
+    """Table-driven GSM 7-bit codec versus per-character scans."""
+
+    @staticmethod
+    def _legacy_encode(text: str) -> bytes:
+        """The previous encoder: GSM7_BASIC.index per character, per-bit packing."""
+        septets = []
+        for char in text:
+            if char in GSM7_BASIC:
+                septets.append(GSM7_BASIC.index(char))
+            elif char in GSM7_EXTENDED:
+                septets.extend((0x1B, GSM7_EXTENDED[char]))
+            else:
+                raise PDUError(char)
+
+        octets, bits, count = [], 0, 0
+        for septet in septets:
+            bits |= septet << count
+            count += 7
+            while count >= 8:
+                octets.append(bits & 0xFF)
+                bits >>= 8
+                count -= 8
+        if count:
+            octets.append(bits & 0xFF)
+        return bytes(octets)
+
+    @staticmethod
+    def _legacy_decode(data: bytes, length: int) -> str:
+        """The previous decoder: per-bit unpacking, per-septet lookups."""
+        septets, bits, count = [], 0, 0
+        for octet in data:
+            bits |= octet << count
+            count += 8
+            while count >= 7 and len(septets) < length:
+                septets.append(bits & 0x7F)
+                bits >>= 7
+                count -= 7
+        rev = {v: k for k, v in GSM7_EXTENDED.items()}
+        text, i = [], 0
+        while i < len(septets):
+            if septets[i] == 0x1B and i + 1 < len(septets):
+                i += 1
+                text.append(rev.get(septets[i], "?"))
+            elif septets[i] != 0x1B:
+                text.append(GSM7_BASIC[septets[i]])
+            i += 1
+        return "".join(text)
+
+    def test_encode_decode_10k_messages(self):
+        """Encode, count parts and decode 10k single-part messages."""
+        messages = [f"Meter {i:05d}: reading {i * 7 % 1000} kWh, status OK {{ok}} @ 12:00 €" + "x" * 90
+                    for i in range(10_000)]
+
+        # Reference: the old "auto" path encoded the text twice (detection,
+        # then the real encoding) and calculate_sms_parts once more
+        start = time.perf_counter()
+        legacy_packed = []
+        for text in messages:
+            self._legacy_encode(text)
+            self._legacy_encode(text)
+            legacy_packed.append(self._legacy_encode(text))
+        legacy_encode_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        packed = []
+        for text in messages:
+            calculate_sms_parts(text)
+            packed.append(encode_gsm7(text))
+        encode_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for data, text in zip(legacy_packed, messages):
+            self._legacy_decode(data, len(gsm7_septets(text)))
+        legacy_decode_s = time.perf_counter() - start
+
+        lengths = [len(gsm7_septets(text)) for text in messages]
+        start = time.perf_counter()
+        decoded = [decode_gsm7(data, length) for data, length in zip(packed, lengths)]
+        decode_s = time.perf_counter() - start
+
+        print(f"\nGSM7 10k msgs: encode legacy {legacy_encode_s * 1000:.0f} ms, "
+              f"table {encode_s * 1000:.0f} ms ({legacy_encode_s / encode_s:.0f}x); "
+              f"decode legacy {legacy_decode_s * 1000:.0f} ms, "
+              f"table {decode_s * 1000:.0f} ms ({legacy_decode_s / decode_s:.0f}x)")
+
+        assert packed == legacy_packed
+        assert decoded == messages
+        assert encode_s < legacy_encode_s
+        assert decode_s < legacy_decode_s
+
+
+class TestTPDUDecode:
+    """Single-pass memoryview TPDU decoder versus the slicing decoder."""
+
+    @staticmethod
+    def _legacy_decode(pdu_hex: str) -> dict:
+        """The previous decode_sms_deliver: bytes slicing, per-nibble digits."""
+        pdu = bytes.fromhex(pdu_hex)
+        idx = 1 + pdu[0] + 1
+        sender_len, sender_type = pdu[idx], pdu[idx + 1]
+        idx += 2
+        digits = []
+        for octet in pdu[idx:idx + (sender_len + 1) // 2]:
+            for nibble in (octet & 0x0F, octet >> 4):
+                if nibble != 0xF:
+                    digits.append(str(nibble))
+        sender = "".join(digits[:sender_len])
+        if (sender_type & 0x70) == 0x10:
+            sender = "+" + sender
+        idx += (sender_len + 1) // 2
+        dcs = pdu[idx + 1]
+        idx += 2
+        semi = [(octet & 0x0F) * 10 + (octet >> 4) for octet in pdu[idx:idx + 6]]
+        tz = pdu[idx + 6]
+        timestamp = "{:02d}/{:02d}/{:02d},{:02d}:{:02d}:{:02d}".format(*semi) + \
+            f"{'-' if tz & 0x08 else '+'}{(tz & 0x07) * 10 + (tz >> 4):02d}"
+        idx += 7
+        udl = pdu[idx]
+        user_data = pdu[idx + 1:]
+        udh = user_data[:user_data[0] + 1] if pdu[1 + pdu[0]] & 0x40 and user_data else b""
+        if (dcs & 0x0C) == 0x08:
+            text, encoding = user_data[len(udh):udl].decode("utf-16-be"), "ucs2"
+        else:
+            header_septets = (len(udh) * 8 + 6) // 7
+            text, encoding = decode_gsm7(user_data, udl)[header_septets:], "gsm7"
+        return {"sender": sender, "timestamp": timestamp, "text": text,
+                "encoding": encoding, "concat": parse_concat_udh(udh)}
+
+    def test_decode_10k_deliver_pdus(self):
+        """Decode 10k SMS-DELIVER PDUs, single and concatenated parts."""
+        pdus = []
+        for i in range(10_000):
+            text = f"Alert {i:05d}: door {i % 7} opened" + "." * (i % 40)
+            submit = encode_sms_submit("+1234567890", text, udh=concat_udh(i % 256, 2, 1) if i % 2 else b"")
+            # Turn the SUBMIT into a DELIVER: first octet, no MR, SCTS instead of VP
+            tpdu = bytes.fromhex(submit)[1:]
+            dcs_end = 4 + (tpdu[2] + 1) // 2 + 2
+            deliver = bytes([tpdu[0] & 0x40]) + tpdu[2:dcs_end] + \
+                bytes.fromhex("32105101035400") + tpdu[dcs_end:]
+            pdus.append("00" + deliver.hex().upper())
+
+        start = time.perf_counter()
+        legacy = [self._legacy_decode(pdu) for pdu in pdus]
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = [decode_sms_deliver(pdu) for pdu in pdus]
+        decode_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for pdu in pdus:
+            decode_tpdu(pdu)
+        tpdu_s = time.perf_counter() - start
+
+        print(f"\nTPDU 10k PDUs: legacy {legacy_s * 1000:.0f} ms, decode_sms_deliver "
+              f"{decode_s * 1000:.0f} ms, decode_tpdu {tpdu_s * 1000:.0f} ms")
+
+        assert decoded == legacy
+        # The full decoder also parses PID, the SMSC and every header element
+        assert tpdu_s < legacy_s * 2
+
+
+class TestSubmitBuilder:
+    """Preallocated SMS-SUBMIT builder versus list building and per-octet hex."""
+
+    @staticmethod
+    def _legacy_encode(number: str, text: str) -> str:
+        """The previous builder: list of ints, address encoded every time, join of f-strings."""
+        pdu = [0x00, 0x01, 0x00]
+        phone_data, phone_type = encode_phone_number(number)
+        pdu.append(len(number.lstrip("+")))
+        pdu.append(phone_type)
+        pdu.extend(phone_data)
+        pdu.append(0x00)
+        septets = gsm7_septets(text)
+        if septets is not None:
+            pdu.append(0x00)
+            pdu.append(len(septets))
+            pdu.extend(encode_gsm7(text))
+        else:
+            user_data = text.encode("utf-16-be")
+            pdu.append(0x08)
+            pdu.append(len(user_data))
+            pdu.extend(user_data)
+        return "".join(f"{b:02X}" for b in pdu)
+
+    def test_encode_100k_submits(self):
+        """Encode 100k GSM7 and 100k UCS2 single-part messages to 10 recipients."""
+        numbers = [f"+3161234{i:04d}" for i in range(10)]
+        payloads = {
+            "gsm7": [f"Order {i:06d} shipped, track at example.com/t/{i:06d}" for i in range(100_000)],
+            "ucs2": [f"Заказ {i:06d} отправлен, отслеживание на сайте" for i in range(100_000)],
+        }
+
+        for encoding, texts in payloads.items():
+            start = time.perf_counter()
+            legacy = [self._legacy_encode(numbers[i % 10], text) for i, text in enumerate(texts)]
+            legacy_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pdus = [encode_sms_submit(numbers[i % 10], text) for i, text in enumerate(texts)]
+            encode_s = time.perf_counter() - start
+
+            print(f"\nSMS-SUBMIT 100k {encoding}: legacy {legacy_s * 1000:.0f} ms, "
+                  f"builder {encode_s * 1000:.0f} ms ({legacy_s / encode_s:.1f}x)")
+
+            assert pdus == legacy
+            assert encode_s < legacy_s
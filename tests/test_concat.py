@@ -0,0 +1,151 @@
+"""
+Tests for concatenated SMS reassembly.
+"""
+
+import pytest
+from quectelpy.parsers import SMSReassembler, StreamReassembler, reassemble
+from quectelpy.types import ConcatInfo, SMSMessage
+
+
+def _part(sequence, total=3, reference=7, sender="+1234567890", index=None, content=None):
+    """One part of a long message."""
+    return SMSMessage(
+        index=sequence if index is None else index,
+        status="REC UNREAD",
+        sender=sender,
+        timestamp="23/01/15,10:30:45+00",
+        content=f"part{sequence} " if content is None else content,
+        encoding="gsm7",
+        pdu="00" * 40,
+        concat=ConcatInfo(reference, total, sequence)
+    )
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_parts_joined_in_sequence_order():
+    """Test the joined message appears with the last part, whatever the order."""
+    reassembler = SMSReassembler()
+
+    assert reassembler.add(_part(3)) is None
+    assert reassembler.add(_part(1)) is None
+    message = reassembler.add(_part(2))
+
+    assert message.content == "part1 part2 part3 "
+    assert message.index == 1
+    assert message.indices == [1, 2, 3]
+    assert message.concat is None
+    assert message.pdu is None
+    assert reassembler.pending == 0
+    assert reassembler.stats.completed == 1
+    assert reassembler.stats.pending_bytes == 0
+
+
+def test_sets_keyed_by_sender_reference_and_total():
+    """Test parts of different messages are never mixed."""
+    reassembler = SMSReassembler()
+
+    reassembler.add(_part(1, total=2))
+    reassembler.add(_part(1, total=2, sender="+999"))
+    reassembler.add(_part(1, total=2, reference=8))
+    reassembler.add(_part(1, total=3))
+
+    assert reassembler.pending == 4
+    assert reassembler.add(_part(2, total=2, sender="+999")).sender == "+999"
+    assert reassembler.pending == 3
+
+
+def test_duplicate_part_replaces_stored_copy():
+    """Test a redelivered part does not complete the message twice."""
+    reassembler = SMSReassembler()
+
+    reassembler.add(_part(1, total=2))
+    reassembler.add(_part(1, total=2, content="again "))
+
+    assert reassembler.stats.duplicates == 1
+    assert reassembler.add(_part(2, total=2)).content == "again part2 "
+
+
+def test_age_eviction():
+    """Test incomplete messages are evicted after max_age and reported."""
+    clock = FakeClock()
+    evicted = []
+    reassembler = SMSReassembler(max_age=60.0, on_evict=evicted.append, clock=clock)
+
+    reassembler.add(_part(1))
+    clock.now = 30.0
+    reassembler.add(_part(1, reference=8))
+    clock.now = 61.0
+
+    parts = reassembler.evict()
+
+    assert [p.concat.reference for p in parts] == [7]
+    assert evicted == [parts]
+    assert parts[0].content == "part1 "
+    assert parts[0].concat == ConcatInfo(7, 3, 1)
+    assert reassembler.pending == 1
+    assert reassembler.stats.evicted_age == 1
+
+    # A late part starts a new set instead of completing the evicted one
+    clock.now = 100.0
+    assert reassembler.add(_part(2)) is None
+    assert reassembler.stats.evicted_age == 2
+
+
+def test_memory_cap_evicts_oldest():
+    """Test the oldest incomplete message goes when the cap is exceeded."""
+    evicted = []
+    reassembler = SMSReassembler(max_bytes=1000, on_evict=evicted.append)
+
+    reassembler.add(_part(1, reference=1, content="a" * 300))
+    reassembler.add(_part(1, reference=2, content="b" * 300))
+    reassembler.add(_part(1, reference=3, content="c" * 300))
+
+    assert [parts[0].concat.reference for parts in evicted] == [1]
+    assert reassembler.stats.evicted_memory == 1
+    assert reassembler.stats.pending_bytes <= 1000
+    assert reassembler.pending == 2
+
+
+def test_invalid_limits():
+    """Test nonsensical limits are rejected."""
+    with pytest.raises(ValueError):
+        SMSReassembler(max_bytes=0)
+    with pytest.raises(ValueError):
+        SMSReassembler(max_age=0)
+
+
+def test_reassemble_batch():
+    """Test complete messages take their first part's place; leftovers go last."""
+    single = SMSMessage(5, "REC READ", "+111", "23/01/15,10:30:45+00", "short")
+    messages = [
+        _part(2, total=2, index=11),
+        _part(1, reference=9),
+        single,
+        _part(1, total=2, index=10),
+    ]
+
+    result = reassemble(messages)
+
+    assert [m.content for m in result] == ["part1 part2 ", "short", "part1 "]
+    assert result[0].indices == [10, 11]
+    assert result[2].concat == ConcatInfo(9, 3, 1)
+
+
+def test_stream_reassembler_batches():
+    """Test parts fed in separate batches are joined when the last arrives."""
+    joiner = StreamReassembler()
+
+    assert list(joiner.feed([_part(1, total=2)])) == []
+    assert [m.content for m in joiner.feed([_part(2, total=2), _part(1, reference=9)])] == [
+        "part1 part2 "
+    ]
+    assert [m.concat for m in joiner.finish()] == [ConcatInfo(9, 3, 1)]
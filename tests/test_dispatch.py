@@ -0,0 +1,142 @@
+"""
+Tests for off-reader URC callback execution.
+"""
+
+import threading
+import time
+
+import pytest
+from quectelpy.core import ModemCore, OverflowPolicy, URCDispatcher, URCHandler
+
+
+def _blocked_handler(policy, max_queue_size=3, **kwargs):
+    """Handler whose single callback holds the worker (and one queue slot) until released."""
+    dispatcher = URCDispatcher(workers=1, max_queue_size=max_queue_size, policy=policy, **kwargs)
+    handler = URCHandler(dispatcher=dispatcher)
+    release = threading.Event()
+    started = threading.Event()
+    received = []
+
+    def slow(line):
+        started.set()
+        release.wait(2.0)
+        received.append(line)
+
+    sub = handler.register_callback("+", slow)
+    handler.handle_urc("+FIRST: 0")
+    assert started.wait(1.0)
+    return dispatcher, handler, sub, release, received
+
+
+def test_callbacks_run_off_caller_thread():
+    """Test callbacks run on a worker thread, in order per subscription."""
+    with URCDispatcher() as dispatcher:
+        handler = URCHandler(dispatcher=dispatcher)
+        threads, lines = set(), []
+        handler.register_callback("+CREG", lambda line: (threads.add(threading.current_thread()), lines.append(line)))
+
+        for i in range(50):
+            handler.handle_urc(f"+CREG: {i}")
+
+        assert dispatcher.join(timeout=1.0)
+
+    assert threading.current_thread() not in threads
+    assert lines == [f"+CREG: {i}" for i in range(50)]
+    assert dispatcher.stats.submitted == dispatcher.stats.delivered == 50
+    assert dispatcher.stats.depth == 0
+
+
+def test_drop_oldest():
+    """Test a full queue discards its oldest URC and counts the drop."""
+    dispatcher, handler, sub, release, received = _blocked_handler(OverflowPolicy.DROP_OLDEST)
+
+    for i in range(4):
+        handler.handle_urc(f"+CSQ: {i}")
+
+    assert dispatcher.stats.dropped == 2
+    assert dispatcher.subscriber_stats(sub).depth == 2
+    release.set()
+    dispatcher.close()
+    assert received == ["+FIRST: 0", "+CSQ: 2", "+CSQ: 3"]
+
+
+def test_coalesce_replaces_same_type():
+    """Test a full queue replaces a queued URC of the same type."""
+    dispatcher, handler, sub, release, received = _blocked_handler(OverflowPolicy.COALESCE)
+
+    handler.handle_urc('+CMTI: "SM",1')
+    handler.handle_urc("+CREG: 1")
+    handler.handle_urc("+CREG: 5")
+    handler.handle_urc('+CMTI: "SM",2')
+
+    assert dispatcher.stats.coalesced == 2
+    assert dispatcher.stats.dropped == 0
+    release.set()
+    dispatcher.close()
+    assert received == ["+FIRST: 0", "+CREG: 5", '+CMTI: "SM",2']
+
+
+def test_block_waits_then_drops():
+    """Test BLOCK holds the caller and drops after block_timeout."""
+    dispatcher, handler, sub, release, received = _blocked_handler(OverflowPolicy.BLOCK, block_timeout=0.1)
+
+    handler.handle_urc("+CSQ: 1")
+    handler.handle_urc("+CSQ: 2")
+    start = time.monotonic()
+    handler.handle_urc("+CSQ: 3")
+
+    assert time.monotonic() - start >= 0.1
+    assert dispatcher.stats.blocked == 1
+    assert dispatcher.stats.dropped == 1
+    release.set()
+    dispatcher.close()
+    assert received == ["+FIRST: 0", "+CSQ: 1", "+CSQ: 2"]
+
+
+def test_queue_bound_includes_lines_in_flight():
+    """Test a slow callback never has more than max_queue_size URCs held."""
+    with URCDispatcher(workers=1, max_queue_size=4) as dispatcher:
+        handler = URCHandler(dispatcher=dispatcher)
+        held = []
+
+        def slow(line):
+            stats = dispatcher.stats
+            held.append(stats.submitted - stats.dropped - stats.delivered)
+            time.sleep(0.005)
+
+        handler.register_callback("+CSQ", slow)
+        for i in range(200):
+            handler.handle_urc(f"+CSQ: {i}")
+            stats = dispatcher.stats
+            held.append(stats.submitted - stats.dropped - stats.delivered)
+
+        assert dispatcher.join(timeout=2.0)
+
+    assert max(held) <= 4
+    assert dispatcher.stats.dropped > 0
+
+
+def test_invalid_arguments():
+    """Test nonsensical sizes are rejected."""
+    with pytest.raises(ValueError):
+        URCDispatcher(workers=0)
+    with pytest.raises(ValueError):
+        URCDispatcher(max_queue_size=0)
+
+
+def test_slow_callback_does_not_delay_commands(mock_transport):
+    """Test a solicited response is not held up behind a slow callback."""
+    with URCDispatcher() as dispatcher:
+        core = ModemCore(mock_transport, urc_dispatcher=dispatcher)
+        core.register_urc_callback("+CMTI", lambda line: time.sleep(0.5))
+        core.start()
+
+        mock_transport.add_response(['+CMTI: "SM",1', "+CSQ: 24,99", "OK"])
+        start = time.monotonic()
+        response = core.send_at("AT+CSQ", timeout=2.0)
+        elapsed = time.monotonic() - start
+
+        core.close()
+
+    assert response == ["+CSQ: 24,99", "OK"]
+    assert elapsed < 0.25
@@ -0,0 +1,111 @@
+"""
+Tests for the local SMS inbox mirror.
+"""
+
+import time
+
+from quectelpy import QuectelModem
+from quectelpy.core import SerialTransport
+from quectelpy.types import SMSStatus
+
+
+def _cpms(used: int, storage: str = "ME") -> list[str]:
+    return [f'+CPMS: "{storage}",{used},100,"{storage}",{used},100,"{storage}",{used},100', "OK"]
+
+
+LIST_TWO = [
+    '+CMGL: 1,"REC READ","+1234567890",,"23/01/15,10:30:45+00"',
+    "First",
+    '+CMGL: 2,"REC UNREAD","+0987654321",,"23/01/15,11:45:30+00"',
+    "Second",
+    "OK",
+]
+
+
+def _modem(pty_modem) -> QuectelModem:
+    pty_modem.responses.update({
+        "AT+CMGF?": ["+CMGF: 1", "OK"],
+        "AT+CPMS?": _cpms(2),
+        'AT+CMGL="ALL"': LIST_TWO,
+    })
+    return QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1))
+
+
+def test_first_sync_lists_store(pty_modem):
+    """Test the first sync relists and queries send no commands."""
+    with _modem(pty_modem) as modem, modem.sms.inbox() as inbox:
+        assert inbox.sync() == 2
+        sent = len(pty_modem.received)
+
+        assert [m.content for m in inbox.messages()] == ["First", "Second"]
+        assert [m.index for m in inbox.messages(SMSStatus.REC_UNREAD)] == [2]
+        assert inbox.get(1).storage == "ME"
+        assert len(inbox) == 2
+        assert len(pty_modem.received) == sent
+
+    assert inbox.stats.full_syncs == 1
+
+
+def test_sync_unchanged_checks_count_only(pty_modem):
+    """Test a sync without changes costs a single AT+CPMS?."""
+    with _modem(pty_modem) as modem, modem.sms.inbox() as inbox:
+        inbox.sync()
+        sent = len(pty_modem.received)
+
+        assert inbox.sync() == 0
+
+    assert pty_modem.received[sent:] == ["AT+CPMS?"]
+    assert inbox.stats.full_syncs == 1
+
+
+def test_cmti_read_incrementally(pty_modem):
+    """Test an announced message is read with AT+CMGR, without relisting."""
+    with _modem(pty_modem) as modem, modem.sms.inbox() as inbox:
+        inbox.sync()
+        pty_modem.responses.update({
+            "AT+CPMS?": _cpms(3),
+            "AT+CMGR=3": ['+CMGR: "REC UNREAD","+1112223333",,"23/01/15,12:00:00+00"', "Third", "OK"],
+        })
+        sent = len(pty_modem.received)
+        pty_modem.send_lines(['+CMTI: "ME",3'])
+        deadline = time.monotonic() + 2.0
+        while inbox.pending == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert inbox.sync() == 1
+
+    assert pty_modem.received[sent:] == ["AT+CPMS?", "AT+CMGR=3"]
+    assert inbox.get(3).content == "Third"
+    assert inbox.stats.incremental == 1
+    assert inbox.stats.full_syncs == 1
+
+
+def test_count_mismatch_triggers_relist(pty_modem):
+    """Test a change made without +CMTI is picked up by a full relist."""
+    with _modem(pty_modem) as modem, modem.sms.inbox() as inbox:
+        inbox.sync()
+        pty_modem.responses.update({
+            "AT+CPMS?": _cpms(1),
+            'AT+CMGL="ALL"': LIST_TWO[2:],
+        })
+
+        assert inbox.sync() == 0
+        assert [m.index for m in inbox.messages()] == [2]
+
+    assert inbox.stats.full_syncs == 2
+
+
+def test_delete_updates_mirror(pty_modem):
+    """Test delete() removes the message on the modem and from the mirror."""
+    with _modem(pty_modem) as modem, modem.sms.inbox() as inbox:
+        inbox.sync()
+        pty_modem.responses["AT+CMGD=1"] = ["OK"]
+        pty_modem.responses["AT+CPMS?"] = _cpms(1)
+        inbox.delete(1)
+        sent = len(pty_modem.received)
+
+        inbox.sync()
+
+    assert inbox.get(1) is None
+    assert len(inbox) == 1
+    assert pty_modem.received[sent:] == ["AT+CPMS?"]
@@ -133,3 +133,25 @@ def test_get_gprs_attachment_status_not_attached(modem, mock_transport):
 
     # Verify
     assert attached is False
+
+
+def test_get_status_snapshot(modem, mock_transport):
+    """Test the status snapshot costs a single chained command."""
+    mock_transport.add_response([
+        "+CSQ: 24,99",
+        '+CREG: 2,1,"1A2B","00012345",7',
+        "+CGREG: 0,5",
+        '+COPS: 0,0,"AT&T",7',
+        '+QNWINFO: "LTE","310410","LTE BAND 4",5110',
+        "OK",
+    ])
+
+    status = modem.network.get_status_snapshot()
+
+    assert mock_transport.written == [b"AT+CSQ;+CREG?;+CGREG?;+COPS?;+QNWINFO\r\n"]
+    assert status.signal.rssi == 24
+    assert status.registration.is_registered is True
+    assert status.registration.lac == "1A2B"
+    assert status.gprs_registration.stat == 5
+    assert status.operator.oper == "AT&T"
+    assert status.network_info.band == "LTE BAND 4"
@@ -0,0 +1,131 @@
+"""
+Tests for the persistent SMS outbox.
+"""
+
+import sqlite3
+
+import pytest
+from quectelpy import QuectelModem
+from quectelpy.core import SerialTransport
+from quectelpy.features import SMSManager, SMSOutbox
+from quectelpy.features.outbox import retry_backoff
+from quectelpy.types import OutboxState
+from quectelpy.exceptions import ATTimeoutError, CMSError, SMSError
+
+
+def _script(pty_modem, texts, results):
+    """Answer AT+CMGS for each text with its result lines."""
+    pty_modem.responses["AT+CMGF?"] = ["+CMGF: 0", "OK"]
+    for text, result in zip(texts, results):
+        cmd, pdu = SMSManager._build_cmgs_parts("+1234567890", text, "auto", False)[0]
+        pty_modem.responses[cmd] = b"\r\n> "
+        pty_modem.responses[pdu + "^Z"] = result
+
+
+def _modem(pty_modem) -> QuectelModem:
+    return QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1))
+
+
+def test_sends_queue_in_order(pty_modem):
+    """Test queued messages are sent oldest first and found by reference."""
+    texts = ["First", "Second", "Third"]
+    _script(pty_modem, texts, [[f"+CMGS: {ref}", "OK"] for ref in (10, 11, 12)])
+    results = []
+
+    with _modem(pty_modem) as modem, modem.sms.outbox(on_result=results.append) as outbox:
+        ids = outbox.enqueue_many(("+1234567890", text) for text in texts)
+        assert outbox.join(timeout=5.0)
+
+        entry = outbox.get(ids[1])
+        assert entry.state == OutboxState.SENT
+        assert entry.references == [11]
+        assert entry.attempts == 1
+        assert outbox.by_reference(12).text == "Third"
+        assert outbox.by_reference(99) is None
+
+    assert [r.id for r in results] == ids
+    assert outbox.stats.sent == 3
+    assert outbox.stats.parts == 3
+    assert outbox.stats.throughput > 0
+    assert outbox.stats.avg_latency >= outbox.stats.avg_send_time > 0
+
+
+def test_transient_error_retried(pty_modem):
+    """Test a congestion error is retried until attempts run out."""
+    _script(pty_modem, ["Hello"], [["+CMS ERROR: 42"]])
+
+    with _modem(pty_modem) as modem:
+        with SMSOutbox(modem.sms, max_attempts=2, max_backoff=0.01) as outbox:
+            message_id = outbox.enqueue("+1234567890", "Hello")
+            assert outbox.join(timeout=5.0)
+            entry = outbox.get(message_id)
+
+    assert entry.state == OutboxState.FAILED
+    assert entry.attempts == 2
+    assert entry.error_code == 42
+    assert outbox.stats.retries == 1
+    assert outbox.stats.failed == 1
+
+
+def test_permanent_error_not_retried(pty_modem):
+    """Test an unassigned number fails the message at once."""
+    _script(pty_modem, ["Hello"], [["+CMS ERROR: 1"]])
+
+    with _modem(pty_modem) as modem, modem.sms.outbox() as outbox:
+        message_id = outbox.enqueue("+1234567890", "Hello")
+        assert outbox.join(timeout=5.0)
+        entry = outbox.get(message_id)
+
+    assert entry.state == OutboxState.FAILED
+    assert entry.attempts == 1
+    assert outbox.stats.retries == 0
+
+
+def test_rate_limit(pty_modem):
+    """Test sends are spaced by 1/rate seconds."""
+    texts = ["One", "Two", "Three"]
+    _script(pty_modem, texts, [["+CMGS: 1", "OK"]] * 3)
+
+    with _modem(pty_modem) as modem, modem.sms.outbox(rate=10.0) as outbox:
+        outbox.enqueue_many(("+1234567890", text) for text in texts)
+        assert outbox.join(timeout=5.0)
+
+    assert outbox.stats.elapsed >= 0.2
+
+
+def test_queue_survives_restart(tmp_path):
+    """Test queued and interrupted messages are kept in the database."""
+    path = str(tmp_path / "outbox.db")
+    outbox = SMSOutbox(sms=None, path=path)
+    first, second = outbox.enqueue_many([("+1", "a"), ("+2", "b")])
+    outbox.close()
+
+    # Simulate a crash while the second message was being sent
+    with sqlite3.connect(path) as db:
+        db.execute("UPDATE outbox SET state = 'sending' WHERE id = ?", (second,))
+    db.close()
+
+    outbox = SMSOutbox(sms=None, path=path)
+    assert outbox.pending == 2
+    assert outbox.get(second).state == OutboxState.QUEUED
+    outbox.close()
+
+
+def test_retry_backoff_classification():
+    """Test errors are classified by CMS code and cause."""
+    assert retry_backoff(CMSError(42, "Congestion")) == 60.0
+    assert retry_backoff(CMSError(1, "Unassigned (unallocated) number")) is None
+
+    try:
+        raise SMSError("send failed") from ATTimeoutError("timeout")
+    except SMSError as e:
+        assert retry_backoff(e) is not None
+    assert retry_backoff(SMSError("PDU encoding failed")) is None
+
+
+def test_invalid_arguments():
+    """Test rate and max_attempts are validated."""
+    with pytest.raises(ValueError):
+        SMSOutbox(sms=None, rate=0)
+    with pytest.raises(ValueError):
+        SMSOutbox(sms=None, max_attempts=0)
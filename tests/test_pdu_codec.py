@@ -2,6 +2,9 @@
 Tests for PDU encoding and decoding.
 """
 
+import random
+from dataclasses import replace
+
 import pytest
 from quectelpy.parsers.pdu import (
     encode_gsm7,
@@ -13,8 +16,19 @@ from quectelpy.parsers.pdu import (
     encode_timestamp,
     decode_timestamp,
     encode_sms_submit,
+    encode_sms_submit_parts,
     decode_sms_deliver,
+    decode_status_report,
+    decode_tpdu,
+    data_coding,
+    DataCoding,
+    decode_many,
     calculate_sms_parts,
+    concat_udh,
+    split_sms_text,
+    plan_sms,
+    NATIONAL_LANGUAGES,
+    parse_concat_udh,
     PDUError,
     _pack_septets,
     _unpack_septets,
@@ -293,6 +307,24 @@ class TestSMSSubmit:
         assert isinstance(pdu, str)
         assert len(pdu) > 0
 
+    def test_encode_exact_bytes(self):
+        """Test the builder's output octet by octet."""
+        pdu = encode_sms_submit("+1234567890", "Hello", validity_period=60, request_status=True)
+
+        assert pdu == "0031000A9121436587090000" "0B" "05C8329BFD06"
+
+    def test_address_digits_ignore_separators(self):
+        """Test the address length counts digits only."""
+        pdu = encode_sms_submit("+1 234-567-890", "Hello")
+
+        assert decode_tpdu(pdu).address == "+1234567890"
+        assert pdu[6:8] == "0A"
+
+    def test_user_data_too_long(self):
+        """Test text that does not fit one PDU raises PDUError."""
+        with pytest.raises(PDUError):
+            encode_sms_submit("+1234567890", "x" * 161)
+
 
 class TestSMSDeliver:
     """Test SMS-DELIVER PDU decoding."""
@@ -325,6 +357,200 @@ class TestSMSDeliver:
             decode_sms_deliver(pdu)
 
 
+class TestStatusReport:
+    """Test SMS-STATUS-REPORT PDU decoding."""
+
+    PDU = (
+        "00"  # SMSC (default)
+        "06"  # PDU type (SMS-STATUS-REPORT)
+        "2A"  # Message reference (42)
+        "0A912143658709"  # Recipient (+1234567890)
+        "32105101035400"  # SC timestamp
+        "32105101036400"  # Discharge time
+        "00"  # Status (received by SME)
+    )
+
+    def test_decode_status_report(self):
+        """Test decoding a delivered report."""
+        decoded = decode_status_report(self.PDU)
+
+        assert decoded["reference"] == 42
+        assert decoded["recipient"] == "+1234567890"
+        assert decoded["timestamp"] == "23/01/15,10:30:45+00"
+        assert decoded["discharge_time"] == "23/01/15,10:30:46+00"
+        assert decoded["status"] == 0
+
+    def test_decode_status_report_rejects_deliver(self):
+        """Test an SMS-DELIVER PDU is not taken for a report."""
+        with pytest.raises(PDUError):
+            decode_status_report("0791447758100650040A912143658709000032105101035400" "05C8329BFD06")
+
+    def test_decode_status_report_truncated(self):
+        """Test a report without status raises PDUError."""
+        with pytest.raises(PDUError):
+            decode_status_report(self.PDU[:-2])
+
+
+class TestTPDUDecoder:
+    """Test full TPDU decoding."""
+
+    DELIVER = "0791447758100650040A912143658709000032105101035400" "05C8329BFD06"
+
+    def test_deliver_with_smsc(self):
+        """Test the SMSC address and deliver fields are decoded."""
+        tpdu = decode_tpdu(self.DELIVER)
+
+        assert tpdu.type == "deliver"
+        assert tpdu.smsc == "+447785016005"
+        assert tpdu.address == "+1234567890"
+        assert tpdu.timestamp == "23/01/15,10:30:45+00"
+        assert tpdu.coding.alphabet == "gsm7"
+        assert tpdu.text == "Hello"
+        assert tpdu.concat is None
+        assert decode_tpdu(bytes.fromhex(self.DELIVER[16:]), smsc=False) == replace(tpdu, smsc=None)
+
+    def test_alphanumeric_sender(self):
+        """Test an alphanumeric originator (TON 101) is decoded as text."""
+        pdu = "00" "04" "07D0" + encode_gsm7("BANK").hex() + "0000" "32105101035400" "02" + encode_gsm7("Hi").hex()
+
+        assert decode_tpdu(pdu).address == "BANK"
+        assert decode_sms_deliver(pdu)["sender"] == "BANK"
+
+    def test_8bit_port_addressed(self):
+        """Test 8-bit data with a 16-bit port header is not decoded as text."""
+        pdu = "00" "44" "0A912143658709" "00" "04" "32105101035400" "0A" "0605040B8423F0" "0102FF"
+        tpdu = decode_tpdu(pdu)
+
+        assert tpdu.coding.alphabet == "8bit"
+        assert tpdu.ports == (2948, 9200)
+        assert tpdu.element(0x05).data == bytes.fromhex("0B8423F0")
+        assert tpdu.text is None
+        assert tpdu.data == b"\x01\x02\xff"
+        assert decode_sms_deliver(pdu)["encoding"] == "8bit"
+
+    def test_submit(self):
+        """Test an SMS-SUBMIT built by encode_sms_submit decodes back."""
+        pdu = encode_sms_submit("+1234567890", "Hello", validity_period=60,
+                                request_status=True, udh=concat_udh(5, 2, 1))
+        tpdu = decode_tpdu(pdu)
+
+        assert tpdu.type == "submit"
+        assert tpdu.first_octet & 0x20  # TP-SRR
+        assert tpdu.validity == b"\x0b"
+        assert tpdu.concat == (5, 2, 1)
+        assert tpdu.text == "Hello"
+
+    def test_data_coding(self):
+        """Test DCS groups map to alphabet and message class."""
+        assert data_coding(0x00) == DataCoding(0x00, "gsm7", None)
+        assert data_coding(0x18).alphabet == "ucs2"
+        assert data_coding(0x18).message_class == 0
+        assert data_coding(0xF5) == DataCoding(0xF5, "8bit", 1)
+        assert data_coding(0xE0).alphabet == "ucs2"
+        assert data_coding(0x24).compressed
+
+    def test_status_report_optional_parameters(self):
+        """Test TP-PI, PID and DCS after the status of a report."""
+        tpdu = decode_tpdu(TestStatusReport.PDU + "03" "00" "08")
+
+        assert tpdu.type == "status-report"
+        assert tpdu.reference == 42
+        assert tpdu.coding.alphabet == "ucs2"
+        assert tpdu.text is None
+
+    def test_special_digits(self):
+        """Test * and # digits in a semi-octet address."""
+        assert decode_phone_number(bytes([0xBA, 0xF1]), 3, 0x81) == "*#1"
+
+    def test_fuzz_only_pdu_errors(self):
+        """Test random, truncated and mutated PDUs raise nothing but PDUError."""
+        rng = random.Random(23)
+        valid = [
+            self.DELIVER,
+            TestStatusReport.PDU,
+            "00" "44" "0A912143658709" "00" "04" "32105101035400" "0A" "0605040B8423F0" "0102FF",
+            encode_sms_submit("+1234567890", "Привет мир", validity_period=60, udh=concat_udh(5, 2, 1)),
+        ]
+        inputs = [bytes(rng.randrange(256) for _ in range(rng.randrange(48))) for _ in range(3000)]
+        for pdu in map(bytes.fromhex, valid):
+            inputs.extend(pdu[:end] for end in range(len(pdu)))
+            for _ in range(500):
+                mutated = bytearray(pdu)
+                mutated[rng.randrange(len(pdu))] = rng.randrange(256)
+                inputs.append(bytes(mutated))
+        inputs.append("0G")
+
+        decoded = 0
+        for pdu in inputs:
+            try:
+                decode_tpdu(pdu)
+                decoded += 1
+            except PDUError:
+                pass
+
+        assert decoded > 0
+
+
+class TestNationalShiftTables:
+    """Test national language shift tables and the part-count optimiser."""
+
+    TURKISH = (
+        "Yarın saat 10'da görüşürüz, lütfen geç kalmayın. Şişli'deki ofiste buluşalım; "
+        "İstanbul trafiği çok yoğun olabilir, erken çıkın."
+    )
+    ALL = tuple(NATIONAL_LANGUAGES.values())
+
+    def test_turkish_uses_single_shift(self):
+        """Test Turkish text is sent in GSM 7-bit with the Turkish single shift."""
+        plan = plan_sms(self.TURKISH * 2, languages=self.ALL)
+
+        assert plan.encoding == "gsm7"
+        assert (plan.locking_shift, plan.single_shift) == (0, NATIONAL_LANGUAGES["turkish"])
+        assert plan.parts == 2
+        assert plan.header == bytes([0x24, 0x01, 0x01])
+        assert calculate_sms_parts(self.TURKISH * 2) == 4
+
+    def test_parts_round_trip(self):
+        """Test every part carries the shift element and decodes back."""
+        text = self.TURKISH * 2
+        pdus = encode_sms_submit_parts("+1234567890", text, reference=7, languages=self.ALL)
+
+        decoded = [decode_tpdu(pdu) for pdu in pdus]
+        assert all(tpdu.element(0x24).data == b"\x01" for tpdu in decoded)
+        assert [tpdu.concat for tpdu in decoded] == [(7, 2, 1), (7, 2, 2)]
+        assert "".join(tpdu.text for tpdu in decoded) == text
+
+    def test_single_pdu_with_locking_shift(self):
+        """Test a single PDU gets a header with the shift element only."""
+        pdu = encode_sms_submit("+1234567890", "€" * 100, "gsm7", languages=self.ALL)
+        tpdu = decode_tpdu(pdu)
+
+        assert tpdu.elements[0].iei == 0x25
+        assert tpdu.concat is None
+        assert tpdu.text == "€" * 100
+
+    def test_tie_prefers_ucs2(self):
+        """Test a short message that fits either way is sent as UCS2."""
+        plan = plan_sms("Olá João, a reunião é às 15h.", languages=self.ALL)
+
+        assert plan.encoding == "ucs2"
+        assert plan.parts == 1
+
+    def test_tables_are_opt_in(self):
+        """Test every entry point keeps to the default alphabet unless asked."""
+        assert plan_sms("€" * 100).locking_shift == 0
+        assert split_sms_text(self.TURKISH)[0] == "ucs2"
+        assert len(encode_sms_submit_parts("+1234567890", self.TURKISH * 2)) == 4
+        assert split_sms_text(self.TURKISH, languages=[1]) == ("gsm7", [self.TURKISH])
+
+    def test_gsm7_outside_tables_raises(self):
+        """Test characters outside every table still raise PDUError."""
+        with pytest.raises(PDUError):
+            plan_sms("Hello 世界", "gsm7", languages=self.ALL)
+        with pytest.raises(PDUError):
+            plan_sms("Hello ş", languages=[9])
+
+
 class TestCalculateSMSParts:
     """Test SMS parts calculation."""
 
@@ -361,6 +587,9 @@ class TestCalculateSMSParts:
 
         assert parts == 2  # Over 160, needs 2 parts
 
+        # A locking shift table with € in it fits one part
+        assert calculate_sms_parts(text, "gsm7", languages=NATIONAL_LANGUAGES.values()) == 1
+
     def test_single_part_ucs2(self):
         """Test single-part UCS2 message."""
         text = "A" * 70
@@ -393,3 +622,128 @@ class TestCalculateSMSParts:
         """Test invalid encoding raises error."""
         with pytest.raises(PDUError):
             calculate_sms_parts("Hello", "invalid")
+
+
+def _submit_user_data(pdu_hex: str) -> tuple[int, int, bytes]:
+    """Return (first octet, UDL, UD) of an SMS-SUBMIT PDU without VP."""
+    pdu = bytes.fromhex(pdu_hex)
+    digits = pdu[3]
+    idx = 5 + (digits + 1) // 2 + 2  # SMSC, type, MR, DA len/type, DA, PID, DCS
+    return pdu[1], pdu[idx], pdu[idx + 1:]
+
+
+class TestConcatenatedSMS:
+    """Test multipart encoding with a User Data Header."""
+
+    def test_concat_udh(self):
+        """Test 8-bit and 16-bit concatenation headers."""
+        assert concat_udh(0x42, 3, 1) == bytes([0x05, 0x00, 0x03, 0x42, 0x03, 0x01])
+        assert concat_udh(0x1234, 2, 2, ref16=True) == bytes([0x06, 0x08, 0x04, 0x12, 0x34, 0x02, 0x02])
+
+    def test_split_gsm7(self):
+        """Test 153-septet parts that never split an escape sequence."""
+        encoding, segments = split_sms_text("a" * 152 + "€" + "b" * 10, "gsm7")
+
+        assert encoding == "gsm7"
+        assert segments == ["a" * 152, "€" + "b" * 10]
+        assert split_sms_text("a" * 160)[1] == ["a" * 160]
+        assert [len(s) for s in split_sms_text("a" * 400, ref16=True)[1]] == [152, 152, 96]
+
+    def test_split_ucs2_keeps_surrogate_pairs(self):
+        """Test 67-unit parts that never split a surrogate pair."""
+        encoding, segments = split_sms_text("й" * 66 + "😀" + "й" * 3, "auto")
+
+        assert encoding == "ucs2"
+        assert segments == ["й" * 66, "😀ййй"]
+
+    def test_gsm7_udh_fill_bits(self):
+        """Test septets after the UDH start on a septet boundary."""
+        pdus = encode_sms_submit_parts("+1234567890", "Hello" * 40, reference=7)
+        first_octet, udl, ud = _submit_user_data(pdus[0])
+
+        assert len(pdus) == 2
+        assert first_octet & 0x40  # TP-UDHI
+        assert ud[:6] == concat_udh(7, 2, 1)
+        assert udl == 7 + 153
+        # 6 UDH octets = 48 bits: one fill bit, then the text from septet 7
+        assert decode_gsm7(ud, udl)[7:] == ("Hello" * 40)[:153]
+
+    def test_ucs2_parts(self):
+        """Test UCS2 parts carry the UDH in octet-counted user data."""
+        pdus = encode_sms_submit_parts("+1234567890", "Привет" * 20, ref16=True, reference=0x0102)
+        first_octet, udl, ud = _submit_user_data(pdus[1])
+
+        assert len(pdus) == 2
+        assert ud[:7] == concat_udh(0x0102, 2, 2, ref16=True)
+        assert udl == len(ud) == 7 + 2 * (120 - 66)
+        assert decode_ucs2(ud[7:]) == ("Привет" * 20)[66:]
+
+    def test_single_part_has_no_udh(self):
+        """Test a short message is one PDU without a header."""
+        pdus = encode_sms_submit_parts("+1234567890", "Hello")
+
+        assert pdus == [encode_sms_submit("+1234567890", "Hello")]
+        assert not _submit_user_data(pdus[0])[0] & 0x40
+
+    def test_decode_parts(self, deliver_pdus):
+        """Test the decoder skips the UDH and reports the concatenation element."""
+        for text, kwargs in [("Hello €" * 30, {"reference": 9}), ("Привет" * 20, {"ref16": True, "reference": 0x0102})]:
+            decoded = [decode_sms_deliver(pdu) for pdu in deliver_pdus("+1234567890", text, **kwargs)]
+
+            assert [d["concat"] for d in decoded] == [(kwargs["reference"], 2, 1), (kwargs["reference"], 2, 2)]
+            assert "".join(d["text"] for d in decoded) == text
+
+        assert decode_sms_deliver(deliver_pdus("+1234567890", "Hello")[0])["concat"] is None
+
+    def test_parse_concat_udh(self):
+        """Test other elements are skipped and invalid sequence numbers ignored."""
+        # Port addressing element (IEI 0x05) before the concatenation element
+        udh = bytes([0x0B, 0x05, 0x04, 0x0B, 0x84, 0x23, 0xF0]) + concat_udh(0x42, 3, 2)[1:]
+
+        assert parse_concat_udh(udh) == (0x42, 3, 2)
+        assert parse_concat_udh(concat_udh(1, 2, 3)) is None
+        assert parse_concat_udh(b"") is None
+
+    def test_extended_chars_counted_as_septets(self):
+        """Test UDL counts both septets of an escaped character."""
+        _, udl, _ = _submit_user_data(encode_sms_submit("+1234567890", "€5"))
+
+        assert udl == 3
+
+
+class TestDecodeMany:
+    """Test bulk PDU decoding."""
+
+    PDU = "0791447758100650040A912143658709000032105101035400" "05C8329BFD06"
+
+    def _inputs(self, count):
+        """PDUs with every tenth one corrupt."""
+        return [self.PDU if i % 10 else "00" for i in range(count)]
+
+    def test_in_process(self):
+        """Test results keep input order and errors do not stop the batch."""
+        results = list(decode_many(iter(self._inputs(25)), chunk_size=4))
+
+        assert [r.index for r in results] == list(range(25))
+        assert [r.ok for r in results].count(False) == 3
+        assert results[1].fields["text"] == "Hello"
+        assert results[0].fields is None
+        assert results[0].error.startswith("PDUError")
+
+    def test_process_pool(self):
+        """Test chunks decoded in worker processes, ordered and as completed."""
+        inputs = self._inputs(200)
+
+        ordered = list(decode_many(inputs, workers=2, chunk_size=16))
+        unordered = list(decode_many(inputs, workers=2, chunk_size=16, ordered=False))
+
+        assert [r.index for r in ordered] == list(range(200))
+        assert sorted(r.index for r in unordered) == list(range(200))
+        assert [r.fields for r in ordered] == [r.fields for r in sorted(unordered, key=lambda r: r.index)]
+
+    def test_invalid_arguments(self):
+        """Test nonsensical sizes are rejected."""
+        with pytest.raises(ValueError):
+            list(decode_many([], workers=0))
+        with pytest.raises(ValueError):
+            list(decode_many([], chunk_size=0))
@@ -0,0 +1,111 @@
+"""
+Tests for ModemPool.
+"""
+
+import threading
+
+import pytest
+from conftest import PtyModem
+from quectelpy import ModemPool, QuectelModem
+from quectelpy.core import SerialTransport
+from quectelpy.features import SMSManager
+
+
+@pytest.fixture
+def pty_modems():
+    """Create three PtyModems."""
+    fakes = [PtyModem() for _ in range(3)]
+    yield fakes
+    for fake in fakes:
+        fake.close()
+
+
+def test_commands_on_many_modems(pty_modems):
+    """Test each pooled modem gets its own responses."""
+    for i, fake in enumerate(pty_modems):
+        fake.responses["AT+CSQ"] = [f"+CSQ: {20 + i},99", "OK"]
+
+    with ModemPool() as pool:
+        modems = [pool.add(transport=SerialTransport(fake.port)) for fake in pty_modems]
+
+        assert all(isinstance(modem, QuectelModem) for modem in modems)
+        assert pool.stats.modems == 3
+
+        for i, modem in enumerate(modems):
+            assert modem.network.get_signal_quality().rssi == 20 + i
+
+
+def test_send_sms_echo_on(pty_modems):
+    """Test a prompt read in the same chunk as the command echo."""
+    fake = pty_modems[0]
+    cmd, pdu = SMSManager._build_cmgs_parts("+1234567890", "Hello", "auto", False)[0]
+    fake.responses.update({
+        "AT+CMGF?": ["+CMGF: 0", "OK"],
+        cmd: f"{cmd}\r\r\n> ".encode(),
+        pdu + "^Z": ["+CMGS: 9", "OK"],
+    })
+
+    with ModemPool() as pool:
+        modem = pool.add(transport=SerialTransport(fake.port))
+
+        assert modem.sms.send_sms("+1234567890", "Hello") == 9
+
+
+def test_single_thread(pty_modems):
+    """Test the pool uses one thread regardless of modem count."""
+    before = threading.active_count()
+
+    with ModemPool() as pool:
+        for fake in pty_modems:
+            pool.add(transport=SerialTransport(fake.port))
+        assert threading.active_count() == before + 1
+
+    assert threading.active_count() == before
+
+
+def test_urcs_routed_per_modem(pty_modems):
+    """Test URCs reach the callback of the modem that emitted them."""
+    received = {i: [] for i in range(len(pty_modems))}
+    done = threading.Event()
+
+    with ModemPool() as pool:
+        for i, fake in enumerate(pty_modems):
+            modem = pool.add(transport=SerialTransport(fake.port))
+
+            def on_cmti(line, i=i):
+                received[i].append(line)
+                if all(received.values()):
+                    done.set()
+
+            modem.register_urc_callback("+CMTI", on_cmti)
+
+        for i, fake in enumerate(pty_modems):
+            fake.send_lines([f'+CMTI: "SM",{i}'])
+
+        assert done.wait(2.0)
+
+    for i in received:
+        assert received[i] == [f'+CMTI: "SM",{i}']
+
+
+def test_stop_and_restart_modem(pty_modems):
+    """Test a pooled modem can be stopped and started again."""
+    fake = pty_modems[0]
+    fake.responses["AT"] = ["OK"]
+
+    with ModemPool() as pool:
+        modem = pool.add(transport=SerialTransport(fake.port))
+        modem.stop()
+        assert pool.stats.modems == 0
+        assert not modem.is_running
+
+        modem.start()
+        assert pool.stats.modems == 1
+        assert modem.send_raw_at("AT") == ["OK"]
+
+
+def test_add_requires_port_or_transport():
+    """Test add() without port or transport raises ValueError."""
+    with ModemPool() as pool:
+        with pytest.raises(ValueError):
+            pool.add()
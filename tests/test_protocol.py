@@ -0,0 +1,259 @@
+"""
+Tests for the AT protocol layer.
+"""
+
+import threading
+import time
+
+import pytest
+from quectelpy.core import ModemCore, SerialTransport
+from quectelpy.exceptions import (
+    ATCommandError,
+    ATParseError,
+    ATTimeoutError,
+    CMEError,
+    CMSError,
+    EC25Error,
+    SMSError,
+    error_from_result,
+)
+
+
+def test_send_at_records_latency(modem_core, mock_transport):
+    """Test that a completed command records its round-trip latency."""
+    mock_transport.add_response(["+CSQ: 24,99", "OK"])
+
+    response = modem_core.send_at("AT+CSQ")
+
+    assert response == ["+CSQ: 24,99", "OK"]
+    assert modem_core.protocol.last_latency is not None
+    assert modem_core.protocol.last_latency < 1.0
+
+
+def test_send_at_timeout_honours_deadline(modem_core):
+    """Test that a command with no response times out at its deadline."""
+    start = time.monotonic()
+
+    with pytest.raises(ATTimeoutError):
+        modem_core.send_at("AT+CSQ", timeout=0.2)
+
+    elapsed = time.monotonic() - start
+    assert 0.2 <= elapsed < 0.5
+
+
+def test_send_batch_splits_responses(modem_core, mock_transport):
+    """Test a chained command is sent on one line and split per command."""
+    mock_transport.add_response([
+        "+CSQ: 24,99",
+        '+CREG: 0,1',
+        '+COPS: 0,0,"AT&T",7',
+        "OK",
+    ])
+
+    csq, creg, cops = modem_core.send_batch(["AT+CSQ", "+CREG?", "+COPS?"], remove_cmd_prefix=True)
+
+    assert mock_transport.written == [b"AT+CSQ;+CREG?;+COPS?\r\n"]
+    assert csq == ["24,99"]
+    assert creg == ["0,1"]
+    assert cops == ['0,0,"AT&T",7']
+
+
+def test_send_batch_multiline_and_urc(modem_core, mock_transport):
+    """Test multi-line results stay together and URCs are not captured."""
+    urcs = []
+    modem_core.register_urc_callback("+CMTI", urcs.append)
+    mock_transport.add_response([
+        "+CSQ: 24,99",
+        '+CMTI: "SM",3',
+        '+CGDCONT: 1,"IP","internet"',
+        '+CGDCONT: 2,"IP","ims"',
+        "OK",
+    ])
+
+    csq, cgdcont = modem_core.send_batch(["+CSQ", "+CGDCONT?"])
+
+    assert csq == ["+CSQ: 24,99"]
+    assert cgdcont == ['+CGDCONT: 1,"IP","internet"', '+CGDCONT: 2,"IP","ims"']
+    assert urcs == ['+CMTI: "SM",3']
+
+
+def test_send_batch_error(modem_core, mock_transport):
+    """Test an ERROR in any chained command fails the batch."""
+    mock_transport.add_response(["+CSQ: 24,99", "ERROR"])
+
+    with pytest.raises(EC25Error):
+        modem_core.send_batch(["+CSQ", "+QBOGUS?"])
+
+
+def test_send_batch_empty(modem_core):
+    """Test an empty batch is rejected."""
+    with pytest.raises(ValueError):
+        modem_core.send_batch([])
+
+
+def test_exclusive_keeps_other_threads_out(pty_modem):
+    """Test commands from other threads wait for an exclusive block."""
+    pty_modem.responses.update({"AT+CMMS=1": ["OK"], "AT+CSQ": ["+CSQ: 24,99", "OK"]})
+    core = ModemCore(SerialTransport(pty_modem.port, timeout=0.1))
+    core.start()
+    other = threading.Thread(target=core.send_at, args=("AT+CSQ",))
+
+    with core.exclusive():
+        core.send_at("AT+CMMS=1")
+        other.start()
+        time.sleep(0.1)
+        core.send_at("AT+CMMS=1")
+
+    other.join(timeout=1.0)
+    core.close()
+    assert pty_modem.received == ["AT+CMMS=1", "AT+CMMS=1", "AT+CSQ"]
+
+
+def test_stream_command_yields_while_arriving(pty_modem):
+    """Test lines are yielded before the final result code arrives."""
+    pty_modem.responses["AT+CMGL=4"] = b"\r\n+CMGL: 1,1,,5\r\n"
+    core = ModemCore(SerialTransport(pty_modem.port, timeout=0.1))
+    core.start()
+
+    stream = core.stream_at("AT+CMGL=4", timeout=2.0)
+    first = next(stream)
+    pty_modem.send_lines(["00", "+CMS ERROR: 321"])
+    with pytest.raises(CMSError):
+        list(stream)
+
+    core.close()
+    assert first == "+CMGL: 1,1,,5"
+
+
+def test_stream_command_abandoned_early(pty_modem):
+    """Test leaving a stream early discards the rest before the next command."""
+    pty_modem.responses.update({
+        "AT+CMGL=4": ["+CMGL: 1,1,,5", "00", "+CMGL: 2,1,,5", "00", "OK"],
+        "AT+CSQ": ["+CSQ: 24,99", "OK"],
+    })
+    core = ModemCore(SerialTransport(pty_modem.port, timeout=0.1))
+    core.start()
+
+    for line in core.stream_at("AT+CMGL=4"):
+        break
+    response = core.send_at("AT+CSQ")
+
+    core.close()
+    assert line == "+CMGL: 1,1,,5"
+    assert response == ["+CSQ: 24,99", "OK"]
+
+
+@pytest.mark.parametrize("result, error_type, code", [
+    ("+CME ERROR: 10", CMEError, 10),
+    ("+CME ERROR: SIM not inserted", CMEError, 10),
+    ("+CMS ERROR: 330", CMSError, 330),
+    ("+CMS ERROR: 500", CMSError, 500),
+])
+def test_error_result_fails_immediately(modem_core, mock_transport, result, error_type, code):
+    """Test +CME/+CMS ERROR ends the command at once with a typed error."""
+    mock_transport.add_response([result])
+
+    start = time.monotonic()
+    with pytest.raises(error_type) as exc_info:
+        modem_core.send_at("AT+CPIN?", timeout=5.0)
+
+    assert time.monotonic() - start < 1.0
+    assert exc_info.value.code == code
+    assert exc_info.value.result == result
+
+
+@pytest.mark.parametrize("result", ["ERROR", "NO CARRIER", "BUSY", "NO ANSWER", "NO DIALTONE"])
+def test_failure_result_codes(modem_core, mock_transport, result):
+    """Test V.250 failure result codes end the command."""
+    mock_transport.add_response([result])
+
+    with pytest.raises(ATCommandError) as exc_info:
+        modem_core.send_at("ATD+1234567890;", timeout=5.0)
+
+    assert exc_info.value.result == result
+    assert isinstance(exc_info.value, EC25Error)
+
+
+def test_cms_error_is_sms_error():
+    """Test CMSError can be caught as SMSError."""
+    error = error_from_result("+CMS ERROR: 331", command="AT+CMGS=20")
+
+    assert isinstance(error, SMSError)
+    assert error.description == "No network service"
+    assert "331" in str(error)
+
+
+def test_unknown_error_code():
+    """Test codes missing from the tables still map to the right type."""
+    error = error_from_result("+CME ERROR: 9999")
+
+    assert isinstance(error, CMEError)
+    assert error.code == 9999
+    assert error.description == "Unknown error code"
+
+
+class TestPromptCommand:
+    """Two-phase commands with a "> " prompt."""
+
+    @pytest.fixture
+    def core(self, pty_modem):
+        core = ModemCore(SerialTransport(pty_modem.port, timeout=0.1))
+        core.start()
+        yield core
+        core.close()
+
+    def test_prompt_then_payload(self, core, pty_modem):
+        """Test the payload is sent after the prompt and the result collected."""
+        pty_modem.responses["AT+CMGS=5"] = b"\r\n> "
+        pty_modem.responses["0011AA^Z"] = ["+CMGS: 42", "OK"]
+
+        response = core.send_prompt_command("AT+CMGS=5", b"0011AA", strip_ok=True)
+
+        assert response == ["+CMGS: 42"]
+        assert pty_modem.received == ["AT+CMGS=5", "0011AA^Z"]
+
+    def test_prompt_after_echo(self, core, pty_modem):
+        """Test a prompt read in the same chunk as the command echo."""
+        pty_modem.responses["AT+CMGS=5"] = b"AT+CMGS=5\r\r\n> "
+        pty_modem.responses["0011AA^Z"] = ["+CMGS: 42", "OK"]
+
+        response = core.send_prompt_command("AT+CMGS=5", b"0011AA", strip_ok=True)
+
+        assert response == ["+CMGS: 42"]
+
+    def test_prompt_timeout_cancels(self, core, pty_modem):
+        """Test a prompt timeout sends ESC so the modem leaves data entry."""
+        pty_modem.responses["AT+CMGS=5"] = b""
+        written = []
+        write = core.transport.write
+        core.transport.write = lambda data: written.append(data) or write(data)
+
+        with pytest.raises(ATTimeoutError):
+            core.send_prompt_command("AT+CMGS=5", b"0011AA", prompt_timeout=0.2)
+
+        assert written[-1] == b"\x1b"
+
+    def test_send_ok_result(self, core, pty_modem):
+        """Test SEND OK ends a socket send."""
+        pty_modem.responses["AT+QISEND=0"] = b"\r\n> "
+        pty_modem.responses["hello^Z"] = ["SEND OK"]
+
+        assert core.send_prompt_command("AT+QISEND=0", b"hello") == ["SEND OK"]
+
+    def test_error_before_prompt(self, core, pty_modem):
+        """Test an error instead of the prompt fails without sending the payload."""
+        pty_modem.responses["AT+CMGS=5"] = ["+CMS ERROR: 304"]
+
+        start = time.monotonic()
+        with pytest.raises(CMSError):
+            core.send_prompt_command("AT+CMGS=5", b"0011AA", prompt_timeout=5.0)
+
+        assert time.monotonic() - start < 1.0
+        assert pty_modem.received == ["AT+CMGS=5"]
+
+    def test_no_prompt(self, core, pty_modem):
+        """Test a command that completes without a prompt is reported."""
+        pty_modem.responses["AT+CMGS=5"] = ["OK"]
+
+        with pytest.raises(ATParseError):
+            core.send_prompt_command("AT+CMGS=5", b"0011AA")
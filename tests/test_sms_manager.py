@@ -2,10 +2,18 @@
 Tests for SMS manager.
 """
 
+import threading
+import time
+
 import pytest
 from quectelpy import QuectelModem, MockTransport
-from quectelpy.types import MessageFormat, SMSStatus
-from quectelpy.exceptions import SMSError
+from quectelpy.core import SerialTransport
+from quectelpy.features import SMSManager
+from quectelpy.features.sms_reports import DeliveryTracker
+from quectelpy.parsers.pdu import encode_sms_submit
+from quectelpy.parsers.sms import SMSParser
+from quectelpy.types import DeliveryState, MessageFormat, SMSStatus, StatusReport
+from quectelpy.exceptions import CMSError, SMSError
 
 
 class TestMessageFormat:
@@ -230,6 +238,88 @@ class TestListMessages:
 
         modem.close()
 
+    def test_list_messages_pdu_mode_status(self, pty_modem):
+        """Test PDU mode lists by status number, not the quoted name."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CMGL=0": ["OK"],
+        })
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            assert modem.sms.list_messages(SMSStatus.REC_UNREAD) == []
+
+        assert pty_modem.received == ["AT+CMGF?", "AT+CMGL=0"]
+
+    def test_list_messages_reassembles_parts(self, deliver_pdus):
+        """Test PDU mode listing joins the parts of a long message."""
+        transport = MockTransport()
+        modem = QuectelModem(transport=transport)
+        modem.start()
+
+        text = "Hello " * 40
+        part1, part2 = deliver_pdus("+1234567890", text, reference=3)
+        transport.add_response(["+CMGF: 0", "OK"])
+        modem.sms.get_message_format()
+
+        response = [
+            f"+CMGL: 4,1,,{len(part2) // 2 - 1}", part2,
+            f"+CMGL: 3,1,,{len(part1) // 2 - 1}", part1,
+            "OK",
+        ]
+        transport.add_response(list(response))
+        messages = modem.sms.list_messages(SMSStatus.ALL)
+        transport.add_response(list(response))
+        fragments = modem.sms.list_messages(SMSStatus.ALL, reassemble=False)
+
+        assert len(messages) == 1
+        assert messages[0].content == text
+        assert messages[0].index == 3
+        assert messages[0].indices == [3, 4]
+        assert [m.concat.sequence for m in fragments] == [2, 1]
+
+        modem.close()
+
+    def test_iter_messages_pdu(self, pty_modem, deliver_pdus):
+        """Test streamed PDU listing with a long message joined on its last part."""
+        single = TestDirectDelivery.PDU
+        part1, part2 = deliver_pdus("+1234567890", "Hello " * 40, reference=5)
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CMGL=0": [
+                f"+CMGL: 1,0,,{len(part1) // 2 - 1}", part1,
+                "+CMGL: 2,0,,23", single,
+                f"+CMGL: 3,0,,{len(part2) // 2 - 1}", part2,
+                "OK",
+            ],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = list(modem.sms.iter_messages(SMSStatus.REC_UNREAD))
+
+        assert [m.index for m in messages] == [2, 1]
+        assert messages[0].content == "Hello"
+        assert messages[1].content == "Hello " * 40
+        assert messages[1].indices == [1, 3]
+
+    def test_iter_messages_text(self, pty_modem):
+        """Test streamed text mode listing keeps multi-line content together."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 1", "OK"],
+            'AT+CMGL="ALL"': [
+                '+CMGL: 1,"REC READ","+1234567890",,"23/01/15,10:30:45+00"',
+                "Line 1",
+                "Line 2",
+                '+CMGL: 2,"REC UNREAD","+0987654321",,"23/01/15,11:45:30+00"',
+                "Message 2",
+                "OK",
+            ],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = list(modem.sms.iter_messages())
+
+        assert [m.content for m in messages] == ["Line 1\nLine 2", "Message 2"]
+        assert messages[1].status == "REC UNREAD"
+
     def test_list_messages_empty(self):
         """Test listing messages when storage is empty."""
         transport = MockTransport()
@@ -238,6 +328,9 @@ class TestListMessages:
         modem = QuectelModem(transport=transport)
         modem.start()
 
+        # The format picks the AT+CMGL status form
+        transport.add_response(["+CMGF: 1", "OK"])  # AT+CMGF?
+
         # Empty response for AT+CMGL
         transport.add_response(["OK"])
 
@@ -298,6 +391,135 @@ class TestDeleteMessages:
         modem.close()
 
 
+class TestBatchReadAndDrain:
+    """Test read_many(), delete_many() and drain()."""
+
+    CPMS = '+CPMS: "ME",{0},100,"ME",{0},100,"ME",{0},100'
+    MESSAGE_1 = ['+CMGR: "REC READ","+1234567890",,"23/01/15,10:30:45+00"', "First"]
+    MESSAGE_3 = ['+CMGR: "REC UNREAD","+0987654321",,"23/01/15,11:45:30+00"', "Third"]
+
+    def test_read_many_chains_cmgr(self, pty_modem):
+        """Test a few messages from a large store are read in one chained line."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 1", "OK"],
+            "AT+CPMS?": [self.CPMS.format(20), "OK"],
+            "AT+CMGR=1;+CMGR=3": self.MESSAGE_1 + self.MESSAGE_3 + ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = modem.sms.read_many([3, 1])
+
+        assert [(m.index, m.content) for m in messages] == [(1, "First"), (3, "Third")]
+        assert pty_modem.received == ["AT+CMGF?", "AT+CPMS?", "AT+CMGR=1;+CMGR=3"]
+
+    def test_read_many_skips_empty_index(self, pty_modem):
+        """Test a chain failing on an empty index falls back to single reads."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 1", "OK"],
+            "AT+CPMS?": [self.CPMS.format(20), "OK"],
+            "AT+CMGR=1;+CMGR=2;+CMGR=3": self.MESSAGE_1 + ["+CMS ERROR: 321"],
+            "AT+CMGR=1": self.MESSAGE_1 + ["OK"],
+            "AT+CMGR=2": ["+CMS ERROR: 321"],
+            "AT+CMGR=3": self.MESSAGE_3 + ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = modem.sms.read_many([1, 2, 3])
+
+        assert [m.index for m in messages] == [1, 3]
+
+    def test_read_many_uses_listing(self, pty_modem):
+        """Test most of the store is read with a single AT+CMGL."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 1", "OK"],
+            "AT+CPMS?": [self.CPMS.format(3), "OK"],
+            'AT+CMGL="ALL"': [
+                '+CMGL: 1,"REC READ","+1234567890",,"23/01/15,10:30:45+00"', "First",
+                '+CMGL: 2,"REC READ","+1234567890",,"23/01/15,10:31:45+00"', "Second",
+                '+CMGL: 3,"REC UNREAD","+0987654321",,"23/01/15,11:45:30+00"', "Third",
+                "OK",
+            ],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = modem.sms.read_many([3, 1])
+
+        assert [m.content for m in messages] == ["First", "Third"]
+        assert 'AT+CMGL="ALL"' in pty_modem.received
+        assert not any(cmd.startswith("AT+CMGR") for cmd in pty_modem.received)
+
+    def test_drain_bulk_delete(self, pty_modem):
+        """Test draining everything costs one listing and one delete."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 1", "OK"],
+            'AT+CMGL="ALL"': [
+                '+CMGL: 1,"REC READ","+1234567890",,"23/01/15,10:30:45+00"', "First",
+                '+CMGL: 3,"REC UNREAD","+0987654321",,"23/01/15,11:45:30+00"', "Third",
+                "OK",
+            ],
+            "AT+CMGD=1,3": ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = modem.sms.drain()
+
+        assert [m.index for m in messages] == [1, 3]
+        assert pty_modem.received == ["AT+CMGF?", 'AT+CMGL="ALL"', "AT+CMGD=1,3"]
+
+    def test_drain_keeps_incomplete_parts(self, pty_modem, deliver_pdus):
+        """Test parts of an incomplete long message stay in storage."""
+        single = TestDirectDelivery.PDU
+        part1, _ = deliver_pdus("+1234567890", "Hello " * 40, reference=5)
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CMGL=0": [
+                f"+CMGL: 1,0,,{len(part1) // 2 - 1}", part1,
+                "+CMGL: 2,0,,23", single,
+                "OK",
+            ],
+            "AT+CMGD=2": ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = modem.sms.drain(SMSStatus.REC_UNREAD)
+
+        assert [m.content for m in messages] == ["Hello"]
+        assert pty_modem.received[-1] == "AT+CMGD=2"
+
+    def test_drain_keeps_undecoded_entries(self, pty_modem):
+        """Test a listed entry drain() cannot return is not bulk deleted."""
+        submit = encode_sms_submit("+1234567890", "Outgoing")
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CMGL=4": [
+                "+CMGL: 1,1,,23", TestDirectDelivery.PDU,
+                f"+CMGL: 2,3,,{len(submit) // 2 - 1}", submit,
+                "OK",
+            ],
+            "AT+CMGD=1": ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            messages = modem.sms.drain()
+
+        assert [m.index for m in messages] == [1]
+        assert pty_modem.received[-1] == "AT+CMGD=1"
+        assert "AT+CMGD=1,3" not in pty_modem.received
+
+    def test_delete_many_chains(self, pty_modem):
+        """Test indices are deleted BATCH_SIZE per command line."""
+        pty_modem.responses.update({
+            "AT+CMGD=1;+CMGD=2": ["OK"],
+            "AT+CMGD=3": ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            modem.sms.BATCH_SIZE = 2
+            modem.sms.delete_many([1, 2, 3])
+
+        assert pty_modem.received == ["AT+CMGD=1;+CMGD=2", "AT+CMGD=3"]
+
+
 class TestStorageManagement:
     """Test SMS storage management."""
 
@@ -408,3 +630,355 @@ class TestSendSMS:
         assert callable(modem.sms.send_sms)
 
         modem.close()
+
+    def test_send_sms_prompt(self, pty_modem):
+        """Test send_sms goes through the prompt command and returns the reference."""
+        cmd, pdu = SMSManager._build_cmgs_parts("+1234567890", "Hello", "auto", False)[0]
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            cmd: b"\r\n> ",
+            pdu + "^Z": ["+CMGS: 42", "OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            ref = modem.sms.send_sms("+1234567890", "Hello")
+
+        assert ref == 42
+        assert pty_modem.received == ["AT+CMGF?", cmd, pdu + "^Z"]
+
+    def test_send_sms_cms_error(self, pty_modem):
+        """Test a network rejection raises CMSError."""
+        cmd, pdu = SMSManager._build_cmgs_parts("+1234567890", "Hello", "auto", False)[0]
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            cmd: b"\r\n> ",
+            pdu + "^Z": ["+CMS ERROR: 331"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            with pytest.raises(CMSError) as exc_info:
+                modem.sms.send_sms("+1234567890", "Hello")
+
+        assert exc_info.value.code == 331
+
+
+    def test_send_multipart_sms(self, pty_modem):
+        """Test a long message goes out as concatenated parts after AT+CMMS=1."""
+        text = "Hello world! " * 20
+        parts = SMSManager._build_cmgs_parts("+1234567890", text, "auto", False, reference=9)
+        pty_modem.responses.update({"AT+CMGF?": ["+CMGF: 0", "OK"], "AT+CMMS=1": ["OK"]})
+        for ref, (cmd, pdu) in enumerate(parts, start=40):
+            pty_modem.responses[cmd] = b"\r\n> "
+            pty_modem.responses[pdu + "^Z"] = [f"+CMGS: {ref}", "OK"]
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            modem.sms._concat_ref = 8
+            refs = modem.sms.send_sms("+1234567890", text)
+
+        assert len(parts) == 2
+        assert refs == [40, 41]
+        assert pty_modem.received == [
+            "AT+CMGF?", "AT+CMMS=1",
+            parts[0][0], parts[0][1] + "^Z",
+            parts[1][0], parts[1][1] + "^Z",
+        ]
+
+
+class TestDirectDelivery:
+    """Test direct-to-TE delivery (+CMT)."""
+
+    PDU = "0791447758100650040A912143658709000032105101035400" "05C8329BFD06"
+
+    def test_messages_delivered_and_acknowledged(self, pty_modem):
+        """Test +CMT PDUs are decoded, queued and acknowledged with AT+CNMA."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS=1": ["+CSMS: 1,1,1", "OK"],
+            "AT+CNMI?": ["+CNMI: 2,1,0,0,0", "OK"],
+            "AT+CNMI=2,2,0,0,0": ["OK"],
+            "AT+CNMA": ["OK"],
+            "AT+CNMI=2,1,0,0,0": ["OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            delivery = modem.sms.start_direct_delivery(phase2plus=True)
+            pty_modem.send_lines(["+CMT: ,23", self.PDU])
+
+            message = delivery.get(timeout=2.0)
+            delivery.stop()
+
+        assert message.sender == "+1234567890"
+        assert message.content == "Hello"
+        assert message.index == -1
+        assert delivery.stats.acknowledged == 1
+        assert pty_modem.received == [
+            "AT+CMGF?", "AT+CSMS=1", "AT+CNMI?", "AT+CNMI=2,2,0,0,0",
+            "AT+CNMA", "AT+CNMI?", "AT+CNMI=2,1,0,0,0"
+        ]
+        assert delivery.get(timeout=0) is None
+
+    def test_long_message_delivered_once_complete(self, pty_modem, deliver_pdus):
+        """Test +CMT parts are acknowledged as they arrive and delivered joined."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS=1": ["+CSMS: 1,1,1", "OK"],
+            "AT+CNMI?": ["+CNMI: 2,1,0,0,0", "OK"],
+            "AT+CNMI=2,2,0,0,0": ["OK"],
+            "AT+CNMA": ["OK"],
+            "AT+CNMI=2,1,0,0,0": ["OK"],
+        })
+        text = "Hello " * 40
+        part1, part2 = deliver_pdus("+1234567890", text)
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            delivery = modem.sms.start_direct_delivery(phase2plus=True)
+            pty_modem.send_lines([f"+CMT: ,{len(part2) // 2 - 1}", part2])
+            # The network sends the next +CMT only after AT+CNMA
+            deadline = time.monotonic() + 2.0
+            while delivery.stats.acknowledged == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            pty_modem.send_lines([f"+CMT: ,{len(part1) // 2 - 1}", part1])
+
+            message = delivery.get(timeout=2.0)
+            delivery.stop()
+
+        assert message.content == text
+        assert message.concat is None
+        assert delivery.stats.parts == 1
+        assert delivery.stats.acknowledged == 2
+        assert delivery.get(timeout=0) is None
+
+    def test_incomplete_message_delivered_on_stop(self, pty_modem, deliver_pdus):
+        """Test a held part is delivered as a fragment when delivery stops."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS?": ["+CSMS: 0,1,1,1", "OK"],
+            "AT+CNMI?": ["+CNMI: 2,1,0,0,0", "OK"],
+            "AT+CNMI=2,2,0,0,0": ["OK"],
+        })
+        part1, _ = deliver_pdus("+1234567890", "Hello " * 40)
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            delivery = modem.sms.start_direct_delivery()
+            pty_modem.send_lines([f"+CMT: ,{len(part1) // 2 - 1}", part1])
+            deadline = time.monotonic() + 2.0
+            while delivery.stats.parts == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert delivery.get(timeout=0) is None
+            delivery.stop(restore_routing=False)
+
+        fragment = delivery.get(timeout=0)
+        assert fragment.concat.sequence == 1
+        assert fragment.content == ("Hello " * 40)[:153]
+
+    def test_phase2_callback_without_ack(self, pty_modem):
+        """Test phase 2 service delivers to the callback without AT+CNMA."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS?": ["+CSMS: 0,1,1,1", "OK"],
+            "AT+CNMI?": ["+CNMI: 2,1,0,0,0", "OK"],
+            "AT+CNMI=2,2,0,0,0": ["OK"],
+        })
+        received = []
+        done = threading.Event()
+
+        def on_message(message):
+            received.append(message)
+            done.set()
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            delivery = modem.sms.start_direct_delivery(on_message=on_message)
+            with pytest.raises(SMSError):
+                modem.sms.start_direct_delivery()
+
+            pty_modem.send_lines(["+CMT: ,23", self.PDU])
+            assert done.wait(2.0)
+            delivery.stop(restore_routing=False)
+
+        assert [m.content for m in received] == ["Hello"]
+        assert "AT+CNMA" not in pty_modem.received
+
+    def test_failed_callback_rejects_and_keeps_routing(self, pty_modem):
+        """Test a message whose callback raises is rejected and delivery continues."""
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS=1": ["+CSMS: 1,1,1", "OK"],
+            "AT+CNMI?": ["+CNMI: 2,1,0,0,0", "OK"],
+            "AT+CNMI=2,2,0,0,0": ["OK"],
+            "AT+CNMA": ["OK"],
+            "AT+CNMA=2": ["OK"],
+        })
+        received = []
+        done = threading.Event()
+
+        def on_message(message):
+            if not received:
+                received.append(None)
+                raise RuntimeError("busy")
+            received.append(message)
+            done.set()
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            delivery = modem.sms.start_direct_delivery(on_message=on_message, phase2plus=True)
+            pty_modem.send_lines(["+CMT: ,23", self.PDU])
+            deadline = time.monotonic() + 2.0
+            while delivery.stats.rejected == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # The network retries the rejected message
+            pty_modem.send_lines(["+CMT: ,23", self.PDU])
+            assert done.wait(2.0)
+            delivery.stop(restore_routing=False)
+
+        assert received[1].content == "Hello"
+        assert delivery.stats.rejected == 1
+        assert delivery.stats.acknowledged == 1
+        assert pty_modem.received[-2:] == ["AT+CNMA=2", "AT+CNMA"]
+
+    @pytest.mark.parametrize("delivery_first", [True, False])
+    def test_routing_shared_with_delivery_tracking(self, pty_modem, delivery_first):
+        """Test direct delivery and tracking each set and restore only their field."""
+        pty_modem.responses = CNMIResponses({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS?": ["+CSMS: 0,1,1,1", "OK"],
+        })
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            if delivery_first:
+                delivery = modem.sms.start_direct_delivery()
+                tracker = modem.sms.track_deliveries()
+            else:
+                tracker = modem.sms.track_deliveries()
+                delivery = modem.sms.start_direct_delivery()
+            assert pty_modem.responses.cnmi == "2,2,0,1,0"
+
+            (delivery if delivery_first else tracker).stop()
+            assert pty_modem.responses.cnmi == ("2,1,0,1,0" if delivery_first else "2,2,0,0,0")
+            (tracker if delivery_first else delivery).stop()
+
+        assert pty_modem.responses.cnmi == "2,1,0,0,0"
+
+
+class CNMIResponses(dict):
+    """Canned responses that keep AT+CNMI settings like a modem."""
+
+    def __init__(self, responses, cnmi="2,1,0,0,0"):
+        super().__init__(responses)
+        self.cnmi = cnmi
+
+    def get(self, cmd, default=None):
+        if cmd == "AT+CNMI?":
+            return [f"+CNMI: {self.cnmi}", "OK"]
+        if cmd.startswith("AT+CNMI="):
+            self.cnmi = cmd.split("=", 1)[1]
+            return ["OK"]
+        return super().get(cmd, default)
+
+
+class TestDeliveryTracking:
+    """Test status report (+CDS/+CDSI) matching."""
+
+    # SMS-STATUS-REPORT for reference 42: delivered
+    REPORT = "00062A0A912143658709" "32105101035400" "32105101036400" "00"
+
+    def _responses(self, pty_modem):
+        cmd, pdu = SMSManager._build_cmgs_parts("+1234567890", "Hello", "auto", True)[0]
+        pty_modem.responses.update({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS?": ["+CSMS: 1,1,1,1", "OK"],
+            "AT+CNMI?": ["+CNMI: 2,1,0,0,0", "OK"],
+            "AT+CNMI=2,1,0,1,0": ["OK"],
+            "AT+CNMI=2,1,0,2,0": ["OK"],
+            "AT+CNMI=2,1,0,0,0": ["OK"],
+            "AT+CNMA": ["OK"],
+            cmd: b"\r\n> ",
+            pdu + "^Z": ["+CMGS: 42", "OK"],
+        })
+
+    def test_cds_matched_to_sent_message(self, pty_modem):
+        """Test a +CDS report marks the sent message delivered and is acknowledged."""
+        self._responses(pty_modem)
+        updated = threading.Event()
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            with modem.sms.track_deliveries(on_update=lambda entry: updated.set()) as tracker:
+                ref = modem.sms.send_sms("+1234567890", "Hello", request_status=True)
+                assert tracker.get(ref).state == DeliveryState.PENDING
+
+                pty_modem.send_lines([f"+CDS: {len(self.REPORT) // 2 - 1}", self.REPORT])
+                assert updated.wait(timeout=2.0)
+                deadline = time.monotonic() + 2.0
+                while tracker.stats.reports == 0 or "AT+CNMA" not in pty_modem.received:
+                    assert time.monotonic() < deadline
+                    time.sleep(0.01)
+
+        entry = tracker.get(42)
+        assert entry.state == DeliveryState.DELIVERED
+        assert entry.latency >= 0
+        assert tracker.stats.delivered == 1
+        assert tracker.pending == 0
+        assert "AT+CNMI=2,1,0,1,0" in pty_modem.received
+        assert pty_modem.received[-1] == "AT+CNMI=2,1,0,0,0"
+
+    def test_stop_restores_previous_ds_only(self, pty_modem):
+        """Test stopping restores the <ds> replaced by start and keeps the other fields."""
+        pty_modem.responses = CNMIResponses({
+            "AT+CMGF?": ["+CMGF: 0", "OK"],
+            "AT+CSMS?": ["+CSMS: 0,1,1,1", "OK"],
+        }, cnmi="2,1,0,2,0")
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            tracker = modem.sms.track_deliveries()
+            assert pty_modem.responses.cnmi == "2,1,0,1,0"
+            # Changed by someone else while tracking
+            pty_modem.responses.cnmi = "2,2,0,1,0"
+            tracker.stop()
+
+        assert pty_modem.responses.cnmi == "2,2,0,2,0"
+
+    def test_cdsi_report_read_and_deleted(self, pty_modem):
+        """Test a stored report announced by +CDSI is read, applied and deleted."""
+        self._responses(pty_modem)
+        pty_modem.responses.update({
+            "AT+CMGR=3": [f"+CMGR: ,,{len(self.REPORT) // 2 - 1}", self.REPORT, "OK"],
+            "AT+CMGD=3": ["OK"],
+        })
+        updated = threading.Event()
+
+        with QuectelModem(transport=SerialTransport(pty_modem.port, timeout=0.1)) as modem:
+            tracker = modem.sms.track_deliveries(on_update=lambda entry: updated.set(), stored=True)
+            tracker.track(42, "+1234567890")
+            pty_modem.send_lines(['+CDSI: "SR",3'])
+            assert updated.wait(timeout=2.0)
+            tracker.stop()
+
+        assert tracker.get(42).state == DeliveryState.DELIVERED
+        assert "AT+CMGD=3" in pty_modem.received
+
+    def test_ttl_and_unmatched(self):
+        """Test pending messages expire after ttl and unknown references are counted."""
+        now = [1000.0]
+        expired = []
+        tracker = DeliveryTracker(None, acknowledge=False, ttl=60.0, on_update=expired.append, clock=lambda: now[0])
+        tracker.track([1, 2], "+1234567890")
+
+        report = StatusReport(reference=2, recipient="+1234567890", timestamp="", discharge_time="", status=0x20)
+        assert tracker.apply(report).state == DeliveryState.PENDING
+        assert tracker.apply(StatusReport(7, "+1", "", "", 0)) is None
+
+        now[0] += 61.0
+        assert [e.reference for e in tracker.evict()] == [1, 2]
+        assert [e.state for e in expired] == [DeliveryState.EXPIRED] * 2
+        assert tracker.get(1) is None
+        assert tracker.stats.unmatched == 1
+        assert tracker.stats.expired == 2
+
+    def test_parse_cds_text_mode(self):
+        """Test parsing a text mode +CDS line."""
+        report = SMSParser.parse_cds(
+            '+CDS: 6,214,"+31628870634",145,"23/01/15,10:30:45+00","23/01/15,10:30:50+00",70'
+        )
+
+        assert report.reference == 214
+        assert report.recipient == "+31628870634"
+        assert report.discharge_time == "23/01/15,10:30:50+00"
+        assert report.state == DeliveryState.FAILED
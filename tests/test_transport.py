@@ -2,8 +2,11 @@
 Tests for transport layer.
 """
 
+import os
+import time
+
 import pytest
-from quectelpy.core import MockTransport
+from quectelpy.core import MockTransport, SerialTransport, LineFramer
 from quectelpy.exceptions import EC25Error
 
 
@@ -103,3 +106,90 @@ def test_mock_transport_clear_responses():
     assert line == b""
 
     transport.close()
+
+
+def test_mock_transport_response_waits_for_write():
+    """Test a queued response is only read once its command is written."""
+    transport = MockTransport(read_timeout=0.5)
+    transport.add_response(["OK"])  # Before the first read: stale input
+    transport.reset_input_buffer()
+
+    transport.add_response(["+CSQ: 24,99", "OK"])
+    start = time.monotonic()
+    assert transport.read_until(timeout=0.05) == b""
+    assert time.monotonic() - start < 0.2
+
+    transport.write(b"AT+CSQ\r")
+    assert transport.read_until() == b"+CSQ: 24,99\r\n"
+    assert transport.read_until() == b"OK\r\n"
+
+    transport.close()
+
+
+def test_line_framer_splits_complete_lines():
+    """Test LineFramer returns complete lines and keeps the partial tail."""
+    framer = LineFramer()
+
+    framer.feed(b"\r\n+CSQ: 24,99\r\n\r\nOK\r\n+CRE")
+    assert framer.lines() == ["+CSQ: 24,99", "OK"]
+    assert framer.pending() == 4
+
+    framer.feed(b"G: 0,1\r\n")
+    assert framer.lines() == ["+CREG: 0,1"]
+    assert framer.pending() == 0
+
+
+def test_line_framer_multibyte_split_across_chunks():
+    """Test a UTF-8 character split between chunks decodes intact."""
+    framer = LineFramer()
+    data = "Grüße\r\n".encode("utf-8")
+
+    framer.feed(data[:3])
+    assert framer.lines() == []
+    framer.feed(data[3:])
+    assert framer.lines() == ["Grüße"]
+
+
+def test_line_framer_take_until():
+    """Test LineFramer.take_until returns raw bytes up to a terminator."""
+    framer = LineFramer()
+    framer.feed(b"\r\n> ")
+
+    assert framer.take_until(b"\r\n") == b"\r\n"
+    assert framer.take_until(b"\r\n") is None
+    assert framer.take_all() == b"> "
+
+
+def test_line_framer_take_prompt():
+    """Test the unterminated "> " prompt is only taken when it is the whole tail."""
+    framer = LineFramer()
+
+    framer.feed(b"\r\n> quoted")
+    assert framer.lines() == []
+    assert framer.take_prompt() is False
+
+    framer.clear()
+    framer.feed(b"\r\n> ")
+    assert framer.lines() == []
+    assert framer.take_prompt() is True
+    assert framer.pending() == 0
+
+
+def test_serial_transport_read_lines_over_pty():
+    """Test SerialTransport reads a burst of lines in bulk from a pty."""
+    master, slave = os.openpty()
+    try:
+        transport = SerialTransport(os.ttyname(slave), timeout=0.5)
+
+        os.write(master, b"\r\n+CMTI: \"ME\",1\r\n+CMTI: \"ME\",2\r\nOK\r\npart")
+        time.sleep(0.05)
+
+        assert transport.read_lines() == ['+CMTI: "ME",1', '+CMTI: "ME",2', "OK"]
+
+        os.write(master, b"ial\r\n")
+        assert transport.read_until(b"\r\n") == b"partial\r\n"
+
+        transport.close()
+    finally:
+        os.close(master)
+        os.close(slave)
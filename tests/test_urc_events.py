@@ -0,0 +1,159 @@
+"""
+Tests for typed URC events and the decoder registry.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import pytest
+from quectelpy.core import URCDispatcher, URCHandler
+from quectelpy.parsers import (
+    IndicationEvent,
+    NewMessageEvent,
+    RegistrationEvent,
+    SignalIndEvent,
+    SMSDeliverEvent,
+    SocketEvent,
+    StatusReportEvent,
+    URCDecoderRegistry,
+    URCEvent,
+    decode_urc,
+    split_urc_fields,
+)
+from quectelpy.types import RegistrationState
+
+
+def test_new_message_event():
+    """Test +CMTI decodes to storage and index."""
+    event = decode_urc('+CMTI: "SM",3')
+
+    assert isinstance(event, NewMessageEvent)
+    assert event.storage == "SM"
+    assert event.index == 3
+
+
+@pytest.mark.parametrize("line, stat, lac, ci, act", [
+    ("+CREG: 1", 1, None, None, None),
+    ('+CGREG: 5,"1A2B","01C3D4E5",7', 5, "1A2B", "01C3D4E5", 7),
+    ('+CEREG: 2', 2, None, None, None),
+])
+def test_registration_event(line, stat, lac, ci, act):
+    """Test registration URCs decode with optional location fields."""
+    event = decode_urc(line)
+
+    assert isinstance(event, RegistrationEvent)
+    assert (event.stat, event.lac, event.ci, event.act) == (stat, lac, ci, act)
+    assert event.state == RegistrationState(stat)
+    assert event.is_registered == (stat in (1, 5))
+
+
+def test_qind_events():
+    """Test +QIND picks the signal event for "csq" and a generic one otherwise."""
+    csq = decode_urc('+QIND: "csq",24,99')
+    fota = decode_urc('+QIND: "FOTA","HTTPSTART"')
+
+    assert isinstance(csq, SignalIndEvent)
+    assert (csq.kind, csq.rssi, csq.ber) == ("csq", 24, 99)
+    assert type(fota) is IndicationEvent
+    assert fota.kind == "FOTA"
+    assert fota.values == ["HTTPSTART"]
+
+
+@pytest.mark.parametrize("line, kind, connect_id, context_id, length", [
+    ('+QIURC: "recv",0', "recv", 0, None, None),
+    ('+QIURC: "recv",2,12', "recv", 2, None, 12),
+    ('+QIURC: "closed",1', "closed", 1, None, None),
+    ('+QIURC: "pdpdeact",1', "pdpdeact", None, 1, None),
+])
+def test_socket_event(line, kind, connect_id, context_id, length):
+    """Test +QIURC socket notifications."""
+    event = decode_urc(line)
+
+    assert isinstance(event, SocketEvent)
+    assert (event.kind, event.connect_id, event.context_id, event.length) == (kind, connect_id, context_id, length)
+
+
+def test_unknown_urc_and_quoted_commas():
+    """Test unknown URCs get a plain event and quoted commas are kept."""
+    event = decode_urc('+CCWA: "+1234567890",,"23/01/15,10:30:45+00"')
+
+    assert type(event) is URCEvent
+    assert event.name == "+CCWA"
+    assert event.fields == ["+1234567890", "", "23/01/15,10:30:45+00"]
+    assert split_urc_fields("") == []
+
+
+def test_fields_parsed_lazily():
+    """Test decoding does not parse; fields are parsed once on access."""
+    event = decode_urc('+CMTI: "SM",x')
+
+    assert "fields" not in vars(event)
+    with pytest.raises(ValueError):
+        event.index
+    assert event.storage == "SM"
+
+
+def test_custom_decoder():
+    """Test applications can register decoders for other URCs."""
+    @dataclass
+    class RingEvent(URCEvent):
+        @cached_property
+        def number(self) -> str:
+            return self.fields[0]
+
+    registry = URCDecoderRegistry()
+    registry.register("+CLIP", RingEvent)
+
+    assert registry.decode('+CLIP: "+1234567890",145').number == "+1234567890"
+    assert registry.unregister("+CLIP") is True
+    assert type(registry.decode('+CLIP: "+1234567890",145')) is URCEvent
+
+
+def test_event_callbacks_share_one_event():
+    """Test event callbacks receive typed events and share the decode."""
+    handler = URCHandler()
+    events = []
+
+    handler.register_event_callback("+CMTI", events.append)
+    handler.register_event_callback("+CMTI", events.append)
+    handler.register_callback("+CMTI", events.append)
+    handler.handle_urc('+CMTI: "ME",7')
+
+    first, second, raw = events
+    assert first is second
+    assert first.index == 7
+    assert raw == '+CMTI: "ME",7'
+
+
+def test_event_callbacks_on_dispatcher_workers():
+    """Test concurrent decodes on dispatcher workers get their own line's event."""
+    with URCDispatcher(workers=4, max_queue_size=1000) as dispatcher:
+        handler = URCHandler(dispatcher=dispatcher)
+        mismatched = []
+
+        def check(event):
+            if event.index != int(event.line.rsplit(",", 1)[1]):
+                mismatched.append(event)
+
+        for _ in range(4):
+            handler.register_event_callback("+CMTI", check)
+        for i in range(500):
+            handler.handle_urc(f'+CMTI: "SM",{i}')
+
+        assert dispatcher.join(timeout=5.0)
+
+    assert dispatcher.stats.delivered == 2000
+    assert mismatched == []
+
+
+def test_multiline_events():
+    """Test +CMT/+CDS events expose header fields and the PDU or text."""
+    cmt = decode_urc("+CMT: ,24\n0791447758100650040B91")
+    text = decode_urc('+CMT: "+1234567890",,"23/01/15,10:30:45+00"\nHello')
+    cds = decode_urc("+CDS: 25\n07914477581006500")
+
+    assert isinstance(cmt, SMSDeliverEvent)
+    assert (cmt.is_pdu, cmt.length, cmt.pdu) == (True, 24, "0791447758100650040B91")
+    assert (text.is_pdu, text.fields[0], text.text) == (False, "+1234567890", "Hello")
+    assert isinstance(cds, StatusReportEvent)
+    assert (cds.header, cds.body, cds.pdu) == ("+CDS: 25", ["07914477581006500"], "07914477581006500")
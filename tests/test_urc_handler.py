@@ -0,0 +1,216 @@
+"""
+Tests for URCHandler dispatch and waiting.
+"""
+
+import threading
+import time
+
+from quectelpy.core import URCHandler, URCSubscription
+
+
+def test_multiple_subscribers_per_prefix():
+    """Test every callback registered for a prefix receives the URC."""
+    handler = URCHandler()
+    first, second = [], []
+
+    handler.register_callback("+CMTI", first.append)
+    handler.register_callback("+CMTI", second.append)
+    handler.handle_urc('+CMTI: "SM",1')
+
+    assert first == ['+CMTI: "SM",1']
+    assert second == ['+CMTI: "SM",1']
+
+
+def test_unsubscribe_handle_keeps_others():
+    """Test removing one subscription leaves the others on the prefix."""
+    handler = URCHandler()
+    first, second = [], []
+
+    sub = handler.register_callback("+CREG", first.append)
+    handler.register_callback("+CREG", second.append)
+
+    assert isinstance(sub, URCSubscription)
+    assert sub.unsubscribe() is True
+    assert sub.unsubscribe() is False
+
+    handler.handle_urc("+CREG: 1")
+    assert first == []
+    assert second == ["+CREG: 1"]
+
+
+def test_unregister_prefix_removes_all():
+    """Test unregistering by prefix removes every callback for it."""
+    handler = URCHandler()
+    received = []
+
+    handler.register_callback("+CREG", received.append)
+    handler.register_callback("+CREG", received.append)
+
+    assert handler.unregister_callback("+CREG") is True
+    assert handler.unregister_callback("+CREG") is False
+    handler.handle_urc("+CREG: 1")
+    assert received == []
+
+
+def test_prefix_matching():
+    """Test prefixes of any length match, including the empty catch-all."""
+    handler = URCHandler()
+    everything, recv, qiurc = [], [], []
+
+    handler.register_callback("", everything.append)
+    handler.register_callback('+QIURC: "recv"', recv.append)
+    handler.register_callback("+QIURC", qiurc.append)
+
+    handler.handle_urc('+QIURC: "recv",0')
+    handler.handle_urc('+QIURC: "closed",0')
+    handler.handle_urc("RING")
+
+    assert everything == ['+QIURC: "recv",0', '+QIURC: "closed",0', "RING"]
+    assert recv == ['+QIURC: "recv",0']
+    assert qiurc == ['+QIURC: "recv",0', '+QIURC: "closed",0']
+
+
+def test_failing_callback_isolated():
+    """Test an exception in one callback does not stop the others."""
+    handler = URCHandler()
+    received = []
+
+    def broken(line):
+        raise RuntimeError("boom")
+
+    handler.register_callback("+CMTI", broken)
+    handler.register_callback("+CMTI", received.append)
+    handler.handle_urc('+CMTI: "SM",2')
+
+    assert received == ['+CMTI: "SM",2']
+
+
+def test_get_callbacks():
+    """Test get_callbacks lists callbacks per prefix in registration order."""
+    handler = URCHandler()
+
+    def a(line):
+        pass
+
+    def b(line):
+        pass
+
+    handler.register_callback("+CMTI", a)
+    handler.register_callback("+CMTI", b)
+
+    assert handler.get_callbacks() == {"+CMTI": [a, b]}
+
+
+def _emit_later(handler, *lines, delay=0.05):
+    """Deliver URCs from another thread after a short delay."""
+    def run():
+        time.sleep(delay)
+        for line in lines:
+            handler.handle_urc(line)
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_wait_for_urc():
+    """Test waiting returns the first matching URC and ignores others."""
+    handler = URCHandler()
+    thread = _emit_later(handler, "+CSQ: 20,99", '+QIURC: "closed",0', '+QIURC: "recv",1')
+
+    line = handler.wait_for_urc('+QIURC: "recv"', timeout=1.0)
+
+    thread.join()
+    assert line == '+QIURC: "recv",1'
+
+
+def test_wait_for_urc_predicate_and_timeout():
+    """Test predicates match and a timeout returns None."""
+    handler = URCHandler()
+    thread = _emit_later(handler, "+CREG: 2", "+CREG: 1")
+
+    assert handler.wait_for_urc(lambda line: line.endswith(" 1"), timeout=1.0) == "+CREG: 1"
+    thread.join()
+
+    start = time.monotonic()
+    assert handler.wait_for_urc("+CMTI", timeout=0.1) is None
+    assert time.monotonic() - start >= 0.1
+
+
+def test_watch_keeps_urcs_before_wait():
+    """Test a watch collects URCs that arrive before wait() is called."""
+    handler = URCHandler()
+
+    with handler.watch(("+CREG", "+CGREG")) as watch:
+        handler.handle_urc("+CREG: 1")
+        handler.handle_urc("+CSQ: 20,99")
+        handler.handle_urc("+CGREG: 5")
+
+        assert watch.wait(0) == "+CREG: 1"
+        assert watch.wait(0) == "+CGREG: 5"
+        assert watch.wait(0) is None
+
+
+def test_iter_urcs_ends_on_cancel():
+    """Test iterators yield in order and end when waiters are cancelled."""
+    handler = URCHandler()
+    thread = _emit_later(handler, '+CMTI: "SM",1', '+CMTI: "SM",2')
+    received = []
+
+    for line in handler.iter_urcs("+CMTI", timeout=1.0):
+        received.append(line)
+        if len(received) == 2:
+            threading.Timer(0.05, handler.cancel_waiters).start()
+
+    thread.join()
+    assert received == ['+CMTI: "SM",1', '+CMTI: "SM",2']
+    assert handler._watches == []
+
+
+def test_modem_core_wait_and_stop(modem_core, mock_transport):
+    """Test the reader wakes a waiter promptly and stop() releases waiters."""
+    mock_transport.add_response(['+CMTI: "SM",4'])
+    threading.Timer(0.05, mock_transport.write, args=(b"",)).start()
+    start = time.monotonic()
+
+    assert modem_core.wait_for_urc("+CMTI", timeout=1.0) == '+CMTI: "SM",4'
+    assert time.monotonic() - start < 0.2
+
+    threading.Timer(0.05, modem_core.stop).start()
+    start = time.monotonic()
+    assert list(modem_core.iter_urcs("+CREG")) == []
+    assert time.monotonic() - start < 0.5
+
+
+def test_multiline_urc_during_command(modem_core, mock_transport):
+    """Test a +CMT and its PDU line reach URC callbacks, not the response."""
+    urcs = []
+    modem_core.register_urc_callback("+CMT:", urcs.append)
+    mock_transport.add_response(["+CSQ: 24,99", "+CMT: ,24", "0791447758100650040B91", "OK"])
+
+    response = modem_core.send_at("AT+CSQ")
+
+    assert response == ["+CSQ: 24,99", "OK"]
+    assert urcs == ["+CMT: ,24\n0791447758100650040B91"]
+
+
+def test_multiline_urc_specs():
+    """Test built-in and custom continuation specs."""
+    handler = URCHandler()
+
+    assert handler.continuation_lines("+CMT: ,24") == 1
+    assert handler.continuation_lines("+CDS: 25") == 1
+    assert handler.continuation_lines('+CDS: 6,12,"+1234567890",145,"23/01/15,10:30:45+00","23/01/15,10:30:50+00",0') == 0
+    assert handler.continuation_lines('+CMTI: "SM",1') == 0
+
+    handler.register_multiline_urc("+QLINES", lambda line: int(line.split(":")[1]))
+    assert handler.continuation_lines("+QLINES: 3") == 3
+
+
+def test_incomplete_multiline_urc_does_not_swallow_result(modem_core, mock_transport):
+    """Test a final result ends an unfinished multi-line URC."""
+    urcs = []
+    modem_core.register_urc_callback("+CBM", urcs.append)
+    mock_transport.add_response(["+CBM: 88", "OK"])
+
+    assert modem_core.send_at("AT") == ["OK"]
+    assert urcs == ["+CBM: 88"]